@@ -0,0 +1,72 @@
+"""add contracts full-text index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-01-12 09:00:00.000000
+
+DE: FTS5-Volltextindex (contracts_fts) inkl. Trigger und Befüllung aus Bestandsdaten.
+    Nur für SQLite; andere Datenbanken nutzen weiterhin die ILIKE-Suche.
+PT: Índice de texto completo FTS5 (contracts_fts) com triggers e carga dos dados existentes.
+    Apenas SQLite; outros bancos continuam usando a busca ILIKE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_add_contracts_fts'
+down_revision: Union[str, None] = '0008_add_operation_type_to_contracts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "title, description, client_name, company_name, notes, ocr_text"
+NEW_COLUMNS = "new.title, new.description, new.client_name, new.company_name, new.notes, new.ocr_text"
+OLD_COLUMNS = "old.title, old.description, old.client_name, old.company_name, old.notes, old.ocr_text"
+
+
+def _is_sqlite() -> bool:
+    return op.get_bind().dialect.name == "sqlite"
+
+
+def upgrade() -> None:
+    """
+    Erstellt contracts_fts und Trigger, baut den Index auf / Cria contracts_fts e triggers, constrói o índice
+    """
+    if not _is_sqlite():
+        return
+
+    op.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS contracts_fts USING fts5("
+        f"{COLUMNS}, content='contracts', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS contracts_fts_ai AFTER INSERT ON contracts BEGIN "
+        f"INSERT INTO contracts_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_COLUMNS}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS contracts_fts_ad AFTER DELETE ON contracts BEGIN "
+        f"INSERT INTO contracts_fts(contracts_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_COLUMNS}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS contracts_fts_au AFTER UPDATE OF {COLUMNS} ON contracts BEGIN "
+        f"INSERT INTO contracts_fts(contracts_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_COLUMNS}); "
+        f"INSERT INTO contracts_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_COLUMNS}); END"
+    )
+
+    # Bestehende Verträge indizieren / Indexar contratos existentes
+    op.execute("INSERT INTO contracts_fts(contracts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """
+    Entfernt Trigger und contracts_fts / Remove triggers e contracts_fts
+    """
+    if not _is_sqlite():
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS contracts_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS contracts_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS contracts_fts_ai")
+    op.execute("DROP TABLE IF EXISTS contracts_fts")
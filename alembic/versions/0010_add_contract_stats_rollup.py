@@ -0,0 +1,60 @@
+"""add contract stats rollup table
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-01-19 09:00:00.000000
+
+DE: Tabelle contract_stats_rollup für vorberechnete Dashboard-Statistiken.
+    Die Befüllung übernimmt der Rollup-Job beim Anwendungsstart.
+PT: Tabela contract_stats_rollup para estatísticas pré-calculadas do dashboard.
+    O preenchimento é feito pelo job de rollup na inicialização da aplicação.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_add_contract_stats_rollup'
+down_revision: Union[str, None] = '0009_add_contracts_fts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Cria tabela contract_stats_rollup / Erstellt contract_stats_rollup Tabelle
+    """
+    op.create_table(
+        'contract_stats_rollup',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('department', sa.String(length=100), nullable=False, server_default=''),
+        sa.Column('team', sa.String(length=100), nullable=False, server_default=''),
+        sa.Column('status', sa.String(length=32), nullable=False),
+        sa.Column('contract_type', sa.String(length=32), nullable=False),
+        sa.Column('operation_type', sa.String(length=16), nullable=False),
+        sa.Column('expiry_bucket', sa.String(length=8), nullable=False),
+        sa.Column('contract_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_value', sa.Numeric(precision=16, scale=2), nullable=False, server_default='0'),
+        sa.Column('alert_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pending_alert_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('bucket_date', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'department', 'team', 'status', 'contract_type', 'operation_type', 'expiry_bucket',
+            name='uq_contract_stats_rollup_key'
+        ),
+    )
+    op.create_index('ix_contract_stats_rollup_department', 'contract_stats_rollup', ['department'])
+    op.create_index('ix_contract_stats_rollup_team', 'contract_stats_rollup', ['team'])
+
+
+def downgrade() -> None:
+    """
+    Remove tabela contract_stats_rollup / Entfernt contract_stats_rollup Tabelle
+    """
+    op.drop_index('ix_contract_stats_rollup_team', table_name='contract_stats_rollup')
+    op.drop_index('ix_contract_stats_rollup_department', table_name='contract_stats_rollup')
+    op.drop_table('contract_stats_rollup')
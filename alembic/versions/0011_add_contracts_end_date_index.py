@@ -0,0 +1,35 @@
+"""add index on contracts.end_date
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-01-26 09:00:00.000000
+
+DE: Index auf contracts.end_date für die tägliche Auswahl der fälligen
+    Ablauf-Benachrichtigungen (end_date IN (heute+60, +30, +10, +1)).
+PT: Índice em contracts.end_date para a seleção diária dos alertas de
+    vencimento devidos (end_date IN (hoje+60, +30, +10, +1)).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011_add_contracts_end_date_index'
+down_revision: Union[str, None] = '0010_add_contract_stats_rollup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Cria índice ix_contracts_end_date / Erstellt Index ix_contracts_end_date
+    """
+    op.create_index('ix_contracts_end_date', 'contracts', ['end_date'])
+
+
+def downgrade() -> None:
+    """
+    Remove índice ix_contracts_end_date / Entfernt Index ix_contracts_end_date
+    """
+    op.drop_index('ix_contracts_end_date', table_name='contracts')
@@ -0,0 +1,51 @@
+"""add extraction cache table
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-02-04 09:00:00.000000
+
+DE: Tabelle extraction_cache: Ergebnisse der PDF-Extraktion nach Datei-Hash,
+    Methode und Extraktor-/Regelversion, mit LRU-Zeitstempel und Größe.
+PT: Tabela extraction_cache: resultados da extração de PDF por hash do arquivo,
+    método e versão do extrator/regras, com carimbo LRU e tamanho.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013_add_extraction_cache'
+down_revision: Union[str, None] = '0012_add_email_outbox'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Cria tabela extraction_cache / Erstellt extraction_cache Tabelle
+    """
+    op.create_table(
+        'extraction_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('file_sha256', sa.String(length=64), nullable=False),
+        sa.Column('method', sa.String(length=20), nullable=False),
+        sa.Column('extractor_version', sa.String(length=64), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column('last_accessed_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('file_sha256', 'method', 'extractor_version', name='uq_extraction_cache_key'),
+    )
+    op.create_index('ix_extraction_cache_last_accessed', 'extraction_cache', ['last_accessed_at'])
+
+
+def downgrade() -> None:
+    """
+    Remove tabela extraction_cache / Entfernt extraction_cache Tabelle
+    """
+    op.drop_index('ix_extraction_cache_last_accessed', table_name='extraction_cache')
+    op.drop_table('extraction_cache')
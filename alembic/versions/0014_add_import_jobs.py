@@ -0,0 +1,80 @@
+"""add import jobs table
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-02-11 09:00:00.000000
+
+DE: Tabelle import_jobs: persistente Warteschlange für PDF-Importe mit Status,
+    Stufe, Fortschritt, Lease und dem Ergebnis als JSON.
+PT: Tabela import_jobs: fila persistente de importações de PDF com status,
+    etapa, progresso, lease e o resultado em JSON.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014_add_import_jobs'
+down_revision: Union[str, None] = '0013_add_extraction_cache'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Cria tabela import_jobs / Erstellt import_jobs Tabelle
+    """
+    op.create_table(
+        'import_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('original_file_name', sa.String(length=255), nullable=False),
+        sa.Column('storage_name', sa.String(length=255), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=False),
+        sa.Column('file_sha256', sa.String(length=64), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=False),
+        sa.Column('extraction_method', sa.String(length=20), nullable=False, server_default='combined'),
+        sa.Column('include_ocr', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column(
+            'status',
+            sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='importjobstatus'),
+            nullable=False,
+            server_default='QUEUED',
+        ),
+        sa.Column(
+            'stage',
+            sa.Enum('QUEUED', 'VALIDATING', 'EXTRACTING', 'DUPLICATE_CHECK', 'ANALYZING', 'DONE', name='importjobstage'),
+            nullable=False,
+            server_default='QUEUED',
+        ),
+        sa.Column('progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('lease_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error_status_code', sa.Integer(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_import_jobs_user_id', 'import_jobs', ['user_id'])
+    op.create_index('ix_import_jobs_status_created', 'import_jobs', ['status', 'created_at'])
+    op.create_index('ix_import_jobs_finished_at', 'import_jobs', ['finished_at'])
+
+
+def downgrade() -> None:
+    """
+    Remove tabela import_jobs / Entfernt import_jobs Tabelle
+    """
+    op.drop_index('ix_import_jobs_finished_at', table_name='import_jobs')
+    op.drop_index('ix_import_jobs_status_created', table_name='import_jobs')
+    op.drop_index('ix_import_jobs_user_id', table_name='import_jobs')
+    op.drop_table('import_jobs')
+    sa.Enum(name='importjobstage').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='importjobstatus').drop(op.get_bind(), checkfirst=True)
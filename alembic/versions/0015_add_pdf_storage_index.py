@@ -0,0 +1,55 @@
+"""add original_pdf_verified and migrate legacy pdf files
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-02-16 09:00:00.000000
+
+DE: Spalte contracts.original_pdf_verified. Die Migration verschiebt einmalig
+    Original-PDFs der alten Struktur (uploads/contracts/*_{id}_*.pdf) nach
+    persisted/contract_{id}/original.pdf und trägt den Pfad in
+    original_pdf_path ein; Download/Ansicht suchen danach nicht mehr per glob.
+PT: Coluna contracts.original_pdf_verified. A migração move uma única vez os
+    PDFs originais da estrutura antiga para persisted/contract_{id}/original.pdf
+    e grava o caminho em original_pdf_path; download/visualização não usam
+    mais glob.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015_add_pdf_storage_index'
+down_revision: Union[str, None] = '0014_add_import_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _project_modules():
+    try:
+        from app.core.config import settings
+        from app.services.pdf_storage_index import migrate_pdf_storage
+    except ImportError:
+        from backend.app.core.config import settings
+        from backend.app.services.pdf_storage_index import migrate_pdf_storage
+    return settings, migrate_pdf_storage
+
+
+def upgrade() -> None:
+    """
+    Fügt original_pdf_verified hinzu und migriert die Dateien / Adiciona original_pdf_verified e migra os arquivos
+    """
+    op.add_column(
+        'contracts',
+        sa.Column('original_pdf_verified', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    settings, migrate_pdf_storage = _project_modules()
+    migrate_pdf_storage(op.get_bind(), settings.UPLOAD_DIR)
+
+
+def downgrade() -> None:
+    """
+    Entfernt original_pdf_verified (Dateien bleiben im neuen Layout) / Remove a coluna (arquivos ficam no novo layout)
+    """
+    op.drop_column('contracts', 'original_pdf_verified')
@@ -0,0 +1,50 @@
+"""move original pdfs into the content-addressed blob store
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-02-18 09:00:00.000000
+
+DE: Verschiebt die Original-PDFs aus uploads/contracts/persisted/ nach
+    uploads/blobs/ab/cd/<sha256> (identische Dateien nur einmal) und
+    aktualisiert original_pdf_path und original_pdf_sha256. Keine
+    Schemaänderung.
+PT: Move os PDFs originais de uploads/contracts/persisted/ para
+    uploads/blobs/ab/cd/<sha256> (arquivos idênticos uma só vez) e atualiza
+    original_pdf_path e original_pdf_sha256. Sem alteração de esquema.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0016_move_pdfs_to_blob_store'
+down_revision: Union[str, None] = '0015_add_pdf_storage_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _project_modules():
+    try:
+        from app.core.config import settings
+        from app.services.blob_store import migrate_to_blob_store
+    except ImportError:
+        from backend.app.core.config import settings
+        from backend.app.services.blob_store import migrate_to_blob_store
+    return settings, migrate_to_blob_store
+
+
+def upgrade() -> None:
+    """
+    Verschiebt die PDFs in den Blob-Speicher / Move os PDFs para o armazenamento de blobs
+    """
+    settings, migrate_to_blob_store = _project_modules()
+    migrate_to_blob_store(op.get_bind(), settings.UPLOAD_DIR)
+
+
+def downgrade() -> None:
+    """
+    Dateien bleiben im Blob-Speicher; die Pfade in der DB sind weiterhin gültig.
+    Os arquivos ficam nos blobs; os caminhos no banco continuam válidos.
+    """
+    pass
@@ -0,0 +1,58 @@
+"""add storage usage accounting tables
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-02-25 09:00:00.000000
+
+DE: Tabelle storage_usage (Bytes/Dateien je Kategorie unter UPLOAD_DIR) und
+    Zeitreihe storage_usage_history. Die Zähler füllt der erste Abgleich
+    beim Start der Anwendung.
+PT: Tabela storage_usage (bytes/arquivos por categoria em UPLOAD_DIR) e série
+    temporal storage_usage_history. Os contadores são preenchidos pela
+    primeira reconciliação na inicialização da aplicação.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0017_add_storage_usage'
+down_revision: Union[str, None] = '0016_move_pdfs_to_blob_store'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Cria tabelas storage_usage e storage_usage_history / Erstellt Tabellen storage_usage und storage_usage_history
+    """
+    op.create_table(
+        'storage_usage',
+        sa.Column('category', sa.String(length=32), nullable=False),
+        sa.Column('bytes', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('files', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column('reconciled_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('category'),
+    )
+    op.create_table(
+        'storage_usage_history',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('category', sa.String(length=32), nullable=False),
+        sa.Column('bytes', sa.BigInteger(), nullable=False),
+        sa.Column('files', sa.Integer(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_storage_usage_history_category_recorded', 'storage_usage_history', ['category', 'recorded_at'])
+
+
+def downgrade() -> None:
+    """
+    Remove tabelas storage_usage e storage_usage_history / Entfernt Tabellen storage_usage und storage_usage_history
+    """
+    op.drop_index('ix_storage_usage_history_category_recorded', table_name='storage_usage_history')
+    op.drop_table('storage_usage_history')
+    op.drop_table('storage_usage')
@@ -8,7 +8,7 @@ used.
 """
 
 from functools import lru_cache
-from typing import List, Annotated, cast
+from typing import List, Annotated, Optional, cast
 
 from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -54,10 +54,72 @@ class Settings(BaseSettings):
     SMTP_USER: Annotated[str, Field(description="SMTP username / Usuário SMTP")] = ""
     SMTP_PASSWORD: Annotated[str, Field(description="SMTP password / Senha SMTP")] = ""
     SMTP_USE_TLS: Annotated[bool, Field(description="Use TLS for SMTP / Usar TLS para SMTP")] = True
+    SMTP_TIMEOUT: Annotated[float, Field(description="SMTP socket timeout in seconds / Timeout do socket SMTP em segundos")] = 10.0
+    SMTP_POOL_SIZE: Annotated[int, Field(description="Persistent SMTP connections (= max in-flight sends) / Conexões SMTP persistentes (= envios simultâneos)")] = 4
+
+    # Alerts / Alertas
+    ALERT_PROCESS_BATCH_SIZE: Annotated[int, Field(description="Contracts per transaction in scheduler alert runs / Contratos por transação nas execuções do scheduler")] = 500
+
+    # E-Mail-Outbox / Caixa de saída de e-mails
+    EMAIL_OUTBOX_BATCH_SIZE: Annotated[int, Field(description="Outbox rows sent per worker batch / Entradas enviadas por lote do worker")] = 50
+    EMAIL_OUTBOX_MAX_ATTEMPTS: Annotated[int, Field(description="Attempts before an outbox row is dead-lettered / Tentativas antes do dead letter")] = 6
+    EMAIL_OUTBOX_BACKOFF_SECONDS: Annotated[float, Field(description="Base delay of the exponential backoff / Atraso base do backoff exponencial")] = 60.0
+    EMAIL_OUTBOX_BACKOFF_MAX_SECONDS: Annotated[float, Field(description="Upper bound of the backoff delay / Limite superior do backoff")] = 3600.0
+    EMAIL_OUTBOX_POLL_SECONDS: Annotated[float, Field(description="Worker poll interval when idle / Intervalo de consulta do worker ocioso")] = 15.0
+    EMAIL_OUTBOX_LEASE_SECONDS: Annotated[float, Field(description="Time after which a SENDING row is reclaimed / Tempo até reaproveitar entrada SENDING")] = 300.0
+
+    # PDF-Extraktion / Extração de PDF
+    EXTRACTION_WORKERS: Annotated[int, Field(description="Extraction worker processes (0 = in-thread) / Processos de extração (0 = em thread)")] = 2
+    EXTRACTION_TIMEOUT_SECONDS: Annotated[float, Field(description="Time limit per extraction job / Tempo limite por extração")] = 120.0
+    EXTRACTION_MEMORY_LIMIT_MB: Annotated[int, Field(description="Address-space limit per worker (0 = none) / Limite de memória por worker (0 = nenhum)")] = 1024
+    EXTRACTION_MAX_TASKS_PER_CHILD: Annotated[int, Field(description="Jobs before a worker is recycled (0 = never) / Tarefas antes de reciclar o worker (0 = nunca)")] = 50
+    EXTRACTION_MP_START_METHOD: Annotated[str, Field(description="multiprocessing start method / Método de início do multiprocessing")] = "spawn"
+    EXTRACTION_CACHE_ENABLED: Annotated[bool, Field(description="Reuse extraction results by file hash / Reutilizar resultados por hash do arquivo")] = True
+    EXTRACTION_CACHE_MAX_BYTES: Annotated[int, Field(description="Size bound of the extraction cache (LRU) / Tamanho máximo do cache de extração (LRU)")] = 256 * 1024 * 1024
+
+    # OCR für Seiten ohne Textschicht / OCR para páginas sem camada de texto
+    OCR_ENABLED: Annotated[bool, Field(description="OCR pages without a text layer / OCR de páginas sem camada de texto")] = True
+    OCR_DPI: Annotated[int, Field(description="Rasterization resolution for OCR / Resolução de rasterização para OCR")] = 300
+    OCR_LANGUAGE: Annotated[str, Field(description="Primary Tesseract language / Idioma principal do Tesseract")] = "deu"
+    OCR_SECOND_LANGUAGE: Annotated[Optional[str], Field(description="Optional second Tesseract language, e.g. eng / Segundo idioma opcional")] = None
+    OCR_WORKERS: Annotated[int, Field(description="Parallel OCR processes per document / Processos de OCR paralelos por documento")] = 2
+    OCR_PAGE_TIMEOUT_SECONDS: Annotated[float, Field(description="Tesseract time limit per page (0 = none) / Tempo limite do Tesseract por página")] = 60.0
+    PDF_WINDOWED_ANALYSIS_MIN_PAGES: Annotated[int, Field(description="Analyze contracts page by page from this page count / Análise por página a partir deste número de páginas")] = 50
+    PDF_ANALYSIS_HEAD_PAGES: Annotated[int, Field(description="Pages searched for title and parties in windowed analysis / Páginas para título e partes na análise por página")] = 3
+    MODEL_PRELOAD_ENABLED: Annotated[bool, Field(description="Preload NLP/dateparser models at startup / Pré-carregar modelos NLP/dateparser na inicialização")] = True
+
+    # Import-Jobs / Jobs de importação
+    IMPORT_JOB_WORKERS: Annotated[int, Field(description="Concurrent import job workers (0 = disabled) / Workers simultâneos de importação (0 = desativado)")] = 2
+    IMPORT_JOB_POLL_SECONDS: Annotated[float, Field(description="Worker poll interval when idle / Intervalo de consulta do worker ocioso")] = 5.0
+    IMPORT_JOB_LEASE_SECONDS: Annotated[float, Field(description="Time after which a RUNNING job is reclaimed / Tempo até reaproveitar job RUNNING")] = 300.0
+    IMPORT_JOB_MAX_ATTEMPTS: Annotated[int, Field(description="Worker starts before an abandoned job fails / Inícios antes de um job abandonado falhar")] = 3
+    IMPORT_JOB_STATS_WINDOW_SECONDS: Annotated[float, Field(description="Window for import throughput statistics / Janela das estatísticas de vazão")] = 3600.0
+
+    # Massenimport / Importação em massa
+    BULK_IMPORT_MAX_FILES: Annotated[int, Field(description="PDF files per bulk import request / Arquivos PDF por importação em massa")] = 500
+    BULK_IMPORT_MAX_BYTES: Annotated[int, Field(description="Total upload/unpacked size of a bulk import / Tamanho total de uma importação em massa")] = 512 * 1024 * 1024
+    BULK_IMPORT_CONCURRENCY: Annotated[int, Field(description="Parallel extractions per bulk import (0 = extraction workers) / Extrações paralelas (0 = workers de extração)")] = 0
 
     # Upload
     MAX_FILE_SIZE: Annotated[int, Field(description="Maximum file size in bytes / Tamanho máximo do arquivo em bytes")] = 10 * 1024 * 1024
     UPLOAD_DIR: Annotated[str, Field(description="Upload directory / Diretório de upload")] = "uploads"
+    PDF_PATH_CACHE_SIZE: Annotated[int, Field(description="Resolved original-PDF paths kept in memory (LRU) / Caminhos de PDF original resolvidos mantidos em memória (LRU)")] = 4096
+    BLOB_GC_INTERVAL_SECONDS: Annotated[int, Field(description="Interval of the unreferenced-blob garbage collector / Intervalo do coletor de blobs sem referência")] = 6 * 60 * 60
+    BLOB_GC_GRACE_SECONDS: Annotated[int, Field(description="Minimum age before an unreferenced blob is deleted / Idade mínima antes de remover um blob sem referência")] = 60 * 60
+    THUMBNAIL_CACHE_MAX_BYTES: Annotated[int, Field(description="Size bound of the page thumbnail cache (LRU) / Tamanho máximo do cache de miniaturas (LRU)")] = 256 * 1024 * 1024
+    THUMBNAIL_PREGENERATE_ENABLED: Annotated[bool, Field(description="Render thumbnails in the background after upload / Renderizar miniaturas em segundo plano após o upload")] = True
+    THUMBNAIL_PREGENERATE_PAGES: Annotated[int, Field(description="Pages with list thumbnails rendered after upload / Páginas com miniaturas geradas após o upload")] = 1
+    THUMBNAIL_RENDER_WORKERS: Annotated[int, Field(description="Processes of the separate thumbnail render pool / Processos do pool separado de renderização de miniaturas")] = 1
+    THUMBNAIL_RENDER_TIMEOUT_SECONDS: Annotated[float, Field(description="Time limit per page render / Tempo limite por renderização de página")] = 15.0
+    STORAGE_USAGE_FLUSH_SECONDS: Annotated[int, Field(description="Interval for writing pending storage usage deltas / Intervalo para gravar os deltas de uso de armazenamento")] = 30
+    STORAGE_RECONCILE_INTERVAL_SECONDS: Annotated[int, Field(description="Interval of the full storage recount and history sample / Intervalo da recontagem completa e do ponto da série histórica")] = 6 * 60 * 60
+    LIBREOFFICE_BINARY: Annotated[Optional[str], Field(description="Path to soffice (default: PATH lookup) / Caminho do soffice (padrão: busca no PATH)")] = None
+    LIBREOFFICE_WORKERS: Annotated[int, Field(description="Warm headless LibreOffice instances for DOCX->PDF / Instâncias LibreOffice aquecidas para DOCX->PDF")] = 2
+    LIBREOFFICE_QUEUE_SIZE: Annotated[int, Field(description="Conversions allowed to wait for a free instance / Conversões que podem aguardar uma instância livre")] = 16
+    LIBREOFFICE_TIMEOUT_SECONDS: Annotated[float, Field(description="Time limit per conversion before the instance is restarted / Tempo limite por conversão antes de reiniciar a instância")] = 60.0
+    LIBREOFFICE_STARTUP_TIMEOUT_SECONDS: Annotated[float, Field(description="Time allowed for an instance to accept UNO connections / Tempo para uma instância aceitar conexões UNO")] = 30.0
+    LIBREOFFICE_MAX_CONVERSIONS: Annotated[int, Field(description="Conversions before an instance is recycled (0 = never) / Conversões antes de reciclar a instância (0 = nunca)")] = 200
+    LIBREOFFICE_HEALTH_INTERVAL_SECONDS: Annotated[float, Field(description="Interval of the instance health check (0 = off) / Intervalo da verificação de saúde (0 = desligado)")] = 60.0
 
 
 @lru_cache()
@@ -5,10 +5,16 @@ Datenbankmodelle für das Vertragsverwaltungssystem
 
 
 from .contract import Contract, ContractStatus, ContractType
+from . import contract_fts  # noqa: F401  (registriert FTS5-DDL / registra DDL FTS5)
 from .rent_step import RentStep
 from .permission import Permission
 from .user import User, UserRole, AccessLevel
 from .contract_approval import ContractApproval, ApprovalStatus
+from .contract_stats_rollup import ContractStatsRollup
+from .email_outbox import EmailOutbox, OutboxStatus
+from .extraction_cache import ExtractionCacheEntry
+from .import_job import ImportJob, ImportJobStatus, ImportJobStage
+from .storage_usage import StorageUsage, StorageUsageSample
 
 __all__ = [
     "User",
@@ -20,5 +26,14 @@ __all__ = [
     "RentStep",
     "Permission",
     "ContractApproval",
-    "ApprovalStatus"
+    "ApprovalStatus",
+    "ContractStatsRollup",
+    "EmailOutbox",
+    "OutboxStatus",
+    "ExtractionCacheEntry",
+    "ImportJob",
+    "ImportJobStatus",
+    "ImportJobStage",
+    "StorageUsage",
+    "StorageUsageSample"
 ]
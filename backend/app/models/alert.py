@@ -73,6 +73,9 @@ class Alert(Base):
         """
         self.status = AlertStatus.SENT
         self.sent_at = when or datetime.now(timezone.utc)
+        # Explizit setzen, damit das Objekt nach dem Commit nicht nachgeladen werden muss
+        # Definido explicitamente para não precisar recarregar o objeto após o commit
+        self.updated_at = self.sent_at
 
     def mark_failed(self, message: str) -> None:
         """Marcar alerta como falhado e registrar erro.
@@ -80,6 +83,7 @@ class Alert(Base):
         """
         self.status = AlertStatus.FAILED
         self.error = message
+        self.updated_at = datetime.now(timezone.utc)
 
     def __repr__(self) -> str:
         return f"<Alert(id={self.id}, contract_id={self.contract_id}, type={self.alert_type.value}, status={self.status.value})>"
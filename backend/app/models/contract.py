@@ -4,7 +4,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 import enum
-from sqlalchemy import Column, Date, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -92,7 +92,7 @@ class Contract(Base):
 
     #Datumsfelder
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
-    end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)  # Index für die tägliche Alert-Auswahl / Índice para a seleção diária de alertas
     renewal_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     #Kundenfelder
@@ -151,6 +151,7 @@ class Contract(Base):
     # Hinweis: Diese Felder erfordern später eine Alembic-Migration.
     # =========================
     original_pdf_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # Serverinterner Pfad zur Original-PDF
+    original_pdf_verified: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)  # Datei unter original_pdf_path bestätigt / Arquivo confirmado
     original_pdf_filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Ursprünglicher Dateiname
     original_pdf_sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)  # SHA256 der Datei (Duplikatprüfung)
     ocr_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Extrahierter Text (OCR / Text-Extraction)
@@ -0,0 +1,62 @@
+"""
+Volltextindex für Verträge (SQLite FTS5)
+Índice de texto completo para contratos (SQLite FTS5)
+
+Die virtuelle Tabelle ``contracts_fts`` spiegelt die durchsuchbaren Textspalten
+der Tabelle ``contracts`` (External-Content-Tabelle, rowid = contracts.id) und
+wird über Trigger synchron gehalten. Auf anderen Datenbanken (z.B. MySQL) wird
+nichts angelegt; die Suche fällt dort auf ILIKE zurück.
+
+A tabela virtual ``contracts_fts`` espelha as colunas de texto pesquisáveis de
+``contracts`` e é mantida sincronizada por triggers. Em outros bancos (ex. MySQL)
+nada é criado; a busca volta para ILIKE.
+"""
+
+from sqlalchemy import DDL, event
+
+from .contract import Contract
+
+FTS_TABLE_NAME = "contracts_fts"
+
+# Durchsuchbare Spalten (Reihenfolge = Spaltenindex für snippet()) / Colunas pesquisáveis
+FTS_COLUMNS = ("title", "description", "client_name", "company_name", "notes", "ocr_text")
+
+_cols = ", ".join(FTS_COLUMNS)
+_new_cols = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_old_cols = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+# DDL-Anweisungen für create_all (Tests, init_db.py); Migration 0009 hat eine eigene, eingefrorene
+# Kopie - Änderungen hier brauchen eine neue Migration
+# Instruções DDL para create_all; a migração 0009 tem sua própria cópia congelada - mudanças aqui
+# exigem uma nova migração
+FTS_CREATE_STATEMENTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE_NAME} USING fts5("
+    f"{_cols}, content='contracts', content_rowid='id', "
+    f"tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_ai AFTER INSERT ON contracts BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME}(rowid, {_cols}) VALUES (new.id, {_new_cols}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_ad AFTER DELETE ON contracts BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME}({FTS_TABLE_NAME}, rowid, {_cols}) VALUES ('delete', old.id, {_old_cols}); END",
+    # Nur bei Änderungen an indizierten Spalten neu indizieren / Reindexar só quando colunas indexadas mudam
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_au AFTER UPDATE OF {_cols} ON contracts BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME}({FTS_TABLE_NAME}, rowid, {_cols}) VALUES ('delete', old.id, {_old_cols}); "
+    f"INSERT INTO {FTS_TABLE_NAME}(rowid, {_cols}) VALUES (new.id, {_new_cols}); END",
+)
+
+FTS_DROP_STATEMENTS = (
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE_NAME}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE_NAME}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE_NAME}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE_NAME}",
+)
+
+# Index füllen/neu aufbauen aus der Inhaltstabelle / Preencher/reconstruir o índice
+FTS_REBUILD_STATEMENT = f"INSERT INTO {FTS_TABLE_NAME}({FTS_TABLE_NAME}) VALUES ('rebuild')"
+
+
+# Bei create_all/drop_all (Tests, init_db.py) den Index mitanlegen bzw. entfernen
+# Criar/remover o índice junto com create_all/drop_all (testes, init_db.py)
+for _statement in FTS_CREATE_STATEMENTS:
+    event.listen(Contract.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in FTS_DROP_STATEMENTS:
+    event.listen(Contract.__table__, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,341 @@
+"""
+Vorberechnete Vertragsstatistiken (Rollup) - Estatísticas de contratos pré-agregadas
+DE: Die Tabelle ``contract_stats_rollup`` hält Zähler je Kombination aus Abteilung,
+    Team, Status, Vertragstyp, Operationsart und Ablauf-Bucket. Änderungen an
+    Verträgen und Alerts werden im selben Flush/Transaktion über ORM-Events
+    eingebucht; das Dashboard liest so nur wenige Zeilen statt alle Verträge.
+PT: A tabela ``contract_stats_rollup`` guarda contadores por combinação de
+    departamento, time, status, tipo, operação e faixa de vencimento. Alterações
+    em contratos e alertas são lançadas no mesmo flush/transação via eventos ORM.
+
+Hinweis / Nota: Massen-Updates per Core (``update(Contract)``, ``insert(Alert)``)
+umgehen die ORM-Events und müssen ``apply_rollup_deltas`` selbst aufrufen.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy import Date, DateTime, Integer, Numeric, String, UniqueConstraint, event, func, insert, select, update, and_, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.core.database import Base
+from .alert import Alert, AlertStatus
+from .contract import Contract
+
+# Ablauf-Buckets relativ zum Stichtag / Faixas de vencimento relativas à data de referência
+BUCKET_NONE = "none"      # kein Enddatum / sem data de fim
+BUCKET_PAST = "past"      # bereits abgelaufen / já vencido
+BUCKET_D30 = "d30"        # 0..30 Tage / 0..30 dias
+BUCKET_D90 = "d90"        # 31..90 Tage / 31..90 dias
+BUCKET_LATER = "later"    # > 90 Tage / > 90 dias
+
+
+class ContractStatsRollup(Base):
+    """Rollup-Zeile je Schlüsselkombination / Linha de rollup por combinação de chave"""
+    __tablename__ = "contract_stats_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "department", "team", "status", "contract_type", "operation_type", "expiry_bucket",
+            name="uq_contract_stats_rollup_key",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Schlüssel ('' = ohne Abteilung/Team) / Chave ('' = sem departamento/time)
+    department: Mapped[str] = mapped_column(String(100), nullable=False, default="", index=True)
+    team: Mapped[str] = mapped_column(String(100), nullable=False, default="", index=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    contract_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    operation_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    expiry_bucket: Mapped[str] = mapped_column(String(8), nullable=False)
+
+    # Zähler / Contadores
+    contract_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_value: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=Decimal("0"))
+    alert_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pending_alert_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Stichtag der Bucket-Zuordnung (NULL = unbekannt, Neuaufbau nötig)
+    # Data de referência das faixas (NULL = desconhecida, reconstrução necessária)
+    bucket_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return (f"<ContractStatsRollup({self.department}/{self.team}/{self.status}/{self.contract_type}/"
+                f"{self.operation_type}/{self.expiry_bucket}: {self.contract_count})>")
+
+
+class RollupKey(NamedTuple):
+    """Schlüssel einer Rollup-Zeile / Chave de uma linha de rollup"""
+    department: str
+    team: str
+    status: str
+    contract_type: str
+    operation_type: str
+    expiry_bucket: str
+
+
+@dataclass
+class RollupDelta:
+    """Änderung der Zähler einer Rollup-Zeile / Variação dos contadores"""
+    contract_count: int = 0
+    total_value: Decimal = Decimal("0")
+    alert_count: int = 0
+    pending_alert_count: int = 0
+
+    def is_zero(self) -> bool:
+        return not (self.contract_count or self.total_value or self.alert_count or self.pending_alert_count)
+
+
+def expiry_bucket(end_date: Optional[date], reference: date) -> str:
+    """
+    Ordnet ein Enddatum einem Ablauf-Bucket zu / Classifica a data de fim em uma faixa
+    """
+    if end_date is None:
+        return BUCKET_NONE
+    days = (end_date - reference).days
+    if days < 0:
+        return BUCKET_PAST
+    if days <= 30:
+        return BUCKET_D30
+    if days <= 90:
+        return BUCKET_D90
+    return BUCKET_LATER
+
+
+def _enum_value(value) -> str:
+    return getattr(value, "value", value) or ""
+
+
+def rollup_key(department, team, status, contract_type, operation_type, end_date, reference: date) -> RollupKey:
+    """Erstellt den Rollup-Schlüssel aus Vertragsfeldern / Cria a chave a partir dos campos do contrato"""
+    return RollupKey(
+        department or "",
+        team or "",
+        _enum_value(status),
+        _enum_value(contract_type),
+        _enum_value(operation_type),
+        expiry_bucket(end_date, reference),
+    )
+
+
+def apply_rollup_deltas(connection, deltas: Dict[RollupKey, RollupDelta]) -> None:
+    """
+    Bucht Deltas in ``contract_stats_rollup`` ein (UPDATE, sonst INSERT).
+    Lança variações em ``contract_stats_rollup`` (UPDATE, senão INSERT).
+
+    Neue Zeilen übernehmen den Stichtag der Tabelle, damit ein veralteter oder
+    noch nie aufgebauter Rollup nicht fälschlich als aktuell gilt.
+    Novas linhas herdam a data de referência da tabela.
+
+    Args:
+        connection: Synchrone SQLAlchemy-Verbindung der laufenden Transaktion
+        deltas: Änderungen je Schlüssel
+    """
+    table = ContractStatsRollup.__table__
+    pending = {key: delta for key, delta in deltas.items() if not delta.is_zero()}
+    if not pending:
+        return
+
+    table_bucket_date = None
+    for key, delta in pending.items():
+        key_filter = and_(*(table.c[name] == value for name, value in key._asdict().items()))
+        counters = dict(
+            contract_count=table.c.contract_count + delta.contract_count,
+            total_value=table.c.total_value + delta.total_value,
+            alert_count=table.c.alert_count + delta.alert_count,
+            pending_alert_count=table.c.pending_alert_count + delta.pending_alert_count,
+        )
+        result = connection.execute(update(table).where(key_filter).values(**counters))
+        if result.rowcount:
+            continue
+
+        if table_bucket_date is None:
+            table_bucket_date = connection.execute(select(func.max(table.c.bucket_date))).scalar()
+        row = dict(
+            key._asdict(),
+            contract_count=delta.contract_count,
+            total_value=delta.total_value,
+            alert_count=delta.alert_count,
+            pending_alert_count=delta.pending_alert_count,
+            bucket_date=table_bucket_date,
+        )
+        if connection.dialect.name == "sqlite":
+            # SQLite serialisiert Schreiber, kein Wettlauf möglich / SQLite serializa escritas
+            connection.execute(insert(table).values(**row))
+            continue
+        try:
+            with connection.begin_nested():
+                connection.execute(insert(table).values(**row))
+        except IntegrityError:
+            # Parallele Transaktion hat die Zeile angelegt / Transação paralela criou a linha
+            connection.execute(update(table).where(key_filter).values(**counters))
+
+
+# ---------------------------------------------------------------------------
+# ORM-Events: Deltas im selben Flush einbuchen / Eventos ORM: lançar variações no mesmo flush
+# ---------------------------------------------------------------------------
+
+_PENDING_KEY = "contract_stats_rollup_deltas"
+
+
+def _with_default(contract: Contract, attr: str):
+    """Wert inkl. Spalten-Default (vor dem INSERT noch None) / Valor com default da coluna"""
+    value = getattr(contract, attr)
+    if value is None:
+        default = Contract.__table__.c[attr].default
+        if default is not None and default.is_scalar:
+            return default.arg
+    return value
+
+
+def _contract_state(contract: Contract, reference: date) -> tuple:
+    key = rollup_key(contract.department, contract.team, _with_default(contract, "status"),
+                     _with_default(contract, "contract_type"), _with_default(contract, "operation_type"),
+                     contract.end_date, reference)
+    return key, Decimal(contract.value or 0)
+
+
+def _collect_deltas(session: Session) -> Dict[RollupKey, RollupDelta]:
+    """
+    Berechnet die Deltas der anstehenden Änderungen (vor dem Flush, DB hat noch den Altzustand).
+    Calcula as variações das alterações pendentes (antes do flush, o BD ainda tem o estado antigo).
+    """
+    new_contracts = [o for o in session.new if isinstance(o, Contract)]
+    dirty_contracts = [o for o in session.dirty if isinstance(o, Contract) and session.is_modified(o)]
+    deleted_contracts = [o for o in session.deleted if isinstance(o, Contract)]
+    new_alerts = [o for o in session.new if isinstance(o, Alert)]
+    dirty_alerts = [o for o in session.dirty if isinstance(o, Alert) and session.is_modified(o)]
+    deleted_alerts = [o for o in session.deleted if isinstance(o, Alert)]
+
+    if not (new_contracts or dirty_contracts or deleted_contracts or new_alerts or dirty_alerts or deleted_alerts):
+        return {}
+
+    today = date.today()
+    deltas: Dict[RollupKey, RollupDelta] = defaultdict(RollupDelta)
+    changed_contracts = {c.id: c for c in dirty_contracts}
+    deleted_ids = {c.id for c in deleted_contracts}
+
+    # Altzustand der Alerts aus der DB / Estado antigo dos alertas no BD
+    old_alerts = {}
+    existing_alert_ids = [a.id for a in dirty_alerts + deleted_alerts if a.id is not None]
+    if existing_alert_ids:
+        rows = session.execute(
+            select(Alert.id, Alert.contract_id, Alert.status).where(Alert.id.in_(existing_alert_ids))
+        ).all()
+        old_alerts = {row.id: row for row in rows}
+
+    # Altzustand der betroffenen Verträge inkl. Alert-Zähler / Estado antigo dos contratos com contadores
+    contract_ids = set(changed_contracts) | deleted_ids
+    contract_ids |= {a.contract_id for a in new_alerts + dirty_alerts if a.contract_id is not None}
+    contract_ids |= {row.contract_id for row in old_alerts.values()}
+    contract_ids.discard(None)
+    old_contracts = {}
+    if contract_ids:
+        alert_counts = (
+            select(
+                Alert.contract_id.label("contract_id"),
+                func.count(Alert.id).label("alerts"),
+                func.sum(case((Alert.status == AlertStatus.PENDING, 1), else_=0)).label("pending"),
+            )
+            .where(Alert.contract_id.in_(contract_ids))
+            .group_by(Alert.contract_id)
+            .subquery()
+        )
+        rows = session.execute(
+            select(
+                Contract.id, Contract.department, Contract.team, Contract.status, Contract.contract_type,
+                Contract.operation_type, Contract.end_date, Contract.value,
+                func.coalesce(alert_counts.c.alerts, 0).label("alerts"),
+                func.coalesce(alert_counts.c.pending, 0).label("pending"),
+            )
+            .outerjoin(alert_counts, alert_counts.c.contract_id == Contract.id)
+            .where(Contract.id.in_(contract_ids))
+        ).all()
+        old_contracts = {row.id: row for row in rows}
+
+    def old_key(contract_id: int) -> Optional[RollupKey]:
+        row = old_contracts.get(contract_id)
+        if row is None:
+            return None
+        return rollup_key(row.department, row.team, row.status, row.contract_type, row.operation_type, row.end_date, today)
+
+    def current_key(contract_id: Optional[int], contract: Optional[Contract] = None) -> Optional[RollupKey]:
+        if contract is None and contract_id in changed_contracts:
+            contract = changed_contracts[contract_id]
+        if contract is not None:
+            return _contract_state(contract, today)[0]
+        return old_key(contract_id)
+
+    # Verträge / Contratos
+    for contract in new_contracts:
+        key, value = _contract_state(contract, today)
+        deltas[key].contract_count += 1
+        deltas[key].total_value += value
+
+    for contract in dirty_contracts + deleted_contracts:
+        row = old_contracts.get(contract.id)
+        if row is None:
+            continue
+        before = deltas[old_key(contract.id)]
+        before.contract_count -= 1
+        before.total_value -= Decimal(row.value or 0)
+        before.alert_count -= int(row.alerts)
+        before.pending_alert_count -= int(row.pending)
+        if contract.id in deleted_ids:
+            continue
+        key, value = _contract_state(contract, today)
+        after = deltas[key]
+        after.contract_count += 1
+        after.total_value += value
+        after.alert_count += int(row.alerts)
+        after.pending_alert_count += int(row.pending)
+
+    # Alerts / Alertas
+    def book_alert(key: Optional[RollupKey], count: int, pending: int) -> None:
+        if key is not None:
+            deltas[key].alert_count += count
+            deltas[key].pending_alert_count += pending
+
+    for alert in new_alerts:
+        contract = alert.__dict__.get("contract")
+        if alert.contract_id in deleted_ids:
+            continue
+        book_alert(current_key(alert.contract_id, contract), 1, int(alert.status in (None, AlertStatus.PENDING)))
+
+    for alert in dirty_alerts + deleted_alerts:
+        old = old_alerts.get(alert.id)
+        if old is None or old.contract_id in deleted_ids:
+            continue
+        book_alert(current_key(old.contract_id), -1, -int(old.status == AlertStatus.PENDING))
+        if alert in deleted_alerts:
+            continue
+        book_alert(current_key(alert.contract_id), 1, int(alert.status == AlertStatus.PENDING))
+
+    return {key: delta for key, delta in deltas.items() if key is not None and not delta.is_zero()}
+
+
+@event.listens_for(Session, "before_flush")
+def _rollup_before_flush(session: Session, flush_context, instances) -> None:
+    with session.no_autoflush:
+        deltas = _collect_deltas(session)
+    if deltas:
+        session.info.setdefault(_PENDING_KEY, []).append(deltas)
+
+
+@event.listens_for(Session, "after_flush")
+def _rollup_after_flush(session: Session, flush_context) -> None:
+    pending: Iterable[Dict[RollupKey, RollupDelta]] = session.info.pop(_PENDING_KEY, [])
+    for deltas in pending:
+        apply_rollup_deltas(session.connection(), deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _rollup_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,71 @@
+"""
+E-Mail-Outbox - Transaktionale Warteschlange für ausgehende E-Mails
+Caixa de saída de e-mails - Fila transacional para e-mails de saída
+
+DE: Benachrichtigungen werden in derselben Transaktion wie der zugehörige
+    ``Alert`` in ``email_outbox`` eingetragen. Ein eigener Worker
+    (``EmailOutboxService.drain_once``) versendet die Einträge stapelweise mit
+    exponentiellem Backoff; nach ``max_attempts`` Fehlversuchen landet ein
+    Eintrag im Status DEAD (Dead Letter).
+PT: As notificações são gravadas em ``email_outbox`` na mesma transação do
+    ``Alert`` correspondente. Um worker dedicado envia as entradas em lotes com
+    backoff exponencial; após ``max_attempts`` falhas a entrada vai para o
+    status DEAD (dead letter).
+"""
+from __future__ import annotations
+
+import enum
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class OutboxStatus(str, enum.Enum):
+    """Zustand eines Outbox-Eintrags / Estado de uma entrada da caixa de saída"""
+
+    PENDING = "pending"    # wartet auf (erneuten) Versuch / aguardando (nova) tentativa
+    SENDING = "sending"    # vom Worker übernommen / reservada pelo worker
+    SENT = "sent"          # zugestellt / entregue
+    DEAD = "dead"          # max. Versuche erreicht / máximo de tentativas atingido
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EmailOutbox(Base):
+    """Ausgehende E-Mail / E-mail de saída"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Abfrage des Workers: fällige Einträge je Status / Consulta do worker: entradas devidas por status
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    alert_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("alerts.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    is_html: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+
+    status: Mapped[OutboxStatus] = mapped_column(Enum(OutboxStatus), default=OutboxStatus.PENDING, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=6, nullable=False)
+    # Frühester nächster Versuch bzw. Ablauf der Reservierung (SENDING)
+    # Próxima tentativa ou fim da reserva (SENDING)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<EmailOutbox(id={self.id}, alert_id={self.alert_id}, status={self.status.value}, attempts={self.attempts})>"
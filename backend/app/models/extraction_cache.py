@@ -0,0 +1,52 @@
+"""
+Extraktions-Cache - Ergebnisse der PDF-Extraktion nach Datei-Hash
+Cache de extração - Resultados da extração de PDF por hash do arquivo
+
+DE: Ein Eintrag enthält Text und ``intelligent_data`` einer PDF-Datei für eine
+    Extraktionsmethode und eine Extraktor-/Regelversion. Der Schlüssel ist der
+    SHA-256 des Dateiinhalts, damit identische Uploads über beliebige Endpunkte
+    dasselbe Ergebnis wiederverwenden. ``last_accessed_at`` steuert die
+    LRU-Verdrängung, ``size_bytes`` die Größenbegrenzung.
+PT: Uma entrada contém o texto e os ``intelligent_data`` de um PDF para um
+    método de extração e uma versão de extrator/regras. A chave é o SHA-256 do
+    conteúdo, de modo que uploads idênticos reutilizam o mesmo resultado.
+    ``last_accessed_at`` controla a remoção LRU e ``size_bytes`` o limite de tamanho.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ExtractionCacheEntry(Base):
+    """Zwischengespeichertes Extraktionsergebnis / Resultado de extração em cache"""
+    __tablename__ = "extraction_cache"
+    __table_args__ = (
+        UniqueConstraint("file_sha256", "method", "extractor_version", name="uq_extraction_cache_key"),
+        # LRU-Verdrängung: älteste Zugriffe zuerst / Remoção LRU: acessos mais antigos primeiro
+        Index("ix_extraction_cache_last_accessed", "last_accessed_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    file_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    method: Mapped[str] = mapped_column(String(20), nullable=False)
+    extractor_version: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # JSON-String: {"extraction": ..., "intelligent_data": ...}
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ExtractionCacheEntry(sha256={self.file_sha256[:12]}, method={self.method}, size={self.size_bytes})>"
@@ -0,0 +1,105 @@
+"""
+Import-Jobs - Persistente Warteschlange für PDF-Importe
+Jobs de importação - Fila persistente para importações de PDF
+
+DE: ``POST /contracts/import/jobs`` speichert die hochgeladene Datei und legt
+    einen Eintrag mit Status QUEUED an. Worker (``ImportJobService.run_next``)
+    reservieren Jobs mit einer Lease, melden Stufe und Fortschritt und legen das
+    fertige ``ExtractionResponse`` als JSON in ``result`` ab. Da Datei und
+    Eintrag persistent sind, werden Jobs nach einem Neustart fortgesetzt:
+    QUEUED-Jobs sofort, RUNNING-Jobs nach Ablauf ihrer Lease.
+PT: ``POST /contracts/import/jobs`` grava o arquivo enviado e cria uma entrada
+    com status QUEUED. Workers reservam jobs com uma lease, reportam etapa e
+    progresso e gravam o ``ExtractionResponse`` final como JSON em ``result``.
+    Como arquivo e entrada são persistentes, os jobs continuam após um
+    reinício: QUEUED imediatamente, RUNNING após o fim da lease.
+"""
+from __future__ import annotations
+
+import enum
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ImportJobStatus(str, enum.Enum):
+    """Zustand eines Import-Jobs / Estado de um job de importação"""
+
+    QUEUED = "queued"          # wartet auf einen Worker / aguardando um worker
+    RUNNING = "running"        # von einem Worker reserviert / reservado por um worker
+    SUCCEEDED = "succeeded"    # Ergebnis liegt vor / resultado disponível
+    FAILED = "failed"          # endgültig fehlgeschlagen / falhou definitivamente
+
+
+class ImportJobStage(str, enum.Enum):
+    """Verarbeitungsstufe mit Fortschritt in Prozent / Etapa de processamento com progresso em %"""
+
+    QUEUED = "queued"
+    VALIDATING = "validating"
+    EXTRACTING = "extracting"
+    DUPLICATE_CHECK = "duplicate_check"
+    ANALYZING = "analyzing"
+    DONE = "done"
+
+
+# Fortschritt beim Erreichen der Stufe / Progresso ao atingir a etapa
+STAGE_PROGRESS = {
+    ImportJobStage.QUEUED: 0,
+    ImportJobStage.VALIDATING: 5,
+    ImportJobStage.EXTRACTING: 15,
+    ImportJobStage.DUPLICATE_CHECK: 80,
+    ImportJobStage.ANALYZING: 90,
+    ImportJobStage.DONE: 100,
+}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ImportJob(Base):
+    """Asynchroner PDF-Import / Importação de PDF assíncrona"""
+    __tablename__ = "import_jobs"
+    __table_args__ = (
+        # Abfrage des Workers: älteste offene Jobs / Consulta do worker: jobs abertos mais antigos
+        Index("ix_import_jobs_status_created", "status", "created_at"),
+        # Durchsatz: abgeschlossene Jobs je Zeitfenster / Vazão: jobs concluídos por janela
+        Index("ix_import_jobs_finished_at", "finished_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Hochgeladene Datei / Arquivo enviado
+    original_file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    storage_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    extraction_method: Mapped[str] = mapped_column(String(20), default="combined", nullable=False)
+    include_ocr: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+
+    status: Mapped[ImportJobStatus] = mapped_column(Enum(ImportJobStatus), default=ImportJobStatus.QUEUED, nullable=False)
+    stage: Mapped[ImportJobStage] = mapped_column(Enum(ImportJobStage), default=ImportJobStage.QUEUED, nullable=False)
+    progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
+    # Ablauf der Reservierung (RUNNING) / Fim da reserva (RUNNING)
+    lease_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # JSON eines ExtractionResponse / JSON de um ExtractionResponse
+    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    error_status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ImportJob(id={self.id}, status={self.status.value}, stage={self.stage.value}, progress={self.progress})>"
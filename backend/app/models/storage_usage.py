@@ -0,0 +1,67 @@
+"""
+Speicherbuchhaltung - Belegter Platz unter UPLOAD_DIR je Kategorie
+Contabilidade de armazenamento - Espaço ocupado em UPLOAD_DIR por categoria
+
+DE: ``storage_usage`` hält je Kategorie (Blobs, Vorschaubilder, Sonstiges)
+    Bytes und Dateianzahl. Schreib- und Löschvorgänge im Blob-Speicher und im
+    Vorschaubild-Cache buchen Deltas ein; ein periodischer Abgleich zählt das
+    Verzeichnis neu und schreibt dabei eine Zeile je Kategorie in
+    ``storage_usage_history`` (Zeitreihe für die Kapazitätsplanung).
+PT: ``storage_usage`` guarda por categoria (blobs, miniaturas, outros) bytes e
+    número de arquivos. Gravações e remoções no armazenamento de blobs e no
+    cache de miniaturas lançam deltas; uma reconciliação periódica reconta o
+    diretório e grava uma linha por categoria em ``storage_usage_history``
+    (série temporal para planejamento de capacidade).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+# Kategorien / Categorias
+CATEGORY_BLOBS = "blobs"            # Original-PDFs (uploads/blobs) / PDFs originais
+CATEGORY_THUMBNAILS = "thumbnails"  # Vorschaubild-Cache (uploads/thumbnails) / Cache de miniaturas
+CATEGORY_OTHER = "other"            # Staging, Importe, alte Struktur / Staging, importações, estrutura antiga
+STORAGE_CATEGORIES = (CATEGORY_BLOBS, CATEGORY_THUMBNAILS, CATEGORY_OTHER)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class StorageUsage(Base):
+    """Aktueller Stand je Kategorie / Estado atual por categoria"""
+    __tablename__ = "storage_usage"
+
+    category: Mapped[str] = mapped_column(String(32), primary_key=True)
+    bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    files: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    # Letzter vollständiger Abgleich (NULL = noch nie) / Última reconciliação completa (NULL = nunca)
+    reconciled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<StorageUsage({self.category}: {self.bytes} bytes, {self.files} files)>"
+
+
+class StorageUsageSample(Base):
+    """Messpunkt der Zeitreihe / Ponto da série temporal"""
+    __tablename__ = "storage_usage_history"
+    __table_args__ = (
+        Index("ix_storage_usage_history_category_recorded", "category", "recorded_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    category: Mapped[str] = mapped_column(String(32), nullable=False)
+    bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    files: Mapped[int] = mapped_column(Integer, nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<StorageUsageSample({self.category} @ {self.recorded_at}: {self.bytes} bytes)>"
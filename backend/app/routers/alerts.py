@@ -453,6 +453,9 @@ async def process_all_alerts(db: AsyncSession = Depends(get_db)):
     Útil para processar alertas manualmente sem esperar o scheduler.
     Nützlich zum manuellen Verarbeiten von Benachrichtigungen ohne auf den Scheduler zu warten.
     
+    Os e-mails são enfileirados na caixa de saída e enviados pelo worker.
+    Die E-Mails werden in die Outbox eingereiht und vom Worker versendet.
+    
     Returns / Retorna:
         dict: Resultado do processamento / Verarbeitungsergebnis
     """
@@ -463,7 +466,7 @@ async def process_all_alerts(db: AsyncSession = Depends(get_db)):
         return {
             "success": True,
             "total_processed": getattr(result, "total", 0),
-            "message": f"Processados {getattr(result, 'total', 0)} alertas / {getattr(result, 'total', 0)} Benachrichtigungen verarbeitet"
+            "message": f"{getattr(result, 'total', 0)} alertas enfileirados / {getattr(result, 'total', 0)} Benachrichtigungen eingereiht"
         }
         
     except Exception as e:
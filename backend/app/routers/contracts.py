@@ -14,10 +14,10 @@ from decimal import Decimal
 import re
 import os
 import asyncio
-import hashlib
+import uuid
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Form
 from sqlalchemy.ext.asyncio import AsyncSession  
 
 from app.core.database import get_db
@@ -25,10 +25,19 @@ from app.schemas.contract import (
     ContractCreate,
     ContractUpdate,
     ContractResponse,
+    ContractSearchHit,
 )
 from app.schemas.approval import ApprovalRequest, RejectionRequest
 from app.services.contract_service import ContractService
-from app.utils.document_generator import render_docx_bytes, _convert_docx_bytes_to_pdf_bytes
+from app.services.extraction_cache_service import ExtractionCacheService
+from app.services.pdf_storage_index import get_pdf_storage_index
+from app.services.blob_store import file_sha256, get_blob_store, release_pdf
+from app.services.extraction_engine import ExtractionError
+from app.services.thumbnail_service import PREVIEW_WIDTH, THUMBNAIL_WIDTH, THUMBNAIL_WIDTHS, PageNotFoundError, get_thumbnail_service
+from app.utils.upload_stream import IngestedUpload, UploadTooLargeError, ingest_upload
+from app.utils.pdf_response import pdf_file_response
+from app.utils.document_generator import render_docx_bytes
+from app.services.document_converter import ConversionError, ConverterBusyError, get_document_converter
 from fastapi.responses import StreamingResponse, Response
 from fastapi import UploadFile, File
 from app.core.config import settings
@@ -42,48 +51,16 @@ from sqlalchemy import select
 
 # Hilfsfunktionen / Funções auxiliares
 
-def move_temp_to_persisted_contract(temp_file_path: str, contract_id: int, original_filename: str) -> str:
+def move_temp_to_persisted_contract(temp_file_path: str, contract_id: int, original_filename: str, sha256: Optional[str] = None) -> str:
     """
-    Verschiebt temporäre Datei in organisierte permanente Struktur
-    Move arquivo temporário para estrutura permanente organizada por contrato
+    Übernimmt temporäre Datei in den Blob-Speicher (``blobs/ab/cd/<sha256>``)
+    Move arquivo temporário para o armazenamento de blobs (``blobs/ab/cd/<sha256>``)
     """
     if not temp_file_path or not os.path.exists(temp_file_path):
         raise ValueError("Temporäre Datei nicht gefunden / Arquivo temporário não encontrado")
     
-    # Verzeichnis für diesen Vertrag erstellen / Criar diretório para este contrato  
-    persisted_dir = os.path.join(settings.UPLOAD_DIR, "contracts", "persisted")
-    contract_dir = os.path.join(persisted_dir, f"contract_{contract_id}")
-    os.makedirs(contract_dir, exist_ok=True)
-    
-    # Zieldatei: immer "original.pdf" / Arquivo destino: sempre "original.pdf"
-    target_path = os.path.join(contract_dir, "original.pdf")
-    
-    # Datei verschieben / Mover arquivo
-    import shutil
-    shutil.move(temp_file_path, target_path)
-    
-    return target_path
-
-def get_contract_pdf_path(contract_id: int) -> Optional[str]:
-    """
-    Lokalisiert PDF-Datei für einen Vertrag in neuer oder alter Struktur
-    Localiza arquivo PDF para um contrato em estrutura nova ou antiga
-    """
-    # Neue Struktur: uploads/contracts/persisted/contract_{id}/original.pdf
-    new_path = os.path.join(settings.UPLOAD_DIR, "contracts", "persisted", f"contract_{contract_id}", "original.pdf")
-    if os.path.exists(new_path):
-        return new_path
-    
-    # Fallback: alte Struktur (für Migration) - suche pattern *_{contract_id}_*
-    old_dir = os.path.join(settings.UPLOAD_DIR, "contracts")
-    if os.path.exists(old_dir):
-        import glob
-        pattern = os.path.join(old_dir, f"*_{contract_id}_*.pdf")
-        matches = glob.glob(pattern)
-        if matches:
-            return matches[0]  # Erstes Match zurückgeben
-    
-    return None
+    # Identische PDFs teilen sich einen Blob / PDFs idênticos compartilham um blob
+    return get_blob_store().put(temp_file_path, sha256 or None)
 
 # Router für Contract-Endpoints
 router = APIRouter(
@@ -105,6 +82,27 @@ def get_contract_service(db: AsyncSession = Depends(get_db)) -> ContractService:
     """
     return ContractService(db)  
 
+
+async def _stage_pdf_upload(pdf_file: UploadFile) -> IngestedUpload:
+    """
+    Speichert ein PDF blockweise im Staging-Verzeichnis (vor dem Anlegen des Vertrags).
+    Grava um PDF em blocos no diretório de staging (antes de criar o contrato).
+    """
+    staging_path = os.path.join(settings.UPLOAD_DIR, "contracts", "temp", f"upload_{uuid.uuid4().hex}.pdf")
+    try:
+        return await ingest_upload(pdf_file, staging_path)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+
+def _discard_staged(staged: Optional[IngestedUpload]) -> None:
+    """Entfernt ein nicht übernommenes Staging-PDF / Remove um PDF de staging não utilizado"""
+    if staged is not None and os.path.exists(staged.path):
+        try:
+            os.remove(staged.path)
+        except OSError:
+            pass
+
 # GET /contracts/ - Liste alle Verträge
 from app.schemas.contract import ContractListResponse
 
@@ -258,6 +256,7 @@ async def create_contract_with_upload(
     - Validação unificada / Unified validation
     - Transação atômica / Atomic transaction
     """
+    staged: Optional[IngestedUpload] = None
     try:
         # 1. Validar PDF se existe / Validate PDF if exists
         if pdf_file and pdf_file.filename:
@@ -267,14 +266,8 @@ async def create_contract_with_upload(
                     detail="Apenas arquivos PDF são permitidos / Only PDF files allowed"
                 )
             
-            # Ler conteúdo para validar tamanho / Read content to validate size
-            content = await pdf_file.read()
-            if len(content) > 10 * 1024 * 1024:  # 10MB
-                raise HTTPException(
-                    status_code=413, 
-                    detail="Arquivo muito grande. Máximo 10MB / File too large. Max 10MB"
-                )
-            await pdf_file.seek(0)  # Reset para reler / Reset to re-read
+            # Blockweise zwischenspeichern (Größe + Hash) / Gravar em blocos no staging (tamanho + hash)
+            staged = await _stage_pdf_upload(pdf_file)
         
         # 2. Criar objeto ContractCreate para usar validações existentes
         # Create ContractCreate object to use existing validations
@@ -322,24 +315,12 @@ async def create_contract_with_upload(
         
         # 4. Se tem PDF, salvar e anexar / If has PDF, save and attach
         if pdf_file and pdf_file.filename:
-            # Criar diretório / Create directory
-            contract_dir = os.path.join(
-                settings.UPLOAD_DIR, 
-                "contracts", 
-                "persisted", 
-                f"contract_{created.id}"
-            )
-            os.makedirs(contract_dir, exist_ok=True)
+            # PDF aus dem Staging in den Blob-Speicher / Mover PDF do staging para os blobs
+            file_hash = staged.sha256
+            file_path = get_blob_store().put(staged.path, file_hash)
             
-            # Salvar PDF / Save PDF
-            file_path = os.path.join(contract_dir, "original.pdf")
-            content = await pdf_file.read()
-            
-            with open(file_path, "wb") as f:
-                f.write(content)
-            
-            # Calcular hash / Calculate hash
-            file_hash = hashlib.sha256(content).hexdigest()
+            # Text aus dem Extraktions-Cache übernehmen (falls importiert) / Reutilizar texto do cache de extração
+            ocr_text, ocr_sha256 = await ExtractionCacheService(contract_service.db).cached_ocr_text(file_hash)
             
             # Anexar ao contrato / Attach to contract
             await contract_service.attach_original_pdf(
@@ -347,8 +328,8 @@ async def create_contract_with_upload(
                 file_path, 
                 pdf_file.filename, 
                 file_hash, 
-                "",  # ocr_text vazio / empty
-                ""   # ocr_sha256 vazio / empty
+                ocr_text,
+                ocr_sha256
             )
             
             # Refresh para pegar metadados do PDF / Refresh to get PDF metadata
@@ -366,6 +347,8 @@ async def create_contract_with_upload(
             status_code=500, 
             detail=f"Fehler beim Erstellen des Vertrags / Erro ao criar contrato: {str(e)}"
         )
+    finally:
+        _discard_staged(staged)
 
 # ============================================================================
 # ENDPOINTS COM CAMINHOS FIXOS (devem vir ANTES de /{contract_id})
@@ -389,7 +372,7 @@ async def get_contract_stats(
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Fehler beim Abrufen der Vertragsstatistiken")
     
-@router.get("/search", response_model=list, status_code=status.HTTP_200_OK)
+@router.get("/search", response_model=List[ContractSearchHit], status_code=status.HTTP_200_OK)
 async def search_contracts(
     query: str = Query(..., description="Suchbegriff für Titel oder Beschreibung"),
     page: int = Query(1, ge=1, description="Seitennummer"),
@@ -404,7 +387,7 @@ async def search_contracts(
         per_page (int): Anzahl der Verträge pro Seite (Standard: 10, Max: 100)
         contract_service (ContractService): Dienst für Vertragsoperationen
     Rückgabe:
-        ContractListResponse: Liste der gefundenen Verträge mit Paginierungsinformationen
+        List[ContractSearchHit]: Gefundene Verträge nach Relevanz, inkl. Textausschnitt (FTS5)
     """
     return await contract_service.search_contracts(
         query=query,
@@ -579,6 +562,7 @@ async def update_contract_with_upload(
     - Se pdf_file fornecido → substitui PDF antigo / If pdf_file provided → replaces old PDF
     - Se pdf_file None → mantém PDF existente / If pdf_file None → keeps existing PDF
     """
+    staged: Optional[IngestedUpload] = None
     try:
         # 1. Validar PDF se existe / Validate PDF if exists
         if pdf_file and pdf_file.filename:
@@ -588,13 +572,8 @@ async def update_contract_with_upload(
                     detail="Apenas arquivos PDF são permitidos / Only PDF files allowed"
                 )
             
-            content = await pdf_file.read()
-            if len(content) > 10 * 1024 * 1024:  # 10MB
-                raise HTTPException(
-                    status_code=413, 
-                    detail="Arquivo muito grande. Máximo 10MB / File too large. Max 10MB"
-                )
-            await pdf_file.seek(0)
+            # Blockweise zwischenspeichern (Größe + Hash) / Gravar em blocos no staging (tamanho + hash)
+            staged = await _stage_pdf_upload(pdf_file)
         
         # 2. Criar objeto ContractUpdate com campos fornecidos
         # Create ContractUpdate object with provided fields
@@ -655,33 +634,14 @@ async def update_contract_with_upload(
         
         # 4. Se tem PDF, substituir / If has PDF, replace
         if pdf_file and pdf_file.filename:
-            # Remover PDF antigo se existe / Remove old PDF if exists
-            old_pdf_path = get_contract_pdf_path(contract_id)
-            if old_pdf_path and os.path.exists(old_pdf_path):
-                try:
-                    os.remove(old_pdf_path)
-                except Exception as e:
-                    # Log mas não falha / Log but don't fail
-                    print(f"Aviso: não foi possível remover PDF antigo: {e}")
-            
-            # Criar diretório / Create directory
-            contract_dir = os.path.join(
-                settings.UPLOAD_DIR, 
-                "contracts", 
-                "persisted", 
-                f"contract_{contract_id}"
-            )
-            os.makedirs(contract_dir, exist_ok=True)
-            
-            # Salvar novo PDF / Save new PDF
-            file_path = os.path.join(contract_dir, "original.pdf")
-            content = await pdf_file.read()
+            old_pdf_path = await get_pdf_storage_index().resolve_id(contract_service.db, contract_id)
             
-            with open(file_path, "wb") as f:
-                f.write(content)
+            # Novo PDF do staging para os blobs / Neues PDF aus dem Staging in den Blob-Speicher
+            file_hash = staged.sha256
+            file_path = get_blob_store().put(staged.path, file_hash)
             
-            # Calcular hash / Calculate hash
-            file_hash = hashlib.sha256(content).hexdigest()
+            # Text aus dem Extraktions-Cache übernehmen (falls importiert) / Reutilizar texto do cache de extração
+            ocr_text, ocr_sha256 = await ExtractionCacheService(contract_service.db).cached_ocr_text(file_hash)
             
             # Anexar ao contrato / Attach to contract
             await contract_service.attach_original_pdf(
@@ -689,9 +649,12 @@ async def update_contract_with_upload(
                 file_path, 
                 pdf_file.filename, 
                 file_hash, 
-                "",  # ocr_text vazio / empty
-                ""   # ocr_sha256 vazio / empty
+                ocr_text,
+                ocr_sha256
             )
+            # Alte PDF freigeben (geteilte Blobs räumt der GC auf) / Liberar PDF antigo (blobs compartilhados ficam para o GC)
+            if old_pdf_path != file_path:
+                release_pdf(get_blob_store(), old_pdf_path)
             
             # Refresh para pegar metadados do PDF / Refresh to get PDF metadata
             updated = await contract_service.get_contract(contract_id)
@@ -707,6 +670,8 @@ async def update_contract_with_upload(
             status_code=500, 
             detail=f"Fehler beim Aktualisieren / Erro ao atualizar: {str(e)}"
         )
+    finally:
+        _discard_staged(staged)
 
 # DELETE /contracts/{contract_id} - Löscht einen Vertrag nach ID
 @router.delete("/{contract_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -763,12 +728,7 @@ async def delete_original_pdf(
     if not contract.original_pdf_path:
         raise HTTPException(status_code=404, detail="Kein PDF vorhanden / Nenhum PDF anexado")
     
-    # Deletar arquivo físico se existir
-    if os.path.exists(contract.original_pdf_path):
-        try:
-            os.remove(contract.original_pdf_path)
-        except Exception as e:
-            print(f"Error deleting PDF file: {e}")
+    old_pdf_path = contract.original_pdf_path
     
     # Atualizar registro no banco
     await db.execute(
@@ -776,12 +736,17 @@ async def delete_original_pdf(
         .where(Contract.id == contract_id)
         .values(
             original_pdf_path=None,
+            original_pdf_verified=False,
             original_pdf_filename=None,
             original_pdf_sha256=None,
             uploaded_at=None
         )
     )
     await db.commit()
+    get_pdf_storage_index().invalidate(contract_id)
+    # Blob nur über den GC löschen (evtl. von anderen Verträgen referenziert)
+    # Blob só é removido pelo GC (pode ser referenciado por outros contratos)
+    release_pdf(get_blob_store(), old_pdf_path)
     
     return None
 
@@ -796,6 +761,7 @@ async def generate_contract_document(
     Erzeugt und liefert das Vertragsdokument (DOCX oder PDF).
     - Rendert ein .docx-Template mit den Vertragsdaten
     - Konvertiert zu PDF mittels LibreOffice (`soffice`) falls gewünscht und verfügbar
+      (Pool warmer Instanzen; 503, wenn die Warteschlange voll ist)
     """
     contract = await contract_service.get_contract(contract_id)
     if not contract:
@@ -821,8 +787,18 @@ async def generate_contract_document(
     if format == "docx":
         return Response(content=docx_bytes, media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document", headers={"Content-Disposition": f"attachment; filename=contract_{contract_id}.docx"})
 
-    # se PDF solicitado, tentar converter em thread (blocking)
-    pdf_bytes = await asyncio.to_thread(_convert_docx_bytes_to_pdf_bytes, docx_bytes)
+    # se PDF solicitado, converter no pool de instâncias LibreOffice aquecidas
+    try:
+        pdf_bytes = await get_document_converter().convert(docx_bytes)
+    except ConverterBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF-Konvertierung ausgelastet / Conversão de PDF sobrecarregada",
+            headers={"Retry-After": "5"},
+        )
+    except ConversionError:
+        # Auch ohne soffice (ConverterUnavailableError): DOCX ausliefern / Também sem soffice: enviar DOCX
+        pdf_bytes = b""
     if pdf_bytes:
         return Response(content=pdf_bytes, media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=contract_{contract_id}.pdf"})
 
@@ -833,6 +809,7 @@ async def generate_contract_document(
 @router.get("/{contract_id}/original")
 async def download_original_pdf(
     contract_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -852,23 +829,13 @@ async def download_original_pdf(
     except HTTPException:
         raise
 
-    # PDF-Datei mit neuer Suchfunktion lokalisieren
-    file_path = get_contract_pdf_path(contract_id)
-    
-    # Fallback: aus Datenbank gespeicherter Pfad (für Kompatibilität)
-    if not file_path:
-        db_file_path = getattr(contract, "original_pdf_path", None)
-        if db_file_path and os.path.exists(db_file_path):
-            file_path = db_file_path
+    # Speicherort aus den DB-Metadaten (LRU, keine Verzeichnissuche)
+    # Local a partir dos metadados do banco (LRU, sem varrer diretórios)
+    file_path = get_pdf_storage_index().resolve(contract)
     
     if not file_path:
         raise HTTPException(status_code=404, detail="Original-PDF nicht vorhanden")
 
-    def iterfile():
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                yield chunk
-
     # Filename com suporte a UTF-8 (caracteres alemães: ä, ö, ü, ß)
     # Filename with UTF-8 support (German characters: ä, ö, ü, ß)
     filename = contract.original_pdf_filename or f"contract_{contract_id}.pdf"
@@ -884,15 +851,16 @@ async def download_original_pdf(
             f'filename="{safe_filename_ascii}"; '
             f"filename*=UTF-8''{safe_filename_utf8}"
         ),
-        "Content-Type": "application/pdf"
     }
     
-    return StreamingResponse(iterfile(), media_type="application/pdf", headers=headers)
+    # Range/ETag/304 über die gemeinsame PDF-Auslieferung / Range/ETag/304 pela entrega de PDF comum
+    return pdf_file_response(request, file_path, getattr(contract, "original_pdf_sha256", None), headers)
 
 
 @router.get("/{contract_id}/view")
 async def view_original_pdf(
     contract_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -912,50 +880,87 @@ async def view_original_pdf(
     except HTTPException:
         raise
 
-    # PDF-Datei mit neuer Suchfunktion lokalisieren / Localizar arquivo PDF com nova função de busca
-    file_path = get_contract_pdf_path(contract_id)
-    
-    # Fallback: aus Datenbank gespeicherter Pfad (für Kompatibilität)
-    # Fallback: caminho salvo no banco de dados (para compatibilidade)
-    if not file_path:
-        db_file_path = getattr(contract, "original_pdf_path", None)
-        if db_file_path and os.path.exists(db_file_path):
-            file_path = db_file_path
+    # Speicherort aus den DB-Metadaten (LRU, keine Verzeichnissuche)
+    # Local a partir dos metadados do banco (LRU, sem varrer diretórios)
+    file_path = get_pdf_storage_index().resolve(contract)
     
     if not file_path:
         raise HTTPException(status_code=404, detail="Original-PDF nicht vorhanden / PDF original não disponível")
 
-    def iterfile():
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                yield chunk
-
-    # Filename com suporte a UTF-8 (caracteres alemães: ä, ö, ü, ß)
-    # Filename with UTF-8 support (German characters: ä, ö, ü, ß)
-    filename = getattr(contract, "original_pdf_filename", None) or f"contract_{contract_id}.pdf"
-    
-    # RFC 5987: filename* para suporte UTF-8
-    safe_filename_ascii = re.sub(r'[^\w\s.-]', '_', filename)  # Fallback ASCII
-    safe_filename_utf8 = quote(filename.encode('utf-8'))  # UTF-8 encoding
-    
     # IMPORTANTE: usar APENAS inline, sem filename, para forçar visualização no navegador
     # IMPORTANT: use ONLY inline, without filename, to force browser viewing
+    # Cache nur mit Revalidierung (ETag/304), damit der PDF-Viewer Bereiche nachladen kann
+    # Cache só com revalidação (ETag/304), para o visualizador de PDF carregar intervalos
     headers = {
         "Content-Disposition": "inline",
-        "Content-Type": "application/pdf",
-        "Cache-Control": "no-cache, no-store, must-revalidate",
-        "Pragma": "no-cache",
-        "Expires": "0",
         "X-Content-Type-Options": "nosniff"
     }
     
-    return StreamingResponse(
-        iterfile(), 
-        media_type="application/pdf", 
-        headers=headers
+    return pdf_file_response(request, file_path, getattr(contract, "original_pdf_sha256", None), headers)
+
+
+async def _thumbnail_response(
+    request: Request, contract_id: int, page: int, width: int, db: AsyncSession, current_user: User
+) -> Response:
+    """
+    Gemeinsame Logik für Vorschaubild und Vorschau / Lógica comum de miniatura e pré-visualização
+    """
+    if width not in THUMBNAIL_WIDTHS:
+        raise HTTPException(status_code=400, detail=f"Breite muss eine von {THUMBNAIL_WIDTHS} sein / Largura deve ser uma de {THUMBNAIL_WIDTHS}")
+    contract = await ContractService(db).get_contract(contract_id)
+    if not contract:
+        raise HTTPException(status_code=404, detail="Vertrag nicht gefunden / Contrato não encontrado")
+    require_view_original(current_user, contract.created_by)
+
+    file_path = get_pdf_storage_index().resolve(contract)
+    if not file_path:
+        raise HTTPException(status_code=404, detail="Original-PDF nicht vorhanden / PDF original não disponível")
+    sha256 = contract.original_pdf_sha256 or await asyncio.to_thread(file_sha256, file_path)
+    try:
+        image_path = await get_thumbnail_service().thumbnail(file_path, sha256, page, width)
+    except PageNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ExtractionError as e:
+        raise HTTPException(status_code=500, detail=f"Vorschaubild fehlgeschlagen / Falha na miniatura: {e}")
+
+    # Inhalt hängt nur von Hash, Seite und Breite ab / Conteúdo depende só de hash, página e largura
+    return pdf_file_response(
+        request, image_path, f"{sha256}-{page}-{width}", {"Cache-Control": "private, max-age=86400"},
+        media_type="image/png",
     )
 
 
+@router.get("/{contract_id}/pages/{page}/thumbnail")
+async def get_page_thumbnail(
+    contract_id: int,
+    page: int,
+    request: Request,
+    width: int = Query(THUMBNAIL_WIDTH, description=f"Breite in px / Largura em px: {THUMBNAIL_WIDTHS}"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Vorschaubild (PNG) einer Seite der Original-PDF, Seiten ab 1.
+    Miniatura (PNG) de uma página do PDF original, páginas a partir de 1.
+    """
+    return await _thumbnail_response(request, contract_id, page, width, db, current_user)
+
+
+@router.get("/{contract_id}/preview")
+async def get_contract_preview(
+    contract_id: int,
+    request: Request,
+    width: int = Query(PREVIEW_WIDTH, description=f"Breite in px / Largura em px: {THUMBNAIL_WIDTHS}"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Vorschau der ersten Seite (PNG), ohne die ganze PDF zu laden.
+    Pré-visualização da primeira página (PNG), sem baixar o PDF inteiro.
+    """
+    return await _thumbnail_response(request, contract_id, 1, width, db, current_user)
+
+
 @router.post("/{contract_id}/template", status_code=status.HTTP_201_CREATED)
 async def upload_contract_template(
     contract_id: int,
@@ -1006,39 +1011,31 @@ async def upload_original_pdf(
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Apenas arquivos PDF / Nur PDF-Dateien")
     
-    # Ler conteúdo
-    content = await file.read()
-    if len(content) > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(status_code=413, detail="Arquivo muito grande / Datei zu groß (max 10MB)")
-    
-    # Criar diretório para este contrato
-    contract_dir = os.path.join(settings.UPLOAD_DIR, "contracts", "persisted", f"contract_{contract_id}")
-    os.makedirs(contract_dir, exist_ok=True)
-    
-    # Salvar como original.pdf
-    file_path = os.path.join(contract_dir, "original.pdf")
-    with open(file_path, "wb") as f:
-        f.write(content)
-    
-    # Calcular hash
-    import hashlib
-    file_hash = hashlib.sha256(content).hexdigest()
+    # Blockweise ins Staging (Größe + Hash), dann in den Blob-Speicher / Em blocos para o staging, depois para os blobs
+    staged = await _stage_pdf_upload(file)
+    try:
+        file_hash = staged.sha256
+        file_path = get_blob_store().put(staged.path, file_hash)
+    finally:
+        _discard_staged(staged)
     
     # Anexar ao contrato
-    relative_path = os.path.join("uploads", "contracts", "persisted", f"contract_{contract_id}", "original.pdf")
+    ocr_text, ocr_sha256 = await ExtractionCacheService(db).cached_ocr_text(file_hash)
     await contract_service.attach_original_pdf(
         contract_id, 
         file_path, 
         file.filename, 
         file_hash, 
-        "", # ocr_text vazio
-        ""  # ocr_sha256 vazio
+        ocr_text,
+        ocr_sha256
     )
+    if contract.original_pdf_path != file_path:
+        release_pdf(get_blob_store(), contract.original_pdf_path)
     
     return {
         "message": "PDF anexado com sucesso / PDF erfolgreich angehängt",
         "filename": file.filename,
-        "path": relative_path
+        "path": os.path.relpath(file_path, os.path.dirname(os.path.abspath(settings.UPLOAD_DIR)))
     }
 
 
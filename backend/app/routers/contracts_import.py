@@ -9,24 +9,33 @@ Suporta upload, extração e validação de dados de contrato.
 """
 
 import asyncio
+import json
 import os
 import time
 import logging
+import uuid
+import zipfile
 from typing import Optional, List
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import hashlib
 from datetime import datetime, timezone
-from sqlalchemy import select
-from app.models.contract import Contract
 from app.core.database import get_db
 from app.core.security import get_current_active_user
 from app.models.user import User
 from app.schemas.extracted_contract import ExtractionResponse
 from app.services.pdf_reader import PDFReaderService
+from app.schemas.import_job import ImportJobResponse
+from app.core.config import settings
+from app.services.blob_store import get_blob_store
+from app.services.thumbnail_service import get_thumbnail_service
+from app.services.bulk_import_service import BulkImportItem, BulkImportLimitError, BulkImportService, unpack_zip
+from app.services.contract_import_service import ContractImportError, ContractImportService, build_extracted_draft
+from app.services.import_job_service import ImportJobService
+from app.utils.upload_stream import IngestedUpload, UploadTooLargeError, ingest_upload
 
 # Logging konfigurieren / Configurar logging
 logger = logging.getLogger(__name__)
@@ -56,33 +65,98 @@ PERSISTED_UPLOAD_DIR = "uploads/contracts/persisted"
 os.makedirs(TEMP_UPLOAD_DIR, exist_ok=True)
 os.makedirs(PERSISTED_UPLOAD_DIR, exist_ok=True)
 
-def move_temp_file_to_persisted(temp_file_path: str, contract_id: int, original_filename: str) -> str:
+def move_temp_file_to_persisted(temp_file_path: str, sha256: Optional[str] = None) -> str:
     """
-    Verschiebt temporäre Datei in organisierte permanente Struktur
-    Move arquivo temporário para estrutura permanente organizada
+    Übernimmt temporäre Datei in den Blob-Speicher (inhaltsadressiert)
+    Move arquivo temporário para o armazenamento de blobs (endereçado por conteúdo)
     
     Args:
         temp_file_path (str): Caminho do arquivo temporário
-        contract_id (int): ID do contrato
-        original_filename (str): Nome original do arquivo
+        sha256 (Optional[str]): Hash já calculado no upload (evita recalcular)
         
     Returns:
-        str: Novo caminho do arquivo permanente
+        str: Caminho do blob
     """
-    # Verzeichnis für diesen Vertrag erstellen / Criar diretório para este contrato
-    contract_dir = os.path.join(PERSISTED_UPLOAD_DIR, f"contract_{contract_id}")
-    os.makedirs(contract_dir, exist_ok=True)
-    
-    # Zieldatei: immer "original.pdf" / Arquivo destino: sempre "original.pdf"
-    target_path = os.path.join(contract_dir, "original.pdf")
-    
-    # Datei verschieben / Mover arquivo
-    import shutil
-    shutil.move(temp_file_path, target_path)
-    
+    target_path = get_blob_store().put(temp_file_path, sha256)
     logger.info(f"Datei verschoben / Arquivo movido: {temp_file_path} → {target_path}")
     return target_path
 
+
+async def _ingest(file: UploadFile, target_path: str) -> IngestedUpload:
+    """
+    Speichert den Upload blockweise; Überschreitung von MAX_FILE_SIZE → 413.
+    Grava o upload em blocos; excesso de MAX_FILE_SIZE → 413.
+    """
+    try:
+        return await ingest_upload(file, target_path, max_bytes=MAX_FILE_SIZE)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+
+
+async def _run_extraction_job(
+    pdf_path: str,
+    extraction_method: str,
+    db: Optional[AsyncSession] = None,
+    file_hash: Optional[str] = None,
+) -> dict:
+    """
+    Liefert das Extraktionsergebnis aus dem Cache oder reicht die Extraktion an
+    den Prozesspool weiter und übersetzt dessen Fehler.
+    Retorna o resultado do cache ou envia a extração ao pool de processos e
+    traduz os seus erros.
+
+    Returns:
+        dict: ``extraction`` und ``intelligent_data``
+    """
+    try:
+        return await ContractImportService(db).extract(pdf_path, extraction_method, file_hash)
+    except ContractImportError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+
+async def _ingest_import_upload(file: UploadFile, current_user: User, prefix: str = "temp") -> tuple:
+    """
+    Prüft Dateiname und -typ und speichert den Upload im temporären Ordner.
+    Verifica nome e tipo do arquivo e grava o upload na pasta temporária.
+
+    Returns:
+        tuple: (IngestedUpload, Speichername / nome de armazenamento)
+    """
+    # Datei validieren / Validar arquivo
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Kein Dateiname angegeben / Nenhum nome de arquivo fornecido"
+        )
+
+    # Dateierweiterung prüfen / Verificar extensão do arquivo
+    file_extension = Path(file.filename).suffix.lower()
+    if file_extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Ungültiger Dateityp / Tipo de arquivo inválido: {file_extension}. Erlaubt / Permitido: {ALLOWED_EXTENSIONS}"
+        )
+
+    # Eindeutigen temporären Dateinamen erstellen / Criar nome de arquivo temporário único
+    timestamp = int(time.time())
+    safe_filename = f"{prefix}_{current_user.id}_{timestamp}_{file.filename}"
+    temp_file_path = os.path.join(TEMP_UPLOAD_DIR, safe_filename)
+
+    # Datei blockweise speichern (Größe + SHA-256 beim Kopieren) / Gravar em blocos (tamanho + SHA-256 na cópia)
+    upload = await _ingest(file, temp_file_path)
+    if upload.size == 0:
+        try:
+            os.remove(temp_file_path)
+        except Exception:
+            pass
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Leere Datei / Arquivo vazio"
+        )
+
+    logger.info(f"Datei temporär gespeichert / Arquivo salvo temporariamente: {temp_file_path}")
+    return upload, safe_filename
+
 @router.post("/pdf", response_model=ExtractionResponse)
 async def import_contract_pdf(
     file: UploadFile = File(..., description="PDF-Datei des Vertrags / Arquivo PDF do contrato"),
@@ -108,222 +182,101 @@ async def import_contract_pdf(
         ExtractionResponse: Extraktionsergebnis / Resultado da extração
     """
     start_time = time.time()
-    file_path = None
 
     try:
         logger.info(f"PDF-Import gestartet / Importação de PDF iniciada: {file.filename} von Benutzer / do usuário {current_user.id}")
-        
-        # Datei validieren / Validar arquivo
-        if not file.filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Kein Dateiname angegeben / Nenhum nome de arquivo fornecido"
-            )
-        
-        # Dateierweiterung prüfen / Verificar extensão do arquivo
-        file_extension = Path(file.filename).suffix.lower()
-        if file_extension not in ALLOWED_EXTENSIONS:
-            raise HTTPException(
-                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                detail=f"Ungültiger Dateityp / Tipo de arquivo inválido: {file_extension}. Erlaubt / Permitido: {ALLOWED_EXTENSIONS}"
-            )
-        
-        # Dateigröße prüfen / Verificar tamanho do arquivo
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"Datei zu groß / Arquivo muito grande: {file_size} Bytes. Maximum / Máximo: {MAX_FILE_SIZE} Bytes"
-            )
-        
-        if file_size == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Leere Datei / Arquivo vazio"
-            )
-        
-        # Eindeutigen temporären Dateinamen erstellen / Criar nome de arquivo temporário único
-        timestamp = int(time.time())
-        safe_filename = f"temp_{current_user.id}_{timestamp}_{file.filename}"
-        temp_file_path = os.path.join(TEMP_UPLOAD_DIR, safe_filename)
-        
-        # Datei temporär speichern / Salvar arquivo temporariamente (in Thread auslagern um Event-Loop nicht zu blockieren)
-        def _write_file(path: str, content: bytes) -> None:
-            with open(path, "wb") as buffer:
-                buffer.write(content)
 
-        await asyncio.to_thread(_write_file, temp_file_path, file_content)
-        
-        logger.info(f"Datei temporär gespeichert / Arquivo salvo temporariamente: {temp_file_path}")
-
-        # PDF-Reader-Service initialisieren / Inicializar serviço de leitura de PDF
-        pdf_reader = PDFReaderService()
+        upload, safe_filename = await _ingest_import_upload(file, current_user)
 
-        # PDF validieren / Validar PDF (executar em thread se for CPU/IO-bound)
-        validation_result = await asyncio.to_thread(pdf_reader.validate_pdf, temp_file_path)
-        if not validation_result.get('valid'):
-            try:
-                os.remove(temp_file_path)
-            except Exception:
-                pass
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Ungültige PDF-Datei / Arquivo PDF inválido: {validation_result.get('error', 'Unbekannter Fehler')}"
-            )
-
-        # Text extrahieren (möglicherweise IO/CPU-bound) - in Thread auslagern
-        if extraction_method == "combined":
-            extraction_result = await asyncio.to_thread(pdf_reader.extract_text_combined, temp_file_path)
-        elif extraction_method == "pdfplumber":
-            extraction_result = await asyncio.to_thread(pdf_reader.extract_text_with_pdfplumber, temp_file_path)
-        elif extraction_method == "pypdf2":
-            extraction_result = await asyncio.to_thread(pdf_reader.extract_text_with_pypdf2, temp_file_path)
-        elif extraction_method == "pymupdf":
-            extraction_result = await asyncio.to_thread(pdf_reader.extract_text_with_pymupdf, temp_file_path)
-        else:
-            extraction_result = await asyncio.to_thread(pdf_reader.extract_text_combined, temp_file_path)
-
-        if not extraction_result.get('success'):
-            try:
-                os.remove(temp_file_path)
-            except Exception:
-                pass
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Textextraktion fehlgeschlagen / Extração de texto falhou: {extraction_result.get('error', 'Unbekannter Fehler')}"
-            )
-
-        # Intelligente Extraktion durchführen / Executar extração inteligente
-        intelligent_data = await asyncio.to_thread(pdf_reader.extract_intelligent_data, extraction_result.get('text', ''))
-
-        # --------------------
-        # SHA256-Hashes berechnen und Duplikatsprüfung (exakt)
-        # --------------------
-        file_hash = hashlib.sha256(file_content).hexdigest()
-        ocr_text_raw = extraction_result.get('text', '') or ''
-        normalized_text = " ".join(ocr_text_raw.lower().split())
-        ocr_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
-
-        # Duplikatprüfung: exakter Datei-Hash
-        try:
-            existing_res = await db.execute(select(Contract).where(Contract.original_pdf_sha256 == file_hash))
-            existing_contract = existing_res.scalar_one_or_none()
-            if existing_contract:
-                # Bei exaktem Duplikat: temporäre Datei entfernen und Fehler melden mit Hinweis auf existierenden Vertrag
-                try:
-                    os.remove(temp_file_path)
-                except Exception:
-                    pass
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Duplikat: dieselbe Datei ist bereits im System (contract_id={existing_contract.id})"
-                )
-
-            # Duplikatprüfung per OCR-Hash
-            existing_res2 = await db.execute(select(Contract).where(Contract.ocr_text_sha256 == ocr_hash))
-            existing_contract2 = existing_res2.scalar_one_or_none()
-            if existing_contract2:
-                try:
-                    os.remove(temp_file_path)
-                except Exception:
-                    pass
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Duplikat: derselbe Vertragsinhalt wurde bereits hochgeladen (contract_id={existing_contract2.id})"
-                )
-        except HTTPException:
-            raise
-        except Exception as e:
-            # Bei DB-Fehlern nicht automatisch ablehnen – loggen und weiter (vorsichtig)
-            logger.warning(f"Warnung während Duplikatprüfung: {e}")
-
-        # ExtractedContractDraft erstellen / Criar ExtractedContractDraft
-        from app.schemas.extracted_contract import ExtractedContractDraft, ConfidenceLevel
-        extracted_data = ExtractedContractDraft(
+        # Validierung, Extraktion, Duplikatprüfung und Entwurf / Validação, extração, duplicatas e rascunho
+        import_service = ContractImportService(db, reader=PDFReaderService())
+        return await import_service.process_pdf(
+            pdf_path=upload.path,
+            original_file_name=file.filename,
+            storage_name=safe_filename,
+            file_hash=upload.sha256,
+            file_size=upload.size,
             extraction_method=extraction_method,
-            raw_text=extraction_result.get('text', ''),
-            pdf_metadata=extraction_result.get('metadata', {}),
-            title=intelligent_data.get('title'),
-            title_confidence=0.8 if intelligent_data.get('title') else 0.0,
-            client_name=intelligent_data.get('client_name'),
-            client_name_confidence=0.7 if intelligent_data.get('client_name') else 0.0,
-            client_email=intelligent_data.get('client_email'),
-            client_email_confidence=0.9 if intelligent_data.get('client_email') else 0.0,
-            client_phone=intelligent_data.get('client_phone'),
-            client_phone_confidence=0.8 if intelligent_data.get('client_phone') else 0.0,
-            client_address=intelligent_data.get('client_address'),
-            client_address_confidence=0.7 if intelligent_data.get('client_address') else 0.0,
-            value=intelligent_data.get('money_values', {}).get('value'),
-            value_confidence=intelligent_data.get('money_values', {}).get('confidence', 0.0),
-            currency=intelligent_data.get('money_values', {}).get('currency'),
-            currency_confidence=0.9 if intelligent_data.get('money_values', {}).get('currency') else 0.0,
-            start_date=intelligent_data.get('dates', {}).get('start_date'),
-            start_date_confidence=0.7 if intelligent_data.get('dates', {}).get('start_date') else 0.0,
-            end_date=intelligent_data.get('dates', {}).get('end_date'),
-            end_date_confidence=0.7 if intelligent_data.get('dates', {}).get('end_date') else 0.0,
-            renewal_date=intelligent_data.get('dates', {}).get('renewal_date'),
-            renewal_date_confidence=0.7 if intelligent_data.get('dates', {}).get('renewal_date') else 0.0,
-            terms_and_conditions=intelligent_data.get('terms_and_conditions'),
-            terms_and_conditions_confidence=0.6 if intelligent_data.get('terms_and_conditions') else 0.0,
-            description=intelligent_data.get('description'),
-            description_confidence=0.4 if intelligent_data.get('description') else 0.0,
-            raw_text_confidence=0.7,
-            client_document=None,
-            client_document_confidence=0.0,
-            notes=None,
-            notes_confidence=0.0,
-            overall_confidence=0.0,
-            confidence_level=ConfidenceLevel.UNKNOWN,
+            include_ocr=include_ocr,
+            started_at=start_time,
+        )
+
+    except ContractImportError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unerwarteter Fehler beim PDF-Import / Erro inesperado na importação de PDF: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Interner Serverfehler / Erro interno do servidor: {str(e)}"
         )
 
-        # OCR durchführen falls gewünscht / Executar OCR se desejado
-        if include_ocr and extraction_result.get('total_chars', 0) < 100:
-            logger.info("OCR wird durchgeführt / OCR será executado - wenig Text extrahiert / pouco texto extraído")
-            # Hier könnte OCR implementiert werden / Aqui OCR poderia ser implementado
 
-        processing_time = time.time() - start_time
-        uploaded_at = datetime.now(timezone.utc)
+@router.post("/jobs", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_import_job(
+    file: UploadFile = File(..., description="PDF-Datei des Vertrags / Arquivo PDF do contrato"),
+    extraction_method: str = Form("combined", description="Extraktionsmethode / Método de extração"),
+    include_ocr: bool = Form(True, description="OCR einschließen / Incluir OCR"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Reiht einen PDF-Import ein und gibt sofort die Job-ID zurück
+    Enfileira uma importação de PDF e retorna imediatamente o ID do job
 
-        logger.info(f"PDF-Import erfolgreich / Importação de PDF bem-sucedida: {processing_time:.2f}s")
+    DE: Die Verarbeitung übernimmt ein Hintergrund-Worker; Fortschritt und
+        Ergebnis liefert ``GET /contracts/import/jobs/{job_id}``.
+    PT: O processamento é feito por um worker em segundo plano; progresso e
+        resultado são retornados por ``GET /contracts/import/jobs/{job_id}``.
 
-        return ExtractionResponse(
-            success=True,
-            extracted_data=extracted_data,
-            processing_time=processing_time,
-            file_size=file_size,
-            error_message=None,
-            # Metadados do arquivo temporário (será movido após criação do contrato)
+    Returns / Retorna:
+        ImportJobResponse: Eingereihter Job / Job enfileirado
+    """
+    logger.info(f"PDF-Import-Job angefordert / Job de importação solicitado: {file.filename} von Benutzer / do usuário {current_user.id}")
+    upload, safe_filename = await _ingest_import_upload(file, current_user, prefix="job")
+    try:
+        job = await ImportJobService(db).enqueue(
+            current_user.id,
+            upload,
             original_file_name=file.filename,
-            original_file_storage_name=safe_filename,
-            original_file_sha256=file_hash,
-            ocr_text_sha256=ocr_hash,
-            uploaded_at=uploaded_at,
-            temp_file_path=temp_file_path  # Caminho temporário para movimentação posterior
+            storage_name=safe_filename,
+            extraction_method=extraction_method,
+            include_ocr=include_ocr,
         )
-        
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Unerwarteter Fehler beim PDF-Import / Erro inesperado na importação de PDF: {str(e)}")
+        try:
+            os.remove(upload.path)
+        except Exception:
+            pass
+        logger.error(f"Fehler beim Einreihen des Imports / Erro ao enfileirar importação: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Interner Serverfehler / Erro interno do servidor: {str(e)}"
         )
-    finally:
-        # Aufräumen bei Fehlern: nur löschen, wenn nicht erfolgreich persistiert
-        # (Wenn oben ein Duplikat erkannt wurde, haben wir die Datei bereits gelöscht.)
-        # NOTE: In Erfolgsfall behalten wir die Datei im Upload-Ordner als persistenten Speicher.
-        if file_path and os.path.exists(file_path):
-            # Wenn ein Fehler aufgetreten ist und wir nicht erfolgreich zurückgegeben haben, entfernen
-            # (Die Erfolgs-Rückgabe passiert bereits oben; hier behandeln wir nur Fälle mit Exception)
-            # Versuche Entfernung; falls fehlschlägt, loggen
-            try:
-                # Prüfe ob letzte Operation eine Exception war: im Ausnahmefall bleibt file_path bestehen
-                pass
-            except Exception:
-                logger.debug("Finally block reached (kein automatisches Löschen im Erfolgsfall)")
+    return ImportJobResponse.from_job(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ImportJobResponse)
+async def get_import_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Liefert Stufe, Fortschritt und ggf. Ergebnis eines Import-Jobs
+    Retorna etapa, progresso e, se houver, o resultado de um job de importação
+
+    Returns / Retorna:
+        ImportJobResponse: Zustand des Jobs / Estado do job
+    """
+    job = await ImportJobService(db).get_job(job_id)
+    if job is None or (job.user_id != current_user.id and not current_user.is_system_admin()):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import-Job nicht gefunden / Job de importação não encontrado"
+        )
+    return ImportJobResponse.from_job(job)
 
 @router.post("/upload", response_model=ExtractionResponse)
 async def upload_contract_with_metadata(
@@ -369,30 +322,17 @@ async def upload_contract_with_metadata(
                 detail=f"Ungültiger Dateityp / Tipo de arquivo inválido: {file_extension}"
             )
         
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"Datei zu groß / Arquivo muito grande: {file_size} Bytes"
-            )
-        
-        # Datei speichern / Salvar arquivo
+        # Datei blockweise speichern / Gravar arquivo em blocos
         timestamp = int(time.time())
         safe_filename = f"{current_user.id}_{timestamp}_{file.filename}"
         file_path = os.path.join(TEMP_UPLOAD_DIR, safe_filename)
+        upload = await _ingest(file, file_path)
+        file_size = upload.size
+        file_hash = upload.sha256
         
-        # Salvar arquivo sem bloquear o event loop
-        def _write_file(path: str, content: bytes) -> None:
-            with open(path, "wb") as buffer:
-                buffer.write(content)
-
-        await asyncio.to_thread(_write_file, file_path, file_content)
-        
-        # PDF verarbeiten / Processar PDF (in thread, evita bloquear o event loop)
-        pdf_reader = PDFReaderService()
-        extraction_result = await asyncio.to_thread(pdf_reader.extract_text_combined, file_path)
+        # PDF im Prozesspool verarbeiten / Processar PDF no pool de processos
+        engine_result = await _run_extraction_job(file_path, "combined", db, file_hash)
+        extraction_result = engine_result['extraction']
 
         if not extraction_result or not extraction_result.get('success'):
             try:
@@ -404,47 +344,10 @@ async def upload_contract_with_metadata(
                 detail=f"Textextraktion fehlgeschlagen / Extração de texto falhou: {extraction_result.get('error') if extraction_result else 'Unknown error'}"
             )
 
-        # Intelligente Extraktion in thread
-        intelligent_data = await asyncio.to_thread(pdf_reader.extract_intelligent_data, extraction_result.get('text', ''))
+        intelligent_data = engine_result['intelligent_data']
         
-        # ExtractedContractDraft erstellen / Criar ExtractedContractDraft
-        from app.schemas.extracted_contract import ExtractedContractDraft, ConfidenceLevel
-        extracted_data = ExtractedContractDraft(
-            extraction_method="combined",
-            raw_text=extraction_result['text'],
-            pdf_metadata=extraction_result.get('metadata', {}),
-            title=intelligent_data.get('title'),
-            title_confidence=0.8 if intelligent_data.get('title') else 0.0,
-            client_name=intelligent_data.get('client_name'),
-            client_name_confidence=0.7 if intelligent_data.get('client_name') else 0.0,
-            client_email=intelligent_data.get('client_email'),
-            client_email_confidence=0.9 if intelligent_data.get('client_email') else 0.0,
-            client_phone=intelligent_data.get('client_phone'),
-            client_phone_confidence=0.8 if intelligent_data.get('client_phone') else 0.0,
-            client_address=intelligent_data.get('client_address'),
-            client_address_confidence=0.7 if intelligent_data.get('client_address') else 0.0,
-            value=intelligent_data.get('money_values', {}).get('value'),
-            value_confidence=intelligent_data.get('money_values', {}).get('confidence', 0.0),
-            currency=intelligent_data.get('money_values', {}).get('currency'),
-            currency_confidence=0.9 if intelligent_data.get('money_values', {}).get('currency') else 0.0,
-            start_date=intelligent_data.get('dates', {}).get('start_date'),
-            start_date_confidence=0.7 if intelligent_data.get('dates', {}).get('start_date') else 0.0,
-            end_date=intelligent_data.get('dates', {}).get('end_date'),
-            end_date_confidence=0.7 if intelligent_data.get('dates', {}).get('end_date') else 0.0,
-            renewal_date=intelligent_data.get('dates', {}).get('renewal_date'),
-            renewal_date_confidence=0.7 if intelligent_data.get('dates', {}).get('renewal_date') else 0.0,
-            terms_and_conditions=intelligent_data.get('terms_and_conditions'),
-            terms_and_conditions_confidence=0.6 if intelligent_data.get('terms_and_conditions') else 0.0,
-            description=intelligent_data.get('description'),
-            description_confidence=0.4 if intelligent_data.get('description') else 0.0,
-            raw_text_confidence=0.7,
-            client_document=None,
-            client_document_confidence=0.0,
-            notes=None,
-            notes_confidence=0.0,
-            overall_confidence=0.0,
-            confidence_level=ConfidenceLevel.UNKNOWN,
-        )
+        # Gleicher Entwurf wie beim PDF-Import / Mesmo rascunho do import de PDF
+        extracted_data = build_extracted_draft(extraction_result, intelligent_data, "combined")
         
         # Übergebene Metadaten verwenden / Usar metadados fornecidos
         if title:
@@ -463,39 +366,21 @@ async def upload_contract_with_metadata(
         uploaded_at = datetime.now(timezone.utc)
 
         # SHA256-Hashes berechnen und Duplikatsprüfung (exakt) für Upload mit Metadaten
-        file_hash = hashlib.sha256(file_content).hexdigest()
         ocr_text_raw = extraction_result.get('text', '') or ''
         normalized_text = " ".join(ocr_text_raw.lower().split())
         ocr_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
 
         try:
-            existing_res = await db.execute(select(Contract).where(Contract.original_pdf_sha256 == file_hash))
-            existing_contract = existing_res.scalar_one_or_none()
-            if existing_contract:
-                try:
-                    os.remove(file_path)
-                except Exception:
-                    pass
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Duplikat: dieselbe Datei ist bereits im System (contract_id={existing_contract.id})"
-                )
-
-            existing_res2 = await db.execute(select(Contract).where(Contract.ocr_text_sha256 == ocr_hash))
-            existing_contract2 = existing_res2.scalar_one_or_none()
-            if existing_contract2:
-                try:
-                    os.remove(file_path)
-                except Exception:
-                    pass
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Duplikat: derselbe Vertragsinhalt wurde bereits hochgeladen (contract_id={existing_contract2.id})"
-                )
-        except HTTPException:
-            raise
+            duplicate = await ContractImportService(db).find_duplicate(file_hash, ocr_hash)
         except Exception as e:
             logger.warning(f"Warnung während Duplikatprüfung (Upload mit Metadaten): {e}")
+            duplicate = None
+        if duplicate:
+            try:
+                os.remove(file_path)
+            except Exception:
+                pass
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=duplicate)
 
         processing_time = time.time() - start_time
 
@@ -535,8 +420,119 @@ async def upload_contract_with_metadata(
         except Exception:
             logger.debug("Finally block reached in upload endpoint")
 
+async def _collect_bulk_items(files: List[UploadFile], prefix: str) -> List[BulkImportItem]:
+    """
+    Speichert PDFs und entpackt ZIP-Archive eines Massenimports in den temporären Ordner.
+    Grava PDFs e extrai arquivos ZIP de uma importação em massa na pasta temporária.
+
+    Fehler einzelner Dateien werden im jeweiligen Eintrag vermerkt; nur das
+    Überschreiten der Stapelgrenzen bricht den Import ab (413).
+    Erros de arquivos individuais ficam no respectivo item; apenas exceder os
+    limites do lote interrompe a importação (413).
+    """
+    items: List[BulkImportItem] = []
+
+    def stored() -> List[BulkImportItem]:
+        return [item for item in items if item.path]
+
+    try:
+        for index, file in enumerate(files):
+            file_name = os.path.basename(file.filename or f"datei_{index}")
+            extension = Path(file_name).suffix.lower()
+            remaining_files = settings.BULK_IMPORT_MAX_FILES - len(stored())
+            remaining_bytes = settings.BULK_IMPORT_MAX_BYTES - sum(item.size for item in stored())
+
+            if extension == ".zip":
+                archive_path = os.path.join(TEMP_UPLOAD_DIR, f"{prefix}_{index}_{file_name}")
+                try:
+                    await ingest_upload(file, archive_path, max_bytes=settings.BULK_IMPORT_MAX_BYTES)
+                    items.extend(await asyncio.to_thread(
+                        unpack_zip, archive_path, TEMP_UPLOAD_DIR, f"{prefix}_{index}",
+                        MAX_FILE_SIZE, remaining_files, remaining_bytes,
+                    ))
+                except zipfile.BadZipFile:
+                    items.append(BulkImportItem(file_name=file_name, error="Ungültiges ZIP-Archiv / Arquivo ZIP inválido"))
+                finally:
+                    try:
+                        os.remove(archive_path)
+                    except OSError:
+                        pass
+            elif extension in ALLOWED_EXTENSIONS:
+                if remaining_files <= 0:
+                    raise BulkImportLimitError(f"Zu viele Dateien / Arquivos demais (max. {settings.BULK_IMPORT_MAX_FILES})")
+                target_path = os.path.join(TEMP_UPLOAD_DIR, f"{prefix}_{index}_{file_name}")
+                try:
+                    upload = await ingest_upload(file, target_path, max_bytes=min(MAX_FILE_SIZE, remaining_bytes))
+                except UploadTooLargeError as e:
+                    items.append(BulkImportItem(file_name=file_name, error=str(e)))
+                    continue
+                if upload.size == 0:
+                    os.remove(target_path)
+                    items.append(BulkImportItem(file_name=file_name, error="Leere Datei / Arquivo vazio"))
+                    continue
+                items.append(BulkImportItem(file_name=file_name, path=upload.path, sha256=upload.sha256, size=upload.size))
+            else:
+                items.append(BulkImportItem(
+                    file_name=file_name,
+                    error=f"Ungültiger Dateityp / Tipo de arquivo inválido: {extension}",
+                    skipped=True,
+                ))
+    except (BulkImportLimitError, UploadTooLargeError) as e:
+        for item in stored():
+            try:
+                os.remove(item.path)
+            except OSError:
+                pass
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    return items
+
+
+@router.post("/bulk")
+async def bulk_import_contracts(
+    files: List[UploadFile] = File(..., description="PDF-Dateien und/oder ZIP-Archive / Arquivos PDF e/ou arquivos ZIP"),
+    extraction_method: str = Form("combined", description="Extraktionsmethode / Método de extração"),
+    auto_create: bool = Form(False, description="Entwürfe als DRAFT-Verträge anlegen / Criar rascunhos como contratos DRAFT"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Massenimport: mehrere PDFs oder ZIP-Archive, Ergebnis als NDJSON
+    Importação em massa: vários PDFs ou arquivos ZIP, resultado em NDJSON
+
+    DE: Je Datei eine Zeile (``type: file``) mit Status ``extracted``,
+        ``created``, ``duplicate``, ``error`` oder ``skipped`` und dem
+        ``ExtractedContractDraft`` unter ``draft``; zuletzt eine Zeile
+        ``type: summary``. Zeilen erscheinen, sobald eine Datei fertig ist.
+    PT: Uma linha por arquivo (``type: file``) com status ``extracted``,
+        ``created``, ``duplicate``, ``error`` ou ``skipped`` e o
+        ``ExtractedContractDraft`` em ``draft``; por fim uma linha
+        ``type: summary``. As linhas são enviadas assim que cada arquivo termina.
+
+    Returns / Retorna:
+        StreamingResponse: application/x-ndjson
+    """
+    logger.info(f"Massenimport gestartet / Importação em massa iniciada: {len(files)} Upload(s) von Benutzer / do usuário {current_user.id}")
+    prefix = f"bulk_{current_user.id}_{uuid.uuid4().hex[:8]}"
+    items = await _collect_bulk_items(files, prefix)
+    thumbnails = get_thumbnail_service()
+    service = BulkImportService(
+        db,
+        persist_file=move_temp_file_to_persisted,
+        # Vorschaubilder der neuen Verträge im Hintergrund / Miniaturas dos novos contratos em segundo plano
+        on_created=lambda contract: thumbnails.schedule_pregeneration(contract.original_pdf_path, contract.original_pdf_sha256),
+    )
+
+    async def ndjson():
+        async for record in service.run(
+            items, extraction_method=extraction_method, auto_create=auto_create, created_by=current_user.id
+        ):
+            yield json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @router.get("/status")
 async def get_import_status(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -566,6 +562,8 @@ async def get_import_status(
             "max_file_size": MAX_FILE_SIZE,
             "allowed_extensions": ALLOWED_EXTENSIONS,
             "files_in_upload_dir": file_count,
+            # Warteschlange und Durchsatz der Import-Jobs / Fila e vazão dos jobs de importação
+            "import_jobs": await ImportJobService(db).queue_stats(),
             "message": "Import-System ist betriebsbereit / Sistema de importação está operacional" if upload_dir_exists and upload_dir_writable else "Import-System ist nicht verfügbar / Sistema de importação não está disponível"
         }
         
@@ -11,13 +11,17 @@ Statistiken gefiltert nach Rolle und Zugriffsstufe des authentifizierten
 Benutzers zurückgibt.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.security import get_current_user
-from app.models.user import User
+from app.models.user import User, AccessLevel
 from app.services.dashboard_service import DashboardService
+from app.services.stats_rollup_service import StatsRollupService
+from app.services.storage_usage_service import StorageUsageService
 from app.schemas.dashboard import DashboardStats
 
 
@@ -123,3 +127,49 @@ async def get_dashboard_stats(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error fetching dashboard stats / Fehler beim Abrufen der Dashboard-Statistiken: {str(e)}"
         )
+
+
+@router.get("/rollup/check")
+async def check_stats_rollup(
+    repair: bool = Query(False, description="Bei Abweichungen neu aufbauen / Reconstruir em caso de divergência"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Konsistenzprüfung des Statistik-Rollups (contract_stats_rollup)
+    Verificação de consistência do rollup de estatísticas
+
+    Vergleicht die vorberechnete Tabelle mit einem Neuaufbau aus den Live-Daten
+    und baut sie bei ``repair=true`` neu auf. Nur für Level 5+.
+    Compara a tabela pré-calculada com uma reconstrução dos dados atuais. Apenas Level 5+.
+    """
+    if current_user.access_level < AccessLevel.LEVEL_5:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Keine Berechtigung / Sem permissão"
+        )
+    return await StatsRollupService(db).check(repair=repair)
+
+
+@router.get("/storage/history")
+async def get_storage_history(
+    days: int = Query(90, ge=1, le=3650, description="Zeitraum in Tagen / Período em dias"),
+    category: Optional[str] = Query(None, description="blobs, thumbnails oder other / blobs, thumbnails ou other"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Zeitreihe der Speicherbelegung für die Kapazitätsplanung
+    Série temporal do uso de armazenamento para planejamento de capacidade
+
+    Ein Messpunkt je Kategorie und Abgleich (STORAGE_RECONCILE_INTERVAL_SECONDS),
+    dazu der aktuelle Stand. Nur für Level 5+.
+    Um ponto por categoria e reconciliação, mais o estado atual. Apenas Level 5+.
+    """
+    if current_user.access_level < AccessLevel.LEVEL_5:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Keine Berechtigung / Sem permissão"
+        )
+    service = StorageUsageService(db)
+    return {"current": await service.usage(), "history": await service.history(days=days, category=category)}
@@ -17,6 +17,10 @@ from pathlib import Path
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.services.extraction_engine import get_extraction_engine
+from app.services.model_registry import get_model_registry
+from app.services.storage_usage_service import StorageUsageService
+from app.services.document_converter import get_document_converter
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -87,13 +91,14 @@ async def health_check_database(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/storage")
-async def health_check_storage():
+async def health_check_storage(db: AsyncSession = Depends(get_db)):
     """
     Health Check do Sistema de Arquivos / Dateisystem Health Check
     
     Verifica / Überprüft:
     - Diretório de uploads acessível / Upload-Verzeichnis zugänglich
     - Espaço em disco disponível / Verfügbarer Speicherplatz
+    - Belegung je Kategorie aus storage_usage / Uso por categoria de storage_usage
     """
     try:
         upload_dir = Path(settings.UPLOAD_DIR)
@@ -123,6 +128,12 @@ async def health_check_storage():
         elif used_percent > 75:
             status_msg = "WARNING - Disk space low"
         
+        # Gebuchte Zähler statt Verzeichnisdurchlauf / Contadores lançados em vez de varrer o diretório
+        try:
+            usage = await StorageUsageService(db).usage()
+        except Exception as e:
+            usage = {"error": str(e)}
+        
         return {
             "status": status_msg,
             "upload_directory": str(upload_dir),
@@ -132,6 +143,7 @@ async def health_check_storage():
                 "free_gb": round(free_space_gb, 2),
                 "used_percent": round(used_percent, 2)
             },
+            "usage": usage,
             "timestamp": datetime.utcnow().isoformat()
         }
         
@@ -144,6 +156,52 @@ async def health_check_storage():
         )
 
 
+def models_status() -> dict:
+    """
+    Vorladezustand von Modellen und Extraktions-Workern / Estado de pré-carga de modelos e workers
+
+    Bei Extraktion in Worker-Prozessen liegen die Modelle dort; ``warm`` gilt,
+    sobald alle Worker gestartet und initialisiert sind.
+    Com extração em processos worker, os modelos ficam nos workers.
+    """
+    engine = get_extraction_engine()
+    registry = get_model_registry()
+    if engine.workers > 0:
+        warm = engine.warm
+        where = "extraction_workers"
+    else:
+        warm = registry.ready
+        where = "process"
+    return {
+        "status": "OK" if warm else "WARMING",
+        "warm": warm,
+        "loaded_in": where,
+        "extraction_workers": {"workers": engine.workers, "warm": engine.warm, "restarts": engine.restarts,
+                               "render_restarts": engine.render_restarts},
+        "models": registry.status(),
+    }
+
+
+@router.get("/ready")
+async def health_check_ready():
+    """
+    Readiness-Probe / Verificação de prontidão
+
+    503, solange Modelle bzw. Extraktions-Worker noch laden, damit der erste
+    Import nach einem Deployment nicht die Ladezeit trägt.
+    503 enquanto modelos ou workers de extração ainda carregam.
+
+    Use: Kubernetes readiness probe
+    """
+    models = models_status()
+    if settings.MODEL_PRELOAD_ENABLED and not models["warm"]:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Models are still loading / Modelle werden noch geladen"
+        )
+    return {"status": "OK", "models": models, "timestamp": datetime.utcnow().isoformat()}
+
+
 @router.get("/detailed")
 async def health_check_detailed(db: AsyncSession = Depends(get_db)):
     """
@@ -153,6 +211,7 @@ async def health_check_detailed(db: AsyncSession = Depends(get_db)):
     - Sistema / System
     - Banco de dados / Datenbank
     - Armazenamento / Speicher
+    - Modelle vorgeladen / Modelos pré-carregados
     
     Use: Monitoramento completo, troubleshooting
     """
@@ -170,12 +229,18 @@ async def health_check_detailed(db: AsyncSession = Depends(get_db)):
         
         # Storage health
         try:
-            storage_health = await health_check_storage()
+            storage_health = await health_check_storage(db)
             storage_status = "OK"
         except Exception as e:
             storage_health = {"error": str(e)}
             storage_status = "ERROR"
         
+        # Models / Modelle
+        models = models_status()
+
+        # DOCX->PDF (LibreOffice-Pool) / Conversão DOCX->PDF
+        converter = get_document_converter().status()
+
         # Overall status
         overall_status = "OK" if (db_status == "OK" and storage_status == "OK") else "DEGRADED"
         
@@ -191,7 +256,9 @@ async def health_check_detailed(db: AsyncSession = Depends(get_db)):
                 "storage": {
                     "status": storage_status,
                     "details": storage_health
-                }
+                },
+                "models": models,
+                "document_converter": converter
             }
         }
         
@@ -271,6 +271,7 @@ class ContractResponse(ContractBase):
     original_pdf_path: Optional[str] = Field(None, description="Serverinterner Pfad zur Original-PDF")
     original_pdf_filename: Optional[str] = Field(None, description="Original hochgeladene PDF-Datei")
     original_pdf_sha256: Optional[str] = Field(None, description="SHA256 Hash der Original-PDF")
+    original_pdf_verified: bool = Field(False, description="Datei unter original_pdf_path bestätigt / Arquivo confirmado")
     uploaded_at: Optional[datetime] = Field(None, description="Zeitpunkt des Uploads der Original-PDF (UTC)")
     # Novo campo: nome do usuário responsável
     responsible_user_name: Optional[str] = Field(None, description="Name des verantwortlichen Benutzers")
@@ -290,6 +291,13 @@ class ContractResponse(ContractBase):
         return dt.isoformat()
 
 
+# Schema für Suchtreffer (Volltextsuche) / Schema para resultados da busca de texto completo
+class ContractSearchHit(ContractResponse):
+    """Vertrag mit Relevanz und Textausschnitt aus der Volltextsuche"""
+    search_rank: Optional[float] = Field(None, description="Relevanz (BM25, höher = besser) / Relevância (BM25, maior = melhor)")
+    search_snippet: Optional[str] = Field(None, description="HTML-escapter Textausschnitt mit <mark>-Hervorhebung / Trecho escapado em HTML com destaque <mark>")
+
+
 # Schema para resposta de listagem de contratos
 class ContractListResponse(BaseModel):
     total: int
@@ -0,0 +1,55 @@
+"""
+Schemas für Import-Jobs / Schemas para jobs de importação
+
+DE: Antwort von ``POST /contracts/import/jobs`` und ``GET /contracts/import/jobs/{id}``.
+PT: Resposta de ``POST /contracts/import/jobs`` e ``GET /contracts/import/jobs/{id}``.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.models.import_job import ImportJob, ImportJobStage, ImportJobStatus
+from app.schemas.extracted_contract import ExtractionResponse
+
+
+class ImportJobResponse(BaseModel):
+    """
+    Zustand eines Import-Jobs
+    Estado de um job de importação
+    """
+    id: int = Field(..., description="Job-ID / ID do job")
+    status: ImportJobStatus = Field(..., description="Status / Status")
+    stage: ImportJobStage = Field(..., description="Verarbeitungsstufe / Etapa de processamento")
+    progress: int = Field(..., ge=0, le=100, description="Fortschritt in Prozent / Progresso em porcentagem")
+    original_file_name: str = Field(..., description="Original hochgeladene PDF-Datei / Arquivo PDF enviado")
+    file_size: int = Field(..., description="Dateigröße in Bytes / Tamanho do arquivo em bytes")
+    extraction_method: str = Field(..., description="Extraktionsmethode / Método de extração")
+    attempts: int = Field(..., description="Bisherige Versuche / Tentativas até agora")
+    created_at: datetime = Field(..., description="Eingereiht am / Enfileirado em")
+    started_at: Optional[datetime] = Field(None, description="Gestartet am / Iniciado em")
+    finished_at: Optional[datetime] = Field(None, description="Beendet am / Concluído em")
+    error_status_code: Optional[int] = Field(None, description="HTTP-Status des Fehlers / Status HTTP do erro")
+    error_message: Optional[str] = Field(None, description="Fehlermeldung / Mensagem de erro")
+    result: Optional[ExtractionResponse] = Field(None, description="Extraktionsergebnis / Resultado da extração")
+
+    @classmethod
+    def from_job(cls, job: ImportJob) -> "ImportJobResponse":
+        """Erstellt die Antwort aus einem Job / Cria a resposta a partir de um job"""
+        return cls(
+            id=job.id,
+            status=job.status,
+            stage=job.stage,
+            progress=job.progress,
+            original_file_name=job.original_file_name,
+            file_size=job.file_size,
+            extraction_method=job.extraction_method,
+            attempts=job.attempts,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error_status_code=job.error_status_code,
+            error_message=job.error_message,
+            result=ExtractionResponse.model_validate_json(job.result) if job.result else None,
+        )
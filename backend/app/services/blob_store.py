@@ -0,0 +1,296 @@
+"""
+Inhaltsadressierter Blob-Speicher für Original-PDFs - Vertrag MGS
+Armazenamento de blobs endereçado por conteúdo para PDFs originais
+
+DE: PDFs liegen unter ``UPLOAD_DIR/blobs/ab/cd/<sha256>`` (zwei Ebenen
+    Sharding, höchstens 256 Einträge je Verzeichnis). Geschrieben wird über
+    eine temporäre Datei und ``os.replace`` (atomar); identische PDFs werden
+    nur einmal gespeichert. Referenzen sind die Verträge, deren
+    ``original_pdf_path``/``original_pdf_sha256`` auf den Blob zeigen; der
+    Garbage Collector löscht Blobs ohne Referenz nach einer Karenzzeit.
+PT: Os PDFs ficam em ``UPLOAD_DIR/blobs/ab/cd/<sha256>`` (dois níveis de
+    sharding). A gravação usa um arquivo temporário e ``os.replace``
+    (atômico); PDFs idênticos são armazenados uma só vez. As referências são
+    os contratos cujo ``original_pdf_path``/``original_pdf_sha256`` apontam
+    para o blob; o coletor de lixo remove blobs sem referência após um prazo
+    de carência.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.contract import Contract
+from app.models.storage_usage import CATEGORY_BLOBS
+from app.services.storage_usage_service import StorageUsageTracker, get_storage_tracker
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+_TMP_MARKER = ".tmp-"
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 einer Datei in Blöcken / SHA-256 de um arquivo em blocos"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """
+    Dateisystem-Blobs nach SHA-256 (``ab/cd/<hash>``)
+    Blobs no sistema de arquivos por SHA-256 (``ab/cd/<hash>``)
+    """
+
+    def __init__(self, root: str, usage: Optional[StorageUsageTracker] = None) -> None:
+        self.root = root
+        # Meldet neue/gelöschte Blobs an die Speicherbuchhaltung / Informa blobs novos/removidos à contabilidade
+        self.usage = usage
+
+    def _account(self, bytes_delta: int, files_delta: int) -> None:
+        if self.usage is not None:
+            self.usage.record(CATEGORY_BLOBS, bytes_delta, files_delta)
+
+    def path_for(self, sha256: str) -> str:
+        """
+        Pfad eines Blobs / Caminho de um blob
+
+        Raises:
+            ValueError: Kein gültiger SHA-256-Hex-Wert / Não é um SHA-256 hexadecimal válido
+        """
+        sha256 = sha256.lower()
+        if not _SHA256_RE.match(sha256):
+            raise ValueError(f"Ungültiger SHA-256 / SHA-256 inválido: {sha256!r}")
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def contains(self, path: Optional[str]) -> bool:
+        """Liegt ``path`` im Blob-Speicher? / ``path`` está no armazenamento de blobs?"""
+        if not path:
+            return False
+        root = os.path.abspath(self.root)
+        return os.path.commonpath([root, os.path.abspath(path)]) == root
+
+    def exists(self, sha256: str) -> bool:
+        return os.path.isfile(self.path_for(sha256))
+
+    def put(self, source_path: str, sha256: Optional[str] = None) -> str:
+        """
+        Übernimmt eine Datei (verschiebt sie) und liefert den Blob-Pfad. Ist
+        der Inhalt schon vorhanden, wird die Quelle nur gelöscht.
+        Assume um arquivo (movendo-o) e retorna o caminho do blob. Se o
+        conteúdo já existir, a origem é apenas removida.
+
+        Args:
+            source_path: Datei im Staging / Arquivo no staging
+            sha256: Bereits beim Upload berechneter Hash; sonst wird gehasht / Hash já calculado no upload
+        """
+        target = self.path_for(sha256 or file_sha256(source_path))
+        if os.path.isfile(target):
+            # Zeitstempel auffrischen, damit der GC ihn nicht gerade jetzt entfernt
+            # Renovar o timestamp para o GC não removê-lo justamente agora
+            os.utime(target)
+            os.remove(source_path)
+            return target
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temp_path = f"{target}{_TMP_MARKER}{uuid.uuid4().hex}"
+        try:
+            # Gleiches Dateisystem: Umbenennen, sonst Kopie in die Temp-Datei
+            # Mesmo sistema de arquivos: renomear; senão, cópia para o temporário
+            shutil.move(source_path, temp_path)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._account(os.path.getsize(target), 1)
+        return target
+
+    def delete(self, sha256: str) -> bool:
+        path = self.path_for(sha256)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        self._account(-size, -1)
+        return True
+
+    def iter_blobs(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        (Name, Eintrag) aller Dateien der Shards, auch Temp-Dateien.
+        (Nome, entrada) de todos os arquivos dos shards, inclusive temporários.
+        """
+        if not os.path.isdir(self.root):
+            return
+        for first in os.scandir(self.root):
+            if not first.is_dir() or len(first.name) != 2:
+                continue
+            for second in os.scandir(first.path):
+                if not second.is_dir() or len(second.name) != 2:
+                    continue
+                for entry in os.scandir(second.path):
+                    if entry.is_file():
+                        yield entry.name, entry
+
+
+def release_pdf(store: BlobStore, path: Optional[str]) -> None:
+    """
+    Gibt eine ersetzte/gelöschte Original-PDF frei: Blobs können geteilt sein
+    und bleiben dem GC überlassen; Dateien der alten Struktur werden gelöscht.
+    Libera um PDF original substituído/removido: blobs podem ser
+    compartilhados e ficam para o GC; arquivos da estrutura antiga são removidos.
+    """
+    if not path or store.contains(path) or not os.path.exists(path):
+        return
+    try:
+        os.remove(path)
+    except OSError as e:
+        logger.warning(f"Alte PDF nicht entfernt / PDF antigo não removido: {path}: {e}")
+
+
+async def blob_reference_counts(db: AsyncSession) -> Dict[str, int]:
+    """
+    Referenzen je Blob-Hash aus ``contracts`` / Referências por hash de blob a partir de ``contracts``
+    """
+    rows = await db.execute(
+        sa.select(Contract.original_pdf_sha256, sa.func.count())
+        .where(Contract.original_pdf_path.isnot(None), Contract.original_pdf_sha256.isnot(None))
+        .group_by(Contract.original_pdf_sha256)
+    )
+    return {sha256: count for sha256, count in rows.all() if sha256}
+
+
+async def _referenced_blobs(db: AsyncSession, store: BlobStore) -> Set[str]:
+    referenced = set(await blob_reference_counts(db))
+    # Zusätzlich über den Pfad, falls der gespeicherte Hash leer/abweichend ist
+    # Também pelo caminho, caso o hash armazenado esteja vazio/divergente
+    paths = await db.execute(sa.select(Contract.original_pdf_path).where(Contract.original_pdf_path.isnot(None)))
+    referenced.update(os.path.basename(path) for (path,) in paths.all() if store.contains(path))
+    return referenced
+
+
+def _sweep(store: BlobStore, referenced: Set[str], cutoff: float) -> Dict[str, int]:
+    stats = {"scanned": 0, "removed": 0, "removed_bytes": 0, "kept": 0}
+    for name, entry in store.iter_blobs():
+        stats["scanned"] += 1
+        if _TMP_MARKER not in name and name in referenced:
+            stats["kept"] += 1
+            continue
+        try:
+            stat_result = entry.stat()
+            if stat_result.st_mtime > cutoff:
+                stats["kept"] += 1
+                continue
+            os.remove(entry.path)
+        except FileNotFoundError:
+            continue
+        stats["removed"] += 1
+        stats["removed_bytes"] += stat_result.st_size
+    store._account(-stats["removed_bytes"], -stats["removed"])
+    return stats
+
+
+async def collect_garbage(
+    db: AsyncSession,
+    store: Optional[BlobStore] = None,
+    grace_seconds: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Löscht Blobs ohne Referenz und liegengebliebene Temp-Dateien, die älter
+    als die Karenzzeit sind (Uploads vor dem Commit bleiben geschützt).
+    Remove blobs sem referência e temporários abandonados mais antigos que o
+    prazo de carência (uploads antes do commit ficam protegidos).
+
+    Returns:
+        Zähler scanned/removed/removed_bytes/kept / Contadores
+    """
+    store = store or get_blob_store()
+    grace = settings.BLOB_GC_GRACE_SECONDS if grace_seconds is None else grace_seconds
+    referenced = await _referenced_blobs(db, store)
+    # Verzeichnisdurchlauf im Thread, nicht im Event-Loop / Varredura numa thread, fora do event loop
+    stats = await asyncio.to_thread(_sweep, store, referenced, time.time() - grace)
+    if stats["removed"]:
+        logger.info(f"Blob-GC / GC de blobs: {stats}")
+    return stats
+
+
+_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Gemeinsamer Blob-Speicher unter ``UPLOAD_DIR/blobs`` / Armazenamento compartilhado"""
+    global _store
+    if _store is None:
+        _store = BlobStore(os.path.join(settings.UPLOAD_DIR, "blobs"), get_storage_tracker())
+    return _store
+
+
+# ---------- Einmalige Migration / Migração única ----------
+
+def migrate_to_blob_store(connection: sa.engine.Connection, upload_dir: str) -> Dict[str, int]:
+    """
+    Verschiebt die PDFs aus ``persisted/`` (``contract_{id}/original.pdf``,
+    ``contract_{id}.pdf``) in den Blob-Speicher und aktualisiert Pfad und Hash.
+    Move os PDFs de ``persisted/`` para o armazenamento de blobs e atualiza
+    caminho e hash.
+
+    Args:
+        connection: Synchrone Verbindung (z. B. ``op.get_bind()``) / Conexão síncrona
+        upload_dir: ``settings.UPLOAD_DIR``
+    """
+    store = BlobStore(os.path.join(upload_dir, "blobs"))
+    persisted = os.path.abspath(os.path.join(upload_dir, "contracts", "persisted"))
+    contracts = sa.table(
+        "contracts",
+        sa.column("id", sa.Integer),
+        sa.column("original_pdf_path", sa.String),
+        sa.column("original_pdf_sha256", sa.String),
+        sa.column("original_pdf_verified", sa.Boolean),
+    )
+    rows = connection.execute(
+        sa.select(contracts.c.id, contracts.c.original_pdf_path).where(contracts.c.original_pdf_path.isnot(None))
+    ).all()
+    counts = {"moved": 0, "deduplicated": 0, "skipped": 0}
+    # Mehrere Verträge mit derselben Datei / Vários contratos com o mesmo arquivo
+    migrated: Dict[str, Tuple[str, str]] = {}
+
+    for contract_id, path in rows:
+        absolute = os.path.abspath(path)
+        if absolute in migrated:
+            target, sha256 = migrated[absolute]
+        elif absolute.startswith(persisted + os.sep) and os.path.isfile(absolute):
+            # Hash aus dem Inhalt, nicht aus der DB (dort teils leer) / Hash do conteúdo, não do banco (às vezes vazio)
+            sha256 = file_sha256(absolute)
+            counts["deduplicated" if store.exists(sha256) else "moved"] += 1
+            target = store.put(absolute, sha256)
+            migrated[absolute] = (target, sha256)
+        else:
+            counts["skipped"] += 1
+            continue
+        connection.execute(
+            sa.update(contracts).where(contracts.c.id == contract_id)
+            .values(original_pdf_path=target, original_pdf_sha256=sha256, original_pdf_verified=True)
+        )
+        parent = os.path.dirname(absolute)
+        if parent != persisted:
+            try:
+                os.rmdir(parent)
+            except OSError:
+                pass
+
+    logger.info(f"PDFs in den Blob-Speicher migriert / PDFs migrados para blobs: {counts}")
+    return counts
@@ -0,0 +1,500 @@
+"""
+Massenimport Service - Viele PDF-Verträge (ZIP oder Dateiliste) in einem Durchlauf
+Serviço de importação em massa - Muitos contratos PDF (ZIP ou lista) de uma vez
+
+DE: ``unpack_zip`` entpackt PDF-Einträge eines Archivs blockweise (SHA-256 und
+    Größenprüfung je Eintrag, Grenzen für Anzahl und Gesamtgröße).
+    ``BulkImportService.run`` entfernt Duplikate innerhalb des Stapels und
+    gegenüber ``original_pdf_sha256``, holt Ergebnisse aus dem Extraktions-Cache,
+    verteilt die übrigen Dateien parallel auf den Extraktions-Prozesspool und
+    liefert je Datei einen Datensatz (für NDJSON), sobald sie fertig ist. Nach
+    der Extraktion werden Duplikate per ``ocr_text_sha256`` erkannt. Im Modus
+    ``auto_create`` werden alle Entwürfe in einer Transaktion als
+    DRAFT-Verträge angelegt.
+PT: ``unpack_zip`` extrai as entradas PDF de um arquivo em blocos (SHA-256 e
+    verificação de tamanho por entrada, limites de quantidade e tamanho total).
+    ``BulkImportService.run`` remove duplicatas dentro do lote e em relação a
+    ``original_pdf_sha256``, usa o cache de extração, distribui os demais
+    arquivos em paralelo no pool de processos e entrega um registro por arquivo
+    (para NDJSON) assim que ele termina. Após a extração, duplicatas são
+    detectadas por ``ocr_text_sha256``. No modo ``auto_create`` todos os
+    rascunhos são criados como contratos DRAFT em uma única transação.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.contract import Contract, ContractStatus
+from app.schemas.extracted_contract import ExtractedContractDraft
+from app.services.blob_store import get_blob_store
+from app.services.contract_import_service import ContractImportError, ContractImportService, build_extracted_draft
+from app.services.extraction_cache_service import ExtractionCacheService
+from app.services.pdf_reader import PDFReaderService
+from app.utils.upload_stream import UPLOAD_CHUNK_SIZE, UploadTooLargeError
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_CLIENT = "Unbekannt / Desconhecido"
+
+# Datensatz-Status / Status do registro
+STATUS_EXTRACTED = "extracted"
+STATUS_CREATED = "created"
+STATUS_DUPLICATE = "duplicate"
+STATUS_ERROR = "error"
+STATUS_SKIPPED = "skipped"
+
+
+class BulkImportLimitError(ValueError):
+    """Stapel überschreitet Anzahl- oder Größengrenze / Lote excede limite de quantidade ou tamanho"""
+
+
+@dataclass
+class BulkImportItem:
+    """Eine Datei des Stapels / Um arquivo do lote"""
+    file_name: str
+    path: Optional[str] = None
+    sha256: Optional[str] = None
+    size: int = 0
+    source: Optional[str] = None  # Name des ZIP-Archivs / Nome do arquivo ZIP
+    error: Optional[str] = None
+    skipped: bool = False  # keine PDF-Datei / não é um arquivo PDF
+
+
+def _remove_quietly(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _is_ignored_member(name: str) -> bool:
+    # Verzeichnisse und Metadaten von macOS/Office / Diretórios e metadados do macOS/Office
+    parts = Path(name).parts
+    return name.endswith("/") or "__MACOSX" in parts or any(part.startswith(".") for part in parts)
+
+
+def unpack_zip(
+    zip_path: str,
+    target_dir: str,
+    prefix: str,
+    max_member_bytes: Optional[int] = None,
+    max_files: Optional[int] = None,
+    max_total_bytes: Optional[int] = None,
+) -> List[BulkImportItem]:
+    """
+    Entpackt die PDF-Einträge eines ZIP-Archivs blockweise nach ``target_dir``.
+    Extrai as entradas PDF de um arquivo ZIP em blocos para ``target_dir``.
+
+    Die Größen im ZIP-Verzeichnis werden nicht vertraut; gezählt wird beim
+    Entpacken. Zu große oder beschädigte Einträge werden als Fehler gemeldet.
+    Os tamanhos do diretório ZIP não são confiáveis; a contagem ocorre na
+    extração. Entradas grandes demais ou corrompidas são reportadas como erro.
+
+    Raises:
+        BulkImportLimitError: Zu viele Dateien oder Gesamtgröße überschritten
+        zipfile.BadZipFile: Kein gültiges ZIP-Archiv / Arquivo ZIP inválido
+    """
+    member_limit = settings.MAX_FILE_SIZE if max_member_bytes is None else max_member_bytes
+    file_limit = settings.BULK_IMPORT_MAX_FILES if max_files is None else max_files
+    total_limit = settings.BULK_IMPORT_MAX_BYTES if max_total_bytes is None else max_total_bytes
+    source = os.path.basename(zip_path)
+    items: List[BulkImportItem] = []
+    total = 0
+    extracted = 0
+
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            if _is_ignored_member(info.filename):
+                continue
+            file_name = os.path.basename(info.filename)
+            if Path(file_name).suffix.lower() != ".pdf":
+                items.append(BulkImportItem(
+                    file_name=file_name, source=source, error="Keine PDF-Datei / Não é um arquivo PDF", skipped=True
+                ))
+                continue
+            if extracted >= file_limit:
+                raise BulkImportLimitError(f"Zu viele Dateien / Arquivos demais (max. {file_limit})")
+
+            target_path = os.path.join(target_dir, f"{prefix}_{uuid.uuid4().hex[:12]}_{file_name}")
+            digest = hashlib.sha256()
+            size = 0
+            try:
+                with archive.open(info) as member, open(target_path, "wb") as out:
+                    while True:
+                        chunk = member.read(UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        if size > member_limit:
+                            raise UploadTooLargeError(member_limit)
+                        if total + size > total_limit:
+                            raise BulkImportLimitError(f"Archiv zu groß / Arquivo grande demais (max. {total_limit} Bytes)")
+                        digest.update(chunk)
+                        out.write(chunk)
+            except BulkImportLimitError:
+                _remove_quietly(target_path)
+                raise
+            except (UploadTooLargeError, zipfile.BadZipFile, zipfile.LargeZipFile, RuntimeError, OSError) as e:
+                # Einzelner Eintrag defekt/verschlüsselt/zu groß / Entrada corrompida/criptografada/grande demais
+                _remove_quietly(target_path)
+                items.append(BulkImportItem(file_name=file_name, source=source, error=str(e)))
+                continue
+
+            total += size
+            extracted += 1
+            items.append(BulkImportItem(
+                file_name=file_name, path=target_path, sha256=digest.hexdigest(), size=size, source=source
+            ))
+    return items
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _parse_decimal(value: Any) -> Optional[Decimal]:
+    if value in (None, ""):
+        return None
+    try:
+        return Decimal(str(value)).quantize(Decimal("0.01"))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _clip(value: Optional[str], length: int) -> Optional[str]:
+    return value[:length] if value else value
+
+
+def contract_from_draft(
+    draft: ExtractedContractDraft,
+    item: BulkImportItem,
+    ocr_hash: str,
+    created_by: int,
+) -> Contract:
+    """
+    Erstellt einen DRAFT-Vertrag aus einem Entwurf; Pflichtfelder erhalten Platzhalter.
+    Cria um contrato DRAFT a partir de um rascunho; campos obrigatórios recebem valores padrão.
+    """
+    currency = (draft.currency or "EUR").upper()
+    start_date = _parse_date(draft.start_date) or date.today()
+    end_date = _parse_date(draft.end_date)
+    if end_date is not None and end_date <= start_date:
+        # Gleiche Regel wie ContractService.create_contract / Mesma regra de ContractService.create_contract
+        end_date = None
+    return Contract(
+        title=_clip(draft.title, 200) or _clip(Path(item.file_name).stem, 200),
+        description=draft.description,
+        status=ContractStatus.DRAFT,
+        value=_parse_decimal(draft.value),
+        currency=currency[:3] if len(currency) >= 3 else "EUR",
+        start_date=start_date,
+        end_date=end_date,
+        renewal_date=_parse_date(draft.renewal_date),
+        client_name=_clip(draft.client_name, 200) or UNKNOWN_CLIENT,
+        client_address=_clip(draft.client_address, 300),
+        client_email=_clip(draft.client_email, 100),
+        client_phone=_clip(draft.client_phone, 20),
+        terms_and_conditions=draft.terms_and_conditions,
+        created_by=created_by,
+        original_pdf_filename=_clip(item.file_name, 255),
+        original_pdf_sha256=item.sha256,
+        ocr_text=draft.raw_text,
+        ocr_text_sha256=ocr_hash,
+        uploaded_at=datetime.now(timezone.utc),
+    )
+
+
+class BulkImportService:
+    """
+    Serviço de importação em massa de contratos PDF
+    Dienst für den Massenimport von PDF-Verträgen
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        concurrency: Optional[int] = None,
+        import_service: Optional[ContractImportService] = None,
+        persist_file: Optional[Callable[[str, Optional[str]], str]] = None,
+        on_created: Optional[Callable[[Contract], Any]] = None,
+    ):
+        """
+        Initialisiert den Dienst mit einer Datenbanksitzung.
+        Inicializa o serviço com uma sessão de banco de dados.
+
+        Args:
+            concurrency: Parallele Extraktionen (Standard: Größe des Prozesspools)
+            import_service: Pipeline ohne DB für die parallelen Extraktionen
+            persist_file: Verschiebt die PDF eines angelegten Vertrags (Pfad, SHA256) -> neuer Pfad
+            on_created: Wird nach dem Commit je angelegtem Vertrag aufgerufen (z. B. Vorschaubilder)
+        """
+        self.db = db
+        configured = settings.BULK_IMPORT_CONCURRENCY if concurrency is None else concurrency
+        self.concurrency = max(1, configured or settings.EXTRACTION_WORKERS)
+        # Ohne Sitzung: parallele Tasks dürfen die Sitzung nicht teilen / Sem sessão: tarefas paralelas não podem compartilhá-la
+        self.import_service = import_service or ContractImportService(None, reader=PDFReaderService())
+        self.persist_file = persist_file
+        self.on_created = on_created
+
+    @staticmethod
+    def _record(item: BulkImportItem, status: str, **fields: Any) -> Dict[str, Any]:
+        record = {
+            "type": "file",
+            "file_name": item.file_name,
+            "source": item.source,
+            "status": status,
+            "file_sha256": item.sha256,
+            "file_size": item.size,
+        }
+        record.update(fields)
+        return record
+
+    async def _existing_file_hashes(self, hashes: List[str]) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        for start in range(0, len(hashes), 500):
+            rows = await self.db.execute(
+                select(Contract.original_pdf_sha256, Contract.id)
+                .where(Contract.original_pdf_sha256.in_(hashes[start:start + 500]))
+            )
+            for file_hash, contract_id in rows.all():
+                found.setdefault(file_hash, contract_id)
+        return found
+
+    async def _extract(
+        self, item: BulkImportItem, method: str, semaphore: asyncio.Semaphore
+    ) -> Tuple[BulkImportItem, Optional[Dict[str, Any]], Optional[str]]:
+        """Validiert und extrahiert eine Datei; Fehler werden zurückgegeben / Erros são retornados"""
+        async with semaphore:
+            try:
+                validation = await asyncio.to_thread(self.import_service.reader.validate_pdf, item.path)
+                if not validation.get("valid"):
+                    raise ContractImportError(
+                        f"Ungültige PDF-Datei / Arquivo PDF inválido: {validation.get('error', 'Unbekannter Fehler')}"
+                    )
+                return item, await self.import_service.extract(item.path, method), None
+            except ContractImportError as e:
+                return item, None, str(e)
+            except Exception as e:
+                logger.error(f"Bulk import failed for {item.file_name} / Falha na importação em massa: {e}")
+                return item, None, f"Interner Serverfehler / Erro interno do servidor: {e}"
+
+    async def run(
+        self,
+        items: List[BulkImportItem],
+        extraction_method: str = "combined",
+        auto_create: bool = False,
+        created_by: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Verarbeitet den Stapel und liefert je Datei einen Datensatz, zuletzt eine Zusammenfassung.
+        Processa o lote e entrega um registro por arquivo e, por fim, um resumo.
+
+        Im Modus ``auto_create`` folgen die Datensätze erst nach dem Commit.
+        No modo ``auto_create`` os registros vêm somente após o commit.
+        """
+        started = time.time()
+        counts = {s: 0 for s in (STATUS_EXTRACTED, STATUS_CREATED, STATUS_DUPLICATE, STATUS_ERROR, STATUS_SKIPPED)}
+        pending: List[Tuple[BulkImportItem, ExtractedContractDraft, str, Dict[str, Any]]] = []
+
+        def emit(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+            if auto_create and record["status"] == STATUS_EXTRACTED:
+                # Ausgabe und Zählung erst nach dem Commit / Saída e contagem somente após o commit
+                return []
+            counts[record["status"]] += 1
+            return [record]
+
+        # 1. Duplikate per Datei-Hash (Stapel und Datenbank) / Duplicatas por hash do arquivo (lote e banco)
+        seen: Dict[str, BulkImportItem] = {}
+        candidates: List[BulkImportItem] = []
+        for item in items:
+            if item.error or not item.path:
+                status = STATUS_SKIPPED if item.skipped else STATUS_ERROR
+                for record in emit(self._record(item, status, error=item.error)):
+                    yield record
+                continue
+            first = seen.get(item.sha256)
+            if first is not None:
+                _remove_quietly(item.path)
+                for record in emit(self._record(item, STATUS_DUPLICATE, duplicate_of={"file_name": first.file_name})):
+                    yield record
+                continue
+            seen[item.sha256] = item
+            candidates.append(item)
+
+        existing = await self._existing_file_hashes([item.sha256 for item in candidates])
+        remaining: List[BulkImportItem] = []
+        for item in candidates:
+            if item.sha256 in existing:
+                _remove_quietly(item.path)
+                for record in emit(self._record(item, STATUS_DUPLICATE, duplicate_of={"contract_id": existing[item.sha256]})):
+                    yield record
+            else:
+                remaining.append(item)
+
+        # 2. Cache-Treffer sofort, Rest parallel im Prozesspool / Acertos no cache já, o resto em paralelo no pool
+        cache = ExtractionCacheService(self.db) if settings.EXTRACTION_CACHE_ENABLED else None
+        ready: List[Tuple[BulkImportItem, Dict[str, Any]]] = []
+        to_extract: List[BulkImportItem] = []
+        for item in remaining:
+            cached = await cache.get(item.sha256, extraction_method) if cache is not None else None
+            if cached is not None:
+                ready.append((item, cached))
+            else:
+                to_extract.append(item)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self._extract(item, extraction_method, semaphore)) for item in to_extract]
+        ocr_seen: Dict[str, BulkImportItem] = {}
+
+        async def finish(item: BulkImportItem, result: Dict[str, Any], from_cache: bool) -> Dict[str, Any]:
+            extraction = result.get("extraction") or {}
+            if not extraction.get("success"):
+                _remove_quietly(item.path)
+                return self._record(item, STATUS_ERROR, error=f"Textextraktion fehlgeschlagen / Extração de texto falhou: {extraction.get('error', 'Unbekannter Fehler')}")
+            if cache is not None and not from_cache:
+                await cache.put(item.sha256, extraction_method, result)
+
+            normalized = " ".join((extraction.get("text") or "").lower().split())
+            ocr_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+            first = ocr_seen.get(ocr_hash)
+            if first is not None:
+                _remove_quietly(item.path)
+                return self._record(item, STATUS_DUPLICATE, ocr_text_sha256=ocr_hash, duplicate_of={"file_name": first.file_name})
+            duplicate = (await self.db.execute(
+                select(Contract.id).where(Contract.ocr_text_sha256 == ocr_hash)
+            )).scalars().first()
+            if duplicate is not None:
+                _remove_quietly(item.path)
+                return self._record(item, STATUS_DUPLICATE, ocr_text_sha256=ocr_hash, duplicate_of={"contract_id": duplicate})
+            ocr_seen[ocr_hash] = item
+
+            draft = build_extracted_draft(extraction, result.get("intelligent_data") or {}, extraction_method)
+            record = self._record(
+                item,
+                STATUS_EXTRACTED,
+                ocr_text_sha256=ocr_hash,
+                temp_file_path=item.path,
+                draft=draft.model_dump(mode="json"),
+            )
+            pending.append((item, draft, ocr_hash, record))
+            return record
+
+        try:
+            for item, result in ready:
+                for record in emit(await finish(item, result, from_cache=True)):
+                    yield record
+            # Ausgabe in Fertigstellungsreihenfolge / Saída na ordem de conclusão
+            for future in asyncio.as_completed(tasks):
+                item, result, error = await future
+                if error is not None:
+                    _remove_quietly(item.path)
+                    record = self._record(item, STATUS_ERROR, error=error)
+                else:
+                    record = await finish(item, result, from_cache=False)
+                for record in emit(record):
+                    yield record
+        finally:
+            # Abbruch (z. B. Client getrennt): offene Dateien entfernen / Cancelamento: remover arquivos pendentes
+            for task, item in zip(tasks, to_extract):
+                if not task.done():
+                    task.cancel()
+                    _remove_quietly(item.path)
+
+        # 3. Optional: alle Entwürfe in einer Transaktion anlegen / Opcional: criar todos os rascunhos em uma transação
+        if auto_create and pending:
+            for record in await self._create_contracts(pending, created_by):
+                counts[record["status"]] += 1
+                yield record
+
+        yield {
+            "type": "summary",
+            "total": len(items),
+            **counts,
+            "processing_time": round(time.time() - started, 3),
+        }
+
+    async def _create_contracts(
+        self,
+        pending: List[Tuple[BulkImportItem, ExtractedContractDraft, str, Dict[str, Any]]],
+        created_by: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """
+        Legt alle Entwürfe in einer Transaktion als DRAFT-Verträge an.
+        Cria todos os rascunhos como contratos DRAFT em uma única transação.
+
+        Schlägt der Commit fehl, wird nichts angelegt und die Dateien bleiben
+        im temporären Ordner (Status ``extracted`` mit Fehlermeldung).
+        Se o commit falhar, nada é criado e os arquivos permanecem na pasta
+        temporária (status ``extracted`` com mensagem de erro).
+        """
+        contracts = [contract_from_draft(draft, item, ocr_hash, created_by) for item, draft, ocr_hash, _ in pending]
+        moved: List[Tuple[str, str]] = []
+        try:
+            self.db.add_all(contracts)
+            await self.db.flush()
+            for contract, (item, _, _, _) in zip(contracts, pending):
+                if self.persist_file is not None:
+                    target = self.persist_file(item.path, item.sha256)
+                    moved.append((target, item.path))
+                    contract.original_pdf_path = target
+                else:
+                    contract.original_pdf_path = item.path
+                contract.original_pdf_verified = os.path.isfile(contract.original_pdf_path)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            blob_store = get_blob_store()
+            for target, original in moved:
+                try:
+                    # Produktiv landet jede Datei im Blob-Speicher; Blobs können geteilt sein:
+                    # zurückkopieren, den Rest erledigt der Blob-GC
+                    # Em produção todo arquivo vai para o armazenamento de blobs; blobs podem ser
+                    # compartilhados: copiar de volta, o GC de blobs cuida do resto
+                    if blob_store.contains(target):
+                        shutil.copy2(target, original)
+                    else:
+                        # Nur eigene persist_file-Callbacks außerhalb des Blob-Speichers (z. B. Tests)
+                        # Só callbacks persist_file próprios fora do armazenamento de blobs (ex.: testes)
+                        shutil.move(target, original)
+                except OSError:
+                    logger.warning(f"Datei konnte nicht zurückverschoben werden / Arquivo não pôde ser movido de volta: {target}")
+            logger.error(f"Bulk auto-create failed / Falha na criação em massa: {e}")
+            error = f"Verträge konnten nicht angelegt werden / Não foi possível criar os contratos: {e}"
+            return [dict(record, error=error) for _, _, _, record in pending]
+
+        logger.info(f"Bulk import created {len(contracts)} draft contracts / Contratos DRAFT criados: {len(contracts)}")
+        if self.on_created is not None:
+            for contract in contracts:
+                self.on_created(contract)
+        records = []
+        for contract, (_, _, _, record) in zip(contracts, pending):
+            records.append(dict(
+                record,
+                status=STATUS_CREATED,
+                contract_id=contract.id,
+                temp_file_path=None,
+                original_pdf_path=contract.original_pdf_path,
+            ))
+        return records
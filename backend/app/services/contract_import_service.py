@@ -0,0 +1,271 @@
+"""
+Vertragsimport Service - PDF-Import von der gespeicherten Datei bis zum Entwurf
+Serviço de importação de contratos - Importação de PDF do arquivo gravado ao rascunho
+
+DE: ``ContractImportService.process_pdf`` führt die Schritte des PDF-Imports aus
+    (Validierung, Extraktion im Prozesspool bzw. aus dem Cache, Duplikatprüfung,
+    Aufbau des ``ExtractedContractDraft``). Der synchrone Endpunkt
+    ``/contracts/import/pdf`` und die Import-Jobs nutzen dieselbe Pipeline; über
+    ``on_stage`` werden Stufenwechsel gemeldet. Fehler werden als
+    ``ContractImportError`` mit passendem HTTP-Statuscode ausgelöst.
+PT: ``ContractImportService.process_pdf`` executa as etapas da importação de PDF
+    (validação, extração no pool de processos ou do cache, verificação de
+    duplicatas, montagem do ``ExtractedContractDraft``). O endpoint síncrono e os
+    jobs de importação usam o mesmo pipeline; ``on_stage`` informa as mudanças de
+    etapa. Erros são lançados como ``ContractImportError`` com o código HTTP adequado.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.contract import Contract
+from app.models.import_job import ImportJobStage
+from app.schemas.extracted_contract import ConfidenceLevel, ExtractedContractDraft, ExtractionResponse
+from app.services.extraction_cache_service import ExtractionCacheService
+from app.services.extraction_engine import ExtractionError, ExtractionTimeoutError, get_extraction_engine
+from app.services.pdf_reader import PDFReaderService
+
+logger = logging.getLogger(__name__)
+
+StageCallback = Callable[[ImportJobStage], Awaitable[None]]
+
+
+class ContractImportError(ValueError):
+    """Import fehlgeschlagen, mit HTTP-Statuscode / Importação falhou, com código HTTP"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+
+
+def build_extracted_draft(
+    extraction_result: Dict[str, Any],
+    intelligent_data: Dict[str, Any],
+    extraction_method: str,
+) -> ExtractedContractDraft:
+    """
+    Erstellt den Vertragsentwurf aus Extraktionstext und intelligenten Daten.
+    Cria o rascunho do contrato a partir do texto extraído e dos dados inteligentes.
+    """
+    money_values = intelligent_data.get('money_values') or {}
+    dates = intelligent_data.get('dates') or {}
+    return ExtractedContractDraft(
+        extraction_method=extraction_method,
+        raw_text=extraction_result.get('text', ''),
+        pdf_metadata=extraction_result.get('metadata', {}),
+        title=intelligent_data.get('title'),
+        title_confidence=0.8 if intelligent_data.get('title') else 0.0,
+        client_name=intelligent_data.get('client_name'),
+        client_name_confidence=0.7 if intelligent_data.get('client_name') else 0.0,
+        client_email=intelligent_data.get('client_email'),
+        client_email_confidence=0.9 if intelligent_data.get('client_email') else 0.0,
+        client_phone=intelligent_data.get('client_phone'),
+        client_phone_confidence=0.8 if intelligent_data.get('client_phone') else 0.0,
+        client_address=intelligent_data.get('client_address'),
+        client_address_confidence=0.7 if intelligent_data.get('client_address') else 0.0,
+        value=money_values.get('value'),
+        value_confidence=money_values.get('confidence', 0.0),
+        currency=money_values.get('currency'),
+        currency_confidence=0.9 if money_values.get('currency') else 0.0,
+        start_date=dates.get('start_date'),
+        start_date_confidence=0.7 if dates.get('start_date') else 0.0,
+        end_date=dates.get('end_date'),
+        end_date_confidence=0.7 if dates.get('end_date') else 0.0,
+        renewal_date=dates.get('renewal_date'),
+        renewal_date_confidence=0.7 if dates.get('renewal_date') else 0.0,
+        terms_and_conditions=intelligent_data.get('terms_and_conditions'),
+        terms_and_conditions_confidence=0.6 if intelligent_data.get('terms_and_conditions') else 0.0,
+        description=intelligent_data.get('description'),
+        description_confidence=0.4 if intelligent_data.get('description') else 0.0,
+        raw_text_confidence=0.7,
+        client_document=None,
+        client_document_confidence=0.0,
+        notes=None,
+        notes_confidence=0.0,
+        overall_confidence=0.0,
+        confidence_level=ConfidenceLevel.UNKNOWN,
+    )
+
+
+class ContractImportService:
+    """
+    Serviço de importação de contratos a partir de PDF
+    Dienst für den Vertragsimport aus PDF
+    """
+
+    def __init__(self, db: Optional[AsyncSession], reader: Optional[PDFReaderService] = None):
+        """
+        Initialisiert den Dienst mit einer Datenbanksitzung.
+        Inicializa o serviço com uma sessão de banco de dados.
+        """
+        self.db = db
+        self.reader = reader or PDFReaderService()
+
+    async def extract(
+        self, pdf_path: str, extraction_method: str, file_hash: Optional[str] = None, include_ocr: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Liefert das Extraktionsergebnis aus dem Cache oder aus dem Prozesspool.
+        Retorna o resultado da extração do cache ou do pool de processos.
+
+        Ohne OCR wird das Ergebnis unter einem eigenen Cache-Schlüssel abgelegt.
+        Sem OCR o resultado é guardado sob uma chave de cache própria.
+
+        Returns:
+            dict: ``extraction`` und ``intelligent_data``
+
+        Raises:
+            ContractImportError: 504 bei Zeitüberschreitung, sonst 500 (Datei wird entfernt)
+        """
+        cache = (
+            ExtractionCacheService(self.db)
+            if self.db is not None and file_hash and settings.EXTRACTION_CACHE_ENABLED
+            else None
+        )
+        cache_method = extraction_method if include_ocr else f"{extraction_method}:no-ocr"
+        if cache is not None:
+            cached = await cache.get(file_hash, cache_method)
+            if cached is not None:
+                return cached
+
+        try:
+            result = await get_extraction_engine().extract(pdf_path, extraction_method, ocr=include_ocr)
+        except ExtractionError as e:
+            _remove_quietly(pdf_path)
+            if isinstance(e, ExtractionTimeoutError):
+                raise ContractImportError(
+                    f"Textextraktion Zeitüberschreitung / Extração de texto excedeu o tempo limite: {e}",
+                    status_code=504,
+                )
+            raise ContractImportError(f"Textextraktion fehlgeschlagen / Extração de texto falhou: {e}", status_code=500)
+
+        if cache is not None:
+            await cache.put(file_hash, cache_method, result)
+        return result
+
+    async def find_duplicate(self, file_hash: str, ocr_hash: str) -> Optional[str]:
+        """
+        Sucht einen Vertrag mit gleichem Datei- oder Text-Hash.
+        Procura um contrato com o mesmo hash de arquivo ou de texto.
+
+        Returns:
+            Optional[str]: Fehlermeldung bei Duplikat / Mensagem de erro em caso de duplicata
+        """
+        existing = (await self.db.execute(
+            select(Contract.id).where(Contract.original_pdf_sha256 == file_hash)
+        )).scalars().first()
+        if existing is not None:
+            return f"Duplikat: dieselbe Datei ist bereits im System (contract_id={existing})"
+
+        existing = (await self.db.execute(
+            select(Contract.id).where(Contract.ocr_text_sha256 == ocr_hash)
+        )).scalars().first()
+        if existing is not None:
+            return f"Duplikat: derselbe Vertragsinhalt wurde bereits hochgeladen (contract_id={existing})"
+        return None
+
+    async def process_pdf(
+        self,
+        *,
+        pdf_path: str,
+        original_file_name: str,
+        storage_name: str,
+        file_hash: str,
+        file_size: int,
+        extraction_method: str = "combined",
+        include_ocr: bool = True,
+        started_at: Optional[float] = None,
+        on_stage: Optional[StageCallback] = None,
+    ) -> ExtractionResponse:
+        """
+        Verarbeitet eine gespeicherte PDF-Datei zum Extraktionsergebnis.
+        Processa um arquivo PDF gravado até o resultado da extração.
+
+        Bei Fehlern wird die Datei entfernt; im Erfolgsfall bleibt sie für die
+        spätere Vertragsanlage liegen (``temp_file_path``).
+        Em caso de erro o arquivo é removido; em caso de sucesso ele permanece
+        para a criação posterior do contrato (``temp_file_path``).
+
+        Raises:
+            ContractImportError: Ungültige PDF (400), Duplikat (400), Extraktion (500/504)
+        """
+        start_time = started_at if started_at is not None else time.time()
+
+        async def stage(value: ImportJobStage) -> None:
+            if on_stage is not None:
+                await on_stage(value)
+
+        # PDF validieren / Validar PDF
+        await stage(ImportJobStage.VALIDATING)
+        validation_result = await asyncio.to_thread(self.reader.validate_pdf, pdf_path)
+        if not validation_result.get('valid'):
+            _remove_quietly(pdf_path)
+            raise ContractImportError(
+                f"Ungültige PDF-Datei / Arquivo PDF inválido: {validation_result.get('error', 'Unbekannter Fehler')}"
+            )
+
+        # Text + intelligente Extraktion im Prozesspool (CPU-bound, hält den GIL)
+        # Texto + extração inteligente no pool de processos (CPU-bound, segura o GIL)
+        await stage(ImportJobStage.EXTRACTING)
+        engine_result = await self.extract(pdf_path, extraction_method, file_hash, include_ocr)
+        extraction_result = engine_result['extraction']
+        if not extraction_result.get('success'):
+            _remove_quietly(pdf_path)
+            raise ContractImportError(
+                f"Textextraktion fehlgeschlagen / Extração de texto falhou: {extraction_result.get('error', 'Unbekannter Fehler')}",
+                status_code=500,
+            )
+        intelligent_data = engine_result['intelligent_data']
+
+        # SHA256 des normalisierten Texts und Duplikatprüfung (exakt)
+        # SHA256 do texto normalizado e verificação de duplicatas (exata)
+        await stage(ImportJobStage.DUPLICATE_CHECK)
+        ocr_text_raw = extraction_result.get('text', '') or ''
+        normalized_text = " ".join(ocr_text_raw.lower().split())
+        ocr_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+        try:
+            duplicate = await self.find_duplicate(file_hash, ocr_hash)
+        except Exception as e:
+            # Bei DB-Fehlern nicht automatisch ablehnen – loggen und weiter (vorsichtig)
+            logger.warning(f"Warnung während Duplikatprüfung: {e}")
+            duplicate = None
+        if duplicate:
+            _remove_quietly(pdf_path)
+            raise ContractImportError(duplicate)
+
+        await stage(ImportJobStage.ANALYZING)
+        extracted_data = build_extracted_draft(extraction_result, intelligent_data, extraction_method)
+
+        processing_time = time.time() - start_time
+        logger.info(f"PDF-Import erfolgreich / Importação de PDF bem-sucedida: {processing_time:.2f}s")
+
+        return ExtractionResponse(
+            success=True,
+            extracted_data=extracted_data,
+            processing_time=processing_time,
+            file_size=file_size,
+            error_message=None,
+            # Metadados do arquivo temporário (será movido após criação do contrato)
+            original_file_name=original_file_name,
+            original_file_storage_name=storage_name,
+            original_file_sha256=file_hash,
+            ocr_text_sha256=ocr_hash,
+            uploaded_at=datetime.now(timezone.utc),
+            temp_file_path=pdf_path,  # Caminho temporário para movimentação posterior
+        )
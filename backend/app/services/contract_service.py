@@ -8,17 +8,20 @@ from datetime import date, datetime, timedelta
 from datetime import timezone
 from typing import List, Optional, Dict, Any, cast
 from decimal import Decimal
+import html
+import re
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, or_, desc, asc, select, and_
+from sqlalchemy import func, or_, desc, asc, select, and_, text, Integer
 #schemas models
 from ..models.contract import Contract, ContractStatus, ContractType
+from ..models.contract_fts import FTS_TABLE_NAME
 from ..models.user import User
 from ..schemas.contract import (
     ContractCreate, 
     ContractUpdate, 
     ContractResponse,  
-    ContractInDB
-
+    ContractInDB,
+    ContractSearchHit,
 )
 from ..models.rent_step import RentStep
 from ..schemas.contract import (
@@ -27,6 +30,59 @@ from ..schemas.contract import (
     RentStepResponse,
 )
 from sqlalchemy.exc import IntegrityError
+from .pdf_storage_index import get_pdf_storage_index
+from .thumbnail_service import get_thumbnail_service
+
+# Wörter der Benutzereingabe für FTS5 / Palavras da entrada do usuário para FTS5
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Spaltengewichte für bm25(): title, description, client_name, company_name, notes, ocr_text
+# Pesos das colunas para bm25()
+_FTS_BM25_WEIGHTS = "10.0, 2.0, 5.0, 5.0, 1.0, 1.0"
+
+# Platzhalter für snippet(); <mark> erst nach dem Escapen einsetzen
+# Marcadores para snippet(); <mark> só é inserido depois do escape
+_SNIPPET_OPEN = "\x02"
+_SNIPPET_CLOSE = "\x03"
+
+
+def build_fts_match_query(search: str) -> Optional[str]:
+    """
+    Wandelt freie Benutzereingabe in eine sichere FTS5-MATCH-Abfrage um.
+    Converte a entrada livre do usuário em uma consulta FTS5 MATCH segura.
+
+    Jedes Wort wird als Phrase mit Präfixsuche quotiert (``"miet"*``), alle Wörter
+    müssen vorkommen. Operatoren/Sonderzeichen der Eingabe werden so neutralisiert.
+    Cada palavra vira uma frase com busca por prefixo; todas devem ocorrer.
+
+    Returns / Retorna:
+        Optional[str]: MATCH-Ausdruck oder None bei leerer Eingabe / expressão MATCH ou None
+    """
+    tokens = _FTS_TOKEN_RE.findall(search or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def render_search_snippet(raw: Optional[str]) -> Optional[str]:
+    """
+    Escapt den Vertragstext des Ausschnitts und setzt danach die <mark>-Tags.
+    Escapa o texto do contrato no trecho e só depois insere as tags <mark>.
+    """
+    if raw is None:
+        return None
+    escaped = html.escape(raw, quote=True)
+    return escaped.replace(_SNIPPET_OPEN, "<mark>").replace(_SNIPPET_CLOSE, "</mark>")
+
+
+def _ilike_search_filter(search: str):
+    """ILIKE-Fallback ohne Volltextindex / Fallback ILIKE sem índice de texto completo"""
+    return or_(
+        Contract.title.ilike(f"%{search}%"),
+        Contract.description.ilike(f"%{search}%"),
+        Contract.client_name.ilike(f"%{search}%")
+    )
+
 
 class ContractService:
     """
@@ -131,6 +187,7 @@ class ContractService:
 
         # Metadaten aktualisieren / Atualizar metadados
         contract.original_pdf_path = file_path
+        contract.original_pdf_verified = True
         contract.original_pdf_filename = filename
         contract.original_pdf_sha256 = file_sha256 or ""
         contract.ocr_text = ocr_text or ""
@@ -140,6 +197,10 @@ class ContractService:
         try:
             await self.db.commit()
             await self.db.refresh(contract)
+            # Ersetzte Datei: Index direkt auf den neuen Pfad setzen / Arquivo substituído: índice aponta para o novo caminho
+            get_pdf_storage_index().remember(contract_id, file_path)
+            # Vorschaubilder im Hintergrund / Miniaturas em segundo plano
+            get_thumbnail_service().schedule_pregeneration(file_path, file_sha256)
             return ContractResponse.model_validate(contract)
         except Exception as e:
             await self.db.rollback()
@@ -259,13 +320,9 @@ class ContractService:
                 if hasattr(Contract, attr) and value is not None:
                     query = query.where(getattr(Contract, attr) == value)
         
-         # Search anwenden / Aplicar busca
-        if search:
-            search_filter = or_(
-                Contract.title.ilike(f"%{search}%"),
-                Contract.description.ilike(f"%{search}%"),
-                Contract.client_name.ilike(f"%{search}%")
-            )
+         # Search anwenden (FTS5 wenn verfügbar, sonst ILIKE) / Aplicar busca (FTS5 se disponível, senão ILIKE)
+        search_filter = await self._build_search_filter(search) if search else None
+        if search_filter is not None:
             query = query.where(search_filter)
         
 
@@ -276,12 +333,7 @@ class ContractService:
                 if hasattr(Contract, attr) and value is not None:
                     count_query = count_query.where(getattr(Contract, attr) == value)
         # Search filter also apply to count / Aplicar filtro de busca também na contagem
-        if search:
-            search_filter = or_(
-                Contract.title.ilike(f"%{search}%"),
-                Contract.description.ilike(f"%{search}%"),
-                Contract.client_name.ilike(f"%{search}%")
-            )
+        if search_filter is not None:
             count_query = count_query.where(search_filter)
 
         total_result = await self.db.execute(count_query)
@@ -344,6 +396,8 @@ class ContractService:
             return False
         await self.db.delete(db_contract)
         await self.db.commit()
+        # SQLite vergibt die ID erneut / SQLite reutiliza o ID
+        get_pdf_storage_index().invalidate(contract_id)
         return True 
 
     async def get_contract_stats(self) -> dict:
@@ -469,9 +523,13 @@ class ContractService:
         await self.db.commit()
         return True
 
-    async def search_contracts(self, query: str, skip: int = 0, limit: int = 10) -> list:
+    async def search_contracts(self, query: str, skip: int = 0, limit: int = 10) -> List[ContractSearchHit]:
         """
         Verträge suchen / Buscar contratos
+
+        Nutzt den FTS5-Index (BM25-Ranking, snippet()-Hervorhebung) und fällt ohne
+        Index (z.B. MySQL) auf ILIKE über Titel, Beschreibung und Kunde zurück.
+        Usa o índice FTS5 (ranking BM25, destaque via snippet()) e volta para ILIKE sem índice.
         
         Args / Argumentos:
             query (str): Suchbegriff / Termo de busca
@@ -479,25 +537,89 @@ class ContractService:
             limit (int): Maximale Anzahl / Número máximo
             
         Returns / Retorna:
-            ContractListResponse: Suchergebnisse / Resultados da busca
+            List[ContractSearchHit]: Suchergebnisse nach Relevanz / Resultados por relevância
         """
-        search_filter = or_(
-            Contract.title.ilike(f"%{query}%"),
-            Contract.description.ilike(f"%{query}%"),
-            Contract.client_name.ilike(f"%{query}%")
+        skip = max(0, int(skip or 0))
+        limit = min(max(1, int(limit or 10)), 100)
+
+        if await self._fts_available():
+            match_query = build_fts_match_query(query)
+            if match_query is None:
+                return []
+            hits_result = await self.db.execute(
+                text(
+                    f"SELECT rowid, bm25({FTS_TABLE_NAME}, {_FTS_BM25_WEIGHTS}) AS rank, "
+                    f"snippet({FTS_TABLE_NAME}, -1, :mark_open, :mark_close, '…', 12) AS snippet "
+                    f"FROM {FTS_TABLE_NAME} WHERE {FTS_TABLE_NAME} MATCH :match_query "
+                    f"ORDER BY rank LIMIT :limit OFFSET :skip"
+                ),
+                {"match_query": match_query, "limit": limit, "skip": skip,
+                 "mark_open": _SNIPPET_OPEN, "mark_close": _SNIPPET_CLOSE},
+            )
+            hits = hits_result.all()
+            if not hits:
+                return []
+
+            contracts_result = await self.db.execute(
+                select(Contract).where(Contract.id.in_([hit.rowid for hit in hits]))
+            )
+            contracts_by_id = {c.id: c for c in contracts_result.scalars().all()}
+
+            # Reihenfolge der Relevanz beibehalten / Manter ordem de relevância
+            results: List[ContractSearchHit] = []
+            for hit in hits:
+                contract = contracts_by_id.get(hit.rowid)
+                if contract is None:
+                    continue
+                contract_dict = ContractResponse.model_validate(contract).model_dump()
+                contract_dict["search_rank"] = -float(hit.rank)
+                contract_dict["search_snippet"] = render_search_snippet(hit.snippet)
+                results.append(ContractSearchHit(**contract_dict))
+            return results
+
+        query_obj = (
+            select(Contract)
+            .where(_ilike_search_filter(query))
+            .order_by(desc(Contract.created_at))
+            .offset(skip)
+            .limit(limit)
         )
-        
-        # Total count / Contagem total
-        count_query = select(func.count(Contract.id)).where(search_filter)
-        total_result = await self.db.execute(count_query)
-        total = int(total_result.scalar() or 0)
-        
-        # Search results / Resultados da busca
-        query_obj = select(Contract).where(search_filter).order_by(desc(Contract.created_at)).offset(skip).limit(limit)
         result = await self.db.execute(query_obj)
-        contracts = result.scalars().all()
-        current_page = (skip // limit) + 1 if limit else 1
-        return []
+        return [
+            ContractSearchHit(**ContractResponse.model_validate(contract).model_dump())
+            for contract in result.scalars().all()
+        ]
+
+    async def _fts_available(self) -> bool:
+        """
+        Prüft, ob der FTS5-Index in der aktuellen Datenbank existiert.
+        Verifica se o índice FTS5 existe no banco atual.
+        """
+        bind = getattr(self.db, "bind", None)
+        if bind is None or bind.dialect.name != "sqlite":
+            return False
+        result = await self.db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE_NAME},
+        )
+        return result.scalar() is not None
+
+    async def _build_search_filter(self, search: str):
+        """
+        Erstellt den WHERE-Ausdruck für die Suche (FTS5-Treffer oder ILIKE).
+        Cria a expressão WHERE para a busca (resultados FTS5 ou ILIKE).
+        """
+        if await self._fts_available():
+            match_query = build_fts_match_query(search)
+            if match_query is None:
+                return None
+            matching_ids = (
+                text(f"SELECT rowid FROM {FTS_TABLE_NAME} WHERE {FTS_TABLE_NAME} MATCH :match_query")
+                .bindparams(match_query=match_query)
+                .columns(rowid=Integer)
+            )
+            return Contract.id.in_(matching_ids)
+        return _ilike_search_filter(search)
 
     async def get_active_contracts(self, skip: int = 0, limit: int = 10):
         """
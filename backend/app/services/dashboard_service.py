@@ -14,15 +14,39 @@ technische Daten.
 """
 
 import os
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
 from typing import Dict, Optional
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User, UserRole, AccessLevel
-from app.models.contract import Contract, ContractStatus
+from app.models.contract import Contract, ContractStatus, OperationType
 from app.models.alert import Alert, AlertStatus
+from app.models.contract_stats_rollup import BUCKET_D30, BUCKET_D90
 from app.schemas.dashboard import DashboardStats
+from app.services.stats_rollup_service import StatsRollupService
+from app.services.storage_usage_service import StorageUsageService
+
+
+@dataclass
+class ScopeAggregate:
+    """
+    Aggregierte Vertrags-/Alert-Kennzahlen eines Sichtbereichs
+    Métricas agregadas de contratos/alertas de um escopo
+    """
+    total_contracts: int = 0
+    active_contracts: int = 0
+    expiring_30_days: int = 0
+    expiring_90_days: int = 0
+    monthly_value: float = 0.0
+    monthly_income: float = 0.0
+    monthly_expense: float = 0.0
+    total_alerts: int = 0
+    unread_alerts: int = 0
+    contracts_by_department: Dict[str, int] = field(default_factory=dict)
+    contracts_by_status: Dict[str, int] = field(default_factory=dict)
+    contracts_by_type: Dict[str, int] = field(default_factory=dict)
 
 
 class DashboardService:
@@ -123,18 +147,12 @@ class DashboardService:
         except Exception:
             pass
         
-        # Uso de disco (diretório uploads)
+        # Uso de disco (diretório uploads) aus der Speicherbuchhaltung, ohne Verzeichnisdurchlauf
+        # Uso de disco a partir da contabilidade de armazenamento, sem varrer o diretório
         disk_usage_mb = 0.0
         try:
-            upload_dir = "uploads"
-            if os.path.exists(upload_dir):
-                total_size = 0
-                for dirpath, dirnames, filenames in os.walk(upload_dir):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        if os.path.exists(filepath):
-                            total_size += os.path.getsize(filepath)
-                disk_usage_mb = total_size / (1024 * 1024)
+            usage = await StorageUsageService(self.db).usage()
+            disk_usage_mb = usage["total_bytes"] / (1024 * 1024)
         except Exception:
             pass
         
@@ -179,95 +197,149 @@ class DashboardService:
             user_access_level=user.access_level
         )
     
-    async def _get_director_stats(self, user: User) -> DashboardStats:
+    async def _rollup_aggregate(self, breakdown: bool = False, **scope: Optional[str]) -> Optional[ScopeAggregate]:
         """
-        Estatísticas para DIRECTOR (Level 5)
-        Todos contratos da empresa + relatórios completos
-        
-        Statistiken für DIRECTOR (Level 5)
-        Alle Verträge des Unternehmens + vollständige Berichte
+        Kennzahlen aus ``contract_stats_rollup`` (O(Anzahl Schlüssel) statt O(Anzahl Verträge))
+        Métricas a partir de ``contract_stats_rollup`` (O(nº de chaves) em vez de O(nº de contratos))
+
+        Args:
+            breakdown: Aufschlüsselung nach Abteilung/Status/Typ berechnen
+            **scope: ``department`` und/oder ``team`` des Sichtbereichs
+
+        Returns:
+            ScopeAggregate oder None, wenn der Rollup nicht aktuell ist bzw. der
+            Sichtbereich nicht abgebildet werden kann (dann Live-Abfrage verwenden)
+        """
+        # Benutzer ohne Abteilung/Team: Live-Abfrage (``= NULL`` trifft nichts)
+        # Usuário sem departamento/time: consulta ao vivo (``= NULL`` não retorna nada)
+        if any(value is None for value in scope.values()):
+            return None
+
+        rows = await StatsRollupService(self.db).scope_rows(**scope)
+        if rows is None:
+            return None
+
+        agg = ScopeAggregate()
+        active = ContractStatus.ACTIVE.value
+        for row in rows:
+            agg.total_alerts += row.alert_count
+            agg.unread_alerts += row.pending_alert_count
+            count = row.contract_count
+            if not count:
+                continue
+            agg.total_contracts += count
+            if row.status == active:
+                value = float(row.total_value or 0)
+                agg.active_contracts += count
+                agg.monthly_value += value
+                if row.operation_type == OperationType.INCOME.value:
+                    agg.monthly_income += value
+                elif row.operation_type == OperationType.EXPENSE.value:
+                    agg.monthly_expense += value
+                if row.expiry_bucket == BUCKET_D30:
+                    agg.expiring_30_days += count
+                    agg.expiring_90_days += count
+                elif row.expiry_bucket == BUCKET_D90:
+                    agg.expiring_90_days += count
+            if breakdown:
+                if row.department:
+                    agg.contracts_by_department[row.department] = agg.contracts_by_department.get(row.department, 0) + count
+                agg.contracts_by_status[row.status] = agg.contracts_by_status.get(row.status, 0) + count
+                agg.contracts_by_type[row.contract_type] = agg.contracts_by_type.get(row.contract_type, 0) + count
+        return agg
+
+    async def _aggregate_scope(self, scope_filter=None, breakdown: bool = False) -> ScopeAggregate:
+        """
+        Berechnet alle Vertrags- und Alert-Kennzahlen eines Sichtbereichs in EINER Abfrage
+        Calcula todas as métricas de contratos e alertas de um escopo em UMA consulta
+
+        Bedingte Aggregation (SUM(CASE ...)) über ``contracts``; die Alert-Zähler laufen
+        als Skalar-Unterabfragen in derselben Anweisung mit. Mit ``breakdown=True`` wird
+        zusätzlich nach Abteilung/Status/Typ gruppiert und in Python aufsummiert.
+        Agregação condicional sobre ``contracts``; contadores de alertas como subconsultas
+        escalares na mesma instrução.
+
+        Args:
+            scope_filter: WHERE-Ausdruck des Sichtbereichs (None = alle Verträge)
+            breakdown: Aufschlüsselung nach Abteilung/Status/Typ berechnen
+
+        Returns:
+            ScopeAggregate mit allen Kennzahlen
         """
-        # Total de contratos
-        total_result = await self.db.execute(
-            select(func.count(Contract.id))
-        )
-        total_contracts = total_result.scalar() or 0
-        
-        # Contratos ativos
-        active_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                Contract.status == ContractStatus.ACTIVE
-            )
-        )
-        active_contracts = active_result.scalar() or 0
-        
-        # Expirando em 30 dias
         today = date.today()
-        thirty_days = today + timedelta(days=30)
-        exp30_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= thirty_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_30_days = exp30_result.scalar() or 0
-        
-        # Expirando em 90 dias
-        ninety_days = today + timedelta(days=90)
-        exp90_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= ninety_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_90_days = exp90_result.scalar() or 0
-        
+        is_active = Contract.status == ContractStatus.ACTIVE
 
-        # Valor mensal total (todos)
-        value_result = await self.db.execute(
-            select(func.sum(Contract.value)).where(
-                Contract.status == ContractStatus.ACTIVE
+        def expiring_until(until: date):
+            return and_(
+                is_active,
+                Contract.end_date.isnot(None),
+                Contract.end_date >= today,
+                Contract.end_date <= until,
             )
-        )
-        monthly_value = float(value_result.scalar() or 0.0)
 
-        # Entradas (INCOME) e Saídas (EXPENSE)
-        income_result = await self.db.execute(
-            select(func.sum(Contract.value)).where(
-                Contract.status == ContractStatus.ACTIVE,
-                Contract.operation_type == "INCOME"
-            )
-        )
-        monthly_income = float(income_result.scalar() or 0.0)
+        # Alert-Zähler als unkorrelierte Skalar-Unterabfragen derselben Anweisung
+        # (werden von der Datenbank einmal ausgewertet, kein Join über alle Verträge)
+        # Contadores de alertas como subconsultas escalares não correlacionadas na mesma instrução
+        alerts_in_scope = Alert.contract_id.in_(select(Contract.id).where(scope_filter)) if scope_filter is not None else None
 
-        expense_result = await self.db.execute(
-            select(func.sum(Contract.value)).where(
-                Contract.status == ContractStatus.ACTIVE,
-                Contract.operation_type == "EXPENSE"
-            )
-        )
-        monthly_expense = float(expense_result.scalar() or 0.0)
-        
-        # Alertas
-        alerts_result = await self.db.execute(
-            select(func.count(Alert.id))
-        )
-        total_alerts = alerts_result.scalar() or 0
+        def alert_count(*conditions):
+            parts = [c for c in (alerts_in_scope, *conditions) if c is not None]
+            stmt = select(func.count(Alert.id))
+            if parts:
+                stmt = stmt.where(and_(*parts))
+            return stmt.scalar_subquery()
+
+        dimensions = [Contract.department, Contract.status, Contract.contract_type] if breakdown else []
+        stmt = select(
+            *dimensions,
+            func.count(Contract.id).label("total"),
+            func.sum(case((is_active, 1), else_=0)).label("active"),
+            func.sum(case((expiring_until(today + timedelta(days=30)), 1), else_=0)).label("exp30"),
+            func.sum(case((expiring_until(today + timedelta(days=90)), 1), else_=0)).label("exp90"),
+            func.sum(case((is_active, Contract.value), else_=0)).label("value"),
+            func.sum(case((and_(is_active, Contract.operation_type == OperationType.INCOME), Contract.value), else_=0)).label("income"),
+            func.sum(case((and_(is_active, Contract.operation_type == OperationType.EXPENSE), Contract.value), else_=0)).label("expense"),
+            alert_count().label("alerts"),
+            alert_count(Alert.status == AlertStatus.PENDING).label("unread"),
+        ).select_from(Contract)
+        if scope_filter is not None:
+            stmt = stmt.where(scope_filter)
+        if breakdown:
+            stmt = stmt.group_by(*dimensions)
+
+        result = await self.db.execute(stmt)
+
+        agg = ScopeAggregate()
+        for row in result.all():
+            # Alert-Zähler gelten für den ganzen Sichtbereich (in jeder Zeile gleich)
+            agg.total_alerts = int(row.alerts or 0)
+            agg.unread_alerts = int(row.unread or 0)
+            total = int(row.total or 0)
+            if total == 0:
+                continue
+            agg.total_contracts += total
+            agg.active_contracts += int(row.active or 0)
+            agg.expiring_30_days += int(row.exp30 or 0)
+            agg.expiring_90_days += int(row.exp90 or 0)
+            agg.monthly_value += float(row.value or 0.0)
+            agg.monthly_income += float(row.income or 0.0)
+            agg.monthly_expense += float(row.expense or 0.0)
+            if breakdown:
+                if row.department is not None:
+                    agg.contracts_by_department[row.department] = agg.contracts_by_department.get(row.department, 0) + total
+                agg.contracts_by_status[row.status.value] = agg.contracts_by_status.get(row.status.value, 0) + total
+                agg.contracts_by_type[row.contract_type.value] = agg.contracts_by_type.get(row.contract_type.value, 0) + total
+        return agg
+
+    async def _get_director_stats(self, user: User) -> DashboardStats:
+        """
+        Estatísticas para DIRECTOR (Level 5)
+        Todos contratos da empresa + relatórios completos
         
-        unread_result = await self.db.execute(
-            select(func.count(Alert.id)).where(
-                Alert.status == AlertStatus.PENDING
-            )
-        )
-        unread_alerts = unread_result.scalar() or 0
+        Statistiken für DIRECTOR (Level 5)
+        Alle Verträge des Unternehmens + vollständige Berichte
+        """
+        agg = await self._rollup_aggregate(breakdown=True) or await self._aggregate_scope(breakdown=True)
         
         # Aprovações pendentes (simulado - implementar quando houver tabela)
         pending_approvals = 0
@@ -278,43 +350,21 @@ class DashboardService:
         )
         total_users = users_result.scalar() or 0
         
-        # Contratos por departamento
-        dept_result = await self.db.execute(
-            select(Contract.department, func.count(Contract.id))
-            .where(Contract.department.isnot(None))
-            .group_by(Contract.department)
-        )
-        contracts_by_department = {dept: count for dept, count in dept_result.all()}
-        
-        # Contratos por status
-        status_result = await self.db.execute(
-            select(Contract.status, func.count(Contract.id))
-            .group_by(Contract.status)
-        )
-        contracts_by_status = {status.value: count for status, count in status_result.all()}
-        
-        # Contratos por tipo
-        type_result = await self.db.execute(
-            select(Contract.contract_type, func.count(Contract.id))
-            .group_by(Contract.contract_type)
-        )
-        contracts_by_type = {ctype.value: count for ctype, count in type_result.all()}
-        
         return DashboardStats(
-            total_contracts=total_contracts,
-            active_contracts=active_contracts,
-            expiring_30_days=expiring_30_days,
-            expiring_90_days=expiring_90_days,
-            monthly_value=monthly_value,
-            monthly_income=monthly_income,
-            monthly_expense=monthly_expense,
-            total_alerts=total_alerts,
-            unread_alerts=unread_alerts,
+            total_contracts=agg.total_contracts,
+            active_contracts=agg.active_contracts,
+            expiring_30_days=agg.expiring_30_days,
+            expiring_90_days=agg.expiring_90_days,
+            monthly_value=agg.monthly_value,
+            monthly_income=agg.monthly_income,
+            monthly_expense=agg.monthly_expense,
+            total_alerts=agg.total_alerts,
+            unread_alerts=agg.unread_alerts,
             pending_approvals=pending_approvals,
             total_users=total_users,
-            contracts_by_department=contracts_by_department,
-            contracts_by_status=contracts_by_status,
-            contracts_by_type=contracts_by_type,
+            contracts_by_department=agg.contracts_by_department,
+            contracts_by_status=agg.contracts_by_status,
+            contracts_by_type=agg.contracts_by_type,
             last_backup=None,
             disk_usage_mb=None,
             total_database_size_mb=None,
@@ -336,77 +386,8 @@ class DashboardService:
         Statistiken für DEPARTMENT_ADM (Level 4)
         Verträge der Abteilung + Finanzwerte
         """
-        dept_filter = Contract.department == user.department
-        
-        # Total de contratos do departamento
-        total_result = await self.db.execute(
-            select(func.count(Contract.id)).where(dept_filter)
-        )
-        total_contracts = total_result.scalar() or 0
-        
-        # Contratos ativos
-        active_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(dept_filter, Contract.status == ContractStatus.ACTIVE)
-            )
-        )
-        active_contracts = active_result.scalar() or 0
-        
-        # Expirando em 30 dias
-        today = date.today()
-        thirty_days = today + timedelta(days=30)
-        exp30_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    dept_filter,
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= thirty_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_30_days = exp30_result.scalar() or 0
-        
-        # Expirando em 90 dias
-        ninety_days = today + timedelta(days=90)
-        exp90_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    dept_filter,
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= ninety_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_90_days = exp90_result.scalar() or 0
-        
-        # Valor mensal (PODE ver valores financeiros)
-        value_result = await self.db.execute(
-            select(func.sum(Contract.value)).where(
-                and_(dept_filter, Contract.status == ContractStatus.ACTIVE)
-            )
-        )
-        monthly_value = float(value_result.scalar() or 0.0)
-        
-        # Alertas do departamento
-        alerts_subq = select(Contract.id).where(dept_filter).scalar_subquery()
-        alerts_result = await self.db.execute(
-            select(func.count(Alert.id)).where(Alert.contract_id.in_(alerts_subq))
-        )
-        total_alerts = alerts_result.scalar() or 0
-        
-        unread_result = await self.db.execute(
-            select(func.count(Alert.id)).where(
-                and_(
-                    Alert.contract_id.in_(alerts_subq),
-                    Alert.status == AlertStatus.PENDING
-                )
-            )
-        )
-        unread_alerts = unread_result.scalar() or 0
+        agg = (await self._rollup_aggregate(department=user.department)
+               or await self._aggregate_scope(Contract.department == user.department))
         
         # Aprovações pendentes
         pending_approvals = 0
@@ -423,13 +404,13 @@ class DashboardService:
         department_users = dept_users_result.scalar() or 0
         
         return DashboardStats(
-            total_contracts=total_contracts,
-            active_contracts=active_contracts,
-            expiring_30_days=expiring_30_days,
-            expiring_90_days=expiring_90_days,
-            monthly_value=monthly_value,
-            total_alerts=total_alerts,
-            unread_alerts=unread_alerts,
+            total_contracts=agg.total_contracts,
+            active_contracts=agg.active_contracts,
+            expiring_30_days=agg.expiring_30_days,
+            expiring_90_days=agg.expiring_90_days,
+            monthly_value=agg.monthly_value,
+            total_alerts=agg.total_alerts,
+            unread_alerts=agg.unread_alerts,
             pending_approvals=pending_approvals,
             total_users=None,
             contracts_by_department=None,
@@ -456,83 +437,22 @@ class DashboardService:
         Statistiken für DEPARTMENT_USER (Level 3)
         Verträge der Abteilung OHNE Finanzwerte
         """
-        dept_filter = Contract.department == user.department
-        
-        # Total de contratos do departamento
-        total_result = await self.db.execute(
-            select(func.count(Contract.id)).where(dept_filter)
-        )
-        total_contracts = total_result.scalar() or 0
-        
-        # Contratos ativos
-        active_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(dept_filter, Contract.status == ContractStatus.ACTIVE)
-            )
-        )
-        active_contracts = active_result.scalar() or 0
-        
-        # Expirando em 30 dias
-        today = date.today()
-        thirty_days = today + timedelta(days=30)
-        exp30_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    dept_filter,
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= thirty_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_30_days = exp30_result.scalar() or 0
-        
-        # Expirando em 90 dias
-        ninety_days = today + timedelta(days=90)
-        exp90_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    dept_filter,
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= ninety_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_90_days = exp90_result.scalar() or 0
+        agg = (await self._rollup_aggregate(department=user.department)
+               or await self._aggregate_scope(Contract.department == user.department))
         
         # NÃO retorna valores financeiros (monthly_value = None)
         
-        # Alertas
-        alerts_subq = select(Contract.id).where(dept_filter).scalar_subquery()
-        alerts_result = await self.db.execute(
-            select(func.count(Alert.id)).where(Alert.contract_id.in_(alerts_subq))
-        )
-        total_alerts = alerts_result.scalar() or 0
-        
-        unread_result = await self.db.execute(
-            select(func.count(Alert.id)).where(
-                and_(
-                    Alert.contract_id.in_(alerts_subq),
-                    Alert.status == AlertStatus.PENDING
-                )
-            )
-        )
-        unread_alerts = unread_result.scalar() or 0
-        
         # Aprovações pendentes
         pending_approvals = 0
         
         return DashboardStats(
-            total_contracts=total_contracts,
-            active_contracts=active_contracts,
-            expiring_30_days=expiring_30_days,
-            expiring_90_days=expiring_90_days,
+            total_contracts=agg.total_contracts,
+            active_contracts=agg.active_contracts,
+            expiring_30_days=agg.expiring_30_days,
+            expiring_90_days=agg.expiring_90_days,
             monthly_value=None,
-            total_alerts=total_alerts,
-            unread_alerts=unread_alerts,
+            total_alerts=agg.total_alerts,
+            unread_alerts=agg.unread_alerts,
             pending_approvals=pending_approvals,
             total_users=None,
             contracts_by_department=None,
@@ -559,63 +479,17 @@ class DashboardService:
         Statistiken für TEAM (Level 2)
         Verträge des Teams, KEINE Berichte
         """
-        team_filter = Contract.team == user.team
-        
-        # Total de contratos do time
-        total_result = await self.db.execute(
-            select(func.count(Contract.id)).where(team_filter)
-        )
-        total_contracts = total_result.scalar() or 0
-        
-        # Contratos ativos
-        active_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(team_filter, Contract.status == ContractStatus.ACTIVE)
-            )
-        )
-        active_contracts = active_result.scalar() or 0
-        
-        # Expirando em 30 dias
-        today = date.today()
-        thirty_days = today + timedelta(days=30)
-        exp30_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    team_filter,
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= thirty_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_30_days = exp30_result.scalar() or 0
-        
-        # Alertas do time
-        alerts_subq = select(Contract.id).where(team_filter).scalar_subquery()
-        alerts_result = await self.db.execute(
-            select(func.count(Alert.id)).where(Alert.contract_id.in_(alerts_subq))
-        )
-        total_alerts = alerts_result.scalar() or 0
-        
-        unread_result = await self.db.execute(
-            select(func.count(Alert.id)).where(
-                and_(
-                    Alert.contract_id.in_(alerts_subq),
-                    Alert.status == AlertStatus.PENDING
-                )
-            )
-        )
-        unread_alerts = unread_result.scalar() or 0
+        agg = (await self._rollup_aggregate(team=user.team)
+               or await self._aggregate_scope(Contract.team == user.team))
         
         return DashboardStats(
-            total_contracts=total_contracts,
-            active_contracts=active_contracts,
-            expiring_30_days=expiring_30_days,
+            total_contracts=agg.total_contracts,
+            active_contracts=agg.active_contracts,
+            expiring_30_days=agg.expiring_30_days,
             expiring_90_days=None,
             monthly_value=None,
-            total_alerts=total_alerts,
-            unread_alerts=unread_alerts,
+            total_alerts=agg.total_alerts,
+            unread_alerts=agg.unread_alerts,
             pending_approvals=None,
             total_users=None,
             contracts_by_department=None,
@@ -647,62 +521,16 @@ class DashboardService:
             Contract.created_by == user.id,
             Contract.responsible_user_id == user.id
         )
-        
-        # Total de contratos próprios
-        total_result = await self.db.execute(
-            select(func.count(Contract.id)).where(own_filter)
-        )
-        total_contracts = total_result.scalar() or 0
-        
-        # Contratos ativos
-        active_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(own_filter, Contract.status == ContractStatus.ACTIVE)
-            )
-        )
-        active_contracts = active_result.scalar() or 0
-        
-        # Expirando em 30 dias
-        today = date.today()
-        thirty_days = today + timedelta(days=30)
-        exp30_result = await self.db.execute(
-            select(func.count(Contract.id)).where(
-                and_(
-                    own_filter,
-                    Contract.end_date.isnot(None),
-                    Contract.end_date <= thirty_days,
-                    Contract.end_date >= today,
-                    Contract.status == ContractStatus.ACTIVE
-                )
-            )
-        )
-        expiring_30_days = exp30_result.scalar() or 0
-        
-        # Alertas próprios
-        alerts_subq = select(Contract.id).where(own_filter).scalar_subquery()
-        alerts_result = await self.db.execute(
-            select(func.count(Alert.id)).where(Alert.contract_id.in_(alerts_subq))
-        )
-        total_alerts = alerts_result.scalar() or 0
-        
-        unread_result = await self.db.execute(
-            select(func.count(Alert.id)).where(
-                and_(
-                    Alert.contract_id.in_(alerts_subq),
-                    Alert.status == AlertStatus.PENDING
-                )
-            )
-        )
-        unread_alerts = unread_result.scalar() or 0
+        agg = await self._aggregate_scope(own_filter)
         
         return DashboardStats(
-            total_contracts=total_contracts,
-            active_contracts=active_contracts,
-            expiring_30_days=expiring_30_days,
+            total_contracts=agg.total_contracts,
+            active_contracts=agg.active_contracts,
+            expiring_30_days=agg.expiring_30_days,
             expiring_90_days=None,
             monthly_value=None,
-            total_alerts=total_alerts,
-            unread_alerts=unread_alerts,
+            total_alerts=agg.total_alerts,
+            unread_alerts=agg.unread_alerts,
             pending_approvals=None,
             total_users=None,
             contracts_by_department=None,
@@ -0,0 +1,462 @@
+"""
+DOCX -> PDF-Konvertierung mit einem Pool warmer LibreOffice-Instanzen
+Conversão DOCX -> PDF com um pool de instâncias LibreOffice aquecidas
+
+DE: Statt je Anfrage ``soffice --headless --convert-to`` kalt zu starten,
+    hält der ``DocumentConverter`` N headless-Instanzen mit eigenem Profil
+    bereit und spricht sie per UNO über eine lokale Pipe an. Aufträge warten
+    in einer begrenzten Warteschlange (voll -> ``ConverterBusyError``); eine
+    Instanz, die abstürzt, hängt oder die Zustandsprüfung nicht besteht, wird
+    beendet und neu gestartet, nach ``max_conversions`` Aufträgen wird sie
+    recycelt. Ohne Python-UNO-Bindung (``import uno``) läuft je Platz die
+    CLI-Konvertierung mit festem Profil, ebenfalls begrenzt. Ohne ``soffice``
+    bleibt es beim DOCX-Fallback des Aufrufers.
+PT: Em vez de iniciar ``soffice --headless --convert-to`` a frio a cada
+    requisição, o ``DocumentConverter`` mantém N instâncias headless com
+    perfil próprio e fala com elas via UNO por um pipe local. As tarefas
+    aguardam numa fila limitada (cheia -> ``ConverterBusyError``); uma
+    instância que falha, trava ou não passa na verificação de saúde é
+    encerrada e reiniciada, e após ``max_conversions`` tarefas é reciclada.
+    Sem a ligação Python-UNO, cada posição usa a conversão por CLI com perfil
+    fixo, também limitada. Sem ``soffice`` fica o fallback DOCX do chamador.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.utils.document_generator import convert_docx_bytes_to_pdf_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class ConversionError(Exception):
+    """Konvertierung fehlgeschlagen / Conversão falhou"""
+
+
+class ConverterUnavailableError(ConversionError):
+    """Kein LibreOffice installiert / LibreOffice não instalado"""
+
+
+class ConverterBusyError(ConversionError):
+    """Warteschlange voll / Fila cheia"""
+
+
+def find_soffice() -> Optional[str]:
+    """Pfad zu ``soffice`` (Einstellung oder PATH) / Caminho do ``soffice`` (configuração ou PATH)"""
+    return settings.LIBREOFFICE_BINARY or shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def uno_available() -> bool:
+    """Python-UNO-Bindung importierbar? / Ligação Python-UNO importável?"""
+    return importlib.util.find_spec("uno") is not None
+
+
+# ---------- Instanzen / Instâncias ----------
+
+class UnoOfficeInstance:
+    """
+    Ein headless ``soffice``-Prozess mit eigenem Profil, angesprochen per UNO über eine Pipe
+    Um processo ``soffice`` headless com perfil próprio, acessado via UNO por um pipe
+    """
+
+    def __init__(self, binary: str, index: int, workdir: str, startup_timeout: float) -> None:
+        self.binary = binary
+        self.index = index
+        self.startup_timeout = startup_timeout
+        self.pipe_name = f"vertrag_mgs_{os.getpid()}_{index}_{uuid.uuid4().hex[:8]}"
+        self.profile_dir = os.path.join(workdir, f"profile_{index}")
+        self.job_dir = os.path.join(workdir, f"jobs_{index}")
+        self.conversions = 0
+        self.process: Optional[subprocess.Popen] = None
+        self._desktop = None
+
+    def start(self) -> None:
+        import uno
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        os.makedirs(self.job_dir, exist_ok=True)
+        connection = f"pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+        self.process = subprocess.Popen(
+            [
+                self.binary, "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+                "--nolockcheck", f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+                f"--accept={connection}",
+            ],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            # Eigene Prozessgruppe: der Wrapper startet soffice.bin als Kind
+            # Grupo de processos próprio: o wrapper inicia soffice.bin como filho
+            start_new_session=True,
+        )
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            if self.process.poll() is not None:
+                raise ConversionError(f"soffice beim Start beendet / soffice encerrado na inicialização ({self.process.returncode})")
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise ConversionError("soffice nicht erreichbar / soffice inacessível")
+                time.sleep(0.25)
+        self._desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+
+    def alive(self) -> bool:
+        if self.process is None or self.process.poll() is not None or self._desktop is None:
+            return False
+        try:
+            self._desktop.getComponents()
+            return True
+        except Exception:
+            return False
+
+    def convert(self, docx_bytes: bytes) -> bytes:
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def props(**values: Any):
+            result = []
+            for name, value in values.items():
+                prop = PropertyValue()
+                prop.Name, prop.Value = name, value
+                result.append(prop)
+            return tuple(result)
+
+        job = uuid.uuid4().hex
+        source = os.path.join(self.job_dir, f"{job}.docx")
+        target = os.path.join(self.job_dir, f"{job}.pdf")
+        with open(source, "wb") as handle:
+            handle.write(docx_bytes)
+        try:
+            document = self._desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(source), "_blank", 0, props(Hidden=True, ReadOnly=True)
+            )
+            if document is None:
+                raise ConversionError("Dokument nicht geladen / Documento não carregado")
+            try:
+                document.storeToURL(uno.systemPathToFileUrl(target), props(FilterName="writer_pdf_Export"))
+            finally:
+                document.close(True)
+            with open(target, "rb") as handle:
+                data = handle.read()
+        finally:
+            for path in (source, target):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        self.conversions += 1
+        return data
+
+    def stop(self) -> None:
+        desktop, self._desktop = self._desktop, None
+        if desktop is not None:
+            try:
+                desktop.terminate()
+            except Exception:
+                pass
+        process = self.process
+        if process is None:
+            return
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+    def kill(self) -> None:
+        """Sofort beenden, ohne UNO (hängende Instanz) / Encerrar já, sem UNO (instância travada)"""
+        self._desktop = None
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            process.kill()
+        process.wait()
+
+
+class CliOfficeInstance:
+    """
+    Platz ohne UNO: ``soffice --convert-to`` je Auftrag, aber mit festem Profil
+    Posição sem UNO: ``soffice --convert-to`` por tarefa, mas com perfil fixo
+    """
+
+    def __init__(self, binary: str, index: int, workdir: str, timeout: float) -> None:
+        self.binary = binary
+        self.index = index
+        self.timeout = timeout
+        self.profile_dir = os.path.join(workdir, f"profile_{index}")
+        self.conversions = 0
+
+    def start(self) -> None:
+        os.makedirs(self.profile_dir, exist_ok=True)
+
+    def alive(self) -> bool:
+        return os.path.isdir(self.profile_dir)
+
+    def convert(self, docx_bytes: bytes) -> bytes:
+        data = convert_docx_bytes_to_pdf_bytes(docx_bytes, self.binary, self.profile_dir, self.timeout)
+        if not data:
+            raise ConversionError("soffice-Konvertierung fehlgeschlagen / Conversão soffice falhou")
+        self.conversions += 1
+        return data
+
+    def stop(self) -> None:
+        pass
+
+    def kill(self) -> None:
+        pass
+
+
+# ---------- Pool ----------
+
+class DocumentConverter:
+    """
+    Pool warmer LibreOffice-Instanzen mit begrenzter Warteschlange
+    Pool de instâncias LibreOffice aquecidas com fila limitada
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 16,
+        timeout: float = 60.0,
+        max_conversions: int = 200,
+        health_interval: float = 60.0,
+        instance_factory: Optional[Callable[[int], Any]] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Converter workers must be >= 1 / Número de instâncias deve ser >= 1")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.max_conversions = max_conversions or None
+        self.health_interval = health_interval
+        self.restarts = 0
+        self.conversions = 0
+        self._factory = instance_factory
+        self._mode = "custom" if instance_factory else None
+        self._workdir: Optional[str] = None
+        self._instances: Dict[int, Any] = {}
+        self._idle: Optional[asyncio.Queue] = None
+        self._waiting = 0
+        self._start_lock = asyncio.Lock()
+        self._monitor: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(cls) -> "DocumentConverter":
+        """Pool mit den Einstellungen der Anwendung / Pool com as configurações da aplicação"""
+        return cls(
+            workers=settings.LIBREOFFICE_WORKERS,
+            queue_size=settings.LIBREOFFICE_QUEUE_SIZE,
+            timeout=settings.LIBREOFFICE_TIMEOUT_SECONDS,
+            max_conversions=settings.LIBREOFFICE_MAX_CONVERSIONS,
+            health_interval=settings.LIBREOFFICE_HEALTH_INTERVAL_SECONDS,
+        )
+
+    @property
+    def mode(self) -> str:
+        """``uno``, ``cli``, ``unavailable`` (oder ``custom`` in Tests)"""
+        if self._mode is None:
+            binary = find_soffice()
+            if not binary:
+                self._mode = "unavailable"
+            else:
+                self._mode = "uno" if uno_available() else "cli"
+                workdir = tempfile.mkdtemp(prefix="vertrag_mgs_office_")
+                self._workdir = workdir
+                if self._mode == "uno":
+                    self._factory = lambda index: UnoOfficeInstance(
+                        binary, index, workdir, settings.LIBREOFFICE_STARTUP_TIMEOUT_SECONDS
+                    )
+                else:
+                    self._factory = lambda index: CliOfficeInstance(binary, index, workdir, self.timeout)
+        return self._mode
+
+    @property
+    def available(self) -> bool:
+        return self.mode != "unavailable"
+
+    async def _spawn(self, index: int) -> Any:
+        instance = self._factory(index)
+        self._instances[index] = instance
+        try:
+            await asyncio.to_thread(instance.start)
+        except Exception as e:
+            # Bleibt tot im Pool und wird beim nächsten Auftrag erneut gestartet
+            # Fica morta no pool e é reiniciada na próxima tarefa
+            logger.error(f"LibreOffice instance {index} failed to start / Instância não iniciou: {e}")
+        return instance
+
+    async def _restart(self, instance: Any, reason: str, graceful: bool = False) -> Any:
+        """
+        Beendet eine Instanz (hart, außer beim Recyceln) und startet an ihrem Platz eine neue.
+        Encerra uma instância (à força, exceto ao reciclar) e inicia uma nova em seu lugar.
+        """
+        self.restarts += 1
+        logger.warning(f"LibreOffice instance {instance.index} restarted ({reason}) / Instância reiniciada ({reason})")
+        try:
+            await asyncio.to_thread(instance.stop if graceful else instance.kill)
+        except Exception:
+            pass
+        return await self._spawn(instance.index)
+
+    async def start(self) -> None:
+        """
+        Startet alle Instanzen (beim Hochfahren der Anwendung).
+        Inicia todas as instâncias (na inicialização da aplicação).
+
+        Raises:
+            ConverterUnavailableError: Kein ``soffice`` vorhanden / ``soffice`` ausente
+        """
+        if not self.available:
+            raise ConverterUnavailableError("LibreOffice (soffice) nicht gefunden / não encontrado")
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            idle: asyncio.Queue = asyncio.Queue()
+            for instance in await asyncio.gather(*(self._spawn(index) for index in range(self.workers))):
+                idle.put_nowait(instance)
+            self._idle = idle
+            if self.health_interval > 0:
+                self._monitor = asyncio.get_running_loop().create_task(self._health_loop())
+            logger.info(f"LibreOffice pool ready ({self.workers} x {self.mode}) / Pool LibreOffice pronto")
+
+    async def convert(self, docx_bytes: bytes) -> bytes:
+        """
+        Konvertiert DOCX-Bytes in PDF-Bytes.
+        Converte bytes DOCX em bytes PDF.
+
+        Raises:
+            ConverterUnavailableError: Kein LibreOffice / Sem LibreOffice
+            ConverterBusyError: Warteschlange voll / Fila cheia
+            ConversionError: Konvertierung fehlgeschlagen / Conversão falhou
+        """
+        if self._idle is None:
+            await self.start()
+        idle = self._idle
+        if idle.empty() and self._waiting >= self.queue_size:
+            raise ConverterBusyError("Konvertierung ausgelastet / Conversão sobrecarregada")
+        self._waiting += 1
+        try:
+            instance = await idle.get()
+        finally:
+            self._waiting -= 1
+
+        try:
+            if not await asyncio.to_thread(instance.alive):
+                instance = await self._restart(instance, "health check")
+            try:
+                data = await asyncio.wait_for(asyncio.to_thread(instance.convert, docx_bytes), self.timeout)
+            except asyncio.TimeoutError:
+                instance = await self._restart(instance, "timeout")
+                raise ConversionError(
+                    f"Konvertierung nach {self.timeout:.0f}s abgebrochen / Conversão interrompida após {self.timeout:.0f}s"
+                )
+            except Exception as e:
+                if not await asyncio.to_thread(instance.alive):
+                    instance = await self._restart(instance, "crash")
+                if isinstance(e, ConversionError):
+                    raise
+                raise ConversionError(str(e)) from e
+            self.conversions += 1
+            if self.max_conversions and instance.conversions >= self.max_conversions:
+                instance = await self._restart(instance, "recycle", graceful=True)
+            return data
+        finally:
+            idle.put_nowait(instance)
+
+    async def check_health(self) -> int:
+        """
+        Prüft freie Instanzen und startet tote neu.
+        Verifica instâncias livres e reinicia as mortas.
+
+        Returns:
+            int: Anzahl neu gestarteter Instanzen / Número de instâncias reiniciadas
+        """
+        if self._idle is None:
+            return 0
+        checked: List[Any] = []
+        restarted = 0
+        try:
+            while not self._idle.empty():
+                instance = self._idle.get_nowait()
+                if not await asyncio.to_thread(instance.alive):
+                    instance = await self._restart(instance, "health check")
+                    restarted += 1
+                checked.append(instance)
+        finally:
+            for instance in checked:
+                self._idle.put_nowait(instance)
+        return restarted
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"LibreOffice health check failed / Verificação de saúde falhou: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "started": self._idle is not None,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "waiting": self._waiting,
+            "conversions": self.conversions,
+            "restarts": self.restarts,
+        }
+
+    async def close(self) -> None:
+        """Beendet alle Instanzen (Shutdown) / Encerra todas as instâncias (shutdown)"""
+        monitor, self._monitor = self._monitor, None
+        if monitor is not None:
+            monitor.cancel()
+            try:
+                await monitor
+            except asyncio.CancelledError:
+                pass
+        instances, self._instances = list(self._instances.values()), {}
+        self._idle = None
+        for instance in instances:
+            try:
+                await asyncio.to_thread(instance.stop)
+            except Exception:
+                pass
+        if self._workdir:
+            await asyncio.to_thread(shutil.rmtree, self._workdir, True)
+
+
+_converter: Optional[DocumentConverter] = None
+
+
+def get_document_converter() -> DocumentConverter:
+    """Gemeinsamer Pool der Anwendung / Pool compartilhado da aplicação"""
+    global _converter
+    if _converter is None:
+        _converter = DocumentConverter.from_settings()
+    return _converter
+
+
+async def shutdown_document_converter() -> None:
+    """Beendet den gemeinsamen Pool (Shutdown) / Encerra o pool compartilhado (shutdown)"""
+    global _converter
+    converter, _converter = _converter, None
+    if converter is not None:
+        await converter.close()
@@ -0,0 +1,186 @@
+"""
+E-Mail-Outbox Service - Einreihen und Abarbeiten ausgehender E-Mails
+Serviço da caixa de saída - Enfileirar e processar e-mails de saída
+
+DE: ``enqueue`` legt einen Eintrag in der laufenden Transaktion an (kein Commit);
+    ``drain_once`` reserviert fällige Einträge, versendet sie gesammelt über den
+    SMTP-Pool und plant Fehlschläge mit exponentiellem Backoff neu ein.
+PT: ``enqueue`` cria uma entrada na transação atual (sem commit); ``drain_once``
+    reserva as entradas devidas, envia-as em lote pelo pool SMTP e reagenda
+    falhas com backoff exponencial.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.alert import Alert
+from app.models.email_outbox import EmailOutbox, OutboxStatus
+from app.utils.smtp_pool import OutgoingEmail, SMTPConnectionPool, get_smtp_pool
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_OUTBOX_STATUSES = (OutboxStatus.PENDING, OutboxStatus.SENDING)
+DELIVERY_ERROR = "SMTP delivery failed / SMTP-Zustellung fehlgeschlagen"
+
+_wakeup: Optional[asyncio.Event] = None
+
+
+def compute_backoff(attempts: int, base: float, cap: float) -> float:
+    """
+    Wartezeit vor dem nächsten Versuch: base * 2^(attempts-1), begrenzt auf cap.
+    Espera antes da próxima tentativa: base * 2^(attempts-1), limitada a cap.
+    """
+    return min(cap, base * (2 ** max(0, attempts - 1)))
+
+
+def get_outbox_wakeup() -> asyncio.Event:
+    """Ereignis, auf das der Worker im Leerlauf wartet / Evento aguardado pelo worker ocioso"""
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+
+def wake_outbox_worker() -> None:
+    """Weckt den Worker nach dem Einreihen neuer E-Mails / Acorda o worker após enfileirar e-mails"""
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+class EmailOutboxService:
+    """
+    Serviço da caixa de saída de e-mails
+    Dienst für die E-Mail-Outbox
+    """
+
+    def __init__(self, db: AsyncSession, mailer: Optional[SMTPConnectionPool] = None):
+        """
+        Initialisiert den Dienst mit einer Datenbanksitzung.
+        Inicializa o serviço com uma sessão de banco de dados.
+        """
+        self.db = db
+        # Standard: gemeinsamer SMTP-Pool der Anwendung / Padrão: pool SMTP compartilhado da aplicação
+        self.mailer = mailer
+
+    def enqueue(self, message: OutgoingEmail, alert_id: Optional[int] = None) -> EmailOutbox:
+        """
+        Reiht eine E-Mail in der laufenden Transaktion ein (Commit durch den Aufrufer).
+        Enfileira um e-mail na transação atual (commit pelo chamador).
+        """
+        entry = EmailOutbox(
+            alert_id=alert_id,
+            recipient=message.to,
+            subject=message.subject,
+            body=message.body,
+            is_html=message.is_html,
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        self.db.add(entry)
+        return entry
+
+    async def has_active_entry(self, alert_id: int) -> bool:
+        """
+        Prüft, ob für den Alert bereits ein offener Eintrag existiert.
+        Verifica se já existe uma entrada aberta para o alerta.
+        """
+        result = await self.db.execute(
+            select(EmailOutbox.id)
+            .where(EmailOutbox.alert_id == alert_id, EmailOutbox.status.in_(ACTIVE_OUTBOX_STATUSES))
+            .limit(1)
+        )
+        return result.first() is not None
+
+    async def claim_batch(self, limit: int, now: Optional[datetime] = None) -> List[EmailOutbox]:
+        """
+        Reserviert fällige Einträge (PENDING oder SENDING mit abgelaufener Reservierung).
+        Reserva entradas devidas (PENDING ou SENDING com reserva expirada).
+
+        Args:
+            limit: Maximale Anzahl / Quantidade máxima
+            now: Referenzzeitpunkt (UTC) / Momento de referência (UTC)
+
+        Returns:
+            List[EmailOutbox]: Reservierte Einträge (Status SENDING) / Entradas reservadas
+        """
+        now = now or datetime.now(timezone.utc)
+        result = await self.db.execute(
+            select(EmailOutbox)
+            .where(EmailOutbox.status.in_(ACTIVE_OUTBOX_STATUSES), EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        entries = list(result.scalars().all())
+        lease_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+        for entry in entries:
+            entry.status = OutboxStatus.SENDING
+            entry.next_attempt_at = lease_until
+        if entries:
+            await self.db.commit()
+        return entries
+
+    async def drain_once(self, batch_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Versendet einen Stapel fälliger E-Mails und aktualisiert Outbox und Alerts.
+        Envia um lote de e-mails devidos e atualiza a caixa de saída e os alertas.
+
+        Returns:
+            Dict mit ``claimed``, ``sent``, ``retry`` und ``dead``
+        """
+        entries = await self.claim_batch(batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE)
+        stats = {"claimed": len(entries), "sent": 0, "retry": 0, "dead": 0}
+        if not entries:
+            return stats
+
+        mailer = self.mailer or get_smtp_pool()
+        results = await mailer.send_batch(
+            OutgoingEmail(to=e.recipient, subject=e.subject, body=e.body, is_html=e.is_html) for e in entries
+        )
+
+        alert_ids = {e.alert_id for e in entries if e.alert_id is not None}
+        alerts: Dict[int, Alert] = {}
+        if alert_ids:
+            alert_result = await self.db.execute(select(Alert).where(Alert.id.in_(alert_ids)))
+            alerts = {alert.id: alert for alert in alert_result.scalars().all()}
+
+        now = datetime.now(timezone.utc)
+        for entry, success in zip(entries, results):
+            entry.attempts += 1
+            alert = alerts.get(entry.alert_id) if entry.alert_id is not None else None
+            if success:
+                entry.status = OutboxStatus.SENT
+                entry.sent_at = now
+                entry.last_error = None
+                if alert is not None:
+                    alert.mark_sent(now)
+                stats["sent"] += 1
+            elif entry.attempts >= entry.max_attempts:
+                # Dead Letter: erst jetzt gilt der Alert als fehlgeschlagen / só agora o alerta é considerado falho
+                entry.status = OutboxStatus.DEAD
+                entry.last_error = DELIVERY_ERROR
+                if alert is not None:
+                    alert.mark_failed(DELIVERY_ERROR)
+                stats["dead"] += 1
+            else:
+                entry.status = OutboxStatus.PENDING
+                entry.last_error = DELIVERY_ERROR
+                entry.next_attempt_at = now + timedelta(seconds=compute_backoff(
+                    entry.attempts, settings.EMAIL_OUTBOX_BACKOFF_SECONDS, settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS
+                ))
+                stats["retry"] += 1
+
+        await self.db.commit()
+        logger.info(
+            f"E-mail outbox batch: {stats['sent']} sent, {stats['retry']} retry, {stats['dead']} dead / "
+            f"Lote da caixa de saída processado"
+        )
+        return stats
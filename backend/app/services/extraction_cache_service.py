@@ -0,0 +1,162 @@
+"""
+Extraktions-Cache Service - Wiederverwendung von PDF-Extraktionsergebnissen
+Serviço de cache de extração - Reutilização de resultados de extração de PDF
+
+DE: Ergebnisse werden unter (SHA-256 der Datei, Methode, Extraktor-/Regelversion)
+    abgelegt. Ändert sich die Version, greifen alte Einträge nicht mehr und
+    werden beim nächsten Schreiben entfernt. Übersteigt die Gesamtgröße
+    ``EXTRACTION_CACHE_MAX_BYTES``, werden die am längsten nicht genutzten
+    Einträge verdrängt (LRU).
+PT: Os resultados são guardados sob (SHA-256 do arquivo, método, versão do
+    extrator/regras). Quando a versão muda, entradas antigas deixam de ser
+    usadas e são removidas na próxima gravação. Se o tamanho total ultrapassar
+    ``EXTRACTION_CACHE_MAX_BYTES``, as entradas usadas há mais tempo são
+    removidas (LRU).
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.services.pdf_reader_pkg.version import extraction_cache_version
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCacheService:
+    """
+    Serviço do cache de extração
+    Dienst für den Extraktions-Cache
+    """
+
+    def __init__(self, db: AsyncSession, max_bytes: Optional[int] = None, version: Optional[str] = None):
+        """
+        Initialisiert den Dienst mit einer Datenbanksitzung.
+        Inicializa o serviço com uma sessão de banco de dados.
+        """
+        self.db = db
+        self.max_bytes = settings.EXTRACTION_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.version = version or extraction_cache_version()
+
+    async def get(self, file_sha256: str, method: str) -> Optional[Dict[str, Any]]:
+        """
+        Liefert ein zwischengespeichertes Ergebnis und aktualisiert den LRU-Zeitstempel.
+        Retorna um resultado em cache e atualiza o carimbo LRU.
+
+        Returns:
+            Dict mit ``extraction`` und ``intelligent_data`` oder None
+        """
+        result = await self.db.execute(
+            select(ExtractionCacheEntry.id, ExtractionCacheEntry.payload).where(
+                ExtractionCacheEntry.file_sha256 == file_sha256,
+                ExtractionCacheEntry.method == method,
+                ExtractionCacheEntry.extractor_version == self.version,
+            )
+        )
+        row = result.first()
+        if row is None:
+            return None
+        await self.db.execute(
+            update(ExtractionCacheEntry)
+            .where(ExtractionCacheEntry.id == row.id)
+            .values(last_accessed_at=datetime.now(timezone.utc), hit_count=ExtractionCacheEntry.hit_count + 1)
+        )
+        await self.db.commit()
+        payload = json.loads(row.payload)
+        payload["cached"] = True
+        logger.info(f"Extraction cache hit / Acerto no cache de extração: {file_sha256[:12]} ({method})")
+        return payload
+
+    async def cached_ocr_text(self, file_sha256: str, method: str = "combined") -> Tuple[str, str]:
+        """
+        Text und Text-Hash einer bereits extrahierten Datei (ohne neue Extraktion).
+        Texto e hash do texto de um arquivo já extraído (sem nova extração).
+
+        Returns:
+            Tuple[str, str]: (Text, SHA-256 des normalisierten Texts) oder ("", "")
+        """
+        cached = await self.get(file_sha256, method)
+        text = ((cached or {}).get("extraction") or {}).get("text") or ""
+        if not text:
+            return "", ""
+        normalized = " ".join(text.lower().split())
+        return text, hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    async def put(self, file_sha256: str, method: str, result: Dict[str, Any]) -> bool:
+        """
+        Speichert ein erfolgreiches Ergebnis und setzt die Größengrenze durch.
+        Armazena um resultado bem-sucedido e aplica o limite de tamanho.
+
+        Returns:
+            bool: True, wenn gespeichert / True se armazenado
+        """
+        if not (result.get("extraction") or {}).get("success"):
+            return False
+        payload = json.dumps(
+            {"extraction": result.get("extraction"), "intelligent_data": result.get("intelligent_data") or {}},
+            ensure_ascii=False,
+            default=str,
+        )
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+
+        self.db.add(ExtractionCacheEntry(
+            file_sha256=file_sha256,
+            method=method,
+            extractor_version=self.version,
+            payload=payload,
+            size_bytes=size,
+            hit_count=0,
+            last_accessed_at=datetime.now(timezone.utc),
+        ))
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Paralleler Upload derselben Datei hat schon gespeichert / Upload paralelo já gravou
+            await self.db.rollback()
+            return False
+        await self.evict()
+        return True
+
+    async def evict(self) -> int:
+        """
+        Entfernt Einträge veralteter Versionen und verdrängt nach LRU bis zur Größengrenze.
+        Remove entradas de versões antigas e aplica LRU até o limite de tamanho.
+
+        Returns:
+            int: Anzahl entfernter Einträge / Quantidade de entradas removidas
+        """
+        stale = await self.db.execute(
+            delete(ExtractionCacheEntry).where(ExtractionCacheEntry.extractor_version != self.version)
+        )
+        removed = stale.rowcount or 0
+
+        total = (await self.db.execute(select(func.coalesce(func.sum(ExtractionCacheEntry.size_bytes), 0)))).scalar_one()
+        if total > self.max_bytes:
+            rows = await self.db.execute(
+                select(ExtractionCacheEntry.id, ExtractionCacheEntry.size_bytes)
+                .order_by(ExtractionCacheEntry.last_accessed_at, ExtractionCacheEntry.id)
+            )
+            victims = []
+            for entry_id, size in rows.all():
+                if total <= self.max_bytes:
+                    break
+                victims.append(entry_id)
+                total -= size
+            if victims:
+                await self.db.execute(delete(ExtractionCacheEntry).where(ExtractionCacheEntry.id.in_(victims)))
+                removed += len(victims)
+
+        if removed:
+            await self.db.commit()
+            logger.info(f"Extraction cache evicted {removed} entries / Entradas removidas do cache: {removed}")
+        return removed
@@ -0,0 +1,412 @@
+"""
+PDF-Extraktions-Engine - Prozesspool für CPU-lastige Textextraktion
+Motor de extração de PDF - Pool de processos para extração de texto intensiva em CPU
+
+DE: pdfplumber/PyMuPDF und die Regex-Auswertung halten den GIL; in
+    ``asyncio.to_thread`` bremsen sie jede andere Anfrage des Workers aus.
+    Die Engine verteilt Extraktionen daher auf einen ``ProcessPoolExecutor``
+    mit vorgewärmten Prozessen (Bibliotheken bereits importiert), einem
+    Speicherlimit je Prozess (RLIMIT_AS) und einem Timeout je Auftrag.
+    Hängt ein Prozess trotz Timeout, wird der Pool beendet und neu aufgebaut.
+PT: pdfplumber/PyMuPDF e a análise por regex seguram o GIL; em
+    ``asyncio.to_thread`` atrasam todas as outras requisições do worker.
+    O motor distribui as extrações num ``ProcessPoolExecutor`` com processos
+    pré-aquecidos (bibliotecas já importadas), limite de memória por processo
+    (RLIMIT_AS) e timeout por tarefa. Se um processo travar mesmo assim, o pool
+    é encerrado e recriado.
+
+DE: Vorschaubilder laufen in einem eigenen kleinen Pool mit kurzem Zeitlimit;
+    ein hängendes Rendering beendet nie laufende Extraktionen.
+PT: Miniaturas rodam num pool próprio e pequeno com tempo limite curto; uma
+    renderização travada nunca encerra extrações em andamento.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Methode -> PDFReaderService-Funktion / Método -> função do PDFReaderService
+EXTRACTION_METHODS = {
+    "combined": "extract_text_combined",
+    "adaptive": "extract_text_adaptive",
+    "exhaustive": "extract_text_exhaustive",
+    "pdfplumber": "extract_text_with_pdfplumber",
+    "pypdf2": "extract_text_with_pypdf2",
+    "pymupdf": "extract_text_with_pymupdf",
+}
+# Bibliotheken, die jeder Worker beim Start lädt / Bibliotecas carregadas por cada worker na inicialização
+PRELOAD_MODULES = ("pdfplumber", "fitz", "PyPDF2", "dateparser")
+
+
+class ExtractionError(Exception):
+    """Extraktion fehlgeschlagen / Extração falhou"""
+
+
+class ExtractionTimeoutError(ExtractionError):
+    """Extraktion hat das Zeitlimit überschritten / Extração excedeu o tempo limite"""
+
+
+# ---------- Worker-Prozess / Processo worker ----------
+
+_reader = None
+
+
+def _init_worker(memory_limit_mb: int, preload_models: bool = True) -> None:
+    """
+    Initialisiert einen Worker: Speicherlimit setzen, Bibliotheken vorladen.
+    Inicializa um worker: define o limite de memória e pré-carrega bibliotecas.
+    """
+    # SIGINT gehört dem Elternprozess / SIGINT pertence ao processo pai
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if memory_limit_mb > 0:
+        try:
+            import resource
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning(f"Speicherlimit nicht gesetzt / Limite de memória não definido: {e}")
+
+    import importlib
+    for module in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+    # Modelle im Initialisierer laden: beim Aufwärmen der Engine, nicht beim ersten Auftrag
+    # Carregar modelos no inicializador: no aquecimento do motor, não na primeira tarefa
+    if preload_models:
+        from app.services.model_registry import get_model_registry
+        get_model_registry().preload()
+
+
+def _get_reader():
+    global _reader
+    if _reader is None:
+        from app.services.pdf_reader import PDFReaderService
+        _reader = PDFReaderService()
+        _reader.ocr_enabled = settings.OCR_ENABLED
+        _reader.ocr_dpi = settings.OCR_DPI
+        _reader.ocr_language = settings.OCR_LANGUAGE
+        _reader.ocr_second_language = settings.OCR_SECOND_LANGUAGE
+        _reader.ocr_workers = settings.OCR_WORKERS
+        _reader.ocr_page_timeout = settings.OCR_PAGE_TIMEOUT_SECONDS
+        _reader.ocr_start_method = settings.EXTRACTION_MP_START_METHOD
+        _reader.analysis_head_pages = settings.PDF_ANALYSIS_HEAD_PAGES
+    return _reader
+
+
+def _on_alarm(signum, frame):
+    raise ExtractionTimeoutError("Extraktion abgebrochen (Zeitlimit) / Extração interrompida (tempo limite)")
+
+
+def _ping() -> int:
+    """Aufwärm-Auftrag / Tarefa de aquecimento"""
+    return os.getpid()
+
+
+def _run_extraction(
+    pdf_path: str, method: str = "combined", timeout: Optional[float] = None, ocr: bool = True
+) -> Dict[str, Any]:
+    """
+    Textextraktion, OCR für Seiten ohne Textschicht und intelligente Auswertung
+    in einem Auftrag.
+    Extração de texto, OCR de páginas sem camada de texto e análise inteligente
+    numa única tarefa.
+
+    Returns:
+        Dict mit ``extraction`` (Ergebnis der Textextraktion) und
+        ``intelligent_data`` (leer, wenn die Extraktion fehlschlug)
+    """
+    reader = _get_reader()
+    extract = getattr(reader, EXTRACTION_METHODS.get(method, "extract_text_combined"))
+
+    # Zeitlimit nur im Hauptthread eines Worker-Prozesses / Tempo limite só na thread principal do worker
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer") and multiprocessing.parent_process() is not None
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        extraction = extract(pdf_path)
+        if ocr:
+            from app.services.pdf_reader_pkg.ocr import apply_page_ocr
+            extraction = apply_page_ocr(reader, pdf_path, extraction)
+        intelligent_data: Dict[str, Any] = {}
+        if extraction and extraction.get("success"):
+            pages = extraction.get("pages") or []
+            if len(pages) >= settings.PDF_WINDOWED_ANALYSIS_MIN_PAGES:
+                # Lange Verträge seitenweise: spart die normalisierte Kopie des Gesamttexts und die
+                # Mustersuche darüber; Seiten und Gesamttext bleiben für das Ergebnis ohnehin im Speicher
+                # Contratos longos página a página: evita a cópia normalizada do texto completo e a busca
+                # de padrões sobre ela; páginas e texto completo ficam na memória para o resultado
+                intelligent_data = reader.extract_intelligent_data_windowed(page["text"] for page in pages) or {}
+            else:
+                intelligent_data = reader.extract_intelligent_data(extraction.get("text", "")) or {}
+        return {"extraction": extraction, "intelligent_data": intelligent_data}
+    except MemoryError:
+        raise ExtractionError("Speicherlimit überschritten / Limite de memória excedido")
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+# ---------- Engine (Elternprozess) / Motor (processo pai) ----------
+
+class ExtractionEngine:
+    """
+    Prozesspool für PDF-Extraktionen
+    Pool de processos para extrações de PDF
+
+    ``workers=0`` führt die Extraktion wie bisher in einem Thread aus
+    (z. B. für Umgebungen ohne Mehrprozessbetrieb).
+    ``workers=0`` executa a extração numa thread, como antes.
+    """
+
+    # Zusätzliche Frist, bevor ein hängender Prozess abgeschossen wird
+    # Prazo adicional antes de matar um processo travado
+    KILL_GRACE_SECONDS = 5.0
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 120.0,
+        memory_limit_mb: int = 1024,
+        max_tasks_per_child: Optional[int] = 50,
+        start_method: str = "spawn",
+        preload_models: bool = True,
+        render_workers: int = 1,
+        render_timeout: float = 15.0,
+    ) -> None:
+        if workers < 0:
+            raise ValueError("Extraction workers must be >= 0 / Número de workers deve ser >= 0")
+        if timeout <= 0 or render_timeout <= 0:
+            raise ValueError("Extraction timeout must be > 0 / Tempo limite deve ser > 0")
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self.start_method = start_method
+        self.preload_models = preload_models
+        self.render_workers = max(1, render_workers)
+        self.render_timeout = render_timeout
+        self.restarts = 0
+        self.render_restarts = 0
+        # Alle Worker gestartet und Modelle geladen / Todos os workers iniciados e modelos carregados
+        self.warm = workers == 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._render_executor: Optional[ProcessPoolExecutor] = None
+        self._rewarm_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(cls) -> "ExtractionEngine":
+        """Engine mit den Einstellungen der Anwendung / Motor com as configurações da aplicação"""
+        return cls(
+            workers=settings.EXTRACTION_WORKERS,
+            timeout=settings.EXTRACTION_TIMEOUT_SECONDS,
+            memory_limit_mb=settings.EXTRACTION_MEMORY_LIMIT_MB,
+            max_tasks_per_child=settings.EXTRACTION_MAX_TASKS_PER_CHILD,
+            start_method=settings.EXTRACTION_MP_START_METHOD,
+            preload_models=settings.MODEL_PRELOAD_ENABLED,
+            render_workers=settings.THUMBNAIL_RENDER_WORKERS,
+            render_timeout=settings.THUMBNAIL_RENDER_TIMEOUT_SECONDS,
+        )
+
+    def _new_executor(self, workers: int, preload_models: bool) -> ProcessPoolExecutor:
+        # max_tasks_per_child ist mit "fork" nicht erlaubt / max_tasks_per_child não é permitido com "fork"
+        recycle = self.max_tasks_per_child if self.start_method != "fork" else None
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=(self.memory_limit_mb, preload_models),
+            max_tasks_per_child=recycle,
+        )
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = self._new_executor(self.workers, self.preload_models)
+        return self._executor
+
+    def _ensure_render_executor(self) -> ProcessPoolExecutor:
+        if self._render_executor is None:
+            # Rendern braucht keine Modelle / Renderizar não precisa de modelos
+            self._render_executor = self._new_executor(self.render_workers, False)
+        return self._render_executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor, reason: str) -> None:
+        """
+        Beendet einen Pool hart (hängende oder abgestürzte Prozesse).
+        Encerra um pool à força (processos travados ou com falha).
+        """
+        if self._executor is executor:
+            self._executor = None
+            self.restarts += 1
+            self.warm = False
+            self._schedule_rewarm()
+            logger.warning(f"Extraction pool restarted ({reason}) / Pool de extração reiniciado ({reason})")
+        elif self._render_executor is executor:
+            self._render_executor = None
+            self.render_restarts += 1
+            logger.warning(f"Render pool restarted ({reason}) / Pool de renderização reiniciado ({reason})")
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                process.kill()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_rewarm(self) -> None:
+        """
+        Wärmt den neuen Pool im Hintergrund auf; sonst bliebe ``warm`` (und
+        damit /health/ready) nach einem Neustart dauerhaft False.
+        Aquece o novo pool em segundo plano; senão ``warm`` (e /health/ready)
+        ficaria False para sempre após um reinício.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._rewarm_task is None or self._rewarm_task.done():
+            self._rewarm_task = loop.create_task(self._rewarm())
+
+    async def _rewarm(self) -> None:
+        try:
+            await self.start()
+        except Exception as e:
+            # Der nächste Auftrag baut den Pool erneut auf / A próxima tarefa recria o pool
+            logger.warning(f"Extraction pool warm-up failed / Falha ao aquecer o pool de extração: {e}")
+
+    async def start(self) -> List[int]:
+        """
+        Wärmt alle Worker vor (Prozessstart + Bibliotheksimport beim Hochfahren).
+        Pré-aquece todos os workers (início do processo + importação na inicialização).
+
+        Returns:
+            List[int]: PIDs der gestarteten Worker / PIDs dos workers iniciados
+        """
+        if self.workers == 0:
+            return []
+        executor = self._ensure_executor()
+        loop = asyncio.get_running_loop()
+        # Gleichzeitig eingereichte Aufträge starten je einen Prozess / Tarefas simultâneas iniciam um processo cada
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, _ping) for _ in range(self.workers)))
+        # Inzwischen verworfener Pool zählt nicht / Pool descartado nesse meio tempo não conta
+        if executor is self._executor:
+            self.warm = True
+        logger.info(f"Extraction pool ready with {len(set(pids))} workers / Pool de extração pronto")
+        return sorted(set(pids))
+
+    async def extract(self, pdf_path: str, method: str = "combined", ocr: bool = True) -> Dict[str, Any]:
+        """
+        Extrahiert Text und Vertragsdaten aus einer PDF-Datei.
+        Extrai texto e dados do contrato de um arquivo PDF.
+
+        Args:
+            pdf_path: Pfad zur PDF-Datei / Caminho do arquivo PDF
+            method: combined, pdfplumber, pypdf2 oder pymupdf
+            ocr: Seiten ohne Textschicht per OCR erkennen / Reconhecer páginas sem texto por OCR
+
+        Returns:
+            Dict mit ``extraction`` und ``intelligent_data``
+
+        Raises:
+            ExtractionTimeoutError: Zeitlimit überschritten / Tempo limite excedido
+            ExtractionError: Worker abgestürzt oder Speicherlimit erreicht / Worker falhou ou limite de memória
+        """
+        if method not in EXTRACTION_METHODS:
+            method = "combined"
+        if self.workers == 0:
+            return await asyncio.to_thread(_run_extraction, pdf_path, method, None, ocr)
+        return await self._submit(_run_extraction, pdf_path, method, self.timeout, ocr)
+
+    async def render_page(self, pdf_path: str, page_number: int, width: int) -> bytes:
+        """
+        Rendert eine Seite als PNG (Vorschaubild) im Render-Pool.
+        Renderiza uma página como PNG (miniatura) no pool de renderização.
+
+        Raises:
+            PageNotFoundError: Seite existiert nicht / Página não existe
+            ExtractionTimeoutError, ExtractionError: wie ``extract`` / como ``extract``
+        """
+        from app.services.thumbnail_service import PageNotFoundError, render_page_png
+
+        if self.workers == 0:
+            return await asyncio.to_thread(render_page_png, pdf_path, page_number, width)
+        return await self._submit(
+            render_page_png, pdf_path, page_number, width, passthrough=(PageNotFoundError,), render=True
+        )
+
+    async def _submit(
+        self, func: Callable[..., Any], *args: Any, passthrough: Tuple[type, ...] = (), render: bool = False
+    ) -> Any:
+        """
+        Führt einen Auftrag im Pool aus (Zeitlimit, Neustart bei hängendem/abgestürztem Prozess).
+        Executa uma tarefa no pool (tempo limite, reinício com processo travado/com falha).
+
+        ``render=True`` nutzt den Render-Pool; dessen Neustart trifft keine Extraktionen.
+        ``render=True`` usa o pool de renderização; seu reinício não afeta extrações.
+        """
+        if render:
+            # Rendern ohne SIGALRM im Worker: direkt nach dem kurzen Limit beenden
+            # Renderização sem SIGALRM no worker: encerrar logo após o limite curto
+            executor, timeout, limit = self._ensure_render_executor(), self.render_timeout, self.render_timeout
+        else:
+            executor, timeout = self._ensure_executor(), self.timeout
+            limit = timeout + self.KILL_GRACE_SECONDS
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(executor, func, *args), limit)
+        except asyncio.TimeoutError:
+            # SIGALRM hat nicht gegriffen (z. B. in C-Code hängend) / SIGALRM não funcionou (travado em código C)
+            self._discard_executor(executor, "timeout")
+            raise ExtractionTimeoutError(
+                f"Extraktion nach {timeout:.0f}s abgebrochen / Extração interrompida após {timeout:.0f}s"
+            )
+        except BrokenProcessPool as e:
+            # Prozess beendet, z. B. durch das Speicherlimit / Processo encerrado, p. ex. pelo limite de memória
+            self._discard_executor(executor, "broken pool")
+            raise ExtractionError(f"Extraktions-Worker abgestürzt / Worker de extração falhou: {e}") from e
+        except (ExtractionError, *passthrough):
+            raise
+        except Exception as e:
+            raise ExtractionError(str(e)) from e
+
+    async def close(self) -> None:
+        """Beendet den Pool (Shutdown) / Encerra o pool (shutdown)"""
+        if self._rewarm_task is not None:
+            self._rewarm_task.cancel()
+            self._rewarm_task = None
+        executors = (self._executor, self._render_executor)
+        self._executor = self._render_executor = None
+        for executor in executors:
+            if executor is not None:
+                await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+
+_engine: Optional[ExtractionEngine] = None
+
+
+def get_extraction_engine() -> ExtractionEngine:
+    """Gemeinsame Engine der Anwendung / Motor compartilhado da aplicação"""
+    global _engine
+    if _engine is None:
+        _engine = ExtractionEngine.from_settings()
+    return _engine
+
+
+async def shutdown_extraction_engine() -> None:
+    """Beendet die gemeinsame Engine (Shutdown) / Encerra o motor compartilhado (shutdown)"""
+    global _engine
+    engine, _engine = _engine, None
+    if engine is not None:
+        await engine.close()
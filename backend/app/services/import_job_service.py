@@ -0,0 +1,295 @@
+"""
+Import-Job Service - Einreihen, Abarbeiten und Überwachen von PDF-Import-Jobs
+Serviço de jobs de importação - Enfileirar, processar e monitorar importações de PDF
+
+DE: ``enqueue`` legt einen Job für eine bereits gespeicherte Datei an;
+    ``run_next`` reserviert den ältesten offenen Job (QUEUED oder RUNNING mit
+    abgelaufener Lease), führt ``ContractImportService.process_pdf`` aus und
+    speichert Stufe, Fortschritt und Ergebnis. Jeder Stufenwechsel verlängert
+    die Lease. Ein Job, dessen Worker ``max_attempts`` Mal abgebrochen ist
+    (z. B. Neustart mitten in der Verarbeitung), wird als FAILED markiert.
+PT: ``enqueue`` cria um job para um arquivo já gravado; ``run_next`` reserva o
+    job aberto mais antigo (QUEUED ou RUNNING com lease expirada), executa
+    ``ContractImportService.process_pdf`` e grava etapa, progresso e resultado.
+    Cada mudança de etapa renova a lease. Um job cujo worker foi interrompido
+    ``max_attempts`` vezes (p. ex. reinício durante o processamento) é marcado
+    como FAILED.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.import_job import STAGE_PROGRESS, ImportJob, ImportJobStage, ImportJobStatus
+from app.services.contract_import_service import ContractImportError, ContractImportService
+from app.utils.upload_stream import IngestedUpload
+
+logger = logging.getLogger(__name__)
+
+ABANDONED_ERROR = "Import abgebrochen (Worker beendet) / Importação interrompida (worker encerrado)"
+
+_wakeup: Optional[asyncio.Event] = None
+
+
+def get_import_job_wakeup() -> asyncio.Event:
+    """Ereignis, auf das die Worker im Leerlauf warten / Evento aguardado pelos workers ociosos"""
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+
+def wake_import_workers() -> None:
+    """Weckt die Worker nach dem Einreihen eines Jobs / Acorda os workers após enfileirar um job"""
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+class ImportJobService:
+    """
+    Serviço de jobs de importação de PDF
+    Dienst für PDF-Import-Jobs
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialisiert den Dienst mit einer Datenbanksitzung.
+        Inicializa o serviço com uma sessão de banco de dados.
+        """
+        self.db = db
+
+    async def enqueue(
+        self,
+        user_id: int,
+        upload: IngestedUpload,
+        original_file_name: str,
+        storage_name: str,
+        extraction_method: str = "combined",
+        include_ocr: bool = True,
+    ) -> ImportJob:
+        """
+        Legt einen Job für eine gespeicherte Datei an und weckt die Worker.
+        Cria um job para um arquivo gravado e acorda os workers.
+        """
+        job = ImportJob(
+            user_id=user_id,
+            original_file_name=original_file_name,
+            storage_name=storage_name,
+            file_path=upload.path,
+            file_sha256=upload.sha256,
+            file_size=upload.size,
+            extraction_method=extraction_method,
+            include_ocr=include_ocr,
+            status=ImportJobStatus.QUEUED,
+            stage=ImportJobStage.QUEUED,
+            progress=0,
+            attempts=0,
+            max_attempts=settings.IMPORT_JOB_MAX_ATTEMPTS,
+            created_at=datetime.now(timezone.utc),
+        )
+        self.db.add(job)
+        await self.db.commit()
+        wake_import_workers()
+        logger.info(f"Import job {job.id} queued / Job de importação {job.id} enfileirado: {original_file_name}")
+        return job
+
+    async def get_job(self, job_id: int) -> Optional[ImportJob]:
+        """Liefert einen Job / Retorna um job"""
+        result = await self.db.execute(select(ImportJob).where(ImportJob.id == job_id))
+        return result.scalar_one_or_none()
+
+    async def claim_next(self, now: Optional[datetime] = None) -> Optional[ImportJob]:
+        """
+        Reserviert den ältesten offenen Job (QUEUED oder RUNNING mit abgelaufener Lease).
+        Reserva o job aberto mais antigo (QUEUED ou RUNNING com lease expirada).
+
+        Die Reservierung ist ein bedingtes UPDATE (auch SQLite kennt kein
+        ``SKIP LOCKED``): nur wer die Zeile tatsächlich umschreibt, erhält den
+        Job; alle anderen Worker suchen den nächsten.
+        A reserva é um UPDATE condicional: só quem de fato altera a linha
+        recebe o job; os demais workers procuram o próximo.
+
+        Returns:
+            Optional[ImportJob]: Reservierter Job (Status RUNNING) oder None
+        """
+        while True:
+            now = now or datetime.now(timezone.utc)
+            claimable = or_(
+                ImportJob.status == ImportJobStatus.QUEUED,
+                and_(ImportJob.status == ImportJobStatus.RUNNING, ImportJob.lease_until <= now),
+            )
+            result = await self.db.execute(
+                select(ImportJob.id, ImportJob.attempts, ImportJob.max_attempts)
+                .where(claimable)
+                .order_by(ImportJob.created_at, ImportJob.id)
+                .limit(1)
+            )
+            candidate = result.first()
+            if candidate is None:
+                await self.db.commit()
+                return None
+            job_id, attempts, max_attempts = candidate
+
+            if attempts >= max_attempts:
+                # Wiederholt abgebrochen – nicht endlos neu starten / Interrompido repetidamente – não reiniciar sem fim
+                await self.db.execute(
+                    update(ImportJob)
+                    .where(ImportJob.id == job_id, claimable)
+                    .values(
+                        status=ImportJobStatus.FAILED,
+                        finished_at=now,
+                        lease_until=None,
+                        error_status_code=500,
+                        error_message=ABANDONED_ERROR,
+                    )
+                    .execution_options(synchronize_session="fetch")
+                )
+                await self.db.commit()
+                continue
+
+            claimed = await self.db.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, claimable)
+                .values(
+                    status=ImportJobStatus.RUNNING,
+                    attempts=ImportJob.attempts + 1,
+                    started_at=now,
+                    lease_until=now + timedelta(seconds=settings.IMPORT_JOB_LEASE_SECONDS),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            if not claimed.rowcount:
+                # Ein anderer Worker war schneller / Outro worker foi mais rápido
+                continue
+            result = await self.db.execute(
+                select(ImportJob).where(ImportJob.id == job_id).execution_options(populate_existing=True)
+            )
+            return result.scalar_one()
+
+    async def set_stage(self, job: ImportJob, stage: ImportJobStage) -> None:
+        """
+        Speichert Stufe und Fortschritt und verlängert die Lease.
+        Grava etapa e progresso e renova a lease.
+        """
+        job.stage = stage
+        job.progress = STAGE_PROGRESS[stage]
+        job.lease_until = datetime.now(timezone.utc) + timedelta(seconds=settings.IMPORT_JOB_LEASE_SECONDS)
+        await self.db.commit()
+
+    @staticmethod
+    def _finish(job: ImportJob, status: ImportJobStatus, now: datetime) -> None:
+        job.status = status
+        job.finished_at = now
+        job.lease_until = None
+        if status == ImportJobStatus.SUCCEEDED:
+            job.stage = ImportJobStage.DONE
+            job.progress = 100
+
+    async def _reset_session(self, job: ImportJob) -> None:
+        # Abgebrochene Transaktion verwerfen und den Job neu laden / Descartar a transação e recarregar o job
+        await self.db.rollback()
+        await self.db.refresh(job)
+
+    async def run_job(self, job: ImportJob, import_service: Optional[ContractImportService] = None) -> ImportJob:
+        """
+        Führt einen reservierten Job aus und speichert Ergebnis oder Fehler.
+        Executa um job reservado e grava o resultado ou o erro.
+        """
+        import_service = import_service or ContractImportService(self.db)
+        started = time.time()
+        try:
+            response = await import_service.process_pdf(
+                pdf_path=job.file_path,
+                original_file_name=job.original_file_name,
+                storage_name=job.storage_name,
+                file_hash=job.file_sha256,
+                file_size=job.file_size,
+                extraction_method=job.extraction_method,
+                include_ocr=job.include_ocr,
+                started_at=started,
+                on_stage=lambda stage: self.set_stage(job, stage),
+            )
+        except ContractImportError as e:
+            await self._reset_session(job)
+            self._finish(job, ImportJobStatus.FAILED, datetime.now(timezone.utc))
+            job.error_status_code = e.status_code
+            job.error_message = str(e)
+        except Exception as e:
+            logger.error(f"Import job {job.id} failed / Job de importação {job.id} falhou: {e}")
+            await self._reset_session(job)
+            self._finish(job, ImportJobStatus.FAILED, datetime.now(timezone.utc))
+            job.error_status_code = 500
+            job.error_message = f"Interner Serverfehler / Erro interno do servidor: {e}"
+        else:
+            self._finish(job, ImportJobStatus.SUCCEEDED, datetime.now(timezone.utc))
+            job.result = response.model_dump_json()
+            job.error_status_code = None
+            job.error_message = None
+        await self.db.commit()
+        logger.info(
+            f"Import job {job.id} {job.status.value} in {time.time() - started:.2f}s / "
+            f"Job de importação {job.id} concluído"
+        )
+        return job
+
+    async def run_next(self) -> Optional[ImportJob]:
+        """
+        Reserviert und verarbeitet den nächsten Job.
+        Reserva e processa o próximo job.
+
+        Returns:
+            Optional[ImportJob]: Verarbeiteter Job oder None, wenn die Warteschlange leer ist
+        """
+        job = await self.claim_next()
+        if job is None:
+            return None
+        return await self.run_job(job)
+
+    async def queue_stats(self, window_seconds: Optional[float] = None, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Warteschlangentiefe und Durchsatz im Zeitfenster.
+        Profundidade da fila e vazão na janela de tempo.
+
+        Returns:
+            Dict mit ``queued``, ``running``, ``succeeded``, ``failed``,
+            ``throughput_per_minute`` und ``avg_processing_seconds``
+        """
+        window = settings.IMPORT_JOB_STATS_WINDOW_SECONDS if window_seconds is None else window_seconds
+        now = now or datetime.now(timezone.utc)
+        since = now - timedelta(seconds=window)
+
+        open_rows = await self.db.execute(
+            select(ImportJob.status, func.count(ImportJob.id))
+            .where(ImportJob.status.in_((ImportJobStatus.QUEUED, ImportJobStatus.RUNNING)))
+            .group_by(ImportJob.status)
+        )
+        open_counts = {row[0]: row[1] for row in open_rows.all()}
+
+        finished_rows = await self.db.execute(
+            select(ImportJob.status, ImportJob.started_at, ImportJob.finished_at)
+            .where(ImportJob.finished_at >= since)
+        )
+        finished = {ImportJobStatus.SUCCEEDED: 0, ImportJobStatus.FAILED: 0}
+        durations = []
+        for status, started_at, finished_at in finished_rows.all():
+            finished[status] = finished.get(status, 0) + 1
+            if started_at is not None and finished_at is not None:
+                durations.append((finished_at - started_at).total_seconds())
+
+        done = finished[ImportJobStatus.SUCCEEDED] + finished[ImportJobStatus.FAILED]
+        return {
+            "queued": open_counts.get(ImportJobStatus.QUEUED, 0),
+            "running": open_counts.get(ImportJobStatus.RUNNING, 0),
+            "succeeded": finished[ImportJobStatus.SUCCEEDED],
+            "failed": finished[ImportJobStatus.FAILED],
+            "window_seconds": window,
+            "throughput_per_minute": round(done * 60.0 / window, 3) if window else 0.0,
+            "avg_processing_seconds": round(sum(durations) / len(durations), 3) if durations else None,
+        }
@@ -0,0 +1,137 @@
+"""
+Prozessweites Register für schwere Modelle und Parser - Vertrag MGS
+Registro de processo para modelos e analisadores pesados
+
+DE: Modelle (spaCy, dateparser) werden einmal pro Prozess geladen und von
+    allen PDFReaderService-Instanzen geteilt. Beim Start der Anwendung bzw.
+    im Initialisierer der Extraktions-Worker werden sie vorgeladen, damit der
+    erste Import nach einem Deployment keine Ladezeit trägt.
+PT: Os modelos (spaCy, dateparser) são carregados uma vez por processo e
+    compartilhados por todas as instâncias de PDFReaderService. São
+    pré-carregados na inicialização da aplicação ou no inicializador dos
+    workers de extração, para que a primeira importação após um deploy não
+    pague o tempo de carregamento.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Zustände eines Modells / Estados de um modelo
+COLD = "cold"
+LOADING = "loading"
+WARM = "warm"
+UNAVAILABLE = "unavailable"
+
+
+def _load_spacy_de() -> Any:
+    import spacy
+    return spacy.load("de_core_news_sm")
+
+
+def _load_dateparser() -> Any:
+    import dateparser
+    # Der erste Aufruf lädt die Sprachdaten / A primeira chamada carrega os dados do idioma
+    dateparser.parse("1. Januar 2025", languages=["de"])
+    return dateparser
+
+
+DEFAULT_LOADERS: Dict[str, Callable[[], Any]] = {
+    "spacy_de": _load_spacy_de,
+    "dateparser": _load_dateparser,
+}
+
+
+class ModelRegistry:
+    """
+    Lädt Modelle höchstens einmal pro Prozess (thread-sicher)
+    Carrega modelos no máximo uma vez por processo (thread-safe)
+
+    Nicht installierte Modelle gelten als ``unavailable``; ``get`` liefert
+    dann ``None`` wie die bisherigen ``_ensure_*``-Methoden.
+    Modelos não instalados ficam ``unavailable``; ``get`` retorna ``None``.
+    """
+
+    def __init__(self, loaders: Optional[Dict[str, Callable[[], Any]]] = None) -> None:
+        self._loaders: Dict[str, Callable[[], Any]] = dict(DEFAULT_LOADERS if loaders is None else loaders)
+        self._models: Dict[str, Any] = {}
+        self._states: Dict[str, Dict[str, Any]] = {name: {"state": COLD} for name in self._loaders}
+        self._locks: Dict[str, threading.Lock] = {name: threading.Lock() for name in self._loaders}
+        self._preload_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """Registriert einen Lader / Registra um carregador"""
+        self._loaders[name] = loader
+        self._states[name] = {"state": COLD}
+        self._locks[name] = threading.Lock()
+        self._models.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """
+        Liefert das Modell, lädt es beim ersten Zugriff (wartet auf laufendes Vorladen).
+        Retorna o modelo, carregando-o no primeiro acesso (aguarda o pré-carregamento em andamento).
+
+        Raises:
+            KeyError: Unbekanntes Modell / Modelo desconhecido
+        """
+        if self._states[name]["state"] == WARM:
+            return self._models[name]
+        with self._locks[name]:
+            state = self._states[name]["state"]
+            if state == WARM:
+                return self._models[name]
+            if state == UNAVAILABLE:
+                return None
+            self._states[name] = {"state": LOADING}
+            started = time.perf_counter()
+            try:
+                model = self._loaders[name]()
+            except Exception as e:
+                logger.warning(f"Modell {name} nicht verfügbar / Modelo {name} indisponível: {e}")
+                self._states[name] = {"state": UNAVAILABLE, "error": str(e)}
+                return None
+            self._models[name] = model
+            self._states[name] = {"state": WARM, "load_seconds": round(time.perf_counter() - started, 3)}
+            logger.info(f"Modell {name} geladen / Modelo {name} carregado ({self._states[name]['load_seconds']}s)")
+            return model
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """Lädt die Modelle sofort im aktuellen Thread / Carrega os modelos já na thread atual"""
+        for name in list(names or self._loaders):
+            self.get(name)
+
+    def start_preload(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        """
+        Lädt die Modelle in einem Hintergrund-Thread (einmal pro Prozess).
+        Carrega os modelos numa thread em segundo plano (uma vez por processo).
+        """
+        if self._preload_thread is None:
+            names = list(names or self._loaders)
+            self._preload_thread = threading.Thread(
+                target=self.preload, args=(names,), name="model-preload", daemon=True
+            )
+            self._preload_thread.start()
+        return self._preload_thread
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Zustand je Modell / Estado por modelo"""
+        return {name: dict(state) for name, state in self._states.items()}
+
+    @property
+    def ready(self) -> bool:
+        """Alle Modelle geladen oder endgültig nicht verfügbar / Todos carregados ou definitivamente indisponíveis"""
+        return all(state["state"] in (WARM, UNAVAILABLE) for state in self._states.values())
+
+
+_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Gemeinsames Register des Prozesses / Registro compartilhado do processo"""
+    global _registry
+    if _registry is None:
+        _registry = ModelRegistry()
+    return _registry
@@ -3,9 +3,11 @@ Notification Service – Vertragswarnungen
 Serviço de Notificações – Alertas de contrato
 
 DE: Selektiert Verträge nahe am Ablauf (T-60/T-30/T-10/T-1), erstellt
-    deduplizierte Benachrichtigungen (Alert) und versendet E-Mails HTML.
+    deduplizierte Benachrichtigungen (Alert) und reiht die HTML-E-Mails in
+    die E-Mail-Outbox ein (Versand durch den Outbox-Worker).
 PT: Seleciona contratos próximos do vencimento (T-60/T-30/T-10/T-1), cria
-    notificações deduplicadas (Alert) e envia e-mails HTML.
+    notificações deduplicadas (Alert) e enfileira os e-mails HTML na caixa
+    de saída (envio pelo worker da caixa de saída).
 
 Design:
  - Funções puras de cálculo (dias restantes, tipo de alerta)
@@ -19,14 +21,20 @@ Design:
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone, date
-from typing import Iterable, List, Optional, Tuple, cast
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, insert, or_, select
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.contract import Contract, ContractStatus
 from app.models.alert import Alert, AlertType, AlertStatus, AlertResponse, AlertListResponse
-from app.utils.email import send_email, render_contract_expiry_html, get_email_subject_by_type
+from app.utils.email import render_contract_expiry_html, get_email_subject_by_type
+from app.models.contract_stats_rollup import RollupDelta, RollupKey, apply_rollup_deltas, rollup_key
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox_service import ACTIVE_OUTBOX_STATUSES, EmailOutboxService, wake_outbox_worker
+from app.utils.smtp_pool import OutgoingEmail
 import asyncio
 
 
@@ -123,123 +131,238 @@ class NotificationService:
             except Exception:
                 pass
 
-    async def _get_active_contracts_with_end_date(self) -> List[Contract]:
-        """Seleciona contratos ativos com `end_date` definido.
-        Wählt aktive Verträge mit gesetztem `end_date` aus.
+    async def _get_contracts_due_for_alerts(
+        self,
+        today: date,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Contract, Optional[Alert], int]]:
+        """Seleciona numa única consulta os contratos que precisam de alerta hoje.
+        Wählt in einer einzigen Abfrage die Verträge aus, die heute einen Alert benötigen.
+
+        DE: Die Tagesdifferenz ``end_date - heute`` wird in SQL als CASE über die
+            vier Zieldaten berechnet (portabel und indexfähig statt DATEDIFF/julianday).
+            Verträge mit bereits versendetem (oder noch in der Outbox wartendem)
+            Alert desselben Typs werden per Anti-Join (NOT EXISTS) ausgeschlossen;
+            ein vorhandener, nicht versendeter Alert wird per Outer Join
+            mitgeliefert und erneut eingereiht.
+        PT: A diferença ``end_date - hoje`` é calculada em SQL como CASE sobre as
+            quatro datas-alvo. Contratos com alerta já enviado (ou ainda na caixa
+            de saída) do mesmo tipo são excluídos por anti-join (NOT EXISTS); um
+            alerta existente não enviado vem via outer join e é reenfileirado.
+
+        Args:
+            today: Stichtag (UTC) / Data de referência (UTC)
+            after_id: Nur Verträge mit größerer ID (Keyset-Paginierung) / Apenas contratos com ID maior
+            limit: Maximale Zeilenzahl / Número máximo de linhas
+
+        Returns:
+            Lista de (contrato, alerta existente ou None, dias restantes)
         """
-        result = await self.db.execute(
-            select(Contract).where(
-                and_(
-                    Contract.status == ContractStatus.ACTIVE,  # type: ignore
-                    Contract.end_date.is_not(None),
-                )
-            )
+        targets = {days: today + timedelta(days=days) for days in ALERT_DAY_MARKS}
+
+        def type_matches(alert_entity):
+            # (end_date, alert_type) muss zum selben Tagesmarker gehören / devem pertencer ao mesmo marco
+            return or_(*(
+                and_(Contract.end_date == target, alert_entity.alert_type == map_days_to_alert_type(days))
+                for days, target in targets.items()
+            ))
+
+        days_until = case(
+            *((Contract.end_date == target, days) for days, target in targets.items())
+        ).label("days_until")
+
+        sent_alert = aliased(Alert)
+        queued = (
+            select(EmailOutbox.id)
+            .where(EmailOutbox.alert_id == sent_alert.id, EmailOutbox.status.in_(ACTIVE_OUTBOX_STATUSES))
+            .exists()
         )
-        # normaliza possíveis coroutines retornadas por scalars() ou all()
-        scalars = result.scalars()
-        scalars = await self._await_maybe(scalars)
-        all_res = scalars.all()
-        all_res = await self._await_maybe(all_res)
-        return list(all_res)
-
-    async def _find_existing_alert(self, contract_id: int, alert_type: AlertType) -> Optional[Alert]:
-        result = await self.db.execute(
-            select(Alert).where(
-                and_(Alert.contract_id == contract_id, Alert.alert_type == alert_type)
+        # Bereits gesendet oder noch in der Outbox / Já enviado ou ainda na caixa de saída
+        already_sent = (
+            select(sent_alert.id)
+            .where(
+                sent_alert.contract_id == Contract.id,
+                or_(sent_alert.status == AlertStatus.SENT, queued),
+                type_matches(sent_alert),
             )
+            .exists()
         )
-        val = result.scalar_one_or_none()
-        return await self._await_maybe(val)
 
-    async def _create_alert(
-        self,
-        contract_id: int,
-        alert_type: AlertType,
-        scheduled_for: datetime,
-        recipient: Optional[str],
-        subject: str,
-    ) -> Alert:
-        alert = Alert(
-            contract_id=contract_id,
-            alert_type=alert_type,
-            status=AlertStatus.PENDING,
-            scheduled_for=scheduled_for,
-            recipient=recipient,
-            subject=subject,
+        stmt = (
+            select(Contract, Alert, days_until)
+            .outerjoin(
+                Alert,
+                and_(
+                    Alert.contract_id == Contract.id,
+                    Alert.status != AlertStatus.SENT,
+                    type_matches(Alert),
+                ),
+            )
+            .where(
+                Contract.status == ContractStatus.ACTIVE,  # type: ignore
+                Contract.end_date.in_(list(targets.values())),
+                ~already_sent,
+            )
+            .order_by(Contract.id, Alert.id)
         )
-        self.db.add(alert)
-        await self.db.commit()
-        await self.db.refresh(alert)
-        return alert
-
-    async def _send_alert_email(self, alert: Alert, contract: Contract, days_until: int) -> bool:
+        if after_id is not None:
+            stmt = stmt.where(Contract.id > after_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.db.execute(stmt)
+        rows = await self._await_maybe(result.all())
+
+        # Doppelte offene Alerts liefern mehrere Zeilen: nur die erste pro Vertrag verwenden
+        # Alertas abertos duplicados geram várias linhas: usar apenas a primeira por contrato
+        due: List[Tuple[Contract, Optional[Alert], int]] = []
+        seen: set = set()
+        for contract, alert, days in rows:
+            if contract.id in seen:
+                continue
+            seen.add(contract.id)
+            due.append((contract, alert, int(days)))
+        return due
+
+    async def _create_alerts_bulk(self, rows: List[Dict[str, Any]], contracts: List[Contract]) -> List[Alert]:
+        """Cria todos os novos alertas de um lote com um único INSERT (RETURNING).
+        Legt alle neuen Alerts eines Stapels mit einem einzigen INSERT (RETURNING) an.
+
+        DE: Ohne RETURNING-Unterstützung für executemany (z. B. MySQL) werden die
+            Objekte per ``add_all`` + einem Flush angelegt. Der Core-Insert umgeht
+            die ORM-Events des Statistik-Rollups, daher werden die Zähler hier
+            selbst eingebucht.
+        PT: Sem suporte a RETURNING em executemany (p. ex. MySQL) usa ``add_all``
+            + um flush. O INSERT em massa contorna os eventos ORM do rollup, por
+            isso os contadores são lançados aqui.
+
+        Args:
+            rows: Spaltenwerte je Alert / Valores das colunas por alerta
+            contracts: Zugehöriger Vertrag je Zeile / Contrato correspondente por linha
+        """
+        if not rows:
+            return []
+
+        dialect = self.db.get_bind().dialect
+        if not getattr(dialect, "insert_executemany_returning", False):
+            alerts = [Alert(**row) for row in rows]
+            self.db.add_all(alerts)
+            await self.db.flush()
+            return alerts
+
+        # Reihenfolge von RETURNING ist nicht garantiert: Zuordnung über contract_id (eindeutig je Stapel)
+        # A ordem do RETURNING não é garantida: associação via contract_id (único por lote)
+        result = await self.db.scalars(insert(Alert).returning(Alert), rows)
+        by_contract = {alert.contract_id: alert for alert in await self._await_maybe(result.all())}
+        alerts = [by_contract[row["contract_id"]] for row in rows]
+
+        today = date.today()
+        deltas: Dict[RollupKey, RollupDelta] = defaultdict(RollupDelta)
+        for contract in contracts:
+            key = rollup_key(contract.department, contract.team, contract.status, contract.contract_type,
+                             contract.operation_type, contract.end_date, today)
+            deltas[key].alert_count += 1
+            deltas[key].pending_alert_count += 1
+        await self.db.run_sync(lambda session: apply_rollup_deltas(session.connection(), deltas))
+        return alerts
+
+    def _build_alert_email(self, alert: Alert, contract: Contract, days_until: int) -> Optional[OutgoingEmail]:
+        """Monta a mensagem do alerta; sem destinatário marca o alerta como falho.
+        Erstellt die Alert-Nachricht; ohne Empfänger wird der Alert als fehlgeschlagen markiert.
+        """
         subject = alert.subject or build_email_subject(contract, days_until, cast(AlertType, alert.alert_type))
         body_html = build_email_body_html(contract, days_until, cast(AlertType, alert.alert_type))
         recipient = cast(Optional[str], alert.recipient) or cast(Optional[str], contract.client_email)
         if not recipient:
             # Sem destinatário, marcar como falha informativa
             alert.mark_failed("No recipient available / Kein Empfänger verfügbar")
-            await self.db.commit()
-            return False
-
-        # send_email may be blocking (smtplib); run in thread to avoid blocking event loop
-        success = await asyncio.to_thread(send_email, recipient, cast(str, subject), body_html, True)
-        if success:
-            alert.mark_sent()
-        else:
-            alert.mark_failed("SMTP error / SMTP-Fehler")
-        await self.db.commit()
-        return success
-
-    async def process_due_alerts(self) -> AlertListResponse:
+            return None
+        return OutgoingEmail(to=recipient, subject=cast(str, subject), body=body_html, is_html=True)
+
+    async def process_due_alerts(self, batch_size: Optional[int] = None) -> AlertListResponse:
         """Processa todos os alertas devidos hoje (T-60/30/10/1).
         Verarbeitet alle fälligen Alerts heute.
+
+        Os e-mails são apenas enfileirados na caixa de saída (mesma transação dos
+        alertas); o envio é feito pelo worker da caixa de saída.
+        Die E-Mails werden nur in die Outbox eingereiht (gleiche Transaktion wie die
+        Alerts); der Versand erfolgt durch den Outbox-Worker.
+
+        Args:
+            batch_size: Verträge je Transaktion; None = ein einziger Lauf. Mit
+                batch_size werden die Verträge per Keyset-Paginierung geladen und
+                die ORM-Objekte nach jedem Commit freigegeben.
+                Contratos por transação; None = execução única. Com batch_size os
+                contratos são paginados e os objetos ORM liberados após cada commit.
         """
-        contracts = await self._get_active_contracts_with_end_date()
-        created: List[AlertResponse] = []
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be >= 1 / batch_size deve ser >= 1")
 
         now = datetime.now(timezone.utc)
+        created: List[AlertResponse] = []
+        last_id: Optional[int] = None
+        while True:
+            due = await self._get_contracts_due_for_alerts(now.date(), after_id=last_id, limit=batch_size)
+            if not due:
+                break
+            processed = await self._process_due_chunk(due, now)
+            for alert in processed:
+                # Garantir campos necessários para validação (útil para mocks nos testes)
+                self._ensure_alert_required_fields(alert)
+                created.append(AlertResponse.model_validate(alert))
+            if batch_size is None:
+                break
+            last_id = cast(int, due[-1][0].id)
+            self.db.expunge_all()
 
-        for contract in contracts:
-            # Calcular dias restantes e tipo de alerta
-            end_date_value = cast(Optional[date], contract.end_date)
-            if end_date_value is None:
-                continue
-            days_until = calculate_days_until(end_date_value)
-            alert_type = map_days_to_alert_type(days_until)
-            if alert_type is None or days_until is None:
-                continue
-
-            # Dedupe
-            existing = await self._find_existing_alert(cast(int, contract.id), alert_type)
-            if existing and cast(AlertStatus, existing.status) == AlertStatus.SENT:
-                continue
+        per_page_value = len(created) or 1
+        return AlertListResponse(total=len(created), alerts=created, page=1, per_page=per_page_value)
 
-            subject = build_email_subject(contract, days_until, alert_type)
-            recipient = cast(Optional[str], contract.client_email)
+    async def _process_due_chunk(self, due: List[Tuple[Contract, Optional[Alert], int]], now: datetime) -> List[Alert]:
+        """Cria/reaproveita os alertas de um lote, enfileira os e-mails e faz um único commit.
+        Legt die Alerts eines Stapels an bzw. verwendet sie wieder, reiht die E-Mails ein, ein Commit.
+        """
+        new_rows: List[Dict[str, Any]] = []
+        new_contracts: List[Contract] = []
+        reused: List[Tuple[Contract, Alert, int]] = []
+        new_days: List[int] = []
 
-            # Criar ou reutilizar
+        for contract, existing, days_until in due:
+            alert_type = cast(AlertType, map_days_to_alert_type(days_until))
             if existing is None:
-                alert = await self._create_alert(
+                new_rows.append(dict(
                     contract_id=cast(int, contract.id),
                     alert_type=alert_type,
+                    status=AlertStatus.PENDING,
                     scheduled_for=now,
-                    recipient=recipient,
-                    subject=subject,
-                )
+                    recipient=cast(Optional[str], contract.client_email),
+                    subject=build_email_subject(contract, days_until, alert_type),
+                    # Zeitstempel clientseitig setzen: kein Nachladen nach dem Commit nötig
+                    # Timestamps definidos no cliente: sem recarregar após o commit
+                    created_at=now,
+                    updated_at=now,
+                ))
+                new_contracts.append(contract)
+                new_days.append(days_until)
             else:
-                alert = existing
+                existing.status = AlertStatus.PENDING
+                existing.error = None
+                existing.updated_at = now
+                reused.append((contract, existing, days_until))
 
-            # Enviar
-            await self._send_alert_email(alert, contract, days_until)
+        created = await self._create_alerts_bulk(new_rows, new_contracts)
+        work = list(zip(new_contracts, created, new_days)) + reused
 
-            # Coletar resposta
-            # Garantir campos necessários para validação (útil para mocks nos testes)
-            self._ensure_alert_required_fields(alert)
-            created.append(AlertResponse.model_validate(alert))
+        outbox = EmailOutboxService(self.db)
+        for contract, alert, days_until in work:
+            message = self._build_alert_email(alert, contract, days_until)
+            if message is not None:
+                outbox.enqueue(message, alert_id=alert.id)
 
-        per_page_value = len(created) or 1
-        return AlertListResponse(total=len(created), alerts=created, page=1, per_page=per_page_value)
+        if work:
+            await self.db.commit()
+            wake_outbox_worker()
+        return [alert for _, alert, _ in work]
 
     async def reprocess_alert(self, alert_id: int) -> Optional[AlertResponse]:
         """Reprocessa um alerta (útil para status FAILED).
@@ -262,8 +385,19 @@ class NotificationService:
         if days_until is None:
             return None
 
-        await self._send_alert_email(alert, contract, days_until)
+        # Erneut einreihen, sofern nicht bereits ein offener Outbox-Eintrag existiert
+        # Reenfileirar, a menos que já exista uma entrada aberta na caixa de saída
+        outbox = EmailOutboxService(self.db)
+        if not await outbox.has_active_entry(cast(int, alert.id)):
+            message = self._build_alert_email(alert, contract, days_until)
+            if message is not None:
+                alert.status = AlertStatus.PENDING
+                alert.error = None
+                alert.updated_at = datetime.now(timezone.utc)
+                outbox.enqueue(message, alert_id=alert.id)
+            await self.db.commit()
+            wake_outbox_worker()
+
         # Garantir campos necessários antes de validar
         self._ensure_alert_required_fields(alert)
         return AlertResponse.model_validate(alert)
-
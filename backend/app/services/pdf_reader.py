@@ -12,7 +12,7 @@ import os
 import re
 import logging
 from datetime import datetime, date
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List
 from pathlib import Path
 import io
 from typing import Dict, Any, cast
@@ -47,70 +47,44 @@ class PDFReaderService:
             'eur': ['eur', 'euro', '€']
         }
         
-        # Regex-Patterns für deutsche Verträge / Padrões regex para contratos alemães
+        # Regex-Patterns aus dem gemeinsamen Register / Padrões regex do registro compartilhado
+        from app.services.pdf_reader_pkg.patterns import pattern_sources
         self.patterns = {
-            'date_patterns': [
-                r'\b\d{1,2}\.\d{1,2}\.\d{4}\b',  # DD.MM.YYYY
-                r'\b\d{1,2}\/\d{1,2}\/\d{4}\b',   # DD/MM/YYYY
-                r'\b\d{1,2}-\d{1,2}-\d{4}\b',     # DD-MM-YYYY
-                r'\b\d{1,2}\.\s*\d{1,2}\.\s*\d{4}\b',  # DD. MM. YYYY
-            ],
-            'money_patterns': [
-                r'€\s*\d{1,3}(?:\.\d{3})*(?:,\d{2})?',  # € 1.000,00
-                r'EUR\s*\d{1,3}(?:\.\d{3})*(?:,\d{2})?', # EUR 1.000,00
-                r'\d{1,3}(?:\.\d{3})*(?:,\d{2})?\s*€',  # 1.000,00 €
-                r'\d{1,3}(?:\.\d{3})*(?:,\d{2})?\s*EUR', # 1.000,00 EUR
-            ],
-            'company_patterns': [
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+GmbH\b',  # Nome GmbH
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+AG\b',    # Nome AG
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+KG\b',    # Nome KG
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+OHG\b',   # Nome OHG
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+UG\b',    # Nome UG
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+e\.V\b',  # Nome e.V
-                r'\b[A-ZÄÖÜ][a-zäöüß]+\s+&Co\b',   # Nome &Co
-                
-            ],
-            'email_patterns': [
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            ],
-            'phone_patterns': [
-                r'(\+49\s?)?(\(0\))?[0-9\s\-\(\)]{10,}',  # Deutsche Telefonnummern
-                r'(\+49\s?)?[0-9]{2,4}\s?[0-9]{2,4}\s?[0-9]{2,4}',
-            ]
+            'date_patterns': pattern_sources('date'),
+            'money_patterns': pattern_sources('money'),
+            'company_patterns': pattern_sources('company'),
+            'email_patterns': pattern_sources('email'),
+            'phone_patterns': pattern_sources('phone'),
         }
         
-        # lazy-loaded NLP und Parser libraries
+        # NLP und Parser aus dem prozessweiten Register (model_registry) / do registro do processo
         self._nlp = None
         self._dateparser = None
         # máximo de páginas a processar por documento para evitar uso excessivo de memória
         self.max_pages = 500
+        # OCR für Seiten ohne Textschicht / OCR para páginas sem camada de texto
+        self.ocr_enabled = True
+        self.ocr_dpi = 300
+        self.ocr_language = 'deu'
+        self.ocr_second_language: Optional[str] = None
+        self.ocr_workers = 2
+        self.ocr_page_timeout = 60.0
+        self.ocr_start_method = 'spawn'
+        # Seiten für Kopf- und Parteidaten bei seitenweiser Analyse / Páginas para cabeçalho e partes na análise por página
+        self.analysis_head_pages = 3
 
         logger.info("PDF-Reader-Service initialisiert / PDF Reader Service initialized")
 
     def _ensure_nlp(self):
-        """Lazy-load das Spacy-Modell; safe-fallback, returns None if nicht verfügbar."""
-        if self._nlp is not None:
-            return self._nlp
-        try:
-            import spacy
-            self._nlp = spacy.load("de_core_news_sm")
-            logger.info("Deutsches Spacy-Modell geladen / Modelo Spacy alemão carregado")
-        except Exception:
-            logger.warning("Deutsches Spacy-Modell nicht gefunden / Modelo Spacy alemão não encontrado")
-            self._nlp = None
+        """Spacy-Modell aus dem prozessweiten Register; None, wenn nicht verfügbar."""
+        from app.services.model_registry import get_model_registry
+        self._nlp = get_model_registry().get("spacy_de")
         return self._nlp
 
     def _ensure_dateparser(self):
-        """Lazy-load dateparser; returns module or None."""
-        if self._dateparser is not None:
-            return self._dateparser
-        try:
-            import dateparser
-            self._dateparser = dateparser
-        except Exception:
-            logger.warning("dateparser nicht verfügbar / dateparser não disponível")
-            self._dateparser = None
+        """dateparser aus dem prozessweiten Register; None, wenn nicht verfügbar."""
+        from app.services.model_registry import get_model_registry
+        self._dateparser = get_model_registry().get("dateparser")
         return self._dateparser
     
     def extract_text_with_pdfplumber(self, pdf_path: str) -> Dict[str, Any]:
@@ -147,6 +121,10 @@ class PDFReaderService:
         """
         Kombiniert verschiedene Extraktionsmethoden für optimale Ergebnisse
         Combina diferentes métodos de extração para resultados ótimos
+
+        PyMuPDF zuerst; pdfplumber und PyPDF2 nur für Seiten, die die
+        Qualitätsprüfung nicht bestehen (siehe ``extract_text_adaptive``).
+        PyMuPDF primeiro; pdfplumber e PyPDF2 apenas para páginas reprovadas.
         
         Args / Argumentos:
             pdf_path (str): Pfad zur PDF-Datei / Caminho para o arquivo PDF
@@ -154,51 +132,18 @@ class PDFReaderService:
         Returns / Retorna:
             Dict[str, Any]: Kombiniertes Extraktionsergebnis / Resultado de extração combinado
         """
-        logger.info(f"Kombinierte Textextraktion gestartet / Extração de texto combinada iniciada: {pdf_path}")
-        
-        results = {}
-        
-        # Verschiedene Methoden ausprobieren / Tentar diferentes métodos
-        methods = [
-            ('pdfplumber', self.extract_text_with_pdfplumber),
-            ('pypdf2', self.extract_text_with_pypdf2),
-            ('pymupdf', self.extract_text_with_pymupdf)
-        ]
-        
-        for method_name, method_func in methods:
-            try:
-                result = method_func(pdf_path)
-                results[method_name] = result
-                logger.info(f"Extraktion mit {method_name}: {'Erfolgreich' if result['success'] else 'Fehlgeschlagen'}")
-            except Exception as e:
-                logger.error(f"Fehler bei {method_name}: {str(e)}")
-                results[method_name] = {
-                    'method': method_name,
-                    'success': False,
-                    'error': str(e)
-                }
-        
-        # Bestes Ergebnis auswählen / Selecionar melhor resultado
-        successful_results = [r for r in results.values() if r.get('success', False)]
-        
-        if successful_results:
-            # Ergebnis mit dem meisten Text auswählen / Selecionar resultado com mais texto
-            best_result = max(successful_results, key=lambda x: x.get('total_chars', 0))
-            best_result['all_methods'] = results
-            best_result['combined'] = True
-            
-            logger.info(f"Beste Extraktionsmethode ausgewählt / Melhor método de extração selecionado: {best_result['method']}")
-            return best_result
-        else:
-            logger.error("Alle Extraktionsmethoden fehlgeschlagen / Todos os métodos de extração falharam")
-            return {
-                'method': 'combined',
-                'success': False,
-                'error': 'Alle Extraktionsmethoden fehlgeschlagen',
-                'text': '',
-                'all_methods': results,
-                'combined': True
-            }
+        from app.services.pdf_reader_pkg import extractors
+        return extractors.extract_text_adaptive(self, pdf_path)
+
+    def extract_text_adaptive(self, pdf_path: str) -> Dict[str, Any]:
+        """Delegiert an pdf_reader_pkg.extractors.extract_text_adaptive"""
+        from app.services.pdf_reader_pkg import extractors
+        return extractors.extract_text_adaptive(self, pdf_path)
+
+    def extract_text_exhaustive(self, pdf_path: str) -> Dict[str, Any]:
+        """Delegiert an pdf_reader_pkg.extractors.extract_text_exhaustive (alle drei Bibliotheken)"""
+        from app.services.pdf_reader_pkg import extractors
+        return extractors.extract_text_exhaustive(self, pdf_path)
     
     def validate_pdf(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -228,44 +173,20 @@ class PDFReaderService:
         try:
             logger.info("Intelligente Datenextraktion gestartet / Extração inteligente de dados iniciada")
             # Debug: texto normalizado (primeiros 3000 chars)
-            norm_text = text.replace("\u00ad", "").replace("  ", " ").replace("\n\n", "\n").strip()
+            from app.services.pdf_reader_pkg.extractor_router import extract_contract_fields, normalize_text
+            norm_text = normalize_text(text)
             logger.debug(f"[DEBUG] Texto normalizado (primeiros 3000):\n{norm_text[:3000]}")
 
-            # Roteador especializado por tipo de contrato
-            from app.services.pdf_reader_pkg.extractor_router import extract_contract_fields
-            contract_fields = extract_contract_fields(norm_text)
-            logger.info(f"[DEBUG] Tipo de contrato detectado: {contract_fields.get('contract_type')}")
-            for k, v in contract_fields.items():
-                if k != 'contract_type':
-                    snippet = None
-                    if v and isinstance(v, str):
-                        idx = norm_text.find(v)
-                        if idx != -1:
-                            start = max(0, idx-100)
-                            end = min(len(norm_text), idx+len(v)+100)
-                            snippet = norm_text[start:end]
-                    logger.debug(f"[DEBUG] Campo extraído: {k} = {v}\nSnippet: {snippet}")
-
-            # Extração básica complementar (campos não cobertos)
-            extracted_data = {
-                'title': contract_fields.get('title') or self._extract_title(norm_text),
-                'client_name': contract_fields.get('partner_name') or self._extract_client_name(norm_text),
-                'client_email': self._extract_email(norm_text),
-                'client_phone': self._extract_phone(norm_text),
-                'client_address': contract_fields.get('address') or self._extract_address(norm_text),
-                'money_values': contract_fields.get('value_eur') or self._extract_money_values(norm_text),
-                'dates': self._extract_dates(norm_text),
-                'terms_and_conditions': self._extract_terms_and_conditions(norm_text),
-                'description': self._extract_description(norm_text),
-                'contract_type': contract_fields.get('contract_type'),
-                'start_date': contract_fields.get('start_date'),
-                'end_date': contract_fields.get('end_date'),
-                'payment_frequency': contract_fields.get('payment_frequency'),
-            }
+            # Ein Scan für alle Feldextraktoren / Uma varredura para todos os extratores de campos
+            from app.services.pdf_reader_pkg.patterns import PatternScan
+            scan = PatternScan(norm_text)
 
-            # Extração avançada / Erweiterte Extraktion
-            advanced_data = self.extract_advanced_context_data(norm_text)
-            extracted_data.update(advanced_data)
+            # Nur die Extraktoren des erkannten Vertragstyps / Apenas os extratores do tipo detectado
+            extracted_data = extract_contract_fields(norm_text, scan)
+            logger.info(
+                f"Vertragstyp / Tipo de contrato: {extracted_data['contract_type']}, "
+                f"Extraktoren (ms) / Extratores (ms): {extracted_data['extractor_timings']}"
+            )
 
             logger.info("Intelligente Datenextraktion erfolgreich / Extração inteligente de dados bem-sucedida")
             return extracted_data
@@ -273,37 +194,64 @@ class PDFReaderService:
             logger.error(f"Fehler bei intelligenter Datenextraktion / Erro na extração inteligente de dados: {str(e)}")
             return {}
     
-    def _extract_title(self, text: str) -> Optional[str]:
+    def extract_intelligent_data_windowed(self, pages: Iterable[str]) -> Dict[str, Any]:
+        """
+        Seitenweise Variante von ``extract_intelligent_data`` für lange Verträge
+        Variante por página de ``extract_intelligent_data`` para contratos longos
+
+        Kopf- und Parteidaten nur aus den ersten ``analysis_head_pages`` Seiten;
+        Komplexität und Schlüsselbegriffe in einem Durchlauf.
+        Dados de cabeçalho e das partes só das primeiras ``analysis_head_pages`` páginas.
+
+        Args / Argumentos:
+            pages: Seitentexte, z. B. aus ``extraction['pages']`` / Textos das páginas
+        Returns / Retorna:
+            Dict[str, Any]: Wie ``extract_intelligent_data`` / Como ``extract_intelligent_data``
+        """
+        try:
+            from app.services.pdf_reader_pkg.windowed import analyze_pages
+            extracted_data = analyze_pages(pages, self.analysis_head_pages)
+            logger.info(
+                f"Seitenweise Analyse / Análise por página: {extracted_data['analyzed_pages']} Seiten, "
+                f"Vertragstyp / Tipo de contrato: {extracted_data['contract_type']}, "
+                f"Extraktoren (ms) / Extratores (ms): {extracted_data['extractor_timings']}"
+            )
+            return extracted_data
+        except Exception as e:
+            logger.error(f"Fehler bei seitenweiser Analyse / Erro na análise por página: {str(e)}")
+            return {}
+
+    def _extract_title(self, text: str, scan=None) -> Optional[str]:
         from app.services.pdf_reader_pkg.parsers import extract_title
-        return extract_title(text)
+        return extract_title(text, scan)
     
-    def _extract_client_name(self, text: str) -> Optional[str]:
+    def _extract_client_name(self, text: str, scan=None) -> Optional[str]:
         from app.services.pdf_reader_pkg.parsers import extract_client_name
-        return extract_client_name(text)
+        return extract_client_name(text, scan)
     
-    def _extract_email(self, text: str) -> Optional[str]:
+    def _extract_email(self, text: str, scan=None) -> Optional[str]:
         from app.services.pdf_reader_pkg.parsers import extract_email
-        return extract_email(text)
+        return extract_email(text, scan)
     
-    def _extract_phone(self, text: str) -> Optional[str]:
+    def _extract_phone(self, text: str, scan=None) -> Optional[str]:
         from app.services.pdf_reader_pkg.parsers import extract_phone
-        return extract_phone(text)
+        return extract_phone(text, scan)
     
-    def _extract_address(self, text: str) -> Optional[str]:
+    def _extract_address(self, text: str, scan=None) -> Optional[str]:
         from app.services.pdf_reader_pkg.parsers import extract_address
-        return extract_address(text)
+        return extract_address(text, scan)
     
-    def _extract_money_values(self, text: str) -> Dict[str, Any]:
+    def _extract_money_values(self, text: str, scan=None) -> Dict[str, Any]:
         from app.services.pdf_reader_pkg.financials import extract_money_values
-        return extract_money_values(text)
+        return extract_money_values(text, scan)
     
-    def _extract_dates(self, text: str) -> Dict[str, Any]:
+    def _extract_dates(self, text: str, scan=None) -> Dict[str, Any]:
         from app.services.pdf_reader_pkg.dates import extract_dates
-        return extract_dates(text)
+        return extract_dates(text, scan)
     
-    def _extract_terms_and_conditions(self, text: str) -> Optional[str]:
+    def _extract_terms_and_conditions(self, text: str, scan=None) -> Optional[str]:
         from app.services.pdf_reader_pkg.parsers import extract_terms_and_conditions
-        return extract_terms_and_conditions(text)
+        return extract_terms_and_conditions(text, scan)
     
     def _extract_description(self, text: str) -> Optional[str]:
         """Delegiert an pdf_reader_pkg.parsers.extract_description (lazy import)"""
@@ -314,7 +262,7 @@ class PDFReaderService:
             logger.warning(f"Delegation der Beschreibungsextraktion fehlgeschlagen: {str(e)}")
             return None
 
-    def calculate_notice_period(self, text: str) -> Optional[Dict[str, Any]]:
+    def calculate_notice_period(self, text: str, scan=None) -> Optional[Dict[str, Any]]:
         """
         Calcula período de aviso prévio / Berechnet Kündigungsfrist
         
@@ -327,17 +275,18 @@ class PDFReaderService:
         # Delegation to refactored dates module to avoid duplicating logic here.
         try:
             from app.services.pdf_reader_pkg.dates import calculate_notice_period as _calc
-            return _calc(text)
+            return _calc(text, scan)
         except Exception as e:
             logger.warning(f"Delegation der Kündigungsfrist-Berechnung fehlgeschlagen, fallback: {str(e)}")
             return None
     
-    def extract_advanced_context_data(self, text: str) -> Dict[str, Any]:
+    def extract_advanced_context_data(self, text: str, scan=None) -> Dict[str, Any]:
         """
         Extrai dados contextuais avançados / Extrahiert erweiterte Kontextdaten
         
         Args / Argumentos:
             text (str): Texto do contrato / Vertragstext
+            scan: Vorhandener Muster-Scan des Texts (optional) / Varredura de padrões existente (opcional)
             
         Returns / Retorna:
             Dict[str, Any]: Dados contextuais / Kontextdaten
@@ -346,11 +295,11 @@ class PDFReaderService:
             logger.info("Erweiterte Kontextanalyse gestartet / Advanced context analysis started")
             
             context_data = {
-                'notice_period': self.calculate_notice_period(text),
+                'notice_period': self.calculate_notice_period(text, scan),
                 'contract_complexity': self._analyze_contract_complexity(text),
                 'key_terms': self._extract_key_terms(text),
-                'legal_entities': self._extract_legal_entities(text),
-                'financial_terms': self._extract_financial_terms(text)
+                'legal_entities': self._extract_legal_entities(text, scan),
+                'financial_terms': self._extract_financial_terms(text, scan)
             }
             logger.info("Erweiterte Kontextanalyse erfolgreich / Advanced context analysis successful")
             return context_data
@@ -376,20 +325,20 @@ class PDFReaderService:
             logger.warning(f"Delegation der Schlüsselbegriff-Extraktion fehlgeschlagen: {str(e)}")
             return []
     
-    def _extract_legal_entities(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_legal_entities(self, text: str, scan=None) -> List[Dict[str, Any]]:
         """Delegiert an pdf_reader_pkg.analysis.extract_legal_entities (lazy import)"""
         try:
             from app.services.pdf_reader_pkg.analysis import extract_legal_entities
-            return extract_legal_entities(text)
+            return extract_legal_entities(text, scan)
         except Exception as e:
             logger.warning(f"Delegation der rechtlichen Entitätsextraktion fehlgeschlagen: {str(e)}")
             return []
     
-    def _extract_financial_terms(self, text: str) -> Dict[str, Any]:
+    def _extract_financial_terms(self, text: str, scan=None) -> Dict[str, Any]:
         """Delegiert an pdf_reader_pkg.financials.extract_financial_terms (lazy import)"""
         try:
             from app.services.pdf_reader_pkg.financials import extract_financial_terms
-            return extract_financial_terms(text)
+            return extract_financial_terms(text, scan)
         except Exception as e:
             logger.warning(f"Delegation der finanziellen Begriffsextraktion fehlgeschlagen: {str(e)}")
             return {'payment_terms': [], 'penalties': [], 'discounts': [], 'taxes': []}
\ No newline at end of file
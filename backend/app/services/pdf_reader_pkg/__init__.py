@@ -13,9 +13,13 @@ from .extractors import (
     extract_text_with_pypdf2,
     extract_text_with_pymupdf,
     extract_text_combined,
+    extract_text_adaptive,
+    extract_text_exhaustive,
+    assess_page_quality,
 )
-from .ocr import ocr_with_pytesseract
+from .ocr import ocr_with_pytesseract, pages_without_text_layer, apply_page_ocr
 from .validate import validate_pdf
+from .patterns import PatternScan, scan_text
 from .parsers import (
     extract_title,
     extract_client_name,
@@ -24,14 +28,16 @@ from .parsers import (
     extract_address,
     extract_description,
 )
-from .financials import extract_money_values, extract_financial_terms
-from .dates import extract_dates, calculate_notice_period
+from .financials import extract_money_values, extract_financial_terms, extract_payment_frequency
+from .dates import extract_dates, calculate_notice_period, parse_german_date
 from .analysis import (
     analyze_contract_complexity,
     extract_key_terms,
     extract_legal_entities,
     extract_advanced_context_data,
 )
+from .extractor_router import classify_contract_type, extract_contract_fields
+from .windowed import analyze_pages
 
 __all__ = [
     "PDFReaderService",
@@ -40,8 +46,15 @@ __all__ = [
     "extract_text_with_pypdf2",
     "extract_text_with_pymupdf",
     "extract_text_combined",
+    "extract_text_adaptive",
+    "extract_text_exhaustive",
+    "assess_page_quality",
     "ocr_with_pytesseract",
+    "pages_without_text_layer",
+    "apply_page_ocr",
     "validate_pdf",
+    "PatternScan",
+    "scan_text",
     "extract_title",
     "extract_client_name",
     "extract_email",
@@ -50,10 +63,15 @@ __all__ = [
     "extract_description",
     "extract_money_values",
     "extract_financial_terms",
+    "extract_payment_frequency",
     "extract_dates",
     "calculate_notice_period",
+    "parse_german_date",
     "analyze_contract_complexity",
     "extract_key_terms",
     "extract_legal_entities",
     "extract_advanced_context_data",
+    "classify_contract_type",
+    "extract_contract_fields",
+    "analyze_pages",
 ]
@@ -2,14 +2,21 @@
 
 Implementations migrated from PDFReaderService to avoid delegation.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
-import re
 from .dates import calculate_notice_period
 from .financials import extract_financial_terms
+from .patterns import PatternScan, ensure_scan
 
 logger = logging.getLogger(__name__)
 
+LEGAL_TERMS = (
+    'kündigung', 'kündigungsfrist', 'verlängerung', 'automatische verlängerung',
+    'vertragsende', 'vertragsbeginn', 'leistung', 'vergütung', 'zahlung',
+    'haftung', 'haftungsausschluss', 'gewährleistung', 'garantie',
+    'streitbeilegung', 'schiedsgericht', 'gerichtsstand', 'anwendbares recht'
+)
+
 
 def analyze_contract_complexity(text: str) -> Dict[str, Any]:
     try:
@@ -36,15 +43,9 @@ def analyze_contract_complexity(text: str) -> Dict[str, Any]:
 
 def extract_key_terms(text: str) -> List[Dict[str, Any]]:
     try:
-        legal_terms = [
-            'kündigung', 'kündigungsfrist', 'verlängerung', 'automatische verlängerung',
-            'vertragsende', 'vertragsbeginn', 'leistung', 'vergütung', 'zahlung',
-            'haftung', 'haftungsausschluss', 'gewährleistung', 'garantie',
-            'streitbeilegung', 'schiedsgericht', 'gerichtsstand', 'anwendbares recht'
-        ]
         text_lower = text.lower()
         found_terms = []
-        for term in legal_terms:
+        for term in LEGAL_TERMS:
             if term in text_lower:
                 start_pos = text_lower.find(term)
                 context_start = max(0, start_pos - 30)
@@ -57,35 +58,26 @@ def extract_key_terms(text: str) -> List[Dict[str, Any]]:
         return []
 
 
-def extract_legal_entities(text: str) -> List[Dict[str, Any]]:
+def extract_legal_entities(text: str, scan: Optional[PatternScan] = None) -> List[Dict[str, Any]]:
     try:
-        entity_patterns = [
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:GmbH|GmbH & Co\\. KG)\b',
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:AG|Aktiengesellschaft)\b',
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:KG|Kommanditgesellschaft)\b',
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:OHG|Offene Handelsgesellschaft)\b',
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:UG|Unternehmergesellschaft)\b',
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:e.V|eingetragener Verein)\b',
-            r'\b([A-ZÄÖÜ][a-zäöüß\s]+)\s+(?:&Co|Kommanditgesellschaft)\b',
-        ]
         entities = []
-        for pattern in entity_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append({'name': match.group(1).strip(), 'full_text': match.group(0), 'type': 'legal_entity', 'confidence': 0.9})
+        for match in ensure_scan(text, scan).all('legal_entity'):
+            entities.append({'name': match.group(1).strip(), 'full_text': match.text, 'type': 'legal_entity', 'confidence': 0.9})
         return entities
     except Exception as e:
         logger.error(f"Error in extract_legal_entities: {e}")
         return []
 
 
-def extract_advanced_context_data(text: str) -> Dict[str, Any]:
+def extract_advanced_context_data(text: str, scan: Optional[PatternScan] = None) -> Dict[str, Any]:
     try:
+        scan = ensure_scan(text, scan)
         context_data = {
-            'notice_period': calculate_notice_period(text),
+            'notice_period': calculate_notice_period(text, scan),
             'contract_complexity': analyze_contract_complexity(text),
             'key_terms': extract_key_terms(text),
-            'legal_entities': extract_legal_entities(text),
-            'financial_terms': extract_financial_terms(text)
+            'legal_entities': extract_legal_entities(text, scan),
+            'financial_terms': extract_financial_terms(text, scan)
         }
         return context_data
     except Exception as e:
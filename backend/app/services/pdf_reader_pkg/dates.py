@@ -1,40 +1,98 @@
 """Date extraction and notice period utilities (migrated implementations)."""
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
-import re
 import logging
+import re
+
+from .patterns import PatternScan, ensure_scan, pattern_sources
 
 logger = logging.getLogger(__name__)
 
-DATE_PATTERNS = [
-    r'\b\d{1,2}\.\d{1,2}\.\d{4}\b',
-    r'\b\d{1,2}\/\d{1,2}\/\d{4}\b',
-    r'\b\d{1,2}-\d{1,2}-\d{4}\b',
-    r'\b\d{1,2}\.\s*\d{1,2}\.\s*\d{4}\b',
-]
+# Quelltexte aus dem Muster-Register / Código-fonte do registro de padrões
+DATE_PATTERNS = pattern_sources('date')
+
+# Schnellpfad für die Formate aus DATE_PATTERNS / Caminho rápido para os formatos de DATE_PATTERNS
+_NUMERIC_DATE = re.compile(r'(\d{1,2})\s*([./-])\s*(\d{1,2})\s*\2\s*(\d{4})')
+_MONTH_NAME_DATE = re.compile(r'(\d{1,2})\.?\s*([^\W\d_]+)\.?\s+(\d{4})')
+
+GERMAN_MONTHS = {
+    'januar': 1, 'jänner': 1, 'jan': 1,
+    'februar': 2, 'feb': 2,
+    'märz': 3, 'maerz': 3, 'mär': 3, 'mrz': 3,
+    'april': 4, 'apr': 4,
+    'mai': 5,
+    'juni': 6, 'jun': 6,
+    'juli': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sept': 9, 'sep': 9,
+    'oktober': 10, 'okt': 10,
+    'november': 11, 'nov': 11,
+    'dezember': 12, 'dez': 12,
+}
+
+
+def _build_date(year: str, month: int, day: str) -> Optional[datetime]:
+    try:
+        return datetime(int(year), month, int(day))
+    except ValueError:
+        return None  # z. B. 31.02. / p. ex. 31.02.
+
+
+@lru_cache(maxsize=4096)
+def _parse_with_dateparser(value: str, today: str) -> Optional[datetime]:
+    """
+    Langsamer Fallback für freie Formulierungen, memoisiert je Kalendertag
+    (relative Angaben wie "morgen" hängen vom Datum ab).
+    Fallback lento para textos livres, memoizado por dia do calendário.
+    """
+    try:
+        from app.services.model_registry import get_model_registry
+        dateparser = get_model_registry().get('dateparser')
+        return dateparser.parse(value, languages=['de']) if dateparser else None
+    except Exception:
+        return None
+
+
+def parse_german_date(raw: str) -> Optional[datetime]:
+    """
+    Parst ein deutsches Datum; numerische Formate (TT.MM.JJJJ, TT/MM/JJJJ,
+    TT-MM-JJJJ) und Monatsnamen ("1. Januar 2025") ohne ``dateparser``.
+    Analisa uma data alemã; formatos numéricos e nomes de meses sem ``dateparser``.
+
+    Returns:
+        datetime oder None (ungültiges Datum) / datetime ou None (data inválida)
+    """
+    value = raw.strip()
+    match = _NUMERIC_DATE.fullmatch(value)
+    if match:
+        return _build_date(match.group(4), int(match.group(3)), match.group(1))
+    match = _MONTH_NAME_DATE.fullmatch(value)
+    if match and match.group(2).lower() in GERMAN_MONTHS:
+        return _build_date(match.group(3), GERMAN_MONTHS[match.group(2).lower()], match.group(1))
+    return _parse_with_dateparser(value, date.today().isoformat())
 
 
-def extract_dates(text: str) -> Dict[str, Any]:
+def extract_dates(text: str, scan: Optional[PatternScan] = None) -> Dict[str, Any]:
     """Extrai datas do texto e tenta classificá-las (start/end/renewal)."""
     try:
         dates: List[Dict[str, Any]] = []
-        for pattern in DATE_PATTERNS:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                try:
-                    import dateparser
-                    parsed_date = dateparser.parse(match, languages=['de'])
-                except Exception:
-                    parsed_date = None
-                if parsed_date:
-                    dates.append({'raw': match, 'parsed': parsed_date, 'confidence': 0.8})
+        for found in ensure_scan(text, scan).all('date'):
+            match = found.text
+            parsed_date = parse_german_date(match)
+            if parsed_date:
+                dates.append({'raw': match, 'parsed': parsed_date, 'confidence': 0.8})
 
         start_date = None
         end_date = None
         renewal_date = None
+        positions: Dict[str, int] = {}
         for date_info in dates:
             date_str = date_info['raw']
-            context_start = max(0, text.find(date_str) - 50)
-            context_end = min(len(text), text.find(date_str) + 50)
+            if date_str not in positions:
+                positions[date_str] = text.find(date_str)
+            context_start = max(0, positions[date_str] - 50)
+            context_end = min(len(text), positions[date_str] + 50)
             context = text[context_start:context_end].lower()
             if any(keyword in context for keyword in ['start', 'beginn', 'anfang', 'von']):
                 start_date = date_str
@@ -49,34 +107,26 @@ def extract_dates(text: str) -> Dict[str, Any]:
         return {'start_date': None, 'end_date': None, 'renewal_date': None}
 
 
-def calculate_notice_period(text: str) -> Optional[Dict[str, Any]]:
+def calculate_notice_period(text: str, scan: Optional[PatternScan] = None) -> Optional[Dict[str, Any]]:
     """Detecta cláusulas de Kündigungsfrist/notice period e retorna o período mais relevante."""
     try:
         logger.info("Notice period calculation started")
-        notice_patterns = [
-            r'kündigungsfrist\s*:?\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)',
-            r'kündigung\s+(?:mit|nach)\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)',
-            r'kündigbar\s+(?:mit|nach)\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)',
-            r'beendigung\s+(?:mit|nach)\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)',
-            r'(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)\s*kündigungsfrist',
-            r'(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)\s*(?:vor|vorher)',
-        ]
-        text_lower = text.lower()
+        # Muster sind case-insensitive, der Treffertext wird klein geschrieben
+        # Os padrões ignoram maiúsculas; o texto da ocorrência fica em minúsculas
         notice_periods: List[Dict[str, Any]] = []
-        for pattern in notice_patterns:
-            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
-                period_value = int(match.group(1))
-                period_text = match.group(0)
-                if any(unit in period_text for unit in ['jahre', 'jahren']):
-                    unit = 'years'
-                    days = period_value * 365
-                elif any(unit in period_text for unit in ['monate', 'monaten']):
-                    unit = 'months'
-                    days = period_value * 30
-                else:
-                    unit = 'days'
-                    days = period_value
-                notice_periods.append({'value': period_value, 'unit': unit, 'days': days, 'text': period_text, 'confidence': 0.9})
+        for match in ensure_scan(text, scan).all('notice'):
+            period_value = int(match.group(1))
+            period_text = match.text.lower()
+            if any(unit in period_text for unit in ['jahre', 'jahren']):
+                unit = 'years'
+                days = period_value * 365
+            elif any(unit in period_text for unit in ['monate', 'monaten']):
+                unit = 'months'
+                days = period_value * 30
+            else:
+                unit = 'days'
+                days = period_value
+            notice_periods.append({'value': period_value, 'unit': unit, 'days': days, 'text': period_text, 'confidence': 0.9})
 
         if notice_periods:
             best_period = max(notice_periods, key=lambda x: int(x['days']))
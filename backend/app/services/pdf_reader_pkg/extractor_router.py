@@ -0,0 +1,160 @@
+"""Router für die Feldextraktion nach Vertragstyp / Roteador da extração de campos por tipo de contrato
+
+DE: Der Vertragstyp wird aus einer Schlüsselwortzählung über den Anfang des
+    Dokuments bestimmt (erste Seiten). Die Felder des Import-Entwurfs werden
+    immer extrahiert; von den aufwendigen Analysen (Finanzbedingungen,
+    Rechtsträger, Schlüsselbegriffe, Komplexität) laufen nur die, die dieser
+    Typ braucht. Jeder Extraktor meldet seine Laufzeit (``extractor_timings``,
+    Millisekunden).
+PT: O tipo de contrato é determinado por uma contagem de palavras-chave no
+    início do documento (primeiras páginas). Os campos do rascunho de
+    importação são sempre extraídos; das análises custosas rodam apenas as
+    de que esse tipo precisa. Cada extrator informa seu tempo de execução
+    (``extractor_timings``, milissegundos).
+"""
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .analysis import analyze_contract_complexity, extract_key_terms, extract_legal_entities
+from .dates import calculate_notice_period, extract_dates
+from .financials import extract_financial_terms, extract_money_values, extract_payment_frequency
+from .parsers import (
+    extract_address,
+    extract_client_name,
+    extract_description,
+    extract_email,
+    extract_phone,
+    extract_terms_and_conditions,
+    extract_title,
+)
+from .patterns import PatternScan, ensure_scan
+
+logger = logging.getLogger(__name__)
+
+# Zeichen vom Dokumentanfang für die Klassifikation (~ zwei Seiten)
+# Caracteres do início do documento para a classificação (~ duas páginas)
+CLASSIFY_HEAD_CHARS = 6000
+
+# Werte entsprechen app.models.contract.ContractType / Valores correspondem a ContractType
+OTHER = 'OTHER'
+TYPE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'RENTAL': ('miet', 'vermiet', 'wohnraum', 'nebenkosten', 'kaution'),
+    'LEASE': ('pacht', 'leasing'),
+    'SERVICE': ('dienstleist', 'dienstvertrag', 'werkvertrag', 'wartung', 'service', 'support', 'beratung'),
+    'EMPLOYMENT': ('arbeitsvertrag', 'arbeitnehmer', 'arbeitgeber', 'gehalt', 'urlaubsanspruch'),
+    'PRODUCT': ('kaufvertrag', 'kaufpreis', 'käufer', 'verkäufer', 'lieferung'),
+    'PARTNERSHIP': ('kooperation', 'partnerschaft', 'gesellschafter'),
+}
+_KEYWORD_REGEX = re.compile('|'.join(
+    f'(?P<{contract_type}>{"|".join(map(re.escape, keywords))})' for contract_type, keywords in TYPE_KEYWORDS.items()
+))
+
+Extractor = Callable[[str, PatternScan], Any]
+
+
+def _text_only(func: Callable[[str], Any]) -> Extractor:
+    return lambda text, scan: func(text)
+
+
+# Ergebnisschlüssel -> Extraktor / Chave do resultado -> extrator
+FIELD_EXTRACTORS: Dict[str, Extractor] = {
+    'title': extract_title,
+    'client_name': extract_client_name,
+    'client_email': extract_email,
+    'client_phone': extract_phone,
+    'client_address': extract_address,
+    'money_values': extract_money_values,
+    'dates': extract_dates,
+    'payment_frequency': extract_payment_frequency,
+    'notice_period': calculate_notice_period,
+    'terms_and_conditions': extract_terms_and_conditions,
+    'description': _text_only(extract_description),
+    'financial_terms': extract_financial_terms,
+    'legal_entities': extract_legal_entities,
+    'key_terms': _text_only(extract_key_terms),
+    'contract_complexity': _text_only(analyze_contract_complexity),
+}
+
+# Felder des Import-Entwurfs (build_extracted_draft) und günstige Extraktoren: für jeden Typ
+# Campos do rascunho de importação e extratores baratos: para todos os tipos
+_BASE_FIELDS = (
+    'title', 'client_name', 'client_email', 'client_phone', 'client_address', 'money_values', 'dates',
+    'payment_frequency', 'notice_period', 'terms_and_conditions', 'description',
+)
+
+# Nur die aufwendigen Analysen hängen vom Typ ab; unbekannte Typen nutzen alle
+# Só as análises custosas dependem do tipo; tipos desconhecidos usam todas
+TYPE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'RENTAL': _BASE_FIELDS + ('financial_terms',),
+    'LEASE': _BASE_FIELDS + ('financial_terms',),
+    'SERVICE': _BASE_FIELDS + ('financial_terms',),
+    'EMPLOYMENT': _BASE_FIELDS,
+    'PRODUCT': _BASE_FIELDS + ('financial_terms',),
+    'PARTNERSHIP': _BASE_FIELDS + ('legal_entities',),
+    OTHER: tuple(FIELD_EXTRACTORS),
+}
+
+
+def normalize_text(text: str) -> str:
+    """Entfernt weiche Trennstriche und doppelte Leerzeichen/-zeilen / Remove hífens suaves e espaços/linhas duplicados"""
+    return text.replace("\u00ad", "").replace("  ", " ").replace("\n\n", "\n").strip()
+
+
+def classify_contract_type(text: str, head_chars: int = CLASSIFY_HEAD_CHARS) -> str:
+    """
+    Bestimmt den Vertragstyp aus den Schlüsselwörtern am Dokumentanfang.
+    Determina o tipo de contrato pelas palavras-chave no início do documento.
+
+    Returns:
+        Wert von ``ContractType`` (``OTHER`` ohne Treffer) / Valor de ``ContractType``
+    """
+    counts: Dict[str, int] = {}
+    for match in _KEYWORD_REGEX.finditer(text[:head_chars].lower()):
+        counts[match.lastgroup] = counts.get(match.lastgroup, 0) + 1
+    if not counts:
+        return OTHER
+    # Bei Gleichstand gewinnt die Reihenfolge in TYPE_KEYWORDS / Em empate vence a ordem de TYPE_KEYWORDS
+    return max(TYPE_KEYWORDS, key=lambda contract_type: counts.get(contract_type, 0))
+
+
+def extract_contract_fields(
+    text: str, scan: Optional[PatternScan] = None, contract_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Klassifiziert den Vertrag und führt nur die Extraktoren seines Typs aus.
+    Classifica o contrato e executa apenas os extratores do seu tipo.
+
+    Args:
+        text: Normalisierter Vertragstext / Texto do contrato normalizado
+        scan: Gemeinsamer Muster-Scan des Texts / Varredura de padrões compartilhada
+        contract_type: Vorgegebener Typ statt Klassifikation / Tipo predefinido em vez da classificação
+
+    Returns:
+        Dict mit den Feldern des Typs sowie ``contract_type``, ``start_date``,
+        ``end_date`` und ``extractor_timings`` (ms je Extraktor)
+    """
+    scan = ensure_scan(text, scan)
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    contract_type = contract_type or classify_contract_type(text)
+    timings['classify'] = round((time.perf_counter() - started) * 1000, 3)
+
+    fields: Dict[str, Any] = {'contract_type': contract_type}
+    for name in TYPE_FIELDS.get(contract_type, TYPE_FIELDS[OTHER]):
+        started = time.perf_counter()
+        try:
+            fields[name] = FIELD_EXTRACTORS[name](text, scan)
+        except Exception as e:
+            logger.warning(f"Extraktor {name} fehlgeschlagen / Extrator {name} falhou: {e}")
+            fields[name] = None
+        timings[name] = round((time.perf_counter() - started) * 1000, 3)
+
+    dates = fields.get('dates') or {}
+    fields['start_date'] = dates.get('start_date')
+    fields['end_date'] = dates.get('end_date')
+    fields['extractor_timings'] = timings
+    logger.debug(f"Extraktoren für {contract_type} / Extratores para {contract_type}: {timings}")
+    return fields
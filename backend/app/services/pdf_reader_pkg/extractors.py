@@ -3,9 +3,10 @@
 Funções delegam para `app.services.pdf_reader` para preservar comportamento
 existente enquanto permitimos refatoração incremental.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import os
 import io
+import re
 
 import logging
 
@@ -221,7 +222,205 @@ def ocr_with_pytesseract(reader, image_path: str, language: str = 'deu') -> Dict
         }
 
 
+# ---------- Adaptive Kaskade / Cascata adaptativa ----------
+
+# Schwellwerte je Seite / Limites por página
+MIN_CHARS_PER_PAGE = 40          # sichtbare Zeichen / caracteres visíveis
+MIN_TEXT_COVERAGE = 0.01         # Anteil der Seitenfläche mit Textblöcken / fração da página com blocos de texto
+MAX_GARBAGE_RATIO = 0.05         # Anteil unlesbarer Glyphen / fração de glifos ilegíveis
+
+_CID_PATTERN = re.compile(r"\(cid:\d+\)")
+
+
+def _is_garbage_glyph(char: str) -> bool:
+    code = ord(char)
+    return (
+        char == "\ufffd"
+        or 0xE000 <= code <= 0xF8FF          # Private Use Area (fehlende ToUnicode-Map)
+        or (code < 32 and char not in "\n\r\t")
+    )
+
+
+def assess_page_quality(text: str, coverage: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Bewertet den Text einer Seite (Zeichenzahl, Textabdeckung, unlesbare Glyphen).
+    Avalia o texto de uma página (caracteres, cobertura de texto, glifos ilegíveis).
+
+    Args:
+        text: Extrahierter Seitentext / Texto extraído da página
+        coverage: Anteil der Seitenfläche mit Text (None = unbekannt)
+
+    Returns:
+        Dict mit ``chars``, ``coverage``, ``garbage_ratio`` und ``ok``
+    """
+    text = text or ""
+    cid_chars = sum(len(m) for m in _CID_PATTERN.findall(text))
+    visible = [c for c in text if not c.isspace()]
+    garbage = cid_chars + sum(1 for c in visible if _is_garbage_glyph(c))
+    chars = len(visible)
+    garbage_ratio = garbage / chars if chars else 1.0
+    ok = (
+        chars - cid_chars >= MIN_CHARS_PER_PAGE
+        and garbage_ratio <= MAX_GARBAGE_RATIO
+        and (coverage is None or coverage >= MIN_TEXT_COVERAGE)
+    )
+    return {
+        "chars": chars,
+        "coverage": round(coverage, 4) if coverage is not None else None,
+        "garbage_ratio": round(garbage_ratio, 4),
+        "ok": ok,
+    }
+
+
+def _quality_rank(quality: Dict[str, Any]):
+    return (quality["ok"], -quality["garbage_ratio"], quality["chars"])
+
+
+def _pymupdf_pages(reader, pdf_path: str):
+    """Alle Seiten mit PyMuPDF inkl. Textabdeckung / Todas as páginas com PyMuPDF e cobertura"""
+    import fitz
+
+    pages: Dict[int, Any] = {}
+    with fitz.open(pdf_path) as doc:
+        md = dict(doc.metadata or {})
+        metadata = {
+            'pages': doc.page_count,
+            'title': md.get('title', '') or '',
+            'author': md.get('author', '') or '',
+            'creator': md.get('creator', '') or '',
+            'producer': md.get('producer', '') or '',
+            'creation_date': md.get('creationDate', '') or '',
+            'modification_date': md.get('modDate', '') or '',
+        }
+        for index in range(min(doc.page_count, reader.max_pages)):
+            page = doc[index]
+            blocks = page.get_text("blocks")
+            page_area = abs(page.rect) or 1.0
+            # Nur Textblöcke (Typ 0) / Apenas blocos de texto (tipo 0)
+            text_area = sum((b[2] - b[0]) * (b[3] - b[1]) for b in blocks if b[6] == 0)
+            text = "".join(b[4] for b in blocks if b[6] == 0)
+            pages[index + 1] = (text, min(1.0, text_area / page_area))
+    return pages, metadata
+
+
+def _pdfplumber_pages(reader, pdf_path: str, page_numbers: Optional[List[int]]):
+    import pdfplumber
+
+    pages: Dict[int, Any] = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        numbers = page_numbers or range(1, min(len(pdf.pages), reader.max_pages) + 1)
+        for number in numbers:
+            pages[number] = (pdf.pages[number - 1].extract_text() or "", None)
+    return pages
+
+
+def _pypdf2_pages(reader, pdf_path: str, page_numbers: Optional[List[int]]):
+    import PyPDF2
+
+    pages: Dict[int, Any] = {}
+    with open(pdf_path, 'rb') as file:
+        pdf = PyPDF2.PdfReader(file)
+        numbers = page_numbers or range(1, min(len(pdf.pages), reader.max_pages) + 1)
+        for number in numbers:
+            pages[number] = (pdf.pages[number - 1].extract_text() or "", None)
+    return pages
+
+
+def extract_text_adaptive(reader, pdf_path: str) -> Dict[str, Any]:
+    """
+    Adaptive Kaskade: PyMuPDF für alle Seiten, langsamere Bibliotheken nur für
+    Seiten, die die Qualitätsprüfung nicht bestehen.
+    Cascata adaptativa: PyMuPDF para todas as páginas, bibliotecas mais lentas
+    apenas para as páginas que não passam na verificação de qualidade.
+
+    Returns:
+        Wie die Einzelmethoden; zusätzlich ``backend``/``quality`` je Seite,
+        ``page_backends`` (Seite -> Bibliothek), ``fallback_pages`` (Anzahl
+        erneut extrahierter Seiten) und ``low_quality_pages``
+    """
+    logger.info(f"Adaptive Textextraktion gestartet / Extração de texto adaptativa iniciada: {pdf_path}")
+    if not os.path.exists(pdf_path):
+        return {'method': 'adaptive', 'success': False, 'error': f"PDF file not found: {pdf_path}",
+                'text': '', 'pages': [], 'metadata': {}, 'combined': True}
+    if os.path.getsize(pdf_path) > 50 * 1024 * 1024:
+        return {'method': 'adaptive', 'success': False, 'error': f"PDF file too large (>50MB): {pdf_path}",
+                'text': '', 'pages': [], 'metadata': {}, 'combined': True}
+
+    # Seite -> (Backend, Text, Qualität) / Página -> (backend, texto, qualidade)
+    best: Dict[int, Any] = {}
+    metadata: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    pending: Optional[List[int]] = None  # None = alle Seiten / todas as páginas
+    retried: Optional[List[int]] = None  # von PyMuPDF nicht bestanden / reprovadas no PyMuPDF
+
+    cascade = [
+        ('pymupdf', lambda numbers: _pymupdf_pages(reader, pdf_path)),
+        ('pdfplumber', lambda numbers: _pdfplumber_pages(reader, pdf_path, numbers)),
+        ('pypdf2', lambda numbers: _pypdf2_pages(reader, pdf_path, numbers)),
+    ]
+    for backend, run in cascade:
+        try:
+            pages = run(pending)
+            if backend == 'pymupdf':
+                pages, metadata = pages
+        except Exception as e:
+            logger.warning(f"Adaptive Extraktion: {backend} fehlgeschlagen / falhou: {e}")
+            errors[backend] = str(e)
+            continue
+        for number, (text, coverage) in pages.items():
+            quality = assess_page_quality(text, coverage)
+            if number not in best or _quality_rank(quality) > _quality_rank(best[number][2]):
+                best[number] = (backend, text, quality)
+        pending = sorted(n for n, (_, _, quality) in best.items() if not quality["ok"])
+        if retried is None and backend == 'pymupdf':
+            retried = list(pending)
+        if not pending:
+            break
+
+    if not best:
+        logger.error("Alle Extraktionsmethoden fehlgeschlagen / Todos os métodos de extração falharam")
+        return {'method': 'adaptive', 'success': False, 'error': 'Alle Extraktionsmethoden fehlgeschlagen',
+                'text': '', 'pages': [], 'metadata': metadata, 'errors': errors, 'combined': True}
+
+    text_content: List[Dict[str, Any]] = []
+    for number in sorted(best):
+        backend, text, quality = best[number]
+        if text:
+            text_content.append({'page': number, 'text': text, 'char_count': len(text),
+                                 'backend': backend, 'quality': quality})
+    page_backends = {number: best[number][0] for number in sorted(best)}
+    result = {
+        'method': 'adaptive',
+        'success': True,
+        'text': '\n'.join(page['text'] for page in text_content),
+        'pages': text_content,
+        'metadata': metadata,
+        'total_chars': sum(page['char_count'] for page in text_content),
+        'page_backends': page_backends,
+        # Seiten, für die langsamere Bibliotheken liefen / páginas reprocessadas por bibliotecas mais lentas
+        'fallback_pages': len(retried) if retried is not None else len(page_backends),
+        'low_quality_pages': pending or [],
+        'combined': True,
+    }
+    if errors:
+        result['errors'] = errors
+    logger.info(
+        f"Adaptive Textextraktion erfolgreich / Extração adaptativa bem-sucedida: {result['total_chars']} Zeichen, "
+        f"{result['fallback_pages']} Fallback-Seiten"
+    )
+    return result
+
+
 def extract_text_combined(reader, pdf_path: str) -> Dict[str, Any]:
+    """Kombinierte Extraktion = adaptive Kaskade / Extração combinada = cascata adaptativa"""
+    return extract_text_adaptive(reader, pdf_path)
+
+
+def extract_text_exhaustive(reader, pdf_path: str) -> Dict[str, Any]:
+    """
+    Führt alle drei Bibliotheken vollständig aus und behält das längste Ergebnis.
+    Executa as três bibliotecas por completo e mantém o resultado mais longo.
+    """
     logger.info(f"Kombinierte Textextraktion gestartet / Extração de texto combinada iniciada: {pdf_path}")
     results = {}
     methods = [
@@ -1,8 +1,24 @@
 """OCR wrapper module
 
 Delegates to original PDF reader implementation when available.
+
+Seitenweises OCR / OCR por página:
+DE: Nur Seiten ohne Textschicht werden mit PyMuPDF gerastert und mit
+    Tesseract erkannt, verteilt auf einen Prozesspool. Die Ergebnisse werden
+    seitenweise (mit Konfidenz) in das Extraktionsergebnis übernommen; Seiten
+    mit vorhandenem Text werden nie per OCR verarbeitet.
+PT: Apenas páginas sem camada de texto são rasterizadas com PyMuPDF e
+    reconhecidas com Tesseract, distribuídas num pool de processos. Os
+    resultados são mesclados página a página (com confiança); páginas que já
+    têm texto nunca passam por OCR.
 """
-from typing import Dict, Any
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
 
 
 def ocr_with_pytesseract(image_path: str, language: str = 'deu') -> Dict[str, Any]:
@@ -11,3 +27,207 @@ def ocr_with_pytesseract(image_path: str, language: str = 'deu') -> Dict[str, An
         return _PDFReaderService().ocr_with_pytesseract(image_path, language=language)
     except Exception:
         raise NotImplementedError("pytesseract wrapper not available")
+
+
+# ---------- Seitenweises OCR / OCR por página ----------
+
+def ocr_language(primary: str = 'deu', secondary: Optional[str] = None) -> str:
+    """Tesseract-Sprachangabe, z. B. ``deu+eng`` / Idiomas do Tesseract, p. ex. ``deu+eng``"""
+    languages = [primary or 'deu']
+    if secondary and secondary not in languages:
+        languages.append(secondary)
+    return '+'.join(languages)
+
+
+@lru_cache()
+def tesseract_available() -> bool:
+    """pytesseract und das Tesseract-Programm vorhanden? / pytesseract e o Tesseract disponíveis?"""
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def pages_without_text_layer(pdf_path: str, max_pages: int = 500) -> List[int]:
+    """
+    Seiten (1-basiert), deren Textschicht keine sichtbaren Zeichen enthält.
+    Páginas (base 1) cuja camada de texto não contém caracteres visíveis.
+    """
+    import fitz
+
+    with fitz.open(pdf_path) as doc:
+        return [
+            index + 1
+            for index in range(min(doc.page_count, max_pages))
+            if not doc[index].get_text().strip()
+        ]
+
+
+def rasterize_page(pdf_path: str, page_number: int, dpi: int = 300) -> bytes:
+    """Rendert eine Seite als Graustufen-PNG / Renderiza uma página como PNG em tons de cinza"""
+    import fitz
+
+    with fitz.open(pdf_path) as doc:
+        pixmap = doc[page_number - 1].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+        return pixmap.tobytes("png")
+
+
+def text_from_ocr_data(data: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """
+    Baut Text und mittlere Wortkonfidenz aus ``image_to_data`` zusammen.
+    Monta o texto e a confiança média das palavras a partir de ``image_to_data``.
+
+    Ein Tesseract-Lauf je Seite genügt so für Text und Konfidenz.
+    Assim basta uma execução do Tesseract por página para texto e confiança.
+    """
+    lines: Dict[Any, List[str]] = {}
+    confidences: List[float] = []
+    for index, word in enumerate(data.get('text', [])):
+        word = (word or '').strip()
+        if not word:
+            continue
+        key = (data['block_num'][index], data['par_num'][index], data['line_num'][index])
+        lines.setdefault(key, []).append(word)
+        try:
+            confidence = float(data['conf'][index])
+        except (TypeError, ValueError):
+            continue
+        if confidence >= 0:
+            confidences.append(confidence)
+
+    parts: List[str] = []
+    previous_block = None
+    for (block, _, _), words in lines.items():
+        if previous_block is not None and block != previous_block:
+            parts.append('')  # Leerzeile zwischen Blöcken / linha vazia entre blocos
+        parts.append(' '.join(words))
+        previous_block = block
+    return {
+        'text': '\n'.join(parts),
+        'confidence': round(sum(confidences) / len(confidences), 1) if confidences else 0.0,
+    }
+
+
+def ocr_page(pdf_path: str, page_number: int, dpi: int = 300, language: str = 'deu',
+             timeout: float = 0) -> Dict[str, Any]:
+    """
+    Rastert und erkennt eine Seite (läuft im OCR-Prozess).
+    Rasteriza e reconhece uma página (executa no processo de OCR).
+    """
+    try:
+        import io
+        from PIL import Image
+        import pytesseract
+
+        image = Image.open(io.BytesIO(rasterize_page(pdf_path, page_number, dpi)))
+        data = pytesseract.image_to_data(
+            image, lang=language, output_type=pytesseract.Output.DICT, timeout=timeout or 0
+        )
+        result = text_from_ocr_data(data)
+        return {'page': page_number, 'success': True, 'language': language, **result}
+    except Exception as e:
+        return {'page': page_number, 'success': False, 'error': str(e), 'text': '', 'confidence': 0.0,
+                'language': language}
+
+
+def ocr_pages(pdf_path: str, page_numbers: List[int], dpi: int = 300, language: str = 'deu',
+              workers: int = 2, timeout: float = 0, start_method: str = 'spawn') -> Dict[int, Dict[str, Any]]:
+    """
+    OCR für die angegebenen Seiten, bei mehreren Seiten parallel im Prozesspool.
+    OCR das páginas indicadas, com várias páginas em paralelo no pool de processos.
+
+    Returns:
+        Dict Seite -> Ergebnis von :func:`ocr_page`
+    """
+    workers = min(workers, len(page_numbers))
+    if workers <= 1:
+        return {number: ocr_page(pdf_path, number, dpi, language, timeout) for number in page_numbers}
+
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+    try:
+        futures = {
+            number: executor.submit(ocr_page, pdf_path, number, dpi, language, timeout)
+            for number in page_numbers
+        }
+        results: Dict[int, Dict[str, Any]] = {}
+        for number, future in futures.items():
+            try:
+                results[number] = future.result()
+            except Exception as e:
+                # z. B. abgestürzter OCR-Prozess / p. ex. processo de OCR que falhou
+                results[number] = {'page': number, 'success': False, 'error': str(e), 'text': '',
+                                   'confidence': 0.0, 'language': language}
+        return results
+    finally:
+        # Bei Zeitlimit des Extraktions-Workers nicht auf offene Seiten warten
+        # No tempo limite do worker de extração, não esperar pelas páginas pendentes
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def apply_page_ocr(reader, pdf_path: str, extraction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ergänzt ein Extraktionsergebnis um OCR-Text für Seiten ohne Textschicht.
+    Complementa um resultado de extração com OCR para páginas sem camada de texto.
+
+    Seiten, die bereits Text enthalten (Textschicht oder Extraktion), bleiben
+    unverändert. OCR-Seiten erhalten ``backend='ocr'`` und ``ocr_confidence``;
+    das Ergebnis zusätzlich ``ocr_pages`` und ``ocr_confidence`` (Mittelwert).
+    Páginas que já contêm texto permanecem inalteradas.
+    """
+    if not getattr(reader, 'ocr_enabled', False) or not extraction or not extraction.get('success'):
+        return extraction
+    from app.services.pdf_reader_pkg.extractors import assess_page_quality
+
+    try:
+        candidates = pages_without_text_layer(pdf_path, reader.max_pages)
+    except Exception as e:
+        logger.warning(f"Textschicht-Prüfung fehlgeschlagen / Verificação da camada de texto falhou: {e}")
+        return extraction
+    with_text = {page['page'] for page in extraction.get('pages', []) if (page.get('text') or '').strip()}
+    candidates = [number for number in candidates if number not in with_text]
+    if not candidates:
+        return extraction
+    if not tesseract_available():
+        logger.warning("Tesseract nicht verfügbar, OCR übersprungen / Tesseract indisponível, OCR ignorado")
+        extraction['ocr_skipped_pages'] = candidates
+        return extraction
+
+    language = ocr_language(reader.ocr_language, reader.ocr_second_language)
+    logger.info(f"OCR für {len(candidates)} Seiten ohne Textschicht / OCR para {len(candidates)} páginas sem texto")
+    results = ocr_pages(pdf_path, candidates, reader.ocr_dpi, language, reader.ocr_workers,
+                        reader.ocr_page_timeout, reader.ocr_start_method)
+
+    pages = {page['page']: page for page in extraction.get('pages', [])}
+    ocr_done: List[int] = []
+    errors: Dict[int, str] = {}
+    for number, result in results.items():
+        if not result['success']:
+            errors[number] = result.get('error', '')
+            continue
+        if not result['text'].strip():
+            continue
+        pages[number] = {'page': number, 'text': result['text'], 'char_count': len(result['text']),
+                         'backend': 'ocr', 'quality': assess_page_quality(result['text']),
+                         'ocr_confidence': result['confidence']}
+        ocr_done.append(number)
+
+    merged = [pages[number] for number in sorted(pages)]
+    extraction['pages'] = merged
+    extraction['text'] = '\n'.join(page['text'] for page in merged)
+    extraction['total_chars'] = sum(page['char_count'] for page in merged)
+    extraction['ocr_pages'] = ocr_done
+    extraction['ocr_confidence'] = (
+        round(sum(pages[n]['ocr_confidence'] for n in ocr_done) / len(ocr_done), 1) if ocr_done else None
+    )
+    if errors:
+        extraction['ocr_errors'] = errors
+    if 'page_backends' in extraction:
+        for number in ocr_done:
+            extraction['page_backends'][number] = 'ocr'
+        extraction['low_quality_pages'] = [
+            n for n in extraction.get('low_quality_pages', [])
+            if n not in ocr_done or not pages[n]['quality']['ok']
+        ]
+    return extraction
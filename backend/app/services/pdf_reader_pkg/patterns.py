@@ -0,0 +1,215 @@
+"""Muster-Register und Scanner für die Feldextraktion / Registro de padrões e scanner para a extração de campos
+
+DE: Alle regulären Ausdrücke der Feldextraktion stehen hier und werden beim
+    Import einmal kompiliert. Ein ``PatternScan`` wertet jedes Muster höchstens
+    einmal je Dokument aus; die markierten Treffer (Feld, Muster, Offsets)
+    teilen sich alle Feldextraktoren, statt dass jeder Extraktor das ganze
+    Dokument erneut durchsucht.
+PT: Todas as expressões regulares da extração de campos ficam aqui e são
+    compiladas uma única vez na importação. Um ``PatternScan`` avalia cada
+    padrão no máximo uma vez por documento; as ocorrências marcadas (campo,
+    padrão, offsets) são compartilhadas por todos os extratores, em vez de
+    cada extrator varrer o documento inteiro de novo.
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Match, NamedTuple, Optional, Pattern, Tuple
+
+# Feld -> [(Muster, Inline-Flags)] / Campo -> [(padrão, flags inline)]
+# Die Reihenfolge innerhalb eines Feldes ist die Priorität / A ordem dentro de um campo é a prioridade
+FIELD_PATTERNS: Dict[str, List[Tuple[str, str]]] = {
+    'title': [
+        (r'Vertrag\s+über\s+([^.\n]+)', 'i'),
+        (r'Vereinbarung\s+über\s+([^.\n]+)', 'i'),
+        (r'Dienstleistungsvertrag\s+([^.\n]+)', 'i'),
+        (r'Werkvertrag\s+([^.\n]+)', 'i'),
+        (r'Mietvertrag\s+([^.\n]+)', 'i'),
+        (r'Kaufvertrag\s+([^.\n]+)', 'i'),
+    ],
+    'company': [
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+GmbH\b', ''),
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+AG\b', ''),
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+KG\b', ''),
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+OHG\b', ''),
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+UG\b', ''),
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+e\.V\b', ''),
+        (r'\b[A-ZÄÖÜ][a-zäöüß]+\s+&Co\b', ''),
+    ],
+    'between': [
+        (r'zwischen\s+([^,\n]+)', 'i'),
+    ],
+    'email': [
+        (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', ''),
+    ],
+    'phone': [
+        (r'(\+49\s?)?(\(0\))?[0-9\s\-\(\)]{10,}', ''),
+        (r'(\+49\s?)?[0-9]{2,4}\s?[0-9]{2,4}\s?[0-9]{2,4}', ''),
+    ],
+    'address': [
+        (r'([A-ZÄÖÜ][a-zäöüß]+\s+\d+[a-z]?,\s*\d{5}\s+[A-ZÄÖÜ][a-zäöüß]+)', ''),
+        (r'([A-ZÄÖÜ][a-zäöüß]+\s+\d+[a-z]?,\s*\d{5})', ''),
+    ],
+    'money': [
+        (r'€\s*(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)', ''),
+        (r'EUR\s*(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)', ''),
+        (r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*€', ''),
+        (r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*EUR', ''),
+    ],
+    'date': [
+        (r'\b\d{1,2}\.\d{1,2}\.\d{4}\b', ''),
+        (r'\b\d{1,2}\/\d{1,2}\/\d{4}\b', ''),
+        (r'\b\d{1,2}-\d{1,2}-\d{4}\b', ''),
+        (r'\b\d{1,2}\.\s*\d{1,2}\.\s*\d{4}\b', ''),
+        (r'\b\d{1,2}\.?\s*(?:Januar|Jänner|Februar|März|Maerz|April|Mai|Juni|Juli|August|September|Oktober'
+         r'|November|Dezember|Jan|Feb|Mär|Mrz|Apr|Jun|Jul|Aug|Sept|Sep|Okt|Nov|Dez)\.?\s+\d{4}\b', 'i'),
+    ],
+    'terms': [
+        (r'Allgemeine Geschäftsbedingungen[:\s]*([^.]{50,500})', 'is'),
+        (r'AGB[:\s]*([^.]{50,500})', 'is'),
+        (r'Bedingungen[:\s]*([^.]{50,500})', 'is'),
+    ],
+    'payment_term': [
+        (r'(?:zahlung|bezahlung|entgelt)\s+(?:innerhalb|bis)\s+(\d+)\s*(?:tage|tagen)', 'i'),
+        (r'(?:rechnung|rechnungsstellung)\s+(?:innerhalb|bis)\s+(\d+)\s*(?:tage|tagen)', 'i'),
+        (r'(?:fällig|fälligkeit)\s+(?:innerhalb|bis)\s+(\d+)\s*(?:tage|tagen)', 'i'),
+    ],
+    'penalty': [
+        (r'(?:strafe|strafzahlung|vertragsstrafe)\s+(?:von|in höhe von)\s*€?\s*(\d+(?:\.\d{3})*(?:,\d{2})?)', 'i'),
+        (r'(?:pönale|pönale)\s+(?:von|in höhe von)\s*€?\s*(\d+(?:\.\d{3})*(?:,\d{2})?)', 'i'),
+    ],
+    'notice': [
+        (r'kündigungsfrist\s*:?\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)', 'i'),
+        (r'kündigung\s+(?:mit|nach)\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)', 'i'),
+        (r'kündigbar\s+(?:mit|nach)\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)', 'i'),
+        (r'beendigung\s+(?:mit|nach)\s*(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)', 'i'),
+        (r'(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)\s*kündigungsfrist', 'i'),
+        (r'(\d+)\s*(?:tage|tagen|monate|monaten|jahre|jahren)\s*(?:vor|vorher)', 'i'),
+    ],
+    # Reihenfolge = PaymentFrequency: monatlich, vierteljährlich, halbjährlich, jährlich, einmalig
+    # Ordem = PaymentFrequency: mensal, trimestral, semestral, anual, único
+    'payment_frequency': [
+        (r'\b(?:monatlich\w*|pro\s+monat|je\s+monat|mtl\.)', 'i'),
+        (r'\b(?:vierteljährlich\w*|quartalsweise|pro\s+quartal|je\s+quartal)', 'i'),
+        (r'\b(?:halbjährlich\w*|pro\s+halbjahr)', 'i'),
+        (r'\b(?:jährlich\w*|pro\s+jahr|je\s+jahr|p\.\s?a\.)', 'i'),
+        (r'\b(?:einmalig\w*|einmalzahlung)', 'i'),
+    ],
+    # Ein Ausdruck für alle Rechtsformen: früher sieben Durchläufe mit Backtracking über ganze Sätze
+    # Uma expressão para todas as formas jurídicas: antes eram sete varreduras com backtracking
+    'legal_entity': [
+        (r'\b([A-ZÄÖÜ][a-zäöüß\s]+?)\s+(GmbH & Co\. KG|GmbH|AG|Aktiengesellschaft|KG|Kommanditgesellschaft'
+         r'|OHG|Offene Handelsgesellschaft|UG|Unternehmergesellschaft|e\.V|eingetragener Verein|&Co)\b', 'i'),
+    ],
+}
+
+
+def _inline(source: str, flags: str) -> str:
+    return f'(?{flags}:{source})' if flags else f'(?:{source})'
+
+
+# Beim Import kompiliert / Compilados na importação
+REGISTRY: Dict[str, Tuple[Pattern[str], ...]] = {
+    field: tuple(re.compile(_inline(source, flags)) for source, flags in patterns)
+    for field, patterns in FIELD_PATTERNS.items()
+}
+
+
+def pattern_sources(field: str) -> List[str]:
+    """Quelltexte der Muster eines Feldes / Código-fonte dos padrões de um campo"""
+    return [source for source, _ in FIELD_PATTERNS[field]]
+
+
+class PatternMatch(NamedTuple):
+    """Markierter Treffer / Ocorrência marcada"""
+    field: str
+    pattern: int            # Index im Feld = Priorität / índice no campo = prioridade
+    start: int
+    end: int
+    text: str
+    groups: Tuple[Optional[str], ...]
+
+    def group(self, index: int = 0) -> Optional[str]:
+        return self.text if index == 0 else self.groups[index - 1]
+
+
+def _tag(field: str, index: int, match: Match[str]) -> PatternMatch:
+    return PatternMatch(field, index, match.start(), match.end(), match.group(0), match.groups())
+
+
+class PatternScan:
+    """
+    Treffer eines Texts, je Muster höchstens einmal berechnet und von allen
+    Feldextraktoren geteilt.
+    Ocorrências de um texto, calculadas no máximo uma vez por padrão e
+    compartilhadas por todos os extratores de campos.
+
+    Felder, die nur den ersten Treffer brauchen, suchen nur bis zu diesem.
+    Campos que só precisam da primeira ocorrência buscam apenas até ela.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._matches: Dict[Tuple[str, int], List[PatternMatch]] = {}
+        self._first: Dict[Tuple[str, int], Optional[PatternMatch]] = {}
+
+    def pattern_matches(self, field: str, index: int) -> List[PatternMatch]:
+        """Alle Treffer eines Musters in Textreihenfolge / Todas as ocorrências de um padrão"""
+        key = (field, index)
+        if key not in self._matches:
+            self._matches[key] = [_tag(field, index, m) for m in REGISTRY[field][index].finditer(self.text)]
+        return self._matches[key]
+
+    def first_of(self, field: str, index: int) -> Optional[PatternMatch]:
+        """Erster Treffer eines Musters / Primeira ocorrência de um padrão"""
+        key = (field, index)
+        if key in self._matches:
+            found = self._matches[key]
+            return found[0] if found else None
+        if key not in self._first:
+            match = REGISTRY[field][index].search(self.text)
+            self._first[key] = _tag(field, index, match) if match else None
+        return self._first[key]
+
+    def firsts(self, field: str) -> Iterator[PatternMatch]:
+        """Erster Treffer je Muster, nach Priorität (lazy) / Primeira ocorrência por padrão, por prioridade"""
+        for index in range(len(REGISTRY[field])):
+            match = self.first_of(field, index)
+            if match is not None:
+                yield match
+
+    def first(self, field: str) -> Optional[PatternMatch]:
+        """Erster Treffer des Musters mit der höchsten Priorität / Primeira ocorrência do padrão de maior prioridade"""
+        return next(self.firsts(field), None)
+
+    def first_pattern_matches(self, field: str) -> List[PatternMatch]:
+        """Alle Treffer des ersten Musters mit Treffern / Todas as ocorrências do primeiro padrão com ocorrências"""
+        match = self.first(field)
+        return self.pattern_matches(field, match.pattern) if match else []
+
+    def by_pattern(self, field: str) -> Dict[int, List[PatternMatch]]:
+        """Muster mit Treffern, in Prioritätsreihenfolge / Padrões com ocorrências, por prioridade"""
+        grouped: Dict[int, List[PatternMatch]] = {}
+        for index in range(len(REGISTRY[field])):
+            found = self.pattern_matches(field, index)
+            if found:
+                grouped[index] = found
+        return grouped
+
+    def all(self, field: str) -> List[PatternMatch]:
+        """Alle Treffer eines Feldes, nach Muster geordnet / Todas as ocorrências de um campo, por padrão"""
+        return [match for found in self.by_pattern(field).values() for match in found]
+
+
+def scan_text(text: str, fields: Optional[Iterable[str]] = None) -> Dict[str, List[PatternMatch]]:
+    """
+    Markierte Treffer aller (oder der angegebenen) Felder mit Offsets.
+    Ocorrências marcadas de todos os campos (ou dos indicados) com offsets.
+    """
+    scan = PatternScan(text)
+    return {field: scan.all(field) for field in (fields if fields is not None else FIELD_PATTERNS)}
+
+
+def ensure_scan(text: str, scan: Optional[PatternScan]) -> PatternScan:
+    """Vorhandenen Scan desselben Texts nutzen / Reutiliza a varredura do mesmo texto"""
+    if scan is not None and scan.text == text:
+        return scan
+    return PatternScan(text)
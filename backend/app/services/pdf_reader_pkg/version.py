@@ -0,0 +1,36 @@
+"""Versionen der Extraktion / Versões da extração
+
+DE: Die Cache-Version kombiniert die manuell gepflegten Versionsnummern mit
+    einem Fingerabdruck der Quelltexte von Extraktoren und Parsing-Regeln.
+    Jede Regeländerung ergibt damit eine neue Version, und zwischengespeicherte
+    Ergebnisse älterer Regeln werden nicht mehr verwendet.
+PT: A versão do cache combina os números de versão mantidos manualmente com
+    uma impressão digital do código-fonte dos extratores e das regras de
+    análise. Qualquer alteração de regra gera uma nova versão.
+"""
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+# Bei Änderungen am Extraktionsverfahren erhöhen / Incrementar ao alterar o processo de extração
+EXTRACTOR_VERSION = "3"
+# Bei Änderungen an den Parsing-Regeln erhöhen / Incrementar ao alterar as regras de análise
+PARSING_RULES_VERSION = "5"
+
+
+@lru_cache()
+def rules_fingerprint() -> str:
+    """SHA-256 über die Quelltexte der Extraktion / SHA-256 sobre o código-fonte da extração"""
+    package_dir = Path(__file__).resolve().parent
+    sources = sorted(package_dir.glob("*.py")) + [package_dir.parent / "pdf_reader.py"]
+    digest = hashlib.sha256()
+    for source in sources:
+        if source.exists():
+            digest.update(source.name.encode("utf-8"))
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def extraction_cache_version() -> str:
+    """Schlüsselbestandteil für den Ergebnis-Cache / Parte da chave do cache de resultados"""
+    return f"{EXTRACTOR_VERSION}.{PARSING_RULES_VERSION}-{rules_fingerprint()[:16]}"
@@ -0,0 +1,308 @@
+"""Seitenweise Analyse langer Verträge / Análise página a página de contratos longos
+
+DE: Statt den gesamten Text zu verbinden, zu normalisieren und mehrfach zu
+    teilen, werden die Seiten einmal als Strom verarbeitet: Komplexitätsmetriken
+    und Schlüsselbegriffe werden inkrementell gezählt, Kopf- und Parteidaten
+    (Titel, Kunde, Kontakt) nur auf den ersten N Seiten gesucht, und die
+    übrigen Felder je Seite extrahiert und zusammengeführt. Zusätzlich zum
+    Extraktionsergebnis hält die Analyse so nur eine Seite (bzw. den Kopf) als
+    normalisierte Kopie, auch bei Anlagen mit 500 Seiten.
+PT: Em vez de juntar, normalizar e dividir o texto inteiro várias vezes, as
+    páginas são processadas uma vez como fluxo: métricas de complexidade e
+    termos-chave são contados de forma incremental, dados de cabeçalho e das
+    partes (título, cliente, contato) só são procurados nas primeiras N
+    páginas, e os demais campos são extraídos por página e combinados. Além
+    do resultado da extração, a análise mantém só uma página (ou o cabeçalho)
+    como cópia normalizada, mesmo com anexos de 500 páginas.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .analysis import LEGAL_TERMS
+from .extractor_router import (
+    FIELD_EXTRACTORS,
+    OTHER,
+    TYPE_FIELDS,
+    classify_contract_type,
+    normalize_text,
+)
+from .patterns import PatternScan
+
+logger = logging.getLogger(__name__)
+
+# Seiten, auf denen Kopf- und Parteidaten gesucht werden / Páginas com dados de cabeçalho e das partes
+DEFAULT_HEAD_PAGES = 3
+
+# Felder, die nur im Dokumentkopf gesucht werden / Campos procurados só no cabeçalho do documento
+HEAD_FIELDS = ('title', 'client_name', 'client_email', 'client_phone', 'client_address',
+               'description', 'terms_and_conditions')
+
+_KEY_TERM_CONTEXT = 30
+
+
+class ComplexityCounter:
+    """
+    Inkrementelle Variante von :func:`analysis.analyze_contract_complexity`.
+    Variante incremental de :func:`analysis.analyze_contract_complexity`.
+
+    ``feed`` erhält die Seiten in Reihenfolge; das Ergebnis entspricht dem
+    der Funktion für ``'\\n'.join(seiten)``.
+    """
+
+    def __init__(self) -> None:
+        self.word_count = 0
+        self.complex_words = 0
+        self.sentence_count = 0
+        self.paragraph_count = 0
+        self._started = False
+        # Offener Satz/Absatz enthält sichtbare Zeichen / Frase/parágrafo aberto contém caracteres visíveis
+        self._sentence_open = False
+        self._paragraph_open = False
+        # Offener Absatz endet auf "\n" / Parágrafo aberto termina em "\n"
+        self._trailing_newline = False
+
+    def feed(self, page_text: str) -> None:
+        data = ('\n' + page_text) if self._started else page_text
+        self._started = True
+
+        words = data.split()
+        self.word_count += len(words)
+        self.complex_words += sum(1 for word in words if len(word) > 6)
+
+        *closed, last = data.split('.')
+        for index, piece in enumerate(closed):
+            if piece.strip() or (index == 0 and self._sentence_open):
+                self.sentence_count += 1
+        self._sentence_open = bool(last.strip()) or (not closed and self._sentence_open)
+
+        # "\n\n" kann über die Seitengrenze reichen: das offene "\n" wird erneut
+        # vorangestellt (Leerraum ändert den Absatzzustand nicht)
+        # "\n\n" pode atravessar o limite da página: o "\n" aberto é prefixado de novo
+        if self._trailing_newline:
+            data = '\n' + data
+        *closed, last = data.split('\n\n')
+        for index, piece in enumerate(closed):
+            if piece.strip() or (index == 0 and self._paragraph_open):
+                self.paragraph_count += 1
+        self._paragraph_open = bool(last.strip()) or (not closed and self._paragraph_open)
+        self._trailing_newline = last.endswith('\n')
+
+    def result(self) -> Dict[str, Any]:
+        sentences = self.sentence_count + (1 if self._sentence_open else 0)
+        paragraphs = self.paragraph_count + (1 if self._paragraph_open else 0)
+        complex_word_ratio = self.complex_words / self.word_count if self.word_count > 0 else 0
+        avg_sentence_length = self.word_count / sentences if sentences > 0 else 0
+        complexity_score = min(1.0, (avg_sentence_length / 20) + (complex_word_ratio * 2))
+        return {
+            'word_count': self.word_count,
+            'sentence_count': sentences,
+            'paragraph_count': paragraphs,
+            'avg_sentence_length': avg_sentence_length,
+            'complex_word_ratio': complex_word_ratio,
+            'complexity_score': complexity_score,
+            'complexity_level': 'high' if complexity_score > 0.7 else 'medium' if complexity_score > 0.4 else 'low'
+        }
+
+
+class KeyTermCounter:
+    """
+    Inkrementelle Variante von :func:`analysis.extract_key_terms` mit Trefferzahl.
+    Variante incremental de :func:`analysis.extract_key_terms` com contagem.
+
+    Je Begriff werden die erste Fundstelle (Position im Gesamttext, Kontext
+    von 30 Zeichen) und die Anzahl der Vorkommen gezählt; vom vorherigen
+    Seitenende werden nur die letzten Zeichen für den Kontext gehalten.
+    """
+
+    def __init__(self, terms=LEGAL_TERMS) -> None:
+        self.terms = tuple(terms)
+        self.found: Dict[str, Dict[str, Any]] = {}
+        self._started = False
+        self._offset = 0          # Position des aktuellen Fensters / posição da janela atual
+        self._tail = ''           # Ende der vorherigen Seiten / final das páginas anteriores
+        self._incomplete: List[Dict[str, Any]] = []  # Kontext reicht in die nächste Seite / contexto continua na próxima página
+
+    def feed(self, page_text: str) -> None:
+        data = ('\n' + page_text) if self._started else page_text
+        self._started = True
+        for entry in self._incomplete:
+            missing = entry.pop('_missing')
+            entry['context'] += data[:missing]
+            if missing > len(data):
+                entry['_missing'] = missing - len(data)
+        self._incomplete = [entry for entry in self._incomplete if '_missing' in entry]
+
+        window = self._tail + data
+        window_lower = window.lower()
+        data_lower = window_lower[len(self._tail):]
+        window_start = self._offset - len(self._tail)
+        for term in self.terms:
+            count = data_lower.count(term)
+            if not count:
+                continue
+            if term in self.found:
+                self.found[term]['count'] += count
+                continue
+            index = window_lower.find(term, len(self._tail))
+            context_end = index + len(term) + _KEY_TERM_CONTEXT
+            entry = {
+                'term': term,
+                'context': window[max(0, index - _KEY_TERM_CONTEXT):context_end],
+                'position': window_start + index,
+                'confidence': 0.8,
+                'count': count,
+            }
+            if context_end > len(window):
+                entry['_missing'] = context_end - len(window)
+                self._incomplete.append(entry)
+            self.found[term] = entry
+
+        self._offset += len(data)
+        self._tail = window[-_KEY_TERM_CONTEXT:]
+
+    def result(self) -> List[Dict[str, Any]]:
+        for entry in self._incomplete:
+            entry.pop('_missing', None)
+        self._incomplete = []
+        return [self.found[term] for term in self.terms if term in self.found]
+
+
+# ---------- Zusammenführen der Seitenergebnisse / Combinação dos resultados por página ----------
+
+def _merge_money(total: Optional[Dict[str, Any]], page: Dict[str, Any]) -> Dict[str, Any]:
+    def amount(values):
+        return float(values['value'].replace('.', '').replace(',', '.'))
+
+    if total is None or total.get('value') is None:
+        return page
+    if page.get('value') is None or amount(page) <= amount(total):
+        return total
+    return page
+
+
+def _merge_dates(total: Optional[Dict[str, Any]], page: Dict[str, Any]) -> Dict[str, Any]:
+    # Spätere Fundstellen überschreiben frühere wie im Gesamttext
+    # Ocorrências posteriores substituem as anteriores como no texto completo
+    total = dict(total or {'start_date': None, 'end_date': None, 'renewal_date': None})
+    total.update({key: value for key, value in page.items() if value})
+    return total
+
+
+def _merge_notice(total: Optional[Dict[str, Any]], page: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if total is None or (page is not None and page['days'] > total['days']):
+        return page
+    return total
+
+
+def _merge_first(total: Any, page: Any) -> Any:
+    return page if total is None else total
+
+
+def _merge_lists(total: Optional[Any], page: Any) -> Any:
+    if total is None:
+        return page
+    if isinstance(total, dict):
+        return {key: total.get(key, []) + page.get(key, []) for key in total}
+    return total + page
+
+
+BODY_MERGERS: Dict[str, Callable[[Any, Any], Any]] = {
+    'money_values': _merge_money,
+    'dates': _merge_dates,
+    'payment_frequency': _merge_first,
+    'notice_period': _merge_notice,
+    'financial_terms': _merge_lists,
+    'legal_entities': _merge_lists,
+}
+
+
+def analyze_pages(
+    pages: Iterable[str], head_pages: int = DEFAULT_HEAD_PAGES, contract_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Analysiert einen Vertrag seitenweise in einem Durchlauf.
+    Analisa um contrato página a página numa única passagem.
+
+    Args:
+        pages: Seitentexte in Reihenfolge, z. B. ein Generator / Textos das páginas em ordem, p. ex. um gerador
+        head_pages: Seiten für Typ-, Kopf- und Parteierkennung / Páginas para tipo, cabeçalho e partes
+        contract_type: Vorgegebener Typ statt Klassifikation / Tipo predefinido em vez da classificação
+
+    Returns:
+        Dieselben Schlüssel wie :func:`extractor_router.extract_contract_fields`,
+        dazu immer ``contract_complexity`` und ``key_terms`` (mit ``count``),
+        ``analyzed_pages`` und ``windowed: True``
+    """
+    head_pages = max(1, head_pages)
+    timings: Dict[str, float] = {}
+    complexity = ComplexityCounter()
+    key_terms = KeyTermCounter()
+    head: List[str] = []
+    fields: Dict[str, Any] = {}
+    body_fields: List[str] = []
+
+    def timed(name: str, func: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return func()
+        except Exception as e:
+            logger.warning(f"Extraktor {name} fehlgeschlagen / Extrator {name} falhou: {e}")
+            return None
+        finally:
+            timings[name] = round(timings.get(name, 0.0) + (time.perf_counter() - started) * 1000, 3)
+
+    def extract_body(text: str) -> None:
+        scan = PatternScan(text)
+        for name in list(body_fields):
+            value = timed(name, lambda: FIELD_EXTRACTORS[name](text, scan))
+            if value is not None:
+                fields[name] = BODY_MERGERS[name](fields.get(name), value)
+                if BODY_MERGERS[name] is _merge_first:
+                    # Erste Nennung gefunden, restliche Seiten überspringen
+                    # Primeira menção encontrada, pular as páginas restantes
+                    body_fields.remove(name)
+
+    def analyze_head() -> None:
+        nonlocal contract_type
+        head_text = '\n'.join(head)
+        contract_type = contract_type or timed('classify', lambda: classify_contract_type(head_text))
+        selected = TYPE_FIELDS.get(contract_type, TYPE_FIELDS[OTHER])
+        scan = PatternScan(head_text)
+        for name in selected:
+            if name in HEAD_FIELDS:
+                fields[name] = timed(name, lambda: FIELD_EXTRACTORS[name](head_text, scan))
+            elif name in BODY_MERGERS:
+                body_fields.append(name)
+        for page_text in head:
+            extract_body(page_text)
+
+    page_count = 0
+    for page_text in pages:
+        page_text = normalize_text(page_text)
+        page_count += 1
+        timed('contract_complexity', lambda: complexity.feed(page_text))
+        timed('key_terms', lambda: key_terms.feed(page_text))
+        if page_count <= head_pages:
+            head.append(page_text)
+            if page_count == head_pages:
+                analyze_head()
+        else:
+            extract_body(page_text)
+    if page_count < head_pages:
+        analyze_head()
+
+    for name in body_fields:
+        fields.setdefault(name, None)
+    dates = fields.get('dates') or {}
+    fields.update({
+        'contract_type': contract_type or OTHER,
+        'contract_complexity': complexity.result(),
+        'key_terms': key_terms.result(),
+        'start_date': dates.get('start_date'),
+        'end_date': dates.get('end_date'),
+        'analyzed_pages': page_count,
+        'windowed': True,
+        'extractor_timings': timings,
+    })
+    return fields
@@ -0,0 +1,246 @@
+"""
+Speicherindex für Original-PDFs - Vertrag MGS
+Índice de armazenamento dos PDFs originais
+
+DE: Der Speicherort einer Original-PDF kommt aus der Datenbank
+    (``original_pdf_path`` + ``original_pdf_verified``). Aufgelöste Pfade
+    liegen in einem prozesslokalen LRU, sodass Download/Ansicht weder das
+    Upload-Verzeichnis durchsuchen noch (im Normalfall) die DB abfragen.
+    Nur bestätigte Zeilen liefern einen Pfad; unbestätigte gelten als ohne Datei.
+    Dateien der alten Struktur (``uploads/contracts/*_{id}_*.pdf``) werden
+    einmalig per Migration 0015 nach ``persisted/contract_{id}/original.pdf``
+    verschoben.
+PT: O local de um PDF original vem do banco de dados (``original_pdf_path``
+    + ``original_pdf_verified``). Os caminhos resolvidos ficam num LRU local
+    do processo, então download/visualização não varrem o diretório de
+    upload nem (normalmente) consultam o banco. Só linhas confirmadas
+    retornam um caminho; as demais são tratadas como sem arquivo. Arquivos
+    da estrutura antiga são movidos uma única vez pela migração 0015.
+"""
+
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def persisted_dir(upload_dir: str) -> str:
+    """Verzeichnis der persistierten Original-PDFs / Diretório dos PDFs originais persistidos"""
+    return os.path.join(upload_dir, "contracts", "persisted")
+
+
+def canonical_pdf_path(upload_dir: str, contract_id: int) -> str:
+    """Kanonischer Pfad einer Original-PDF / Caminho canônico de um PDF original"""
+    return os.path.join(persisted_dir(upload_dir), f"contract_{contract_id}", "original.pdf")
+
+
+class PDFStorageIndex:
+    """
+    Löst Vertrags-IDs über die DB-Metadaten zu Dateipfaden auf (mit LRU)
+    Resolve IDs de contrato em caminhos de arquivo pelos metadados do banco (com LRU)
+    """
+
+    def __init__(self, upload_dir: str, max_entries: int = 4096) -> None:
+        self.upload_dir = upload_dir
+        self.max_entries = max_entries
+        self._paths: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, contract_id: int) -> Optional[str]:
+        with self._lock:
+            path = self._paths.get(contract_id)
+            if path is not None:
+                self._paths.move_to_end(contract_id)
+        if path is None:
+            return None
+        # Eine stat() statt Verzeichnissuche; verschwundene Dateien fallen raus
+        # Um stat() em vez de varrer o diretório; arquivos removidos saem do cache
+        if os.path.isfile(path):
+            self.hits += 1
+            return path
+        self.invalidate(contract_id)
+        return None
+
+    def remember(self, contract_id: int, path: str) -> None:
+        """Merkt sich einen bestätigten Pfad / Memoriza um caminho confirmado"""
+        with self._lock:
+            self._paths[contract_id] = path
+            self._paths.move_to_end(contract_id)
+            while len(self._paths) > self.max_entries:
+                self._paths.popitem(last=False)
+
+    def invalidate(self, contract_id: int) -> None:
+        """Entfernt den Eintrag nach Ersetzen/Löschen / Remove a entrada após substituir/excluir"""
+        with self._lock:
+            self._paths.pop(contract_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._paths.clear()
+
+    def _lookup(self, contract_id: int, db_path: Optional[str], verified: bool) -> Optional[str]:
+        self.misses += 1
+        # Nur bestätigte Zeilen haben eine Datei (beim Speichern bzw. durch Migration 0015
+        # geprüft): ihrem Pfad wird ohne stat() vertraut, unbestätigte werden nicht gesucht
+        # Só linhas confirmadas têm arquivo: seu caminho é aceito sem stat(), as não confirmadas não são procuradas
+        if not verified or not db_path:
+            return None
+        self.remember(contract_id, db_path)
+        return db_path
+
+    def resolve(self, contract: Any) -> Optional[str]:
+        """
+        Pfad der Original-PDF eines bereits geladenen Vertrags (ohne DB-Zugriff).
+        Caminho do PDF original de um contrato já carregado (sem acesso ao banco).
+
+        Die geladene Zeile gilt, nicht der LRU: ein Eintrag kann von einem
+        gelöschten Vertrag stammen, dessen ID wiederverwendet wurde.
+        Vale a linha carregada, não o LRU: a entrada pode ser de um contrato
+        excluído cujo ID foi reutilizado.
+
+        Args:
+            contract: ORM-Objekt oder ContractResponse / Objeto ORM ou ContractResponse
+        """
+        return self._lookup(
+            contract.id,
+            getattr(contract, "original_pdf_path", None),
+            bool(getattr(contract, "original_pdf_verified", False)),
+        )
+
+    async def resolve_id(self, db: AsyncSession, contract_id: int) -> Optional[str]:
+        """
+        Pfad der Original-PDF zu einer Vertrags-ID; DB-Abfrage nur bei LRU-Fehltreffer.
+        Caminho do PDF original de um ID; consulta ao banco só em falta no LRU.
+        """
+        path = self._cached(contract_id)
+        if path is not None:
+            return path
+        from app.models.contract import Contract
+
+        row = (await db.execute(
+            sa.select(Contract.original_pdf_path, Contract.original_pdf_verified).where(Contract.id == contract_id)
+        )).one_or_none()
+        if row is None:
+            self.misses += 1
+            return None
+        return self._lookup(contract_id, row.original_pdf_path, row.original_pdf_verified)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._paths), "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
+
+
+_index: Optional[PDFStorageIndex] = None
+
+
+def get_pdf_storage_index() -> PDFStorageIndex:
+    """Gemeinsamer Index des Prozesses / Índice compartilhado do processo"""
+    global _index
+    if _index is None:
+        _index = PDFStorageIndex(settings.UPLOAD_DIR, settings.PDF_PATH_CACHE_SIZE)
+    return _index
+
+
+# ---------- Einmalige Migration / Migração única ----------
+
+def _legacy_files(upload_dir: str) -> Dict[str, List[str]]:
+    """
+    Alte Dateien ``<präfix>_<id>_<rest>.pdf`` direkt in uploads/contracts, nach
+    exakter ID (``_1_`` passt nicht mehr auf ``_11_``).
+    Arquivos antigos diretamente em uploads/contracts, pelo ID exato.
+    """
+    legacy_dir = os.path.join(upload_dir, "contracts")
+    files: Dict[str, List[str]] = {}
+    if not os.path.isdir(legacy_dir):
+        return files
+    for entry in os.scandir(legacy_dir):
+        if not entry.is_file() or not entry.name.lower().endswith(".pdf"):
+            continue
+        tokens = entry.name[:-4].split("_")
+        # Wie das frühere Muster *_{id}_*: weder erstes noch letztes Segment
+        # Como o padrão antigo *_{id}_*: nem o primeiro nem o último segmento
+        for token in set(tokens[1:-1]):
+            if token.isdigit():
+                files.setdefault(str(int(token)), []).append(entry.path)
+    return files
+
+
+def _move_to_canonical(path: str, upload_dir: str, contract_id: int) -> str:
+    target = canonical_pdf_path(upload_dir, contract_id)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.move(path, target)
+    return target
+
+
+def migrate_pdf_storage(connection: sa.engine.Connection, upload_dir: str) -> Dict[str, int]:
+    """
+    Verschiebt Original-PDFs der alten Struktur in das persistierte Layout und
+    setzt ``original_pdf_path``/``original_pdf_verified`` für alle Verträge.
+    Move PDFs originais da estrutura antiga para o layout persistido e define
+    ``original_pdf_path``/``original_pdf_verified`` para todos os contratos.
+
+    Args:
+        connection: Synchrone Verbindung (z. B. ``op.get_bind()``) / Conexão síncrona
+        upload_dir: ``settings.UPLOAD_DIR``
+
+    Returns:
+        Zähler verified/moved/missing / Contadores verified/moved/missing
+    """
+    contracts = sa.table(
+        "contracts",
+        sa.column("id", sa.Integer),
+        sa.column("original_pdf_path", sa.String),
+        sa.column("original_pdf_verified", sa.Boolean),
+    )
+    rows = connection.execute(sa.select(contracts.c.id, contracts.c.original_pdf_path)).all()
+    legacy_dir = os.path.abspath(os.path.join(upload_dir, "contracts"))
+    legacy = _legacy_files(upload_dir)
+    claimed = {os.path.abspath(path) for _, path in rows if path}
+    counts = {"verified": 0, "moved": 0, "missing": 0}
+
+    for contract_id, path in rows:
+        location = None
+        if path and os.path.isfile(path):
+            location = path
+            if os.path.dirname(os.path.abspath(path)) == legacy_dir:
+                location = _move_to_canonical(path, upload_dir, contract_id)
+                counts["moved"] += 1
+        elif os.path.isfile(canonical_pdf_path(upload_dir, contract_id)):
+            location = canonical_pdf_path(upload_dir, contract_id)
+        else:
+            # Nur eindeutige, keinem anderen Vertrag gehörende Treffer übernehmen
+            # Só aceitar candidatos únicos que não pertençam a outro contrato
+            candidates = [
+                candidate for candidate in legacy.get(str(contract_id), [])
+                if os.path.abspath(candidate) not in claimed and os.path.isfile(candidate)
+            ]
+            if len(candidates) == 1:
+                location = _move_to_canonical(candidates[0], upload_dir, contract_id)
+                claimed.add(os.path.abspath(candidates[0]))
+                counts["moved"] += 1
+            elif len(candidates) > 1:
+                logger.warning(
+                    f"Mehrdeutige Alt-PDFs für Vertrag {contract_id} / PDFs antigos ambíguos para o contrato "
+                    f"{contract_id}: {candidates}"
+                )
+
+        values: Dict[str, Any] = {"original_pdf_verified": location is not None}
+        if location is not None:
+            values["original_pdf_path"] = location
+            counts["verified"] += 1
+        elif path:
+            counts["missing"] += 1
+        connection.execute(sa.update(contracts).where(contracts.c.id == contract_id).values(**values))
+
+    logger.info(f"PDF-Speicher migriert / Armazenamento de PDF migrado: {counts}")
+    return counts
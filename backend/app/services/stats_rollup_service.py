@@ -0,0 +1,242 @@
+"""
+Stats Rollup Service - Dienst für vorberechnete Vertragsstatistiken
+DE: Neuaufbau (nächtliches Re-Bucketing), Konsistenzprüfung und Lesen der
+    Tabelle ``contract_stats_rollup``. Die laufende Pflege geschieht über die
+    ORM-Events in ``app.models.contract_stats_rollup``.
+PT: Reconstrução (reclassificação noturna), verificação de consistência e
+    leitura da tabela ``contract_stats_rollup``. A manutenção contínua é feita
+    pelos eventos ORM em ``app.models.contract_stats_rollup``.
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import case, delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.alert import Alert, AlertStatus
+from app.models.contract import Contract
+from app.models.contract_stats_rollup import (
+    BUCKET_D30,
+    BUCKET_D90,
+    BUCKET_LATER,
+    BUCKET_NONE,
+    BUCKET_PAST,
+    ContractStatsRollup,
+    RollupDelta,
+    RollupKey,
+    rollup_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StatsRollupService:
+    """
+    Serviço do rollup de estatísticas de contratos
+    Dienst für das Rollup der Vertragsstatistiken
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialisiert den Dienst mit einer Datenbanksitzung.
+        Inicializa o serviço com uma sessão de banco de dados.
+        """
+        self.db = db
+
+    async def compute_live(self, reference: date) -> Dict[RollupKey, RollupDelta]:
+        """
+        Berechnet die Rollup-Zeilen aus den Live-Daten (eine gruppierte Abfrage).
+        Calcula as linhas do rollup a partir dos dados atuais (uma consulta agrupada).
+
+        Args:
+            reference: Stichtag für die Ablauf-Buckets / Data de referência das faixas
+
+        Returns:
+            Dict[RollupKey, RollupDelta]: Zähler je Schlüssel / Contadores por chave
+        """
+        bucket = case(
+            (Contract.end_date.is_(None), BUCKET_NONE),
+            (Contract.end_date < reference, BUCKET_PAST),
+            (Contract.end_date <= reference + timedelta(days=30), BUCKET_D30),
+            (Contract.end_date <= reference + timedelta(days=90), BUCKET_D90),
+            else_=BUCKET_LATER,
+        ).label("bucket")
+
+        alert_counts = (
+            select(
+                Alert.contract_id.label("contract_id"),
+                func.count(Alert.id).label("alerts"),
+                func.sum(case((Alert.status == AlertStatus.PENDING, 1), else_=0)).label("pending"),
+            )
+            .group_by(Alert.contract_id)
+            .subquery()
+        )
+        dimensions = [Contract.department, Contract.team, Contract.status, Contract.contract_type, Contract.operation_type, bucket]
+        result = await self.db.execute(
+            select(
+                *dimensions,
+                func.count(Contract.id).label("contracts"),
+                func.coalesce(func.sum(Contract.value), 0).label("value"),
+                func.coalesce(func.sum(alert_counts.c.alerts), 0).label("alerts"),
+                func.coalesce(func.sum(alert_counts.c.pending), 0).label("pending"),
+            )
+            .select_from(Contract)
+            .outerjoin(alert_counts, alert_counts.c.contract_id == Contract.id)
+            .group_by(*dimensions)
+        )
+
+        rows: Dict[RollupKey, RollupDelta] = {}
+        for row in result.all():
+            key = rollup_key(row.department, row.team, row.status, row.contract_type, row.operation_type, None, reference)
+            key = key._replace(expiry_bucket=row.bucket)
+            delta = rows.setdefault(key, RollupDelta())
+            delta.contract_count += int(row.contracts)
+            delta.total_value += Decimal(str(row.value or 0)).quantize(Decimal("0.01"))
+            delta.alert_count += int(row.alerts)
+            delta.pending_alert_count += int(row.pending)
+        return rows
+
+    async def _stored_rows(self) -> Dict[RollupKey, RollupDelta]:
+        # Core-Select statt ORM-Entitäten: keine veralteten Objekte aus der Identity Map
+        # Select Core em vez de entidades ORM: sem objetos desatualizados do identity map
+        result = await self.db.execute(select(ContractStatsRollup.__table__))
+        rows: Dict[RollupKey, RollupDelta] = {}
+        for row in result.all():
+            key = RollupKey(row.department, row.team, row.status, row.contract_type, row.operation_type, row.expiry_bucket)
+            rows[key] = RollupDelta(
+                contract_count=row.contract_count,
+                total_value=Decimal(str(row.total_value or 0)).quantize(Decimal("0.01")),
+                alert_count=row.alert_count,
+                pending_alert_count=row.pending_alert_count,
+            )
+        return rows
+
+    async def rebuild(self, reference: Optional[date] = None) -> int:
+        """
+        Baut den Rollup neu auf und ordnet die Ablauf-Buckets zum Stichtag neu zu.
+        Reconstrói o rollup e reclassifica as faixas de vencimento para a data de referência.
+
+        Args:
+            reference: Stichtag (Standard: heute) / Data de referência (padrão: hoje)
+
+        Returns:
+            int: Anzahl geschriebener Zeilen / Número de linhas gravadas
+        """
+        reference = reference or date.today()
+        live = await self.compute_live(reference)
+
+        await self.db.execute(delete(ContractStatsRollup.__table__))
+        if live:
+            await self.db.execute(
+                insert(ContractStatsRollup.__table__),
+                [
+                    dict(key._asdict(), contract_count=d.contract_count, total_value=d.total_value,
+                         alert_count=d.alert_count, pending_alert_count=d.pending_alert_count,
+                         bucket_date=reference)
+                    for key, d in live.items()
+                ],
+            )
+        await self.db.commit()
+        logger.info(f"Stats rollup rebuilt for {reference} ({len(live)} rows) / Rollup reconstruído")
+        return len(live)
+
+    async def check(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Konsistenzprüfung: vergleicht die Tabelle mit einem Neuaufbau aus den Live-Daten.
+        Verificação de consistência: compara a tabela com uma reconstrução a partir dos dados atuais.
+
+        Der Neuaufbau verwendet den Stichtag der gespeicherten Zeilen, damit reine
+        Tageswechsel nicht als Abweichung gemeldet werden.
+        A reconstrução usa a data de referência das linhas gravadas.
+
+        Args:
+            repair: Bei Abweichungen neu aufbauen / Reconstruir em caso de divergência
+
+        Returns:
+            Dict mit ``consistent``, ``bucket_date``, ``mismatches`` und ``repaired``
+        """
+        dates_result = await self.db.execute(
+            select(ContractStatsRollup.bucket_date).distinct()
+        )
+        bucket_dates = [d for d in dates_result.scalars().all()]
+        reference = bucket_dates[0] if len(bucket_dates) == 1 and bucket_dates[0] is not None else date.today()
+
+        stored = await self._stored_rows()
+        live = await self.compute_live(reference)
+
+        mismatches: List[Dict[str, Any]] = []
+        for key in sorted(set(stored) | set(live)):
+            expected = live.get(key, RollupDelta())
+            actual = stored.get(key, RollupDelta())
+            if expected != actual:
+                mismatches.append({
+                    "key": key._asdict(),
+                    "expected": _delta_to_dict(expected),
+                    "actual": _delta_to_dict(actual),
+                })
+
+        # Gemischte oder fehlende Stichtage sind ebenfalls inkonsistent / Datas mistas ou ausentes também são inconsistentes
+        consistent = not mismatches and len(bucket_dates) <= 1 and None not in bucket_dates
+        repaired = False
+        if repair and not consistent:
+            await self.rebuild()
+            repaired = True
+
+        return {
+            "consistent": consistent,
+            "bucket_date": reference.isoformat(),
+            "mismatches": mismatches,
+            "repaired": repaired,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def scope_rows(self, department: Optional[str] = None, team: Optional[str] = None) -> Optional[List[Any]]:
+        """
+        Liefert die Rollup-Zeilen eines Sichtbereichs oder None, wenn der Rollup nicht aktuell ist.
+        Retorna as linhas do rollup de um escopo ou None se o rollup não estiver atualizado.
+
+        Args:
+            department: Abteilungsfilter (None = alle) / Filtro de departamento
+            team: Teamfilter (None = alle) / Filtro de time
+
+        Returns:
+            Optional[List[Row]]: Zeilen oder None (Live-Abfrage verwenden)
+        """
+        today = date.today()
+        state = (await self.db.execute(
+            select(
+                func.count(ContractStatsRollup.id),
+                func.sum(case(
+                    (or_(ContractStatsRollup.bucket_date.is_(None), ContractStatsRollup.bucket_date != today), 1),
+                    else_=0,
+                )),
+            )
+        )).one()
+        row_count, stale_rows = int(state[0] or 0), int(state[1] or 0)
+        if stale_rows:
+            return None
+        if row_count == 0:
+            # Leer ist nur korrekt, wenn es keine Verträge gibt / Vazio só é correto sem contratos
+            has_contracts = (await self.db.execute(select(Contract.id).limit(1))).first() is not None
+            return None if has_contracts else []
+
+        table = ContractStatsRollup.__table__
+        stmt = select(table)
+        if department is not None:
+            stmt = stmt.where(table.c.department == department)
+        if team is not None:
+            stmt = stmt.where(table.c.team == team)
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+
+def _delta_to_dict(delta: RollupDelta) -> Dict[str, Any]:
+    return {
+        "contract_count": delta.contract_count,
+        "total_value": float(delta.total_value),
+        "alert_count": delta.alert_count,
+        "pending_alert_count": delta.pending_alert_count,
+    }
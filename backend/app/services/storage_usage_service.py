@@ -0,0 +1,285 @@
+"""
+Speicherbuchhaltung für UPLOAD_DIR - Vertrag MGS
+Contabilidade de armazenamento do UPLOAD_DIR
+
+DE: Blob-Speicher und Vorschaubild-Cache melden jede neue bzw. gelöschte
+    Datei an den ``StorageUsageTracker`` des Prozesses (nur Speicher, kein
+    DB-Zugriff im Schreibpfad). Der Scheduler bucht die gesammelten Deltas
+    regelmäßig in ``storage_usage`` ein; Leser addieren noch offene Deltas,
+    Dashboard und Health-Check brauchen so keinen Verzeichnisdurchlauf mehr.
+    Ein periodischer Abgleich zählt ``UPLOAD_DIR`` in einem Thread mit
+    niedriger Priorität neu, korrigiert Abweichungen (z. B. Staging-Dateien,
+    die nicht gemeldet werden) und schreibt einen Messpunkt in
+    ``storage_usage_history``.
+PT: O armazenamento de blobs e o cache de miniaturas informam cada arquivo
+    novo ou removido ao ``StorageUsageTracker`` do processo (só memória, sem
+    acesso ao banco no caminho de gravação). O agendador lança os deltas em
+    ``storage_usage`` periodicamente; leitores somam os deltas ainda abertos,
+    assim dashboard e health check não percorrem mais o diretório. Uma
+    reconciliação periódica reconta o ``UPLOAD_DIR`` numa thread de baixa
+    prioridade, corrige divergências e grava um ponto em
+    ``storage_usage_history``.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.storage_usage import (
+    CATEGORY_BLOBS,
+    CATEGORY_OTHER,
+    CATEGORY_THUMBNAILS,
+    STORAGE_CATEGORIES,
+    StorageUsage,
+    StorageUsageSample,
+)
+
+logger = logging.getLogger(__name__)
+
+# Oberste Verzeichnisse unter UPLOAD_DIR mit eigener Kategorie
+# Diretórios de topo em UPLOAD_DIR com categoria própria
+_TOP_LEVEL_CATEGORIES = {"blobs": CATEGORY_BLOBS, "thumbnails": CATEGORY_THUMBNAILS}
+
+
+class StorageUsageTracker:
+    """
+    Offene Deltas (Bytes, Dateien) je Kategorie, threadsicher
+    Deltas em aberto (bytes, arquivos) por categoria, thread-safe
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, category: str, bytes_delta: int, files_delta: int) -> None:
+        if not bytes_delta and not files_delta:
+            return
+        with self._lock:
+            counters = self._pending.setdefault(category, [0, 0])
+            counters[0] += bytes_delta
+            counters[1] += files_delta
+
+    def pending(self) -> Dict[str, Tuple[int, int]]:
+        with self._lock:
+            return {category: (b, f) for category, (b, f) in self._pending.items()}
+
+    def drain(self) -> Dict[str, Tuple[int, int]]:
+        """Liefert und leert die offenen Deltas / Retorna e zera os deltas em aberto"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return {category: (b, f) for category, (b, f) in pending.items()}
+
+    def restore(self, deltas: Dict[str, Tuple[int, int]]) -> None:
+        """Nach fehlgeschlagenem Einbuchen zurücklegen / Devolver após falha ao lançar"""
+        for category, (bytes_delta, files_delta) in deltas.items():
+            self.record(category, bytes_delta, files_delta)
+
+
+def _lower_thread_priority() -> None:
+    # Linux: setpriority mit der Thread-ID betrifft nur diesen Thread
+    # Linux: setpriority com o id da thread afeta só esta thread
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+_scan_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_scan_executor() -> ThreadPoolExecutor:
+    global _scan_executor
+    if _scan_executor is None:
+        _scan_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="storage-reconcile", initializer=_lower_thread_priority
+        )
+    return _scan_executor
+
+
+def _scan_tree(path: str) -> Tuple[int, int]:
+    total_bytes = total_files = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total_bytes += entry.stat(follow_symlinks=False).st_size
+                    total_files += 1
+            except FileNotFoundError:
+                continue
+    return total_bytes, total_files
+
+
+def scan_upload_dir(upload_dir: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Zählt Bytes und Dateien je Kategorie (vollständiger Durchlauf).
+    Conta bytes e arquivos por categoria (varredura completa).
+    """
+    totals = {category: [0, 0] for category in STORAGE_CATEGORIES}
+    try:
+        entries = list(os.scandir(upload_dir))
+    except FileNotFoundError:
+        entries = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                size, files = _scan_tree(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                size, files = entry.stat(follow_symlinks=False).st_size, 1
+            else:
+                continue
+        except FileNotFoundError:
+            continue
+        counters = totals[_TOP_LEVEL_CATEGORIES.get(entry.name, CATEGORY_OTHER)]
+        counters[0] += size
+        counters[1] += files
+    return {category: (b, f) for category, (b, f) in totals.items()}
+
+
+class StorageUsageService:
+    """
+    Liest und pflegt ``storage_usage`` / Lê e mantém ``storage_usage``
+    """
+
+    def __init__(self, db: AsyncSession, tracker: Optional[StorageUsageTracker] = None) -> None:
+        self.db = db
+        self.tracker = tracker or get_storage_tracker()
+
+    async def _apply(self, values: Dict[str, Tuple[int, int]], absolute: bool, now: datetime) -> None:
+        table = StorageUsage.__table__
+        for category, (size, files) in values.items():
+            if absolute:
+                counters = dict(bytes=size, files=files, reconciled_at=now)
+            else:
+                counters = dict(bytes=table.c.bytes + size, files=table.c.files + files)
+            result = await self.db.execute(
+                update(table).where(table.c.category == category).values(updated_at=now, **counters)
+            )
+            if not result.rowcount:
+                await self.db.execute(
+                    insert(table).values(category=category, bytes=size, files=files, updated_at=now,
+                                         reconciled_at=now if absolute else None)
+                )
+
+    async def flush(self) -> int:
+        """
+        Bucht die offenen Deltas ein (UPDATE, sonst INSERT).
+        Lança os deltas em aberto (UPDATE, senão INSERT).
+
+        Returns:
+            int: Anzahl geänderter Kategorien / Número de categorias alteradas
+        """
+        deltas = self.tracker.drain()
+        if not deltas:
+            return 0
+        try:
+            await self._apply(deltas, absolute=False, now=datetime.now(timezone.utc))
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            self.tracker.restore(deltas)
+            raise
+        return len(deltas)
+
+    async def reconcile(self, upload_dir: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
+        """
+        Zählt ``UPLOAD_DIR`` neu, überschreibt die Zähler und schreibt einen
+        Messpunkt je Kategorie in die Zeitreihe.
+        Reconta o ``UPLOAD_DIR``, sobrescreve os contadores e grava um ponto
+        por categoria na série temporal.
+
+        Deltas vor dem Durchlauf sind darin enthalten und werden verworfen;
+        Änderungen während des Durchlaufs bleiben offen und können bis zum
+        nächsten Abgleich doppelt zählen.
+        Deltas anteriores à varredura já estão nela e são descartados;
+        alterações durante a varredura podem contar em dobro até a próxima
+        reconciliação.
+        """
+        upload_dir = upload_dir or settings.UPLOAD_DIR
+        self.tracker.drain()
+        totals = await asyncio.get_running_loop().run_in_executor(_get_scan_executor(), scan_upload_dir, upload_dir)
+
+        before = await self._stored()
+        now = datetime.now(timezone.utc)
+        await self._apply(totals, absolute=True, now=now)
+        await self.db.execute(
+            insert(StorageUsageSample.__table__),
+            [dict(category=category, bytes=size, files=files, recorded_at=now) for category, (size, files) in totals.items()],
+        )
+        await self.db.commit()
+
+        drift = {category: totals[category][0] - before.get(category, (0, 0))[0] for category in totals}
+        if before and any(drift.values()):
+            logger.info(f"Storage usage reconciled, drift in bytes / Armazenamento reconciliado, desvio em bytes: {drift}")
+        return totals
+
+    async def _stored(self) -> Dict[str, Tuple[int, int]]:
+        result = await self.db.execute(select(StorageUsage.category, StorageUsage.bytes, StorageUsage.files))
+        return {category: (size, files) for category, size, files in result.all()}
+
+    async def usage(self) -> Dict[str, Any]:
+        """
+        Bytes/Dateien je Kategorie inkl. offener Deltas (ohne Verzeichnisdurchlauf).
+        Bytes/arquivos por categoria incluindo deltas em aberto (sem varrer o diretório).
+        """
+        result = await self.db.execute(select(StorageUsage.__table__))
+        rows = {row.category: row for row in result.all()}
+        pending = self.tracker.pending()
+
+        categories: Dict[str, Dict[str, int]] = {}
+        for category in sorted(set(STORAGE_CATEGORIES) | set(rows) | set(pending)):
+            row = rows.get(category)
+            size, files = pending.get(category, (0, 0))
+            categories[category] = {
+                "bytes": max((row.bytes if row else 0) + size, 0),
+                "files": max((row.files if row else 0) + files, 0),
+            }
+        reconciled = [row.reconciled_at for row in rows.values() if row.reconciled_at is not None]
+        updated = [row.updated_at for row in rows.values() if row.updated_at is not None]
+        return {
+            "categories": categories,
+            "total_bytes": sum(c["bytes"] for c in categories.values()),
+            "total_files": sum(c["files"] for c in categories.values()),
+            "updated_at": max(updated).isoformat() if updated else None,
+            "reconciled_at": min(reconciled).isoformat() if reconciled else None,
+        }
+
+    async def history(self, days: int = 90, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Messpunkte der letzten ``days`` Tage, älteste zuerst.
+        Pontos dos últimos ``days`` dias, mais antigos primeiro.
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        query = select(StorageUsageSample.__table__).where(StorageUsageSample.recorded_at >= since)
+        if category:
+            query = query.where(StorageUsageSample.category == category)
+        result = await self.db.execute(query.order_by(StorageUsageSample.recorded_at, StorageUsageSample.category))
+        return [
+            {"recorded_at": row.recorded_at.isoformat(), "category": row.category, "bytes": row.bytes, "files": row.files}
+            for row in result.all()
+        ]
+
+
+_tracker: Optional[StorageUsageTracker] = None
+
+
+def get_storage_tracker() -> StorageUsageTracker:
+    """Gemeinsamer Zähler des Prozesses / Contador compartilhado do processo"""
+    global _tracker
+    if _tracker is None:
+        _tracker = StorageUsageTracker()
+    return _tracker
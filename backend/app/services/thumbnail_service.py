@@ -0,0 +1,259 @@
+"""
+Vorschaubilder für Vertrags-PDFs - Vertrag MGS
+Miniaturas para PDFs de contratos
+
+DE: Seiten werden mit PyMuPDF im Extraktions-Pool als PNG gerendert und auf
+    der Platte unter ``UPLOAD_DIR/thumbnails`` zwischengespeichert, Schlüssel
+    ist (SHA-256 der PDF, Seite, Breite). Der Cache ist nach Gesamtgröße
+    begrenzt (LRU über die Änderungszeit, die bei jedem Treffer aufgefrischt
+    wird). Nach einem Upload werden die Bilder der ersten Seite(n) im
+    Hintergrund vorab erzeugt, damit Listenansichten nicht rendern müssen.
+PT: As páginas são renderizadas como PNG com PyMuPDF no pool de extração e
+    armazenadas em disco em ``UPLOAD_DIR/thumbnails``, com chave (SHA-256 do
+    PDF, página, largura). O cache é limitado pelo tamanho total (LRU pela
+    data de modificação, renovada a cada acerto). Após um upload, as imagens
+    da(s) primeira(s) página(s) são geradas em segundo plano.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.models.storage_usage import CATEGORY_THUMBNAILS
+from app.services.storage_usage_service import StorageUsageTracker, get_storage_tracker
+
+logger = logging.getLogger(__name__)
+
+# Erlaubte Breiten (px), damit der Cache nicht je Wunschgröße wächst
+# Larguras permitidas (px), para o cache não crescer por tamanho pedido
+THUMBNAIL_WIDTHS = (160, 320, 640)
+THUMBNAIL_WIDTH = 320
+PREVIEW_WIDTH = 640
+
+
+class PageNotFoundError(LookupError):
+    """Seite existiert nicht in der PDF / Página não existe no PDF"""
+
+
+def render_page_png(pdf_path: str, page_number: int, width: int) -> bytes:
+    """
+    Rendert eine Seite (1-basiert) in der gegebenen Breite als PNG.
+    Renderiza uma página (base 1) na largura dada como PNG.
+
+    Raises:
+        PageNotFoundError: Seite außerhalb der PDF / Página fora do PDF
+    """
+    import fitz
+
+    with fitz.open(pdf_path) as doc:
+        if not 1 <= page_number <= doc.page_count:
+            raise PageNotFoundError(f"Seite {page_number} nicht vorhanden / Página {page_number} inexistente")
+        page = doc[page_number - 1]
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return pixmap.tobytes("png")
+
+
+class ThumbnailCache:
+    """
+    PNG-Dateien nach (Hash, Seite, Breite), begrenzt auf ``max_bytes``
+    Arquivos PNG por (hash, página, largura), limitados a ``max_bytes``
+    """
+
+    # Nach dem Aufräumen bleibt Luft bis zur nächsten Verdrängung
+    # Após a limpeza sobra folga até a próxima remoção
+    EVICT_TO_RATIO = 0.9
+
+    def __init__(self, root: str, max_bytes: int, usage: Optional[StorageUsageTracker] = None) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.usage = usage
+        self._total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def path_for(self, sha256: str, page_number: int, width: int) -> str:
+        return os.path.join(self.root, sha256[:2], f"{sha256}_p{page_number}_w{width}.png")
+
+    def get(self, sha256: str, page_number: int, width: int) -> Optional[str]:
+        """Pfad bei Treffer (frischt die LRU-Zeit auf) / Caminho em caso de acerto (renova o tempo LRU)"""
+        path = self.path_for(sha256, page_number, width)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, sha256: str, page_number: int, width: int, data: bytes) -> str:
+        """Schreibt atomar und verdrängt bei Überschreitung / Grava de forma atômica e remove em excesso"""
+        path = self.path_for(sha256, page_number, width)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+        with open(temp_path, "wb") as handle:
+            handle.write(data)
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = None
+        os.replace(temp_path, path)
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_total()
+            else:
+                self._total += len(data) - (replaced or 0)
+            over_limit = self._total > self.max_bytes
+        if self.usage is not None:
+            self.usage.record(CATEGORY_THUMBNAILS, len(data) - (replaced or 0), 0 if replaced is not None else 1)
+        if over_limit:
+            self.evict()
+        return path
+
+    def _entries(self):
+        if not os.path.isdir(self.root):
+            return
+        for shard in os.scandir(self.root):
+            if shard.is_dir():
+                for entry in os.scandir(shard.path):
+                    if entry.is_file():
+                        yield entry
+
+    def _scan_total(self) -> int:
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self) -> int:
+        """
+        Löscht die am längsten nicht genutzten Bilder bis unter 90 % des Limits.
+        Remove as imagens usadas há mais tempo até ficar abaixo de 90 % do limite.
+        """
+        with self._lock:
+            entries = []
+            for entry in self._entries():
+                stat_result = entry.stat()
+                entries.append((stat_result.st_mtime, stat_result.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            target = int(self.max_bytes * self.EVICT_TO_RATIO)
+            removed = removed_bytes = 0
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    total -= size
+                    continue
+                total -= size
+                removed += 1
+                removed_bytes += size
+            self._total = total
+        if self.usage is not None:
+            self.usage.record(CATEGORY_THUMBNAILS, -removed_bytes, -removed)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_total()
+            return {"bytes": self._total, "max_bytes": self.max_bytes}
+
+
+class ThumbnailService:
+    """
+    Liefert Vorschaubilder aus dem Cache oder rendert sie im Pool
+    Entrega miniaturas do cache ou as renderiza no pool
+    """
+
+    def __init__(self, cache: ThumbnailCache, engine=None) -> None:
+        self.cache = cache
+        self._engine = engine
+        self._inflight: Dict[Tuple[str, int, int], asyncio.Future] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from app.services.extraction_engine import get_extraction_engine
+            return get_extraction_engine()
+        return self._engine
+
+    async def thumbnail(self, pdf_path: str, sha256: str, page_number: int, width: int) -> str:
+        """
+        Pfad des PNG für eine Seite; gleichzeitige Anfragen rendern nur einmal.
+        Caminho do PNG de uma página; requisições simultâneas renderizam só uma vez.
+
+        Raises:
+            PageNotFoundError: Seite existiert nicht / Página não existe
+            ExtractionError: Rendern fehlgeschlagen / Falha ao renderizar
+        """
+        cached = self.cache.get(sha256, page_number, width)
+        if cached is not None:
+            return cached
+        key = (sha256, page_number, width)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            started = time.perf_counter()
+            data = await self.engine.render_page(pdf_path, page_number, width)
+            path = await asyncio.to_thread(self.cache.put, sha256, page_number, width, data)
+            logger.debug(f"Thumbnail {key} gerendert / renderizado ({time.perf_counter() - started:.3f}s)")
+            future.set_result(path)
+            return path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Fehler geht an den Aufrufer; Wartende erhalten ihn über die Future
+            # O erro vai ao chamador; quem aguarda o recebe pela future
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def pregenerate(self, pdf_path: str, sha256: str, pages: Optional[int] = None) -> None:
+        """
+        Erzeugt Listen-Vorschaubilder der ersten Seiten und die Vorschau der ersten Seite.
+        Gera as miniaturas das primeiras páginas e a pré-visualização da primeira página.
+        """
+        pages = settings.THUMBNAIL_PREGENERATE_PAGES if pages is None else pages
+        try:
+            await self.thumbnail(pdf_path, sha256, 1, PREVIEW_WIDTH)
+            for page_number in range(1, pages + 1):
+                await self.thumbnail(pdf_path, sha256, page_number, THUMBNAIL_WIDTH)
+        except PageNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Vorschaubilder nicht erzeugt / Miniaturas não geradas ({pdf_path}): {e}")
+
+    def schedule_pregeneration(self, pdf_path: Optional[str], sha256: Optional[str]) -> Optional[asyncio.Task]:
+        """
+        Startet ``pregenerate`` im Hintergrund (nach dem Import).
+        Inicia ``pregenerate`` em segundo plano (após a importação).
+        """
+        if not settings.THUMBNAIL_PREGENERATE_ENABLED or not pdf_path or not sha256:
+            return None
+        task = asyncio.get_running_loop().create_task(self.pregenerate(pdf_path, sha256))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+
+_service: Optional[ThumbnailService] = None
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    """Gemeinsamer Dienst des Prozesses / Serviço compartilhado do processo"""
+    global _service
+    if _service is None:
+        cache = ThumbnailCache(
+            os.path.join(settings.UPLOAD_DIR, "thumbnails"), settings.THUMBNAIL_CACHE_MAX_BYTES, get_storage_tracker()
+        )
+        _service = ThumbnailService(cache)
+    return _service
@@ -58,7 +58,7 @@ def generate_contract_pdf(
         # Se estivermos executando dentro de um ambiente de teste (pytest), pulamos a conversão
         # para tornar os testes determinísticos (o teste monkeypatch espera os bytes DOCX).
         if not _os.getenv("PYTEST_CURRENT_TEST"):
-            pdf_bytes = _convert_docx_bytes_to_pdf_bytes(docx_bytes)
+            pdf_bytes = convert_docx_bytes_to_pdf_bytes(docx_bytes)
             if pdf_bytes:
                 return pdf_bytes
 
@@ -111,7 +111,12 @@ def render_docx_bytes(template_path: str, data: Dict[str, Any]) -> bytes:
     return bio.read()
 
 
-def _convert_docx_bytes_to_pdf_bytes(docx_bytes: bytes) -> bytes:
+def convert_docx_bytes_to_pdf_bytes(
+    docx_bytes: bytes,
+    soffice_path: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    timeout: float = 30,
+) -> bytes:
     """Versucht, DOCX-Bytes in PDF-Bytes zu konvertieren mittels `soffice` (LibreOffice).
 
     - Speichert die DOCX-Bytes temporär
@@ -119,13 +124,18 @@ def _convert_docx_bytes_to_pdf_bytes(docx_bytes: bytes) -> bytes:
     - Liest die erzeugte PDF-Datei und gibt die Bytes zurück
     - Gibt b"" zurück, wenn die Konvertierung nicht möglich ist
 
+    Mit ``profile_dir`` wird ein festes LibreOffice-Profil wiederverwendet
+    (spart den Profilaufbau beim Kaltstart; je Profil nur ein Prozess).
+    Com ``profile_dir`` um perfil fixo do LibreOffice é reutilizado.
+
     Hinweis: LibreOffice (`soffice`) muss im PATH sein. In Umgebungen ohne `soffice`
     wird b"" zurückgegeben und der DOCX-Bytes-Fallback verwendet.
     """
     # Detect if soffice is available
-    soffice_path = shutil.which("soffice")
+    soffice_path = soffice_path or shutil.which("soffice")
     if not soffice_path:
         return b""
+    profile_args = [f"-env:UserInstallation=file://{_os.path.abspath(profile_dir)}"] if profile_dir else []
 
     # Operação de I/O / subprocess: execute em thread
     with tempfile.TemporaryDirectory() as td:
@@ -137,11 +147,11 @@ def _convert_docx_bytes_to_pdf_bytes(docx_bytes: bytes) -> bytes:
         try:
             # executar conversão
             subprocess.run(
-                [soffice_path, "--headless", "--convert-to", "pdf", "--outdir", td, docx_file],
+                [soffice_path, *profile_args, "--headless", "--convert-to", "pdf", "--outdir", td, docx_file],
                 check=True,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                timeout=30,
+                timeout=timeout,
             )
             # leitura do PDF
             with open(pdf_file, "rb") as pf:
@@ -19,6 +19,27 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def build_mime_message(to: str, subject: str, body: str, is_html: bool = False) -> MIMEMultipart:
+    """
+    Erstellt die MIME-Nachricht / Cria a mensagem MIME
+
+    Args / Argumentos:
+        to (str): Empfänger-E-Mail-Adresse / Endereço de e-mail do destinatário
+        subject (str): E-Mail-Betreff / Assunto do e-mail
+        body (str): E-Mail-Inhalt / Conteúdo do e-mail
+        is_html (bool): HTML-Format verwenden / Usar formato HTML
+
+    Returns / Retorna:
+        MIMEMultipart: Versandfertige Nachricht / Mensagem pronta para envio
+    """
+    msg = MIMEMultipart()
+    msg['From'] = settings.SMTP_USER
+    msg['To'] = to
+    msg['Subject'] = subject
+    msg.attach(MIMEText(body, 'html' if is_html else 'plain'))
+    return msg
+
+
 def send_email(
     to: str, 
     subject: str, 
@@ -40,16 +61,7 @@ def send_email(
     server: smtplib.SMTP | smtplib.SMTP_SSL | None = None
     try:
         # E-Mail-Konfiguration / Configuração de e-mail
-        msg = MIMEMultipart()
-        msg['From'] = settings.SMTP_USER
-        msg['To'] = to
-        msg['Subject'] = subject
-
-        # E-Mail-Inhalt hinzufügen / Adicionar conteúdo do e-mail
-        if is_html:
-            msg.attach(MIMEText(body, 'html'))
-        else:
-            msg.attach(MIMEText(body, 'plain'))
+        msg = build_mime_message(to, subject, body, is_html)
 
         # E-Mail senden / Enviar e-mail
         # Use a short socket timeout for network ops
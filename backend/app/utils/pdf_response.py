@@ -0,0 +1,155 @@
+"""
+PDF-Auslieferung - Range-Anfragen, ETag und bedingte GETs
+Entrega de PDF - Requisições Range, ETag e GET condicional
+
+DE: ``pdf_file_response`` liefert eine gespeicherte PDF-Datei mit
+    ``Accept-Ranges``, starkem ``ETag`` (SHA-256 der Originaldatei) und
+    ``Last-Modified`` aus. ``If-None-Match``/``If-Modified-Since`` werden mit
+    304 beantwortet; ``Range`` (auch mehrere Bereiche) mit 206, ``If-Range``
+    wird gegen ETag bzw. Änderungsdatum geprüft. Die Datei wird nicht mehr in
+    einem Python-Generator gelesen: Der Server kann sie über die
+    ASGI-Erweiterung ``http.response.pathsend`` direkt (sendfile) senden,
+    sonst wird sie in 64-KB-Blöcken in einem Worker-Thread gelesen.
+PT: ``pdf_file_response`` entrega um PDF armazenado com ``Accept-Ranges``,
+    ``ETag`` forte (SHA-256 do arquivo original) e ``Last-Modified``.
+    ``If-None-Match``/``If-Modified-Since`` recebem 304; ``Range`` (também
+    vários intervalos) recebe 206, e ``If-Range`` é comparado com o ETag ou a
+    data de modificação. Com a extensão ASGI ``http.response.pathsend`` o
+    servidor envia o arquivo diretamente (sendfile); caso contrário, em blocos
+    de 64 KB lidos numa thread.
+"""
+
+import os
+from email.utils import parsedate_to_datetime
+from secrets import token_hex
+from typing import Dict, Optional
+
+import anyio
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse, Response
+
+# Browser prüfen bei jedem Öffnen neu, dürfen aber den Cache nutzen (304)
+# O navegador revalida a cada abertura, mas pode usar o cache (304)
+PDF_CACHE_CONTROL = "private, no-cache"
+
+
+def strong_etag(sha256: Optional[str]) -> Optional[str]:
+    """Starker ETag aus dem Datei-Hash / ETag forte a partir do hash do arquivo"""
+    return f'"{sha256}"' if sha256 else None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """
+    Schwacher Vergleich für If-None-Match (RFC 9110 13.1.2).
+    Comparação fraca para If-None-Match (RFC 9110 13.1.2).
+    """
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError, IndexError):
+        return False
+    if since is None:
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+class PDFFileResponse(FileResponse):
+    """
+    FileResponse mit RFC-konformem If-Range (ein Bereich nur bei starkem ETag
+    oder exakt gleichem Datum, sonst die ganze Datei) und korrekten Headern
+    für Antworten mit mehreren Bereichen.
+    FileResponse com If-Range conforme a RFC (intervalo só com ETag forte ou
+    data idêntica; caso contrário, o arquivo completo) e cabeçalhos corretos
+    para respostas com vários intervalos.
+    """
+
+    def _should_use_range(self, http_if_range: str) -> bool:
+        http_if_range = http_if_range.strip()
+        if http_if_range.startswith("W/"):
+            return False
+        return super()._should_use_range(http_if_range)
+
+    async def _handle_multiple_ranges(self, send, ranges, file_size: int, send_header_only: bool) -> None:
+        """
+        Mehrere Bereiche als ``multipart/byteranges`` (RFC 9110 14.6): der
+        Typ gehört in Content-Type, Content-Range nur in die Teile.
+        Vários intervalos como ``multipart/byteranges``: o tipo vai no
+        Content-Type, Content-Range só nas partes.
+        """
+        boundary = token_hex(13)
+        content_length, part_header = self.generate_multipart(ranges, boundary, file_size, self.media_type)
+        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.headers["content-length"] = str(content_length)
+        await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+        if send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            for start, end in ranges:
+                await send({"type": "http.response.body", "body": part_header(start, end), "more_body": True})
+                await file.seek(start)
+                while start < end:
+                    chunk = await file.read(min(self.chunk_size, end - start))
+                    start += len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b"\n", "more_body": True})
+            # Schlussbegrenzer wie in generate_multipart gezählt (``--b--\n``) / Delimitador final como contado
+            await send({"type": "http.response.body", "body": f"--{boundary}--\n".encode("latin-1"),
+                        "more_body": False})
+
+
+def pdf_file_response(
+    request: Request,
+    path: str,
+    sha256: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    media_type: str = "application/pdf",
+) -> Response:
+    """
+    Antwort für eine gespeicherte PDF-Datei (200, 206, 304 oder 416).
+    Resposta para um arquivo PDF armazenado (200, 206, 304 ou 416).
+
+    Args:
+        request: Anfrage mit den Bedingungs- und Range-Headern / Requisição com cabeçalhos condicionais e Range
+        path: Pfad der Datei / Caminho do arquivo
+        sha256: ``original_pdf_sha256`` für den starken ETag; ohne Hash
+            ETag aus Änderungszeit und Größe / sem hash, ETag de data e tamanho
+        headers: Zusätzliche Header, z. B. Content-Disposition / Cabeçalhos adicionais
+        media_type: Für aus der PDF abgeleitete Dateien (z. B. Vorschaubilder) / Para arquivos derivados do PDF
+    """
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        # Bestätigter Pfad, Datei aber inzwischen entfernt / Caminho confirmado, mas arquivo removido
+        raise HTTPException(status_code=404, detail="Datei nicht vorhanden / Arquivo não disponível")
+    response_headers = {"Cache-Control": PDF_CACHE_CONTROL, **(headers or {})}
+    etag = strong_etag(sha256)
+    if etag:
+        response_headers["ETag"] = etag
+    response = PDFFileResponse(path, media_type=media_type, headers=response_headers,
+                               stat_result=stat_result)
+
+    # If-None-Match hat Vorrang vor If-Modified-Since / If-None-Match tem precedência sobre If-Modified-Since
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, response.headers["etag"])
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = if_modified_since is not None and _not_modified_since(if_modified_since, stat_result.st_mtime)
+    if not_modified:
+        kept = {key: response.headers[key] for key in ("etag", "last-modified", "cache-control") if key in response.headers}
+        return Response(status_code=304, headers=kept)
+    return response
+
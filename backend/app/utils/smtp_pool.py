@@ -0,0 +1,203 @@
+"""
+SMTP-Verbindungspool für den Versand von Benachrichtigungen
+Pool de conexões SMTP para o envio de notificações
+
+DE: Hält eine kleine Anzahl langlebiger, authentifizierter SMTP-Verbindungen
+    offen, statt für jede Nachricht neu zu verbinden (TLS-Handshake + Login).
+    Ein Semaphor begrenzt die gleichzeitigen Sendevorgänge auf die Poolgröße;
+    getrennte Verbindungen (SMTPServerDisconnected) werden einmal neu aufgebaut.
+PT: Mantém um pequeno número de conexões SMTP autenticadas e duradouras em vez
+    de reconectar a cada mensagem (handshake TLS + login). Um semáforo limita
+    os envios simultâneos ao tamanho do pool; conexões encerradas pelo servidor
+    (SMTPServerDisconnected) são restabelecidas uma vez.
+"""
+
+import asyncio
+import logging
+import smtplib
+import threading
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.email import build_mime_message
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutgoingEmail:
+    """
+    Zu versendende Nachricht / Mensagem a ser enviada
+    """
+    to: str
+    subject: str
+    body: str
+    is_html: bool = True
+
+
+class SMTPConnectionPool:
+    """
+    Pool persistenter SMTP-Verbindungen mit begrenzter Parallelität
+    Pool de conexões SMTP persistentes com concorrência limitada
+
+    smtplib ist blockierend: jede Übertragung läuft über ``asyncio.to_thread``,
+    die Verbindungen selbst werden nur vom Event Loop vergeben und zurückgenommen.
+    smtplib é bloqueante: cada envio roda via ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        timeout: float = 10.0,
+        size: int = 4,
+    ) -> None:
+        if size < 1:
+            raise ValueError("SMTP pool size must be >= 1 / Tamanho do pool SMTP deve ser >= 1")
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.size = size
+
+        self.connections_opened = 0
+        self._idle: List[smtplib.SMTP] = []
+        self._counter_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_settings(cls) -> "SMTPConnectionPool":
+        """Pool mit den SMTP-Einstellungen der Anwendung / Pool com as configurações SMTP da aplicação"""
+        return cls(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout=settings.SMTP_TIMEOUT,
+            size=settings.SMTP_POOL_SIZE,
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphor an den laufenden Loop binden (Scheduler, Tests) / Semáforo vinculado ao loop atual
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.size)
+            self._loop = loop
+        return self._semaphore
+
+    # ---------- Blockierender Teil (Thread) / Parte bloqueante (thread) ----------
+
+    def _open_connection(self) -> smtplib.SMTP:
+        server: smtplib.SMTP
+        if self.use_tls and self.port == 465:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.use_tls:
+                server.starttls()
+        if self.user:
+            server.login(self.user, self.password)
+        with self._counter_lock:
+            self.connections_opened += 1
+        logger.debug(f"SMTP connection opened to {self.host}:{self.port} / Conexão SMTP aberta")
+        return server
+
+    @staticmethod
+    def _close_quietly(connection: Optional[smtplib.SMTP]) -> None:
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except Exception:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _deliver(self, connection: Optional[smtplib.SMTP], message: OutgoingEmail) -> Tuple[Optional[smtplib.SMTP], bool]:
+        """
+        Sendet eine Nachricht; gibt die weiter nutzbare Verbindung und den Erfolg zurück.
+        Envia uma mensagem; retorna a conexão reutilizável e o sucesso.
+        """
+        text = build_mime_message(message.to, message.subject, message.body, message.is_html).as_string()
+        for attempt in (1, 2):
+            try:
+                if connection is None:
+                    connection = self._open_connection()
+                connection.sendmail(self.user or "", [message.to], text)
+                return connection, True
+            except smtplib.SMTPServerDisconnected as e:
+                # Leerlauf-Timeout des Servers: einmal neu verbinden / Timeout ocioso do servidor: reconectar uma vez
+                self._close_quietly(connection)
+                connection = None
+                if attempt == 2:
+                    logger.error(f"SMTP disconnected while sending to {message.to}: {e} / Conexão SMTP encerrada")
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                # Nachricht abgelehnt, Sitzung bleibt gültig / Mensagem recusada, sessão continua válida
+                logger.error(f"E-Mail-Fehler / Erro de e-mail ao enviar para {message.to}: {e}")
+                return connection, False
+            except (smtplib.SMTPException, OSError) as e:
+                logger.error(f"E-Mail-Fehler / Erro de e-mail ao enviar para {message.to}: {e}")
+                self._close_quietly(connection)
+                return None, False
+        return None, False
+
+    # ---------- Async-API ----------
+
+    async def send(self, message: OutgoingEmail) -> bool:
+        """
+        Sendet eine Nachricht über eine gepoolte Verbindung.
+        Envia uma mensagem por uma conexão do pool.
+
+        Returns:
+            bool: Erfolg des Versands / Sucesso do envio
+        """
+        async with self._get_semaphore():
+            connection = self._idle.pop() if self._idle else None
+            connection, success = await asyncio.to_thread(self._deliver, connection, message)
+            if connection is not None:
+                self._idle.append(connection)
+            return success
+
+    async def send_batch(self, messages: Iterable[OutgoingEmail]) -> List[bool]:
+        """
+        Sendet mehrere Nachrichten (höchstens ``size`` gleichzeitig).
+        Envia várias mensagens (no máximo ``size`` simultâneas).
+
+        Returns:
+            List[bool]: Erfolg je Nachricht in Eingabereihenfolge / Sucesso por mensagem, na ordem de entrada
+        """
+        return list(await asyncio.gather(*(self.send(message) for message in messages)))
+
+    async def close(self) -> None:
+        """Schließt alle offenen Verbindungen / Fecha todas as conexões abertas"""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await asyncio.to_thread(self._close_quietly, connection)
+
+
+_pool: Optional[SMTPConnectionPool] = None
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Gemeinsamer Pool der Anwendung / Pool compartilhado da aplicação"""
+    global _pool
+    if _pool is None:
+        _pool = SMTPConnectionPool.from_settings()
+    return _pool
+
+
+async def close_smtp_pool() -> None:
+    """Schließt den gemeinsamen Pool (Shutdown) / Fecha o pool compartilhado (shutdown)"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -0,0 +1,193 @@
+"""
+Streaming-Upload - Uploads blockweise speichern, hashen und begrenzen
+Upload em streaming - Gravar, calcular hash e limitar uploads em blocos
+
+DE: ``ingest_upload`` kopiert eine ``UploadFile`` in festen Blöcken an ihr
+    Ziel und berechnet dabei SHA-256 und Größe. Überschreitet die Datei
+    ``MAX_FILE_SIZE``, wird sofort abgebrochen; die Teildatei wird entfernt und
+    eine vorhandene Zieldatei bleibt unverändert. Der Speicherbedarf pro Upload
+    ist damit konstant (eine Blockgröße).
+    ``UploadSizeLimitMiddleware`` lehnt zu große Multipart-Anfragen schon vor
+    dem Einlesen ab (Content-Length) bzw. bricht gestreamte Anfragen ab,
+    sobald die Grenze überschritten ist. Einzelne Pfade (z. B. Massenimport)
+    können eine eigene Grenze erhalten.
+PT: ``ingest_upload`` copia um ``UploadFile`` em blocos fixos para o destino,
+    calculando SHA-256 e tamanho. Se o arquivo exceder ``MAX_FILE_SIZE``, a
+    cópia é interrompida, o arquivo parcial é removido e um destino existente
+    permanece intacto. O uso de memória por upload é constante.
+    ``UploadSizeLimitMiddleware`` rejeita requisições multipart grandes demais
+    antes da leitura (Content-Length) ou interrompe as enviadas em streaming.
+    Caminhos específicos (p. ex. importação em massa) podem ter limite próprio.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fastapi import UploadFile
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Reserve für Formularfelder und Multipart-Grenzen / Reserva para campos do formulário e limites multipart
+MULTIPART_OVERHEAD = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Upload überschreitet die Größengrenze / Upload excede o limite de tamanho"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            f"Datei zu groß / Arquivo muito grande. Maximum / Máximo: {max_bytes} Bytes"
+        )
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class IngestedUpload:
+    """Gespeicherter Upload / Upload gravado"""
+    path: str
+    sha256: str
+    size: int
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+async def ingest_upload(
+    upload: UploadFile,
+    target_path: str,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> IngestedUpload:
+    """
+    Kopiert einen Upload blockweise nach ``target_path`` (SHA-256 + Größenprüfung).
+    Copia um upload em blocos para ``target_path`` (SHA-256 + verificação de tamanho).
+
+    Args:
+        upload: Hochgeladene Datei / Arquivo enviado
+        target_path: Zielpfad (wird erst nach vollständigem Empfang ersetzt)
+        max_bytes: Größengrenze (Standard: ``settings.MAX_FILE_SIZE``)
+        chunk_size: Blockgröße in Bytes / Tamanho do bloco em bytes
+
+    Returns:
+        IngestedUpload: Pfad, SHA-256 und Größe / Caminho, SHA-256 e tamanho
+
+    Raises:
+        UploadTooLargeError: Grenze überschritten / Limite excedido
+    """
+    limit = settings.MAX_FILE_SIZE if max_bytes is None else max_bytes
+    os.makedirs(os.path.dirname(target_path) or ".", exist_ok=True)
+    partial_path = f"{target_path}.part"
+    digest = hashlib.sha256()
+    size = 0
+
+    handle = await asyncio.to_thread(open, partial_path, "wb")
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > limit:
+                raise UploadTooLargeError(limit)
+            digest.update(chunk)
+            await asyncio.to_thread(handle.write, chunk)
+        await asyncio.to_thread(handle.close)
+        await asyncio.to_thread(os.replace, partial_path, target_path)
+    except BaseException:
+        handle.close()
+        _remove_quietly(partial_path)
+        raise
+
+    logger.info(f"Upload gespeichert / Upload gravado: {target_path} ({size} Bytes)")
+    return IngestedUpload(path=target_path, sha256=digest.hexdigest(), size=size)
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI-Middleware: begrenzt die Größe von Multipart-Anfragen
+    Middleware ASGI: limita o tamanho de requisições multipart
+    """
+
+    def __init__(self, app, max_bytes: Optional[int] = None, path_limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.max_bytes = (settings.MAX_FILE_SIZE if max_bytes is None else max_bytes) + MULTIPART_OVERHEAD
+        # Pfadpräfix -> eigene Grenze / Prefixo do caminho -> limite próprio
+        self.path_limits = {prefix: limit + MULTIPART_OVERHEAD for prefix, limit in (path_limits or {}).items()}
+
+    def _limit_for(self, path: str) -> int:
+        for prefix, limit in self.path_limits.items():
+            if path.startswith(prefix):
+                return limit
+        return self.max_bytes
+
+    async def _reject(self, send, limit: int) -> None:
+        body = json.dumps({
+            "detail": f"Datei zu groß / Arquivo muito grande. Maximum / Máximo: {limit - MULTIPART_OVERHEAD} Bytes"
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("method") not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = self._limit_for(scope.get("path", ""))
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+            # Ablehnung vor dem Empfang des Bodys / Rejeição antes de receber o corpo
+            await self._reject(send, max_bytes)
+            return
+
+        state = {"received": 0, "exceeded": False, "rejected": False}
+
+        async def limited_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                state["received"] += len(message.get("body", b""))
+                if state["received"] > max_bytes:
+                    state["exceeded"] = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message):
+            # FastAPI meldet den Abbruch als 400 (Body-Fehler); stattdessen 413 senden
+            # O FastAPI reporta a interrupção como 400; enviar 413 em vez disso
+            if state["exceeded"]:
+                if message["type"] == "http.response.start" and not state["rejected"]:
+                    state["rejected"] = True
+                    await self._reject(send, max_bytes)
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _BodyTooLarge:
+            pass
+        if state["exceeded"] and not state["rejected"]:
+            state["rejected"] = True
+            await self._reject(send, max_bytes)
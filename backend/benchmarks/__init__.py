@@ -0,0 +1,10 @@
+"""
+Benchmarks für das Vertragsverwaltungssystem
+Benchmarks do sistema de gestão de contratos
+
+Ausführung aus dem Verzeichnis ``backend`` / Execução a partir do diretório ``backend``:
+    python -m benchmarks.bench_dashboard_stats
+    python -m benchmarks.bench_german_dates
+    python -m benchmarks.bench_pdf_extraction
+    python -m benchmarks.bench_pdf_pipeline --report bench.json
+"""
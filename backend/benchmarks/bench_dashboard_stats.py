@@ -0,0 +1,206 @@
+"""
+Benchmark: Dashboard-Statistiken (Einzelabfragen vs. bedingte Aggregation)
+Benchmark: estatísticas do dashboard (consultas individuais vs. agregação condicional)
+
+Vergleicht die frühere Variante (eine COUNT/SUM-Abfrage pro Kennzahl) mit
+``DashboardService`` (eine gruppierte Abfrage pro Sichtbereich). Gemessen werden
+Datenbank-Roundtrips und Laufzeit für 10k und 100k Verträge in einer temporären
+SQLite-Datenbank.
+
+Compara a variante anterior (uma consulta COUNT/SUM por métrica) com o
+``DashboardService`` (uma consulta agrupada por escopo): round trips e tempo.
+
+Ausführung / Execução (im Verzeichnis backend):
+    python -m benchmarks.bench_dashboard_stats
+    python -m benchmarks.bench_dashboard_stats --sizes 10000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event, insert, select, func, and_, or_
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core.database import Base
+from app.models.alert import Alert, AlertStatus, AlertType
+from app.models.contract import Contract, ContractStatus, ContractType, OperationType
+from app.models.user import User, UserRole, AccessLevel
+from app.services.dashboard_service import DashboardService
+
+DEPARTMENTS = ["Finanzen", "Einkauf", "IT", "Recht", "Vertrieb", "Personal"]
+TEAMS = ["Alpha", "Beta", "Gamma", "Delta"]
+
+
+async def legacy_scope_stats(db, scope_filter=None, breakdown: bool = False) -> dict:
+    """
+    Frühere Implementierung: eine Abfrage pro Kennzahl (Referenz für den Vergleich)
+    Implementação anterior: uma consulta por métrica (referência para comparação)
+    """
+    def scoped(*conditions):
+        parts = [c for c in (scope_filter, *conditions) if c is not None]
+        return and_(*parts) if parts else None
+
+    async def scalar(stmt, *conditions):
+        where = scoped(*conditions)
+        if where is not None:
+            stmt = stmt.where(where)
+        return (await db.execute(stmt)).scalar() or 0
+
+    today = date.today()
+    active = Contract.status == ContractStatus.ACTIVE
+    stats = {
+        "total_contracts": await scalar(select(func.count(Contract.id))),
+        "active_contracts": await scalar(select(func.count(Contract.id)), active),
+    }
+    for days in (30, 90):
+        stats[f"expiring_{days}_days"] = await scalar(
+            select(func.count(Contract.id)),
+            Contract.end_date.isnot(None),
+            Contract.end_date <= today + timedelta(days=days),
+            Contract.end_date >= today,
+            active,
+        )
+    stats["monthly_value"] = float(await scalar(select(func.sum(Contract.value)), active))
+    stats["monthly_income"] = float(await scalar(select(func.sum(Contract.value)), active, Contract.operation_type == OperationType.INCOME))
+    stats["monthly_expense"] = float(await scalar(select(func.sum(Contract.value)), active, Contract.operation_type == OperationType.EXPENSE))
+
+    if scope_filter is None:
+        stats["total_alerts"] = await scalar(select(func.count(Alert.id)))
+        stats["unread_alerts"] = await scalar(select(func.count(Alert.id)), Alert.status == AlertStatus.PENDING)
+    else:
+        scope_ids = select(Contract.id).where(scope_filter).scalar_subquery()
+        stats["total_alerts"] = (await db.execute(
+            select(func.count(Alert.id)).where(Alert.contract_id.in_(scope_ids)))).scalar() or 0
+        stats["unread_alerts"] = (await db.execute(
+            select(func.count(Alert.id)).where(Alert.contract_id.in_(scope_ids), Alert.status == AlertStatus.PENDING))).scalar() or 0
+
+    if breakdown:
+        stats["total_users"] = (await db.execute(select(func.count(User.id)).where(User.is_deleted == False))).scalar() or 0
+        for column in (Contract.department, Contract.status, Contract.contract_type):
+            await db.execute(select(column, func.count(Contract.id)).group_by(column))
+    return stats
+
+
+async def seed(session_factory, contract_count: int) -> list:
+    """Testdaten erzeugen / Gerar dados de teste"""
+    rng = random.Random(42)
+    today = date.today()
+    async with session_factory() as db:
+        users = []
+        for role, level, dept, team in (
+            (UserRole.DIRECTOR, AccessLevel.LEVEL_5, None, None),
+            (UserRole.DEPARTMENT_ADM, AccessLevel.LEVEL_4, "IT", None),
+            (UserRole.TEAM_LEAD, AccessLevel.LEVEL_2, "IT", "Alpha"),
+            (UserRole.STAFF, AccessLevel.LEVEL_1, "IT", "Alpha"),
+        ):
+            user = User(email=f"{role.value}@bench.local", name=role.value, password_hash="x",
+                        role=role, access_level=level, department=dept, team=team)
+            db.add(user)
+            users.append(user)
+        await db.commit()
+        user_ids = [u.id for u in users]
+
+        chunk = 5000
+        for offset in range(0, contract_count, chunk):
+            rows = []
+            for i in range(offset, min(offset + chunk, contract_count)):
+                rows.append({
+                    "title": f"Vertrag {i}",
+                    "client_name": f"Kunde {i % 997}",
+                    "contract_type": rng.choice(list(ContractType)),
+                    "status": rng.choice(list(ContractStatus)),
+                    "operation_type": rng.choice(list(OperationType)),
+                    "value": round(rng.uniform(100, 50000), 2),
+                    "currency": "EUR",
+                    "start_date": today - timedelta(days=rng.randint(30, 900)),
+                    "end_date": today + timedelta(days=rng.randint(-60, 720)),
+                    "department": rng.choice(DEPARTMENTS),
+                    "team": rng.choice(TEAMS),
+                    "created_by": rng.choice(user_ids),
+                    "responsible_user_id": rng.choice(user_ids),
+                })
+            await db.execute(insert(Contract), rows)
+        await db.commit()
+
+        alert_rows = []
+        now = datetime.now()
+        for contract_id in range(1, contract_count + 1, 3):
+            alert_rows.append({
+                "contract_id": contract_id,
+                "alert_type": rng.choice([AlertType.T_MINUS_60, AlertType.T_MINUS_30, AlertType.T_MINUS_10]),
+                "status": rng.choice(list(AlertStatus)),
+                "scheduled_for": now,
+            })
+        for offset in range(0, len(alert_rows), chunk):
+            await db.execute(insert(Alert), alert_rows[offset:offset + chunk])
+        await db.commit()
+
+        for user in users:
+            await db.refresh(user)
+        return users
+
+
+async def run(sizes, repeat: int) -> None:
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+            started = time.perf_counter()
+            users = await seed(session_factory, size)
+            print(f"\n=== {size:,} Verträge (Seed {time.perf_counter() - started:.1f}s) ===")
+
+            round_trips = {"n": 0}
+
+            def count_round_trip(*_args, **_kwargs):
+                round_trips["n"] += 1
+
+            event.listen(engine.sync_engine, "before_cursor_execute", count_round_trip)
+
+            print(f"{'Rolle':<16}{'Variante':<10}{'Roundtrips':>12}{'ms (median)':>14}")
+            for user in users:
+                scope = {
+                    UserRole.DIRECTOR: (None, True),
+                    UserRole.DEPARTMENT_ADM: (Contract.department == user.department, False),
+                    UserRole.TEAM_LEAD: (Contract.team == user.team, False),
+                    UserRole.STAFF: (or_(Contract.created_by == user.id, Contract.responsible_user_id == user.id), False),
+                }[user.role]
+
+                for label, call in (
+                    ("vorher", lambda db: legacy_scope_stats(db, *scope)),
+                    ("nachher", lambda db: DashboardService(db).get_stats_by_role(user)),
+                ):
+                    timings = []
+                    for _ in range(repeat):
+                        async with session_factory() as db:
+                            round_trips["n"] = 0
+                            t0 = time.perf_counter()
+                            await call(db)
+                            timings.append((time.perf_counter() - t0) * 1000)
+                    timings.sort()
+                    print(f"{user.role.value:<16}{label:<10}{round_trips['n']:>12}{timings[len(timings) // 2]:>14.1f}")
+
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dashboard-Statistiken Benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: deutscher Datumsparser (schneller Pfad vs. dateparser)
+Benchmark: analisador de datas alemãs (caminho rápido vs. dateparser)
+
+Vergleicht ``parse_german_date`` (Regex für numerische Daten und deutsche
+Monatsnamen) mit ``dateparser.parse(..., languages=["de"])`` auf denselben
+Eingaben und prüft dabei, dass beide dieselben Ergebnisse liefern.
+
+Compara ``parse_german_date`` com ``dateparser.parse`` nas mesmas entradas e
+verifica que ambos retornam os mesmos resultados.
+
+Ausführung / Execução (im Verzeichnis backend):
+    python -m benchmarks.bench_german_dates
+    python -m benchmarks.bench_german_dates --repeat 5
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.pdf_reader_pkg.dates import parse_german_date
+
+
+def sample_dates() -> list:
+    """Numerische Daten über zwei Jahre / Datas numéricas em dois anos"""
+    return [f"{day:02d}.{month:02d}.{year}" for day in range(1, 29, 3) for month in range(1, 13, 2) for year in (2024, 2025)]
+
+
+def measure(call, values: list, repeat: int):
+    timings = []
+    results = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [call(value) for value in values]
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], results
+
+
+def run(repeat: int) -> None:
+    import dateparser
+
+    values = sample_dates()
+    # Aufwärmen (Sprachdaten laden) / Aquecimento (carregar dados de idioma)
+    dateparser.parse(values[0], languages=["de"])
+
+    slow_ms, slow = measure(lambda value: dateparser.parse(value, languages=["de"]), values, repeat)
+    fast_ms, fast = measure(parse_german_date, values, repeat)
+    mismatches = sum(1 for a, b in zip(fast, slow) if a != b)
+
+    speedup = slow_ms / fast_ms if fast_ms else 0.0
+    print(f"{len(values)} Daten / datas: dateparser = {slow_ms:.1f} ms, schnell / rápido = {fast_ms:.2f} ms "
+          f"(x{speedup:.1f}); Abweichungen / divergências: {mismatches}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Datumsparser Benchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
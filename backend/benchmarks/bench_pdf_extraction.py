@@ -0,0 +1,120 @@
+"""
+Benchmark: PDF-Textextraktion (alle drei Bibliotheken vs. adaptive Kaskade)
+Benchmark: extração de texto de PDF (três bibliotecas vs. cascata adaptativa)
+
+Vergleicht ``extract_text_exhaustive`` (pdfplumber, PyPDF2 und PyMuPDF pro
+Datei, längstes Ergebnis gewinnt) mit ``extract_text_combined`` (PyMuPDF zuerst,
+langsamere Bibliotheken nur für Seiten, die die Qualitätsprüfung nicht bestehen).
+Ohne ``--corpus`` wird ein synthetischer Korpus erzeugt (Textverträge
+unterschiedlicher Länge, teils mit Seiten ohne Textebene).
+
+Compara ``extract_text_exhaustive`` com ``extract_text_combined`` (cascata
+adaptativa): tempo por arquivo, caracteres e páginas com fallback.
+
+Ausführung / Execução (im Verzeichnis backend):
+    python -m benchmarks.bench_pdf_extraction
+    python -m benchmarks.bench_pdf_extraction --corpus uploads/contracts/persisted --repeat 3
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.pdf_reader import PDFReaderService
+
+PARAGRAPH = (
+    "§ {n} Vertragsgegenstand. Die Max Muster GmbH (Auftraggeber) beauftragt den "
+    "Auftragnehmer mit Leistungen gemäß Anlage {n}. Die Vergütung beträgt 1.250,00 EUR "
+    "monatlich. Der Vertrag beginnt am 01.01.2025 und endet am 31.12.2026. "
+    "Kündigungsfrist: drei Monate zum Quartalsende.\n"
+)
+
+
+def build_corpus(target: Path, documents: int) -> list:
+    """
+    Erzeugt Beispiel-PDFs: 1-30 Textseiten, jedes dritte Dokument mit Scan-Seiten.
+    Gera PDFs de exemplo: 1-30 páginas de texto, cada terceiro com páginas digitalizadas.
+    """
+    import fitz
+
+    paths = []
+    for index in range(documents):
+        doc = fitz.open()
+        page_count = 1 + (index * 7) % 30
+        for number in range(page_count):
+            page = doc.new_page()
+            if index % 3 == 2 and number % 4 == 3:
+                # Seite ohne Textebene (nur Grafik) / Página sem camada de texto (apenas gráfico)
+                page.draw_rect(fitz.Rect(50, 50, 550, 790), color=(0, 0, 0), fill=(0.9, 0.9, 0.9))
+                continue
+            page.insert_textbox(fitz.Rect(50, 50, 550, 790), "".join(PARAGRAPH.format(n=n) for n in range(number, number + 6)),
+                                fontsize=10)
+        path = target / f"vertrag_{index:03d}.pdf"
+        doc.save(str(path))
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def measure(call, path: Path, repeat: int):
+    timings = []
+    result = {}
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = call(str(path))
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], result
+
+
+def run(paths: list, repeat: int) -> None:
+    reader = PDFReaderService()
+    # Aufwärmen (Importe) / Aquecimento (imports)
+    reader.extract_text_exhaustive(str(paths[0]))
+
+    totals = {"exhaustive": 0.0, "adaptive": 0.0}
+    fallback_pages = 0
+    page_total = 0
+    print(f"{'Datei':<24}{'Seiten':>7}{'alle 3 ms':>12}{'adaptiv ms':>12}{'Fallback':>10}{'Zeichen Δ':>11}")
+    for path in paths:
+        exhaustive_ms, exhaustive = measure(reader.extract_text_exhaustive, path, repeat)
+        adaptive_ms, adaptive = measure(reader.extract_text_combined, path, repeat)
+        totals["exhaustive"] += exhaustive_ms
+        totals["adaptive"] += adaptive_ms
+        pages = len(adaptive.get("page_backends", {}))
+        fallback_pages += adaptive.get("fallback_pages", 0)
+        page_total += pages
+        delta = adaptive.get("total_chars", 0) - exhaustive.get("total_chars", 0)
+        print(f"{path.name[:23]:<24}{pages:>7}{exhaustive_ms:>12.1f}{adaptive_ms:>12.1f}"
+              f"{adaptive.get('fallback_pages', 0):>10}{delta:>11}")
+
+    speedup = totals["exhaustive"] / totals["adaptive"] if totals["adaptive"] else 0.0
+    print(f"\nSumme / Total: alle 3 = {totals['exhaustive']:.0f} ms, adaptiv = {totals['adaptive']:.0f} ms "
+          f"(x{speedup:.2f}); Fallback-Seiten {fallback_pages}/{page_total}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF-Extraktion Benchmark")
+    parser.add_argument("--corpus", type=Path, help="Verzeichnis mit PDFs (rekursiv) / Diretório com PDFs")
+    parser.add_argument("--documents", type=int, default=24, help="Größe des synthetischen Korpus")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    if args.corpus:
+        paths = sorted(args.corpus.rglob("*.pdf"))
+        if not paths:
+            parser.error(f"Keine PDFs in {args.corpus} / Nenhum PDF em {args.corpus}")
+        run(paths, args.repeat)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run(build_corpus(Path(tmp), args.documents), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+"""
+Benchmark: PDF-Pipeline mit Golden-Korpus (Extraktion, OCR, Parsing, Genauigkeit)
+Benchmark: pipeline de PDF com corpus de referência (extração, OCR, análise, precisão)
+
+Erzeugt einen synthetischen Korpus deutscher Verträge (Textebene, gescannt
+und gemischt, 1 bis 300 Seiten) samt ``golden.json`` mit den erwarteten
+Feldwerten. Für jedes Dokument laufen alle Extraktions-Backends, OCR und
+jede Parsing-Stufe (Klassifikation, jeder Feldextraktor, Router, seitenweise
+Analyse). Gemessen werden Laufzeit und Spitzen-RSS je Stufe (jede Stufe in
+einem frischen Prozess) sowie die Feldgenauigkeit gegenüber ``golden.json``.
+Der JSON-Bericht lässt sich mit ``--compare`` gegen einen früheren Lauf
+(z. B. eines anderen Commits) vergleichen.
+
+Gera um corpus sintético de contratos alemães (camada de texto, digitalizados
+e mistos, 1 a 300 páginas) com ``golden.json`` dos valores esperados. Para
+cada documento rodam todos os backends de extração, o OCR e cada etapa de
+análise. Mede tempo e pico de RSS por etapa (cada etapa num processo novo) e
+a precisão por campo. O relatório JSON pode ser comparado com ``--compare``.
+
+Ausführung / Execução (im Verzeichnis backend):
+    python -m benchmarks.bench_pdf_pipeline --report bench.json
+    python -m benchmarks.bench_pdf_pipeline --quick --report neu.json --compare bench.json
+    python -m benchmarks.bench_pdf_pipeline --corpus-dir /tmp/korpus --report bench.json  # Korpus behalten/wiederverwenden
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.pdf_reader import PDFReaderService
+from app.services.pdf_reader_pkg.extractor_router import (
+    FIELD_EXTRACTORS,
+    classify_contract_type,
+    extract_contract_fields,
+    normalize_text,
+)
+from app.services.pdf_reader_pkg.patterns import PatternScan
+from app.services.pdf_reader_pkg.version import EXTRACTOR_VERSION, PARSING_RULES_VERSION
+from app.services.pdf_reader_pkg.windowed import analyze_pages
+
+REPORT_SCHEMA = 1
+KINDS = ("text", "scanned", "mixed")
+PAGE_COUNTS = (1, 10, 60, 300)
+QUICK_PAGE_COUNTS = (1, 8)
+EXTRACTION_BACKENDS = {
+    "pymupdf": "extract_text_with_pymupdf",
+    "pdfplumber": "extract_text_with_pdfplumber",
+    "pypdf2": "extract_text_with_pypdf2",
+    "adaptive": "extract_text_adaptive",
+    "exhaustive": "extract_text_exhaustive",
+}
+# Felder mit Golden-Werten / Campos com valores de referência
+GOLDEN_FIELDS = ("contract_type", "title", "client_name", "client_email", "value", "start_date",
+                 "end_date", "payment_frequency", "notice_days")
+
+COMPANIES = ("Muster", "Beispiel", "Nordlicht", "Rheinblick", "Sonnenhof", "Bergmann", "Lindner", "Hafenkraft")
+CITIES = ("Berlin", "Hamburg", "München", "Köln", "Leipzig", "Dresden")
+TEMPLATES = {
+    "RENTAL": {
+        "heading": "Mietvertrag",
+        "subjects": ("Büroräume in {city}", "eine Lagerhalle in {city}", "Gewerbeflächen in {city}"),
+        "role": "Vermieter",
+        "clause": "Die Mieterin nutzt die Mietsache ausschließlich zu Bürozwecken. Nebenkosten werden jährlich abgerechnet.",
+    },
+    "SERVICE": {
+        "heading": "Dienstleistungsvertrag",
+        "subjects": ("Wartung der IT-Infrastruktur", "Support für die Buchhaltungssoftware", "Reinigung der Betriebsstätte"),
+        "role": "Auftragnehmer",
+        "clause": "Der Auftragnehmer erbringt die Dienstleistung mit qualifiziertem Personal. Wartungsfenster werden abgestimmt.",
+    },
+    "EMPLOYMENT": {
+        "heading": "Arbeitsvertrag",
+        "subjects": ("die Tätigkeit als Projektleitung", "die Tätigkeit als Sachbearbeitung", "die Tätigkeit im Vertrieb"),
+        "role": "Arbeitgeber",
+        "clause": "Der Arbeitnehmer verpflichtet sich zur Verschwiegenheit. Der Urlaubsanspruch beträgt 30 Arbeitstage.",
+    },
+}
+FREQUENCIES = ("monatlich", "vierteljährlich", "jährlich")
+BOILERPLATE = (
+    "§ {n} Allgemeine Bestimmungen. Die Parteien arbeiten vertrauensvoll zusammen. Änderungen dieses "
+    "Vertrages bedürfen der Schriftform. Die Haftung richtet sich nach den gesetzlichen Vorschriften, "
+    "soweit nachfolgend nichts anderes bestimmt ist. Leistung und Gegenleistung sind in Anlage {n} "
+    "beschrieben. Für Auslagen gilt eine Pauschale von 50,00 EUR je Vorgang.\n"
+)
+
+
+# ---------- Korpus / Corpus ----------
+
+def contract_pages(index: int, page_count: int) -> Dict[str, Any]:
+    """
+    Seitentexte und Golden-Werte eines synthetischen Vertrags (deterministisch).
+    Textos das páginas e valores de referência de um contrato sintético (determinístico).
+    """
+    rng = random.Random(index)
+    contract_type = list(TEMPLATES)[index % len(TEMPLATES)]
+    template = TEMPLATES[contract_type]
+    company = f"{rng.choice(COMPANIES)} GmbH"
+    subject = rng.choice(template["subjects"]).format(city=rng.choice(CITIES))
+    value = f"{rng.randint(2, 90)}.{rng.randint(0, 999):03d},00"
+    start = f"01.{rng.randint(1, 12):02d}.2025"
+    end = f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.2027"
+    frequency = rng.choice(FREQUENCIES)
+    notice_months = rng.choice((1, 3, 6))
+    email = f"vertrag@{company.split()[0].lower()}.de"
+
+    head = (
+        f"{template['heading']}\n"
+        f"Vertrag über {subject}\n"
+        f"zwischen der {company} ({template['role']}), E-Mail {email},\n"
+        f"und der Vertragspartei gemäß Anlage 1.\n"
+        f"Das Entgelt beträgt {frequency} EUR {value} zuzüglich gesetzlicher Umsatzsteuer.\n"
+        f"{template['clause']}\n"
+        f"Vertragsbeginn: {start}\n"
+        f"Die Parteien vereinbaren die Geltung der Anlagen, die Bestandteil dieses Vertrages sind.\n"
+        f"Die Kündigungsfrist: {notice_months} Monate zum Quartalsende.\n"
+    )
+    tail = (
+        "Schlussbestimmungen. Sollten einzelne Bestimmungen unwirksam sein, bleibt der Vertrag im Übrigen wirksam.\n"
+        f"Laufzeit bis {end}\n"
+        "Ort, Datum, Unterschriften der Parteien.\n"
+    )
+    pages = [head]
+    for number in range(1, page_count - 1):
+        pages.append("".join(BOILERPLATE.format(n=number * 4 + k) for k in range(4)))
+    if page_count == 1:
+        pages[0] += tail
+    else:
+        pages.append(tail)
+
+    golden = {
+        "contract_type": contract_type,
+        "title": subject,
+        "client_name": company,
+        "client_email": email,
+        "value": value,
+        "start_date": start,
+        "end_date": end,
+        "payment_frequency": frequency,
+        "notice_days": notice_months * 30,
+    }
+    return {"pages": pages, "golden": golden}
+
+
+def _scanned(kind: str, number: int) -> bool:
+    return kind == "scanned" or (kind == "mixed" and number % 3 == 1)
+
+
+def build_corpus(target: Path, page_counts=PAGE_COUNTS, kinds=KINDS) -> Dict[str, Any]:
+    """
+    Schreibt PDFs und ``golden.json`` nach ``target``; gescannte Seiten sind
+    gerasterte Bilder ohne Textebene.
+    Grava PDFs e ``golden.json`` em ``target``; páginas digitalizadas são
+    imagens rasterizadas sem camada de texto.
+    """
+    import fitz
+
+    target.mkdir(parents=True, exist_ok=True)
+    golden: Dict[str, Any] = {}
+    index = 0
+    for kind in kinds:
+        for page_count in page_counts:
+            spec = contract_pages(index, page_count)
+            name = f"{kind}_{page_count:03d}.pdf"
+            with fitz.open() as doc:
+                for number, text in enumerate(spec["pages"]):
+                    page = doc.new_page()
+                    rect = fitz.Rect(50, 50, page.rect.width - 50, page.rect.height - 50)
+                    if not _scanned(kind, number):
+                        page.insert_textbox(rect, text, fontsize=10)
+                        continue
+                    with fitz.open() as scratch:
+                        source = scratch.new_page()
+                        source.insert_textbox(rect, text, fontsize=10)
+                        pixmap = source.get_pixmap(dpi=150, colorspace=fitz.csGRAY)
+                    page.insert_image(page.rect, pixmap=pixmap)
+                doc.save(str(target / name), deflate=True)
+            golden[name] = {"kind": kind, "pages": page_count, "fields": spec["golden"]}
+            index += 1
+    (target / "golden.json").write_text(json.dumps(golden, indent=2, ensure_ascii=False), encoding="utf-8")
+    return golden
+
+
+# ---------- Stufen (laufen im Kindprozess) / Etapas (executam no processo filho) ----------
+
+def _max_rss_kb() -> int:
+    # Linux: KiB, macOS: Bytes
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _reader() -> PDFReaderService:
+    reader = PDFReaderService()
+    reader.ocr_workers = 1
+    return reader
+
+
+def _stage_extract(pdf_path: str, backend: str) -> Any:
+    return getattr(_reader(), EXTRACTION_BACKENDS[backend])(pdf_path)
+
+
+def _stage_ocr(pdf_path: str, extraction: Dict[str, Any]) -> Any:
+    from app.services.pdf_reader_pkg.ocr import apply_page_ocr, tesseract_available
+    result = apply_page_ocr(_reader(), pdf_path, extraction)
+    result["tesseract_available"] = tesseract_available()
+    return result
+
+
+def _stage_parse(name: str, text: str, pages: List[str]) -> Any:
+    if name == "classify":
+        return classify_contract_type(normalize_text(text))
+    if name == "router":
+        norm_text = normalize_text(text)
+        return extract_contract_fields(norm_text, PatternScan(norm_text))
+    if name == "windowed":
+        return analyze_pages(iter(pages))
+    norm_text = normalize_text(text)
+    return FIELD_EXTRACTORS[name](norm_text, PatternScan(norm_text))
+
+
+STAGES: Dict[str, Callable[..., Any]] = {
+    "extract": _stage_extract,
+    "ocr": _stage_ocr,
+    "parse": _stage_parse,
+}
+
+
+def run_stage(kind: str, *args) -> Dict[str, Any]:
+    """
+    Führt eine Stufe aus und misst Laufzeit und RSS-Zuwachs.
+    Executa uma etapa e mede o tempo e o aumento de RSS.
+    """
+    logging.disable(logging.WARNING)
+    baseline = _max_rss_kb()
+    started = time.perf_counter()
+    result = STAGES[kind](*args)
+    seconds = time.perf_counter() - started
+    peak = _max_rss_kb()
+    return {"seconds": round(seconds, 6), "peak_rss_kb": peak, "rss_delta_kb": peak - baseline, "result": result}
+
+
+class StageRunner:
+    """
+    Jede Stufe in einem frischen (geforkten) Prozess, damit Spitzen-RSS je Stufe messbar ist.
+    Cada etapa num processo novo (fork), para medir o pico de RSS por etapa.
+    """
+
+    def __init__(self, isolate: bool = True) -> None:
+        self.pool = None
+        if isolate:
+            context = multiprocessing.get_context("fork" if sys.platform != "win32" else "spawn")
+            self.pool = context.Pool(1, maxtasksperchild=1)
+
+    def __call__(self, kind: str, *args) -> Dict[str, Any]:
+        if self.pool is None:
+            return run_stage(kind, *args)
+        return self.pool.apply(run_stage, (kind, *args))
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+
+
+# ---------- Genauigkeit / Precisão ----------
+
+def observed_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Vergleichbare Feldwerte aus einem Analyseergebnis / Valores comparáveis de um resultado de análise"""
+    money = result.get("money_values") or {}
+    notice = result.get("notice_period") or {}
+    return {
+        "contract_type": result.get("contract_type"),
+        "title": result.get("title"),
+        "client_name": result.get("client_name"),
+        "client_email": result.get("client_email"),
+        "value": money.get("value"),
+        "start_date": result.get("start_date"),
+        "end_date": result.get("end_date"),
+        "payment_frequency": result.get("payment_frequency"),
+        "notice_days": notice.get("days"),
+    }
+
+
+def score_fields(expected: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    actual = observed_fields(result)
+    return {
+        field: {"expected": expected.get(field), "actual": actual.get(field),
+                "ok": actual.get(field) == expected.get(field)}
+        for field in GOLDEN_FIELDS if field in expected
+    }
+
+
+# ---------- Lauf / Execução ----------
+
+def benchmark_document(runner: StageRunner, path: Path, expected: Dict[str, Any]) -> Dict[str, Any]:
+    stages: Dict[str, Any] = {}
+
+    def record(stage: str, outcome: Dict[str, Any]) -> Any:
+        stages[stage] = {key: value for key, value in outcome.items() if key != "result"}
+        return outcome["result"]
+
+    extraction: Dict[str, Any] = {}
+    for backend in EXTRACTION_BACKENDS:
+        result = record(f"extract.{backend}", runner("extract", str(path), backend))
+        stages[f"extract.{backend}"]["chars"] = result.get("total_chars", len(result.get("text", "")))
+        if backend == "adaptive":
+            extraction = result
+
+    extraction = record("ocr", runner("ocr", str(path), extraction))
+    stages["ocr"]["pages"] = len(extraction.get("ocr_pages") or [])
+    if not extraction.pop("tesseract_available", False):
+        stages["ocr"]["skipped"] = "tesseract unavailable"
+
+    text = extraction.get("text", "")
+    pages = [page["text"] for page in extraction.get("pages", [])]
+    analyses: Dict[str, Any] = {}
+    for name in ("classify", *FIELD_EXTRACTORS, "router", "windowed"):
+        result = record(f"parse.{name}", runner("parse", name, text, pages))
+        if name in ("router", "windowed"):
+            analyses[name] = result
+
+    return {
+        "name": path.name,
+        "kind": expected.get("kind"),
+        "pages": expected.get("pages"),
+        "size_bytes": path.stat().st_size,
+        "stages": stages,
+        "fields": {pipeline: score_fields(expected.get("fields", {}), result) for pipeline, result in analyses.items()},
+    }
+
+
+def summarize(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    stage_names = sorted({stage for document in documents for stage in document["stages"]})
+    stages = {}
+    for stage in stage_names:
+        runs = [document["stages"][stage] for document in documents if stage in document["stages"]]
+        seconds = [run["seconds"] for run in runs]
+        stages[stage] = {
+            "total_seconds": round(sum(seconds), 6),
+            "median_seconds": round(statistics.median(seconds), 6),
+            "max_seconds": round(max(seconds), 6),
+            "max_rss_delta_kb": max(run["rss_delta_kb"] for run in runs),
+        }
+
+    accuracy: Dict[str, Dict[str, float]] = {}
+    for pipeline in sorted({pipeline for document in documents for pipeline in document["fields"]}):
+        scored = [document["fields"][pipeline] for document in documents if pipeline in document["fields"]]
+        fields = {field: [entry[field]["ok"] for entry in scored if field in entry] for field in GOLDEN_FIELDS}
+        accuracy[pipeline] = {field: round(sum(oks) / len(oks), 4) for field, oks in fields.items() if oks}
+        flat = [ok for oks in fields.values() for ok in oks]
+        accuracy[pipeline]["overall"] = round(sum(flat) / len(flat), 4) if flat else 0.0
+        for kind in KINDS:
+            kind_flat = [entry[field]["ok"] for document in documents if document["kind"] == kind
+                         for entry in [document["fields"].get(pipeline, {})] for field in entry]
+            if kind_flat:
+                accuracy[pipeline][f"overall.{kind}"] = round(sum(kind_flat) / len(kind_flat), 4)
+    return {"stages": stages, "accuracy": accuracy}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=Path(__file__).resolve().parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(corpus: Path, golden: Dict[str, Any], isolate: bool = True) -> Dict[str, Any]:
+    runner = StageRunner(isolate)
+    documents = []
+    try:
+        for name, expected in sorted(golden.items(), key=lambda item: (item[1].get("pages", 0), item[0])):
+            started = time.perf_counter()
+            documents.append(benchmark_document(runner, corpus / name, expected))
+            print(f"{name:<24}{expected.get('pages', '?'):>5} Seiten  {time.perf_counter() - started:8.2f} s",
+                  file=sys.stderr)
+    finally:
+        runner.close()
+    return {
+        "schema": REPORT_SCHEMA,
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "extractor_version": EXTRACTOR_VERSION,
+            "parsing_rules_version": PARSING_RULES_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "isolated_stages": isolate,
+        },
+        "summary": summarize(documents),
+        "documents": documents,
+    }
+
+
+# ---------- Ausgabe und Vergleich / Saída e comparação ----------
+
+def print_summary(report: Dict[str, Any]) -> None:
+    print(f"{'Stufe / Etapa':<32}{'Summe s':>10}{'Median s':>10}{'max ΔRSS MB':>13}")
+    for stage, values in report["summary"]["stages"].items():
+        print(f"{stage:<32}{values['total_seconds']:>10.3f}{values['median_seconds']:>10.4f}"
+              f"{values['max_rss_delta_kb'] / 1024:>13.1f}")
+    for pipeline, fields in report["summary"]["accuracy"].items():
+        print(f"\nGenauigkeit / Precisão ({pipeline}): " + ", ".join(f"{k}={v:.2f}" for k, v in fields.items()))
+
+
+def compare_reports(old: Dict[str, Any], new: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """
+    Vergleicht zwei Berichte; liefert die Regressionen (langsamere Stufen
+    über ``tolerance`` bzw. geringere Genauigkeit).
+    Compara dois relatórios; retorna as regressões (etapas mais lentas além
+    de ``tolerance`` ou precisão menor).
+    """
+    regressions = []
+    old_stages, new_stages = old["summary"]["stages"], new["summary"]["stages"]
+    print(f"\n{'Stufe / Etapa':<32}{'alt s':>10}{'neu s':>10}{'Δ %':>9}")
+    for stage in sorted(set(old_stages) & set(new_stages)):
+        before, after = old_stages[stage]["total_seconds"], new_stages[stage]["total_seconds"]
+        change = (after - before) / before if before else 0.0
+        print(f"{stage:<32}{before:>10.3f}{after:>10.3f}{change * 100:>9.1f}")
+        # Sehr kurze Stufen schwanken zu stark / Etapas muito curtas oscilam demais
+        if change > tolerance and after - before > 0.05:
+            regressions.append(f"{stage}: {before:.3f}s -> {after:.3f}s")
+    for pipeline, fields in new["summary"]["accuracy"].items():
+        for field, value in fields.items():
+            before = old["summary"]["accuracy"].get(pipeline, {}).get(field)
+            if before is not None and value < before:
+                regressions.append(f"accuracy {pipeline}.{field}: {before:.2f} -> {value:.2f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF-Pipeline Benchmark mit Golden-Korpus")
+    parser.add_argument("--corpus-dir", type=Path,
+                        help="Korpus hier erzeugen bzw. wiederverwenden (mit golden.json) / Diretório do corpus")
+    parser.add_argument("--quick", action="store_true", help=f"Nur {QUICK_PAGE_COUNTS} Seiten / Apenas poucas páginas")
+    parser.add_argument("--pages", type=int, nargs="+", help="Seitenzahlen des Korpus / Números de páginas")
+    parser.add_argument("--report", type=Path, help="JSON-Bericht schreiben / Gravar relatório JSON")
+    parser.add_argument("--compare", type=Path, help="Früheren Bericht vergleichen / Comparar com relatório anterior")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Erlaubte Verlangsamung je Stufe (0.2 = 20 %%)")
+    parser.add_argument("--no-isolate", action="store_true", help="Stufen im selben Prozess (ohne RSS je Stufe)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    page_counts = tuple(args.pages or (QUICK_PAGE_COUNTS if args.quick else PAGE_COUNTS))
+
+    def execute(corpus: Path) -> Dict[str, Any]:
+        golden_path = corpus / "golden.json"
+        if golden_path.exists():
+            golden = json.loads(golden_path.read_text(encoding="utf-8"))
+        else:
+            print(f"Erzeuge Korpus / Gerando corpus: {corpus}", file=sys.stderr)
+            golden = build_corpus(corpus, page_counts)
+        return run(corpus, golden, isolate=not args.no_isolate)
+
+    if args.corpus_dir:
+        report = execute(args.corpus_dir)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            report = execute(Path(tmp))
+
+    print_summary(report)
+    if args.report:
+        args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+        print(f"\nBericht / Relatório: {args.report}")
+    if args.compare:
+        regressions = compare_reports(json.loads(args.compare.read_text(encoding="utf-8")), report, args.tolerance)
+        if regressions:
+            print("\nRegressionen / Regressões:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ Ela configura FastAPI, middleware, roteadores e agendador.
 
 import asyncio
 import logging
+from datetime import datetime, time, timedelta
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -25,6 +26,16 @@ from app.routers.dashboard import router as dashboard_router
 from app.core.config import settings
 from app.core.database import SessionLocal
 from app.services.notification_service import NotificationService
+from app.services.stats_rollup_service import StatsRollupService
+from app.services.email_outbox_service import EmailOutboxService, get_outbox_wakeup
+from app.utils.smtp_pool import close_smtp_pool
+from app.utils.upload_stream import UploadSizeLimitMiddleware
+from app.services.extraction_engine import get_extraction_engine, shutdown_extraction_engine
+from app.services.import_job_service import ImportJobService, get_import_job_wakeup
+from app.services.model_registry import get_model_registry
+from app.services.blob_store import collect_garbage
+from app.services.storage_usage_service import StorageUsageService
+from app.services.document_converter import get_document_converter, shutdown_document_converter
 
 # Configurar logging / Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,6 +43,13 @@ logger = logging.getLogger(__name__)
 
 # Global scheduler task / Tarefa global do scheduler
 scheduler_task: asyncio.Task | None = None
+stats_rollup_task: asyncio.Task | None = None
+email_outbox_task: asyncio.Task | None = None
+import_job_tasks: list[asyncio.Task] = []
+extraction_warmup_task: asyncio.Task | None = None
+blob_gc_task: asyncio.Task | None = None
+storage_usage_task: asyncio.Task | None = None
+converter_warmup_task: asyncio.Task | None = None
 
 
 async def process_contract_alerts() -> None:
@@ -44,7 +62,7 @@ async def process_contract_alerts() -> None:
         
         async with SessionLocal() as db:
             notification_service = NotificationService(db)
-            result = await notification_service.process_due_alerts()
+            result = await notification_service.process_due_alerts(batch_size=settings.ALERT_PROCESS_BATCH_SIZE)
             
             logger.info(f"Processed {result.total} contract alerts / Processados {result.total} alertas de contratos")
            
@@ -69,13 +87,150 @@ async def background_scheduler() -> None:
 
 
 
+async def refresh_stats_rollup() -> None:
+    """
+    Prüft den Statistik-Rollup und ordnet die Ablauf-Buckets zum heutigen Tag neu zu.
+    Verifica o rollup de estatísticas e reclassifica as faixas de vencimento para hoje.
+    """
+    async with SessionLocal() as db:
+        service = StatsRollupService(db)
+        report = await service.check()
+        if not report["consistent"]:
+            logger.warning(
+                f"Stats rollup inconsistent ({len(report['mismatches'])} mismatches) / "
+                f"Rollup inconsistente ({len(report['mismatches'])} divergências)"
+            )
+        await service.rebuild()
+
+
+async def stats_rollup_scheduler() -> None:
+    """
+    Nächtlicher Job: Rollup beim Start und kurz nach Mitternacht neu aufbauen.
+    Job noturno: reconstrói o rollup na inicialização e logo após a meia-noite.
+    """
+    while True:
+        try:
+            await refresh_stats_rollup()
+        except Exception as e:
+            logger.error(f"Error refreshing stats rollup / Erro ao atualizar rollup de estatísticas: {e}")
+        now = datetime.now()
+        next_run = datetime.combine(now.date() + timedelta(days=1), time(0, 5))
+        await asyncio.sleep((next_run - now).total_seconds())
+
+
+async def email_outbox_worker() -> None:
+    """
+    Outbox-Worker: versendet eingereihte E-Mails stapelweise (Backoff je Eintrag).
+    Worker da caixa de saída: envia os e-mails enfileirados em lotes (backoff por entrada).
+    """
+    wakeup = get_outbox_wakeup()
+    while True:
+        try:
+            async with SessionLocal() as db:
+                stats = await EmailOutboxService(db).drain_once()
+            if stats["claimed"]:
+                # Weitere fällige Einträge sofort abarbeiten / Processar imediatamente as próximas entradas
+                continue
+        except Exception as e:
+            logger.error(f"Error in e-mail outbox worker / Erro no worker da caixa de saída: {e}")
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=settings.EMAIL_OUTBOX_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
+
+
+async def import_job_worker() -> None:
+    """
+    Import-Worker: verarbeitet eingereihte PDF-Import-Jobs nacheinander.
+    Worker de importação: processa os jobs de importação de PDF enfileirados.
+    """
+    wakeup = get_import_job_wakeup()
+    while True:
+        try:
+            async with SessionLocal() as db:
+                job = await ImportJobService(db).run_next()
+            if job is not None:
+                # Nächsten Job sofort übernehmen / Assumir imediatamente o próximo job
+                continue
+        except Exception as e:
+            logger.error(f"Error in import job worker / Erro no worker de importação: {e}")
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=settings.IMPORT_JOB_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
+
+
+async def blob_gc_scheduler() -> None:
+    """
+    Entfernt regelmäßig PDF-Blobs, auf die kein Vertrag mehr verweist.
+    Remove periodicamente blobs de PDF que nenhum contrato referencia.
+    """
+    while True:
+        try:
+            async with SessionLocal() as db:
+                await collect_garbage(db)
+        except Exception as e:
+            logger.error(f"Error in blob garbage collector / Erro no coletor de blobs: {e}")
+        await asyncio.sleep(settings.BLOB_GC_INTERVAL_SECONDS)
+
+
+async def storage_usage_scheduler() -> None:
+    """
+    Bucht Speicher-Deltas ein und zählt UPLOAD_DIR beim Start und periodisch neu.
+    Lança os deltas de armazenamento e reconta o UPLOAD_DIR na inicialização e periodicamente.
+    """
+    loop = asyncio.get_running_loop()
+    next_reconcile = loop.time()
+    while True:
+        try:
+            async with SessionLocal() as db:
+                service = StorageUsageService(db)
+                if loop.time() >= next_reconcile:
+                    next_reconcile = loop.time() + settings.STORAGE_RECONCILE_INTERVAL_SECONDS
+                    await service.reconcile()
+                else:
+                    await service.flush()
+        except Exception as e:
+            logger.error(f"Error in storage accounting / Erro na contabilidade de armazenamento: {e}")
+        await asyncio.sleep(settings.STORAGE_USAGE_FLUSH_SECONDS)
+
+
+async def warm_document_converter() -> None:
+    """
+    Startet die LibreOffice-Instanzen für DOCX->PDF, sofern soffice vorhanden ist.
+    Inicia as instâncias LibreOffice para DOCX->PDF, se o soffice existir.
+    """
+    converter = get_document_converter()
+    if not converter.available:
+        logger.info("LibreOffice not found, documents fall back to DOCX / LibreOffice ausente, fallback para DOCX")
+        return
+    try:
+        await converter.start()
+    except Exception as e:
+        logger.error(f"LibreOffice pool warm-up failed / Falha ao aquecer pool LibreOffice: {e}")
+
+
+async def warm_extraction_engine() -> None:
+    """
+    Startet die Extraktions-Worker samt Modellen, ohne den Start zu blockieren.
+    Inicia os workers de extração com os modelos, sem bloquear a inicialização.
+    """
+    try:
+        await get_extraction_engine().start()
+    except Exception as e:
+        logger.error(f"Extraction pool warm-up failed / Falha ao aquecer pool de extração: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Gerencia o ciclo de vida da aplicação / Manages application lifecycle.
     Inicia e para o scheduler automaticamente.
     """
-    global scheduler_task
+    global scheduler_task, stats_rollup_task, email_outbox_task, import_job_tasks, extraction_warmup_task, blob_gc_task
+    global storage_usage_task, converter_warmup_task
     
     # Startup / Inicialização
     logger.info("Starting application / Iniciando aplicação")
@@ -83,6 +238,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Iniciar task de background / Start background task
     scheduler_task = asyncio.create_task(background_scheduler())
     logger.info("Background scheduler started / Scheduler em background iniciado")
+    stats_rollup_task = asyncio.create_task(stats_rollup_scheduler())
+    email_outbox_task = asyncio.create_task(email_outbox_worker())
+    # Modelle im Hintergrund vorladen: im Prozess selbst nur bei Extraktion im Thread, sonst im Worker-Initialisierer
+    # Pré-carregar modelos em segundo plano: no próprio processo só com extração em thread, senão no inicializador dos workers
+    if settings.MODEL_PRELOAD_ENABLED and settings.EXTRACTION_WORKERS == 0:
+        get_model_registry().start_preload()
+    extraction_warmup_task = asyncio.create_task(warm_extraction_engine())
+    # Import-Worker: übernehmen auch Jobs von vor dem Neustart / Workers de importação: assumem também jobs anteriores ao reinício
+    import_job_tasks = [asyncio.create_task(import_job_worker()) for _ in range(settings.IMPORT_JOB_WORKERS)]
+    blob_gc_task = asyncio.create_task(blob_gc_scheduler())
+    storage_usage_task = asyncio.create_task(storage_usage_scheduler())
+    converter_warmup_task = asyncio.create_task(warm_document_converter())
     
     yield
     
@@ -95,6 +262,59 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except asyncio.CancelledError:
             pass
         logger.info("Background scheduler stopped / Scheduler em background parado")
+    if stats_rollup_task:
+        stats_rollup_task.cancel()
+        try:
+            await stats_rollup_task
+        except asyncio.CancelledError:
+            pass
+    if email_outbox_task:
+        email_outbox_task.cancel()
+        try:
+            await email_outbox_task
+        except asyncio.CancelledError:
+            pass
+    if extraction_warmup_task:
+        extraction_warmup_task.cancel()
+        try:
+            await extraction_warmup_task
+        except asyncio.CancelledError:
+            pass
+    if blob_gc_task:
+        blob_gc_task.cancel()
+        try:
+            await blob_gc_task
+        except asyncio.CancelledError:
+            pass
+    if converter_warmup_task:
+        converter_warmup_task.cancel()
+        try:
+            await converter_warmup_task
+        except asyncio.CancelledError:
+            pass
+    if storage_usage_task:
+        storage_usage_task.cancel()
+        try:
+            await storage_usage_task
+        except asyncio.CancelledError:
+            pass
+        # Offene Deltas nicht verlieren / Não perder deltas em aberto
+        try:
+            async with SessionLocal() as db:
+                await StorageUsageService(db).flush()
+        except Exception as e:
+            logger.error(f"Error flushing storage usage / Erro ao gravar uso de armazenamento: {e}")
+    for task in import_job_tasks:
+        task.cancel()
+    for task in import_job_tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    import_job_tasks = []
+    await close_smtp_pool()
+    await shutdown_extraction_engine()
+    await shutdown_document_converter()
 
 
 # FastAPI-Anwendung erstellen / Criar aplicação FastAPI
@@ -107,6 +327,15 @@ app = FastAPI(
 
 
 
+# Uploads über MAX_FILE_SIZE vor dem Einlesen ablehnen / Rejeitar uploads acima de MAX_FILE_SIZE antes da leitura
+# Vor CORS registriert: CORS bleibt außen, auch 413 trägt CORS-Header
+# Registrado antes do CORS: o CORS fica por fora, o 413 também leva cabeçalhos CORS
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    # Massenimport: Grenze für den ganzen Stapel / Importação em massa: limite para o lote inteiro
+    path_limits={"/api/contracts/import/bulk": settings.BULK_IMPORT_MAX_BYTES},
+)
+
 # CORS-Middleware konfigurieren / Configurar middleware CORS
 app.add_middleware(
     CORSMiddleware,
@@ -171,12 +400,15 @@ def get_scheduler_status():
 async def trigger_contract_alerts():
     """
     Dispara processamento manual de alertas / Manueller Auslöser für Benachrichtigungen
+
+    Retorna assim que os e-mails estão na caixa de saída; o envio é assíncrono.
+    Kehrt zurück, sobald die E-Mails in der Outbox stehen; der Versand erfolgt asynchron.
     """
     try:
         await process_contract_alerts()
         return {
             "success": True,
-            "message": "Contract alerts processing triggered / Processamento de alertas disparado"
+            "message": "Contract alerts queued for sending / Alertas de contratos enfileirados para envio"
         }
     except Exception as e:
         logger.error(f"Error triggering alerts / Erro ao disparar alertas: {e}")
@@ -16,6 +16,7 @@ if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from app.core.database import Base
@@ -64,3 +65,75 @@ async def test_session(test_engine):
     
     async with async_session() as session:
         yield session
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """
+    Sitzungsfabrik auf einer frischen In-Memory-Datenbank
+    Fábrica de sessões sobre um banco em memória novo
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class RecordingSMTPHandler:
+    """
+    aiosmtpd-Handler, der empfangene Nachrichten und die Parallelität aufzeichnet
+    Handler aiosmtpd que registra as mensagens recebidas e a concorrência
+    """
+
+    def __init__(self):
+        self.envelopes = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.0
+
+    async def handle_DATA(self, server, session, envelope):
+        import asyncio
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.envelopes.append(envelope)
+        self.active -= 1
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_server():
+    """
+    Lokaler SMTP-Server (aiosmtpd) als Ersatz für den echten Mailserver
+    Servidor SMTP local (aiosmtpd) como substituto do servidor de e-mail real
+
+    Liefert ein Objekt mit ``host``, ``port``, ``handler`` und ``restart()``.
+    """
+    import socket
+    from types import SimpleNamespace
+
+    controller_module = pytest.importorskip("aiosmtpd.controller")
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    handler = RecordingSMTPHandler()
+    state = SimpleNamespace(host="127.0.0.1", port=port, handler=handler, controller=None)
+
+    def start():
+        state.controller = controller_module.Controller(handler, hostname=state.host, port=port)
+        state.controller.start()
+
+    def restart():
+        # Trennt alle bestehenden Verbindungen / Encerra todas as conexões existentes
+        state.controller.stop()
+        start()
+
+    state.restart = restart
+    start()
+    yield state
+    state.controller.stop()
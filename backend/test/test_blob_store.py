@@ -0,0 +1,114 @@
+"""
+Tests für den inhaltsadressierten Blob-Speicher (Deduplizierung, GC, Migration)
+Testes para o armazenamento de blobs endereçado por conteúdo (deduplicação, GC, migração)
+"""
+
+import hashlib
+import os
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.alert import Alert  # noqa: F401  (Mapper-Registrierung / registro dos mappers)
+from app.models.contract import Contract
+from app.services.blob_store import BlobStore, blob_reference_counts, collect_garbage, migrate_to_blob_store
+
+
+def _file(path, content: bytes) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(content)
+    return str(path)
+
+
+def _contract(**values) -> Contract:
+    return Contract(title="Vertrag", start_date=date(2025, 1, 1), client_name="Muster GmbH", created_by=1, **values)
+
+
+def _age(path: str, seconds: int = 7200) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_put_shards_and_deduplicates(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    content = b"%PDF-1.7 Mietvertrag"
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    first = store.put(_file(tmp_path / "temp" / "a.pdf", content), sha256)
+    assert first == os.path.join(str(tmp_path / "blobs"), sha256[:2], sha256[2:4], sha256)
+    # Ohne Hash wird gehasht; gleicher Inhalt -> gleicher Blob, Quelle entfernt
+    # Sem hash, o arquivo é hasheado; mesmo conteúdo -> mesmo blob, origem removida
+    second = store.put(_file(tmp_path / "temp" / "b.pdf", content))
+    assert second == first
+    assert os.listdir(tmp_path / "temp") == []
+    assert store.contains(first) and not store.contains(str(tmp_path / "temp" / "a.pdf"))
+    assert [name for name, _ in store.iter_blobs()] == [sha256]
+
+    with pytest.raises(ValueError):
+        store.path_for("../../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_garbage_collector_keeps_referenced_and_recent_blobs(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    paths = {}
+    for name in ("geteilt", "verwaist", "frisch"):
+        content = name.encode()
+        paths[name] = store.put(_file(tmp_path / "temp" / f"{name}.pdf", content), hashlib.sha256(content).hexdigest())
+    stale_temp = _file(paths["verwaist"] + ".tmp-abc", b"halb")
+    for name in ("geteilt", "verwaist"):
+        _age(paths[name])
+    _age(stale_temp)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        shared_sha = os.path.basename(paths["geteilt"])
+        db.add_all([_contract(original_pdf_path=paths["geteilt"], original_pdf_sha256=shared_sha) for _ in range(2)])
+        await db.commit()
+        assert await blob_reference_counts(db) == {shared_sha: 2}
+
+        stats = await collect_garbage(db, store, grace_seconds=3600)
+    await engine.dispose()
+
+    assert stats["removed"] == 2
+    assert os.path.exists(paths["geteilt"]) and os.path.exists(paths["frisch"])
+    assert not os.path.exists(paths["verwaist"]) and not os.path.exists(stale_temp)
+
+
+def test_migration_moves_persisted_layout_into_blobs(tmp_path):
+    upload_dir = str(tmp_path)
+    persisted = tmp_path / "contracts" / "persisted"
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        contracts = [
+            _contract(original_pdf_path=_file(persisted / "contract_1" / "original.pdf", b"gleich")),
+            _contract(original_pdf_path=_file(persisted / "contract_2.pdf", b"gleich")),
+            _contract(original_pdf_path=_file(persisted / "contract_3" / "original.pdf", b"anders")),
+            _contract(original_pdf_path=str(tmp_path / "woanders.pdf")),
+        ]
+        session.add_all(contracts)
+        session.commit()
+
+    with engine.begin() as connection:
+        counts = migrate_to_blob_store(connection, upload_dir)
+
+    assert counts == {"moved": 2, "deduplicated": 1, "skipped": 1}
+    store = BlobStore(os.path.join(upload_dir, "blobs"))
+    with Session(engine) as session:
+        rows = session.execute(select(Contract).order_by(Contract.id)).scalars().all()
+    same = hashlib.sha256(b"gleich").hexdigest()
+    assert rows[0].original_pdf_path == rows[1].original_pdf_path == store.path_for(same)
+    assert rows[0].original_pdf_sha256 == same and rows[0].original_pdf_verified is True
+    assert rows[2].original_pdf_path == store.path_for(hashlib.sha256(b"anders").hexdigest())
+    assert rows[3].original_pdf_path == str(tmp_path / "woanders.pdf")
+    assert os.listdir(persisted) == []
+    engine.dispose()
@@ -0,0 +1,133 @@
+"""
+Tests für den Massenimport (ZIP-Entpacken, Duplikate, DRAFT-Anlage)
+Testes para a importação em massa (extração ZIP, duplicatas, criação DRAFT)
+"""
+
+import hashlib
+import os
+import zipfile
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from app.models.alert import Alert  # noqa: F401  (Mapper-Registrierung / registro dos mappers)
+from app.models.contract import Contract, ContractStatus
+from app.services.bulk_import_service import BulkImportItem, BulkImportLimitError, BulkImportService, unpack_zip
+
+
+class _FakeReader:
+    def validate_pdf(self, path):
+        return {"valid": True}
+
+
+class _FakeImportService:
+    """Extraktion ohne Prozesspool: Text = Dateiinhalt / Extração sem pool: texto = conteúdo do arquivo"""
+
+    reader = _FakeReader()
+
+    async def extract(self, pdf_path, method, file_hash=None):
+        with open(pdf_path, "rb") as handle:
+            text = handle.read().decode("utf-8")
+        return {
+            "extraction": {"success": True, "text": text, "method": "adaptive"},
+            "intelligent_data": {"title": f"Titel {text}", "dates": {"start_date": "2026-01-01", "end_date": "2025-01-01"}},
+        }
+
+
+def _item(tmp_path, name: str, content: str) -> BulkImportItem:
+    path = tmp_path / name
+    path.write_text(content)
+    return BulkImportItem(
+        file_name=name, path=str(path), sha256=hashlib.sha256(content.encode()).hexdigest(), size=len(content)
+    )
+
+
+def test_unpack_zip_streams_pdf_members(tmp_path):
+    archive = tmp_path / "batch.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("ordner/a.pdf", b"%PDF-a")
+        zf.writestr("notiz.txt", b"x")
+        zf.writestr("__MACOSX/._a.pdf", b"x")
+        zf.writestr("gross.pdf", b"%PDF-" + b"x" * 100)
+
+    out = tmp_path / "out"
+    out.mkdir()
+    items = unpack_zip(str(archive), str(out), "bulk", max_member_bytes=50, max_files=10, max_total_bytes=10_000)
+    by_name = {item.file_name: item for item in items}
+
+    assert set(by_name) == {"a.pdf", "notiz.txt", "gross.pdf"}
+    assert by_name["a.pdf"].sha256 == hashlib.sha256(b"%PDF-a").hexdigest()
+    assert os.path.exists(by_name["a.pdf"].path)
+    assert by_name["notiz.txt"].skipped is True
+    assert by_name["gross.pdf"].error and by_name["gross.pdf"].path is None
+    assert os.listdir(out) == [os.path.basename(by_name["a.pdf"].path)]
+
+    with pytest.raises(BulkImportLimitError):
+        unpack_zip(str(archive), str(out), "bulk2", max_member_bytes=1000, max_files=1, max_total_bytes=10_000)
+
+
+class TestBulkImportService:
+    """Stapelverarbeitung / Processamento em lote"""
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_within_batch_and_against_db(self, session_factory, tmp_path):
+        async with session_factory() as db:
+            existing_text = "bekannter vertrag"
+            db.add(Contract(
+                title="Alt", client_name="Kunde", start_date=date(2025, 1, 1), created_by=1,
+                original_pdf_sha256=hashlib.sha256(b"datei im system").hexdigest(),
+                ocr_text_sha256=hashlib.sha256(existing_text.encode()).hexdigest(),
+            ))
+            await db.commit()
+
+            items = [
+                _item(tmp_path, "a.pdf", "Vertrag A"),
+                _item(tmp_path, "a_kopie.pdf", "Vertrag A"),
+                _item(tmp_path, "b.pdf", "datei im system"),
+                _item(tmp_path, "c.pdf", "Bekannter   Vertrag"),
+                _item(tmp_path, "d.pdf", "vertrag   a"),
+                BulkImportItem(file_name="e.docx", error="Ungültiger Dateityp", skipped=True),
+            ]
+            service = BulkImportService(db, concurrency=2, import_service=_FakeImportService())
+            records = [r async for r in service.run(items)]
+
+        files = {r["file_name"]: r for r in records if r["type"] == "file"}
+        summary = records[-1]
+        assert files["a.pdf"]["status"] == "extracted"
+        assert files["a.pdf"]["draft"]["title"] == "Titel Vertrag A"
+        assert files["a_kopie.pdf"]["duplicate_of"] == {"file_name": "a.pdf"}
+        assert files["b.pdf"]["duplicate_of"] == {"contract_id": 1}
+        assert files["c.pdf"]["duplicate_of"] == {"contract_id": 1}
+        assert files["d.pdf"]["duplicate_of"] == {"file_name": "a.pdf"}
+        assert files["e.docx"]["status"] == "skipped"
+        assert summary["type"] == "summary" and summary["total"] == 6
+        assert (summary["extracted"], summary["duplicate"], summary["skipped"]) == (1, 4, 1)
+        # Duplikate werden entfernt, Extrahiertes bleibt liegen / Duplicatas removidas, extraídos mantidos
+        assert sorted(os.listdir(tmp_path)) == ["a.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_auto_create_inserts_drafts_in_one_transaction(self, session_factory, tmp_path):
+        persisted = tmp_path / "persisted"
+
+        def persist(path, sha256):
+            target = persisted / f"{sha256}.pdf"
+            persisted.mkdir(exist_ok=True)
+            os.replace(path, target)
+            return str(target)
+
+        async with session_factory() as db:
+            items = [_item(tmp_path, "x.pdf", "Vertrag X"), _item(tmp_path, "y.pdf", "Vertrag Y")]
+            service = BulkImportService(db, import_service=_FakeImportService(), persist_file=persist)
+            records = [r async for r in service.run(items, auto_create=True, created_by=7)]
+
+            contracts = (await db.execute(select(Contract).order_by(Contract.id))).scalars().all()
+
+        assert [r["status"] for r in records[:-1]] == ["created", "created"]
+        assert records[-1]["created"] == 2 and records[-1]["extracted"] == 0
+        assert [c.status for c in contracts] == [ContractStatus.DRAFT, ContractStatus.DRAFT]
+        assert contracts[0].original_pdf_path == str(persisted / f"{contracts[0].original_pdf_sha256}.pdf")
+        assert contracts[0].client_name and contracts[0].created_by == 7
+        # Enddatum vor Startdatum wird verworfen / Data de fim anterior ao início é descartada
+        assert contracts[0].end_date is None
+        assert os.path.exists(contracts[1].original_pdf_path)
@@ -628,7 +628,7 @@ class TestContractDocuments:
         # Kann 200 oder 500 zurückgeben je nach Template-Verfügbarkeit
         assert response.status_code in [200, 500]
     
-    @patch('app.routers.contracts._convert_docx_bytes_to_pdf_bytes')
+    @patch('app.routers.contracts.get_document_converter')
     @patch('app.routers.contracts.render_docx_bytes')
     def test_generate_contract_document_pdf(self, mock_render, mock_convert, client: TestClient, sample_contract_data: Dict[str, Any]):
         """
@@ -645,7 +645,7 @@ class TestContractDocuments:
         
         # Mock das funções / Funktionen mocken
         mock_render.return_value = b"fake-docx-content"
-        mock_convert.return_value = b"fake-pdf-content"
+        mock_convert.return_value.convert = AsyncMock(return_value=b"fake-pdf-content")
         
         # Gerar documento PDF / PDF-Dokument generieren
         response = client.get(f"/contracts/{contract_id}/document?format=pdf")
@@ -1237,7 +1237,7 @@ trailer
 %%EOF"""
     
     @patch('app.routers.contracts_import.PDFReaderService')
-    @patch('app.routers.contracts_import.select')
+    @patch('app.services.contract_import_service.select')
     def test_upload_duplicate_pdf_returns_400(self, mock_select, mock_pdf_service, client: TestClient, valid_pdf_content: bytes):
         """
         Testa detecção de duplicação por hash de arquivo → HTTP 400
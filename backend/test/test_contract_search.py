@@ -0,0 +1,133 @@
+"""
+Tests für die Volltextsuche (SQLite FTS5)
+Testes para a busca de texto completo (SQLite FTS5)
+"""
+
+import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import Base
+from app.models.alert import Alert  # noqa: F401  (Mapper-Registrierung / registro do mapper)
+from app.models.contract import Contract, ContractStatus, ContractType
+from app.models.user import User, UserRole
+from app.services.contract_service import ContractService, build_fts_match_query
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """In-Memory-Datenbank mit FTS5-Index / Banco em memória com índice FTS5"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        user = User(email="search@example.com", name="Search User", password_hash="hash", role=UserRole.STAFF, access_level=1)
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+
+        contracts = [
+            Contract(title="Mietvertrag Büro Hamburg", description="Gewerbemiete für Büroflächen",
+                     client_name="Müller GmbH", created_by=user.id),
+            Contract(title="Wartungsvertrag Server", description="Wartung der IT-Infrastruktur",
+                     client_name="Schmidt AG", notes="Verlängerung mit Mietoption", created_by=user.id),
+            Contract(title="Softwarelizenz", description="Jahreslizenz",
+                     client_name="Beta KG", ocr_text="Die Kündigungsfrist beträgt drei Monate zum Quartalsende.",
+                     created_by=user.id),
+        ]
+        for contract in contracts:
+            contract.start_date = datetime.date(2025, 1, 1)
+            contract.contract_type = ContractType.SERVICE
+            contract.status = ContractStatus.ACTIVE
+            session.add(contract)
+        await session.commit()
+
+        yield session
+
+    await engine.dispose()
+
+
+class TestFtsQueryBuilder:
+    """Tests für die Umwandlung der Benutzereingabe / Testes da conversão da entrada"""
+
+    def test_prefix_phrases(self):
+        assert build_fts_match_query("miet büro") == '"miet"* "büro"*'
+
+    def test_operators_are_neutralised(self):
+        assert build_fts_match_query('foo" OR bar*') == '"foo"* "OR"* "bar"*'
+
+    def test_empty_input(self):
+        assert build_fts_match_query("  -- ") is None
+
+
+class TestContractFullTextSearch:
+    """Suche über FTS5 inkl. Ranking und Trigger / Busca via FTS5 com ranking e triggers"""
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_title_hits_first(self, db_session):
+        hits = await ContractService(db_session).search_contracts("miet")
+
+        assert [hit.title for hit in hits] == ["Mietvertrag Büro Hamburg", "Wartungsvertrag Server"]
+        assert hits[0].search_rank > hits[1].search_rank
+        assert "<mark>" in hits[0].search_snippet
+
+    @pytest.mark.asyncio
+    async def test_snippet_escapes_contract_text(self, db_session):
+        contract = await db_session.get(Contract, 3)
+        contract.ocr_text = '<img src=x onerror="alert(1)"> Kündigungsfrist & Co.'
+        await db_session.commit()
+
+        hits = await ContractService(db_session).search_contracts("kundigungsfrist")
+        assert hits[0].search_snippet == (
+            '&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>Kündigungsfrist</mark> &amp; Co.'
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_finds_ocr_text_and_ignores_diacritics(self, db_session):
+        hits = await ContractService(db_session).search_contracts("kundigungsfrist")
+        assert [hit.title for hit in hits] == ["Softwarelizenz"]
+
+        hits = await ContractService(db_session).search_contracts("muller")
+        assert [hit.client_name for hit in hits] == ["Müller GmbH"]
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(self, db_session):
+        service = ContractService(db_session)
+        hits = await service.search_contracts("softwarelizenz")
+        contract_id = hits[0].id
+
+        contract = await db_session.get(Contract, contract_id)
+        contract.title = "Cloud Abonnement"
+        await db_session.commit()
+        assert await service.search_contracts("softwarelizenz") == []
+        assert [hit.id for hit in await service.search_contracts("cloud")] == [contract_id]
+
+        await service.delete_contract(contract_id)
+        assert await service.search_contracts("cloud") == []
+        count = await db_session.execute(text("SELECT count(*) FROM contracts_fts WHERE contracts_fts MATCH 'cloud'"))
+        assert count.scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_list_contracts_uses_index(self, db_session):
+        result = await ContractService(db_session).list_contracts(search="wartung")
+        assert result["total"] == 1
+        assert result["contracts"][0].title == "Wartungsvertrag Server"
+
+    @pytest.mark.asyncio
+    async def test_ilike_fallback_without_index(self, db_session):
+        await db_session.execute(text("DROP TABLE contracts_fts"))
+        for trigger in ("contracts_fts_ai", "contracts_fts_ad", "contracts_fts_au"):
+            await db_session.execute(text(f"DROP TRIGGER {trigger}"))
+
+        service = ContractService(db_session)
+        hits = await service.search_contracts("Wartung")
+        assert [hit.title for hit in hits] == ["Wartungsvertrag Server"]
+        assert hits[0].search_rank is None
+
+        result = await service.list_contracts(search="Hamburg")
+        assert result["total"] == 1
@@ -0,0 +1,133 @@
+"""
+Tests für DashboardService (bedingte Aggregation pro Sichtbereich)
+Testes para DashboardService (agregação condicional por escopo)
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import Base
+from app.models.alert import Alert, AlertStatus, AlertType
+from app.models.contract import Contract, ContractStatus, ContractType, OperationType
+from app.models.user import User, UserRole, AccessLevel
+from app.services.dashboard_service import DashboardService
+
+
+@pytest_asyncio.fixture
+async def seeded():
+    """Kleiner Datenbestand mit bekannten Kennzahlen / Base pequena com métricas conhecidas"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as db:
+        director = User(email="dir@example.com", name="Dir", password_hash="x", role=UserRole.DIRECTOR,
+                        access_level=AccessLevel.LEVEL_5)
+        dept_adm = User(email="adm@example.com", name="Adm", password_hash="x", role=UserRole.DEPARTMENT_ADM,
+                        access_level=AccessLevel.LEVEL_4, department="IT")
+        staff = User(email="staff@example.com", name="Staff", password_hash="x", role=UserRole.STAFF,
+                     access_level=AccessLevel.LEVEL_1, department="IT", team="Alpha")
+        db.add_all([director, dept_adm, staff])
+        await db.commit()
+
+        today = date.today()
+        specs = [
+            # (department, team, status, operation, value, days_to_end, owner)
+            ("IT", "Alpha", ContractStatus.ACTIVE, OperationType.INCOME, "1000.00", 10, staff),
+            ("IT", "Alpha", ContractStatus.ACTIVE, OperationType.EXPENSE, "250.50", 60, director),
+            ("IT", "Beta", ContractStatus.DRAFT, OperationType.INCOME, "999.00", 5, director),
+            ("Recht", None, ContractStatus.ACTIVE, OperationType.INCOME, "400.00", 200, director),
+            (None, None, ContractStatus.EXPIRED, OperationType.INCOME, None, -3, director),
+        ]
+        contracts = []
+        for i, (dept, team, status, op, value, days, owner) in enumerate(specs):
+            contract = Contract(
+                title=f"Vertrag {i}", client_name="Kunde", start_date=today - timedelta(days=400),
+                end_date=today + timedelta(days=days), status=status, operation_type=op,
+                contract_type=ContractType.SERVICE if i % 2 else ContractType.RENTAL,
+                value=Decimal(value) if value else None, department=dept, team=team, created_by=owner.id,
+            )
+            db.add(contract)
+            contracts.append(contract)
+        await db.commit()
+
+        now = datetime.now()
+        db.add_all([
+            Alert(contract_id=contracts[0].id, alert_type=AlertType.T_MINUS_10, status=AlertStatus.PENDING, scheduled_for=now),
+            Alert(contract_id=contracts[0].id, alert_type=AlertType.T_MINUS_30, status=AlertStatus.SENT, scheduled_for=now),
+            Alert(contract_id=contracts[3].id, alert_type=AlertType.T_MINUS_60, status=AlertStatus.PENDING, scheduled_for=now),
+        ])
+        await db.commit()
+
+    yield engine, session_factory, {"director": director, "dept_adm": dept_adm, "staff": staff}
+    await engine.dispose()
+
+
+def _count_round_trips(engine):
+    counter = {"n": 0}
+
+    def _on_execute(*_args, **_kwargs):
+        counter["n"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _on_execute)
+    return counter
+
+
+class TestDashboardAggregation:
+    """Kennzahlen und Anzahl der Roundtrips / Métricas e número de round trips"""
+
+    @pytest.mark.asyncio
+    async def test_director_stats(self, seeded):
+        engine, session_factory, users = seeded
+        counter = _count_round_trips(engine)
+        async with session_factory() as db:
+            stats = await DashboardService(db).get_stats_by_role(users["director"])
+
+        # Rollup-Status (noch nicht aufgebaut) + Aggregation + Benutzeranzahl
+        # Estado do rollup (ainda não construído) + agregação + contagem de usuários
+        assert counter["n"] == 3
+        assert stats.total_contracts == 5
+        assert stats.active_contracts == 3
+        assert stats.expiring_30_days == 1
+        assert stats.expiring_90_days == 2
+        assert stats.monthly_value == pytest.approx(1650.50)
+        assert stats.total_alerts == 3
+        assert stats.unread_alerts == 2
+        assert stats.total_users == 3
+        assert stats.contracts_by_department == {"IT": 3, "Recht": 1}
+        assert stats.contracts_by_status == {"ACTIVE": 3, "DRAFT": 1, "EXPIRED": 1}
+        assert stats.contracts_by_type == {"RENTAL": 3, "SERVICE": 2}
+
+    @pytest.mark.asyncio
+    async def test_department_stats(self, seeded):
+        engine, session_factory, users = seeded
+        async with session_factory() as db:
+            stats = await DashboardService(db).get_stats_by_role(users["dept_adm"])
+
+        assert stats.total_contracts == 3
+        assert stats.active_contracts == 2
+        assert stats.expiring_90_days == 2
+        assert stats.monthly_value == pytest.approx(1250.50)
+        assert stats.total_alerts == 2
+        assert stats.unread_alerts == 1
+        assert stats.department_users == 2
+
+    @pytest.mark.asyncio
+    async def test_staff_stats_single_round_trip(self, seeded):
+        engine, session_factory, users = seeded
+        counter = _count_round_trips(engine)
+        async with session_factory() as db:
+            stats = await DashboardService(db).get_stats_by_role(users["staff"])
+
+        assert counter["n"] == 1
+        assert stats.total_contracts == 1
+        assert stats.expiring_30_days == 1
+        assert stats.total_alerts == 2
+        assert stats.unread_alerts == 1
+        assert stats.monthly_value is None
@@ -0,0 +1,124 @@
+"""
+Tests für den LibreOffice-Konvertierungspool (Warteschlange, Neustart, Zustandsprüfung, Fallback)
+Testes para o pool de conversão LibreOffice (fila, reinício, verificação de saúde, fallback)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services import document_converter
+from app.services.document_converter import (
+    ConversionError,
+    ConverterBusyError,
+    ConverterUnavailableError,
+    DocumentConverter,
+)
+
+
+class _FakeInstance:
+    """Instanz ohne soffice / Instância sem soffice"""
+
+    started = []
+
+    def __init__(self, index, delay=0.0, crash_on=None, hang_on=None):
+        self.index = index
+        self.delay = delay
+        self.crash_on = crash_on
+        self.hang_on = hang_on
+        self.conversions = 0
+        self.running = False
+        self.killed = threading.Event()
+
+    def start(self):
+        self.running = True
+        _FakeInstance.started.append(self.index)
+
+    def alive(self):
+        return self.running
+
+    def convert(self, docx_bytes):
+        if docx_bytes == self.crash_on:
+            self.running = False
+            raise RuntimeError("soffice abgestürzt / soffice falhou")
+        if docx_bytes == self.hang_on:
+            self.killed.wait(5)
+            raise RuntimeError("Verbindung getrennt / Conexão perdida")
+        time.sleep(self.delay)
+        self.conversions += 1
+        return b"%PDF-" + docx_bytes
+
+    def stop(self):
+        self.running = False
+
+    def kill(self):
+        self.running = False
+        self.killed.set()
+
+
+def _converter(**options):
+    factory_options = {key: options.pop(key) for key in ("delay", "crash_on", "hang_on") if key in options}
+    _FakeInstance.started = []
+    return DocumentConverter(instance_factory=lambda index: _FakeInstance(index, **factory_options), **options)
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_rejects_overflow():
+    converter = _converter(workers=2, queue_size=1, health_interval=0, delay=0.1)
+    await converter.start()
+    assert sorted(_FakeInstance.started) == [0, 1]
+
+    # Zwei laufen, einer wartet, der vierte wird abgewiesen / Duas rodam, uma aguarda, a quarta é recusada
+    results = await asyncio.gather(*(converter.convert(b"doc%d" % n) for n in range(4)), return_exceptions=True)
+    assert [r for r in results if isinstance(r, bytes)] == [b"%PDF-doc0", b"%PDF-doc1", b"%PDF-doc2"]
+    assert isinstance(results[3], ConverterBusyError)
+    assert converter.status()["idle"] == 2 and converter.conversions == 3
+    await converter.close()
+
+
+@pytest.mark.asyncio
+async def test_crash_and_timeout_restart_instance():
+    converter = _converter(workers=1, timeout=0.2, health_interval=0, crash_on=b"kaputt", hang_on=b"haengt")
+    await converter.start()
+
+    with pytest.raises(ConversionError):
+        await converter.convert(b"kaputt")
+    assert converter.restarts == 1
+    assert await converter.convert(b"ok") == b"%PDF-ok"
+
+    with pytest.raises(ConversionError):
+        await converter.convert(b"haengt")
+    assert converter.restarts == 2 and _FakeInstance.started == [0, 0, 0]
+    assert await converter.convert(b"wieder") == b"%PDF-wieder"
+    await converter.close()
+
+
+@pytest.mark.asyncio
+async def test_health_check_and_recycling():
+    converter = _converter(workers=2, health_interval=0)
+    await converter.start()
+    converter._instances[1].running = False
+    assert await converter.check_health() == 1
+    assert all(instance.alive() for instance in converter._instances.values())
+    await converter.close()
+    assert converter.status()["started"] is False
+
+    converter = _converter(workers=1, max_conversions=2, health_interval=0)
+    await converter.start()
+    for _ in range(2):
+        await converter.convert(b"doc")
+    # Nach zwei Aufträgen frische Instanz / Após duas tarefas, instância nova
+    assert converter.restarts == 1 and converter._instances[0].conversions == 0
+    await converter.close()
+
+
+@pytest.mark.asyncio
+async def test_unavailable_without_soffice(monkeypatch):
+    monkeypatch.setattr(document_converter.settings, "LIBREOFFICE_BINARY", None)
+    monkeypatch.setattr(document_converter.shutil, "which", lambda name: None)
+    converter = DocumentConverter(workers=1)
+    assert converter.available is False and converter.status()["mode"] == "unavailable"
+    with pytest.raises(ConverterUnavailableError):
+        await converter.convert(b"doc")
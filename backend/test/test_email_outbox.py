@@ -0,0 +1,134 @@
+"""
+Tests für die E-Mail-Outbox (Backoff, Dead Letter, Reservierung)
+Testes para a caixa de saída de e-mails (backoff, dead letter, reserva)
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import Base
+from app.models.alert import Alert, AlertStatus, AlertType
+from app.models.contract import Contract, ContractStatus
+from app.models.email_outbox import EmailOutbox, OutboxStatus
+from app.models.user import User, UserRole, AccessLevel
+from app.services.email_outbox_service import EmailOutboxService, compute_backoff
+from app.utils.smtp_pool import OutgoingEmail
+
+
+def _mailer(*results):
+    mailer = Mock()
+    mailer.send_batch = AsyncMock(side_effect=lambda messages: [results[0] for _ in list(messages)])
+    return mailer
+
+
+@pytest_asyncio.fixture
+async def queued():
+    """Ein Alert mit eingereihter E-Mail / Um alerta com e-mail enfileirado"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as db:
+        owner = User(email="owner@example.com", name="Owner", password_hash="x", role=UserRole.STAFF,
+                     access_level=AccessLevel.LEVEL_1)
+        db.add(owner)
+        await db.flush()
+        contract = Contract(title="Vertrag", client_name="Kunde", start_date=date.today(),
+                            status=ContractStatus.ACTIVE, created_by=owner.id)
+        db.add(contract)
+        await db.flush()
+        alert = Alert(contract_id=contract.id, alert_type=AlertType.T_MINUS_30,
+                      scheduled_for=datetime.now(timezone.utc))
+        db.add(alert)
+        await db.flush()
+        EmailOutboxService(db).enqueue(
+            OutgoingEmail(to="kunde@example.com", subject="Ablauf", body="<p>Hinweis</p>"), alert_id=alert.id
+        )
+        await db.commit()
+        alert_id = alert.id
+
+    yield session_factory, alert_id
+    await engine.dispose()
+
+
+async def _state(session_factory, alert_id):
+    async with session_factory() as db:
+        entry = (await db.execute(select(EmailOutbox))).scalar_one()
+        alert = await db.get(Alert, alert_id)
+        return entry, alert
+
+
+class TestBackoff:
+    """Exponentielle Wartezeit mit Obergrenze / Espera exponencial com limite"""
+
+    def test_compute_backoff(self):
+        assert compute_backoff(1, 60, 3600) == 60
+        assert compute_backoff(2, 60, 3600) == 120
+        assert compute_backoff(4, 60, 3600) == 480
+        assert compute_backoff(10, 60, 3600) == 3600
+
+
+class TestDrain:
+    """Abarbeitung durch den Worker / Processamento pelo worker"""
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_rescheduled(self, queued):
+        session_factory, alert_id = queued
+        async with session_factory() as db:
+            stats = await EmailOutboxService(db, mailer=_mailer(False)).drain_once()
+        assert stats == {"claimed": 1, "sent": 0, "retry": 1, "dead": 0}
+
+        entry, alert = await _state(session_factory, alert_id)
+        assert entry.status == OutboxStatus.PENDING
+        assert entry.attempts == 1
+        assert entry.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+        # Alert bleibt offen statt FAILED / Alerta continua pendente em vez de FAILED
+        assert alert.status == AlertStatus.PENDING
+
+        # Vor Ablauf des Backoffs wird nichts reserviert / Nada é reservado antes do fim do backoff
+        async with session_factory() as db:
+            assert (await EmailOutboxService(db, mailer=_mailer(True)).drain_once())["claimed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_success_marks_alert_sent(self, queued):
+        session_factory, alert_id = queued
+        async with session_factory() as db:
+            stats = await EmailOutboxService(db, mailer=_mailer(True)).drain_once()
+        assert stats["sent"] == 1
+
+        entry, alert = await _state(session_factory, alert_id)
+        assert entry.status == OutboxStatus.SENT
+        assert entry.sent_at is not None
+        assert alert.status == AlertStatus.SENT
+
+    @pytest.mark.asyncio
+    async def test_max_attempts_dead_letters(self, queued):
+        session_factory, alert_id = queued
+        async with session_factory() as db:
+            await db.execute(update(EmailOutbox).values(attempts=5, max_attempts=6))
+            await db.commit()
+            stats = await EmailOutboxService(db, mailer=_mailer(False)).drain_once()
+        assert stats["dead"] == 1
+
+        entry, alert = await _state(session_factory, alert_id)
+        assert entry.status == OutboxStatus.DEAD
+        assert entry.attempts == 6
+        assert alert.status == AlertStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, queued):
+        session_factory, alert_id = queued
+        async with session_factory() as db:
+            # Worker abgestürzt während SENDING / Worker caiu durante SENDING
+            await db.execute(update(EmailOutbox).values(
+                status=OutboxStatus.SENDING, next_attempt_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+            ))
+            await db.commit()
+            stats = await EmailOutboxService(db, mailer=_mailer(True)).drain_once()
+        assert stats["sent"] == 1
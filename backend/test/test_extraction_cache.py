@@ -0,0 +1,83 @@
+"""
+Tests für den Extraktions-Cache (Treffer, LRU-Verdrängung, Versionswechsel)
+Testes para o cache de extração (acerto, remoção LRU, troca de versão)
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.alert import Alert  # noqa: F401  (Mapper-Registrierung / registro dos mappers)
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.services.extraction_cache_service import ExtractionCacheService
+from app.services.pdf_reader_pkg.version import extraction_cache_version
+
+
+def _result(text: str) -> dict:
+    return {
+        "extraction": {"success": True, "text": text, "method": "adaptive", "page_backends": {1: "pymupdf"}},
+        "intelligent_data": {"title": "Mietvertrag"},
+    }
+
+
+class TestExtractionCache:
+    """Inhaltsadressierter Cache / Cache endereçado por conteúdo"""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_put(self, session_factory):
+        async with session_factory() as db:
+            cache = ExtractionCacheService(db)
+            assert await cache.get("a" * 64, "combined") is None
+            assert await cache.put("a" * 64, "combined", _result("Vertragstext")) is True
+
+            cached = await cache.get("a" * 64, "combined")
+            assert cached["cached"] is True
+            assert cached["extraction"]["text"] == "Vertragstext"
+            assert cached["intelligent_data"] == {"title": "Mietvertrag"}
+            # Andere Methode = anderer Schlüssel / Outro método = outra chave
+            assert await cache.get("a" * 64, "pdfplumber") is None
+
+            text, text_hash = await cache.cached_ocr_text("a" * 64)
+            assert text == "Vertragstext" and len(text_hash) == 64
+            entry = (await db.execute(select(ExtractionCacheEntry))).scalar_one()
+            assert entry.hit_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_is_not_cached(self, session_factory):
+        async with session_factory() as db:
+            cache = ExtractionCacheService(db)
+            assert await cache.put("b" * 64, "combined", {"extraction": {"success": False}}) is False
+            assert await cache.get("b" * 64, "combined") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_keeps_recently_used(self, session_factory):
+        async with session_factory() as db:
+            probe = ExtractionCacheService(db, max_bytes=10**9)
+            await probe.put("0" * 64, "combined", _result("x" * 500))
+            entry_size = (await db.execute(select(ExtractionCacheEntry.size_bytes))).scalar_one()
+            await db.execute(ExtractionCacheEntry.__table__.delete())
+            await db.commit()
+
+            cache = ExtractionCacheService(db, max_bytes=entry_size * 2)
+            await cache.put("1" * 64, "combined", _result("x" * 500))
+            await cache.put("2" * 64, "combined", _result("x" * 500))
+            # Zugriff macht Eintrag 1 zum zuletzt genutzten / Acesso torna a entrada 1 a mais recente
+            assert await cache.get("1" * 64, "combined") is not None
+            await cache.put("3" * 64, "combined", _result("x" * 500))
+
+            assert await cache.get("2" * 64, "combined") is None
+            assert await cache.get("1" * 64, "combined") is not None
+            assert await cache.get("3" * 64, "combined") is not None
+
+    @pytest.mark.asyncio
+    async def test_rules_version_change_invalidates(self, session_factory):
+        async with session_factory() as db:
+            old = ExtractionCacheService(db, version="1.0-alt")
+            await old.put("c" * 64, "combined", _result("alter Text"))
+
+            current = ExtractionCacheService(db)
+            assert current.version == extraction_cache_version()
+            assert await current.get("c" * 64, "combined") is None
+
+            await current.put("d" * 64, "combined", _result("neuer Text"))
+            versions = (await db.execute(select(ExtractionCacheEntry.extractor_version))).scalars().all()
+            assert versions == [current.version]
@@ -0,0 +1,144 @@
+"""
+Tests für die Extraktions-Engine (Prozesspool, Timeouts, Neustart)
+Testes para o motor de extração (pool de processos, timeouts, reinício)
+"""
+
+import asyncio
+import signal
+import time
+
+import pytest
+
+from app.services import extraction_engine
+from app.services.extraction_engine import ExtractionEngine, ExtractionTimeoutError
+
+
+class _SlowReader:
+    """Ersetzt den PDF-Reader in geforkten Workern / Substitui o leitor de PDF nos workers (fork)"""
+
+    def __init__(self, block_alarm: bool = False):
+        self.block_alarm = block_alarm
+
+    def _ensure_dateparser(self):
+        return None
+
+    def extract_text_combined(self, pdf_path):
+        if pdf_path == "fast.pdf":
+            return {"success": True, "text": "schnell"}
+        if self.block_alarm:
+            # Simuliert C-Code, der Signale ignoriert / Simula código C que ignora sinais
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        time.sleep(30)
+        return {"success": True, "text": ""}
+
+    def extract_intelligent_data(self, text):
+        return {"title": text}
+
+
+def _hanging_render(pdf_path, page_number, width):
+    time.sleep(30)
+    return b""
+
+
+@pytest.fixture
+def contract_pdf(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    path = tmp_path / "vertrag.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Mietvertrag\nMax Muster GmbH\nkontakt@muster.de")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+class TestExtractionEngine:
+    """Extraktion in Worker-Prozessen / Extração em processos worker"""
+
+    @pytest.mark.asyncio
+    async def test_extracts_in_warm_worker(self, contract_pdf):
+        engine = ExtractionEngine(workers=1, timeout=60, memory_limit_mb=1024)
+        try:
+            pids = await engine.start()
+            result = await engine.extract(contract_pdf, "pymupdf")
+            second = await engine.extract(contract_pdf, "combined")
+        finally:
+            await engine.close()
+
+        assert len(pids) == 1
+        assert result["extraction"]["success"] is True
+        assert "Mietvertrag" in result["extraction"]["text"]
+        assert "intelligent_data" in result
+        assert second["extraction"]["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_in_thread_fallback(self, contract_pdf):
+        engine = ExtractionEngine(workers=0)
+        result = await engine.extract(contract_pdf, "pdfplumber")
+        assert "Mietvertrag" in result["extraction"]["text"]
+
+    @pytest.mark.asyncio
+    async def test_job_timeout_keeps_pool(self, monkeypatch):
+        monkeypatch.setattr(extraction_engine, "_reader", _SlowReader())
+        engine = ExtractionEngine(workers=1, timeout=0.5, memory_limit_mb=0, start_method="fork")
+        try:
+            with pytest.raises(ExtractionTimeoutError):
+                await engine.extract("slow.pdf")
+            # SIGALRM im Worker genügt, kein Neustart nötig / SIGALRM no worker basta, sem reinício
+            assert engine.restarts == 0
+            assert (await engine.extract("fast.pdf"))["intelligent_data"] == {"title": "schnell"}
+        finally:
+            await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_hung_worker_restarts_pool(self, monkeypatch):
+        monkeypatch.setattr(extraction_engine, "_reader", _SlowReader(block_alarm=True))
+        monkeypatch.setattr(ExtractionEngine, "KILL_GRACE_SECONDS", 0.5)
+        engine = ExtractionEngine(workers=1, timeout=0.5, memory_limit_mb=0, start_method="fork")
+        try:
+            with pytest.raises(ExtractionTimeoutError):
+                await engine.extract("slow.pdf")
+            assert engine.restarts == 1
+            assert (await engine.extract("fast.pdf"))["extraction"]["success"] is True
+        finally:
+            await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_restarted_pool_becomes_ready_again(self, monkeypatch):
+        monkeypatch.setattr(extraction_engine, "_reader", _SlowReader(block_alarm=True))
+        monkeypatch.setattr(ExtractionEngine, "KILL_GRACE_SECONDS", 0.5)
+        engine = ExtractionEngine(workers=1, timeout=0.5, memory_limit_mb=0, start_method="fork", preload_models=False)
+        try:
+            await engine.start()
+            assert engine.warm is True
+            with pytest.raises(ExtractionTimeoutError):
+                await engine.extract("slow.pdf")
+            assert engine.restarts == 1
+            # Neuer Pool wird im Hintergrund aufgewärmt (Readiness) / Novo pool é aquecido em segundo plano (readiness)
+            await engine._rewarm_task
+            assert engine.warm is True
+            assert (await engine.extract("fast.pdf"))["extraction"]["success"] is True
+            assert engine.warm is True
+        finally:
+            await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_hung_render_spares_extraction_pool(self, monkeypatch):
+        from app.services import thumbnail_service
+
+        monkeypatch.setattr(extraction_engine, "_reader", _SlowReader())
+        monkeypatch.setattr(thumbnail_service, "render_page_png", _hanging_render)
+        engine = ExtractionEngine(
+            workers=1, timeout=5, memory_limit_mb=0, start_method="fork", preload_models=False, render_timeout=0.5
+        )
+        try:
+            await engine.start()
+            extraction = asyncio.ensure_future(engine.extract("fast.pdf"))
+            with pytest.raises(ExtractionTimeoutError):
+                await engine.render_page("vertrag.pdf", 1, 160)
+            # Nur der Render-Pool wird neu gestartet / Só o pool de renderização é reiniciado
+            assert engine.render_restarts == 1 and engine.restarts == 0
+            assert engine.warm is True
+            assert (await extraction)["extraction"]["success"] is True
+        finally:
+            await engine.close()
@@ -0,0 +1,87 @@
+"""
+Tests für den Extraktor-Router nach Vertragstyp
+Testes para o roteador de extratores por tipo de contrato
+"""
+
+from app.services.contract_import_service import build_extracted_draft
+from app.services.pdf_reader import PDFReaderService
+from app.services.pdf_reader_pkg import extractor_router
+from app.services.pdf_reader_pkg.extractor_router import (
+    TYPE_FIELDS,
+    classify_contract_type,
+    extract_contract_fields,
+)
+
+RENTAL = (
+    "Mietvertrag über Wohnraum in Berlin\n"
+    "zwischen der Muster GmbH (Vermieter) und Herrn Max Beispiel (Mieter).\n"
+    "Die Miete beträgt monatlich 950,00 EUR zuzüglich Nebenkosten. Die Kaution beträgt 2.850,00 EUR.\n"
+    "Mietbeginn: 01.03.2025. Die Kündigungsfrist: 3 Monate.\n"
+)
+
+SERVICE = (
+    "Dienstleistungsvertrag über Wartung und Support\n"
+    "zwischen der Muster GmbH, Hauptstraße 12, 10115 Berlin und der Beispiel AG.\n"
+    "Die Vergütung beträgt monatlich 1.200,00 EUR. Beginn: 01.04.2025.\n"
+    "Allgemeine Geschäftsbedingungen: Es gelten die beigefügten Bedingungen des Auftragnehmers in der aktuellen Fassung.\n"
+)
+
+
+def test_classify_by_keywords_in_head():
+    assert classify_contract_type(RENTAL) == "RENTAL"
+    assert classify_contract_type("Pachtvertrag über eine landwirtschaftliche Fläche") == "LEASE"
+    assert classify_contract_type("Dienstleistungsvertrag für Wartung und Support") == "SERVICE"
+    assert classify_contract_type("Arbeitsvertrag zwischen Arbeitgeber und Arbeitnehmer") == "EMPLOYMENT"
+    assert classify_contract_type("Ohne erkennbare Schlüsselwörter") == "OTHER"
+    # Nur der Dokumentanfang zählt / Só o início do documento conta
+    assert classify_contract_type("Allgemeines " * 1000 + "Mietvertrag") == "OTHER"
+
+
+def test_runs_only_extractors_of_the_type(monkeypatch):
+    called = []
+    original = dict(extractor_router.FIELD_EXTRACTORS)
+    monkeypatch.setattr(extractor_router, "FIELD_EXTRACTORS", {
+        name: (lambda text, scan, _name=name, _func=func: called.append(_name) or _func(text, scan))
+        for name, func in original.items()
+    })
+
+    result = extract_contract_fields(RENTAL)
+
+    assert result["contract_type"] == "RENTAL"
+    assert called == list(TYPE_FIELDS["RENTAL"])
+    assert "legal_entities" not in result and "key_terms" not in result
+    assert set(result["extractor_timings"]) == {"classify", *TYPE_FIELDS["RENTAL"]}
+    assert all(ms >= 0 for ms in result["extractor_timings"].values())
+
+
+def test_rental_fields():
+    result = extract_contract_fields(RENTAL)
+    assert result["payment_frequency"] == "monatlich"
+    assert result["notice_period"]["days"] == 90
+    assert result["start_date"] == result["dates"]["start_date"]
+    assert result["money_values"]["currency"] == "EUR"
+
+
+def test_unknown_type_runs_all_extractors():
+    result = extract_contract_fields("Vereinbarung vom 01.01.2025 über 1.000,00 EUR jährlich.")
+    assert result["contract_type"] == "OTHER"
+    assert set(result["extractor_timings"]) == {"classify", *extractor_router.FIELD_EXTRACTORS}
+    assert result["payment_frequency"] == "jährlich"
+
+
+def test_pdf_reader_uses_router():
+    data = PDFReaderService().extract_intelligent_data(RENTAL)
+    assert data["contract_type"] == "RENTAL"
+    assert data["title"]
+    assert "extractor_timings" in data
+
+
+def test_service_contract_keeps_draft_fields():
+    result = extract_contract_fields(SERVICE)
+    assert result["contract_type"] == "SERVICE"
+    assert "key_terms" not in result and "contract_complexity" not in result
+
+    draft = build_extracted_draft({"text": SERVICE}, result, "combined")
+    assert draft.client_address == "Hauptstraße 12, 10115 Berlin"
+    assert draft.terms_and_conditions.startswith("Es gelten")
+    assert draft.value is not None and draft.start_date is not None
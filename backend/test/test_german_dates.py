@@ -0,0 +1,65 @@
+"""
+Tests für den schnellen deutschen Datumsparser
+Testes para o analisador rápido de datas alemãs
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.services.model_registry import get_model_registry
+from app.services.pdf_reader_pkg import dates
+from app.services.pdf_reader_pkg.dates import extract_dates, parse_german_date
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("31.12.2026", datetime(2026, 12, 31)),
+    ("01/02/2025", datetime(2025, 2, 1)),
+    ("1-2-2025", datetime(2025, 2, 1)),
+    ("1. 2. 2025", datetime(2025, 2, 1)),
+    ("29.02.2024", datetime(2024, 2, 29)),
+    ("31.02.2025", None),
+    ("1. Januar 2025", datetime(2025, 1, 1)),
+    ("3. März 2026", datetime(2026, 3, 3)),
+    ("15 Okt. 2024", datetime(2024, 10, 15)),
+])
+def test_fast_path_without_dateparser(monkeypatch, raw, expected):
+    def fail(*args, **kwargs):
+        raise AssertionError("dateparser darf nicht aufgerufen werden / dateparser não deve ser chamado")
+
+    monkeypatch.setattr(dates, "_parse_with_dateparser", fail)
+    assert parse_german_date(raw) == expected
+
+
+def test_free_form_falls_back_to_memoized_dateparser(monkeypatch):
+    pytest.importorskip("dateparser")
+    import dateparser
+
+    # Register vorher laden (Aufwärm-Aufruf) / Carregar o registro antes (chamada de aquecimento)
+    get_model_registry().get("dateparser")
+    calls = []
+    original = dateparser.parse
+
+    def counting(value, **kwargs):
+        calls.append(value)
+        return original(value, **kwargs)
+
+    monkeypatch.setattr(dateparser, "parse", counting)
+    dates._parse_with_dateparser.cache_clear()
+    assert parse_german_date("Anfang 2025") == parse_german_date("Anfang 2025")
+    assert calls == ["Anfang 2025"]
+
+
+def test_extract_dates_finds_month_names():
+    text = "Vertragsbeginn am 1. Januar 2025. Das Vertragsende ist bis 31.12.2026."
+    result = extract_dates(text)
+    assert result["start_date"] == "1. Januar 2025"
+    assert result["end_date"] == "31.12.2026"
+
+
+def test_fast_path_matches_dateparser():
+    # Laufzeitvergleich: benchmarks/bench_german_dates.py / Comparação de tempo: benchmarks/bench_german_dates.py
+    dateparser = pytest.importorskip("dateparser")
+    raw = [f"{day:02d}.{month:02d}.{year}" for day in range(1, 29, 3) for month in range(1, 13, 2) for year in (2024, 2025)]
+
+    assert [parse_german_date(value) for value in raw] == [dateparser.parse(value, languages=["de"]) for value in raw]
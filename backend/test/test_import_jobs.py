@@ -0,0 +1,146 @@
+"""
+Tests für die Import-Job-Warteschlange (Fortschritt, Fehler, Neustart, Statistik)
+Testes para a fila de jobs de importação (progresso, erros, reinício, estatísticas)
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import Base
+from app.models.alert import Alert  # noqa: F401  (Mapper-Registrierung / registro dos mappers)
+from app.models.import_job import ImportJobStage, ImportJobStatus
+from app.schemas.extracted_contract import ExtractionResponse
+from app.schemas.import_job import ImportJobResponse
+from app.services.contract_import_service import ContractImportError
+from app.services.import_job_service import ImportJobService
+from app.utils.upload_stream import IngestedUpload
+
+
+class _FakeImportService:
+    """Ersetzt die PDF-Pipeline / Substitui o pipeline de PDF"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.stages = []
+
+    async def process_pdf(self, *, pdf_path, original_file_name, storage_name, file_hash, file_size,
+                          extraction_method="combined", include_ocr=True, started_at=None, on_stage=None):
+        for stage in (ImportJobStage.VALIDATING, ImportJobStage.EXTRACTING):
+            await on_stage(stage)
+            self.stages.append(stage)
+        if self.error is not None:
+            raise self.error
+        return ExtractionResponse(
+            success=True,
+            processing_time=0.1,
+            file_size=file_size,
+            original_file_name=original_file_name,
+            original_file_storage_name=storage_name,
+            original_file_sha256=file_hash,
+            temp_file_path=pdf_path,
+        )
+
+
+def _upload(name: str = "a") -> IngestedUpload:
+    return IngestedUpload(path=f"uploads/contracts/temp/job_{name}.pdf", sha256=name * 64, size=1234)
+
+
+class TestImportJobs:
+    """Persistente Import-Warteschlange / Fila de importação persistente"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_to_completion(self, session_factory):
+        async with session_factory() as db:
+            service = ImportJobService(db)
+            job = await service.enqueue(1, _upload(), "vertrag.pdf", "job_1_vertrag.pdf")
+            assert job.status == ImportJobStatus.QUEUED and job.progress == 0
+
+            claimed = await service.claim_next()
+            assert claimed.id == job.id and claimed.status == ImportJobStatus.RUNNING
+            fake = _FakeImportService()
+            await service.run_job(claimed, import_service=fake)
+
+        async with session_factory() as db:
+            stored = await ImportJobService(db).get_job(job.id)
+            response = ImportJobResponse.from_job(stored)
+            assert fake.stages == [ImportJobStage.VALIDATING, ImportJobStage.EXTRACTING]
+            assert response.status == ImportJobStatus.SUCCEEDED
+            assert response.stage == ImportJobStage.DONE and response.progress == 100
+            assert response.result.original_file_name == "vertrag.pdf"
+            assert response.result.original_file_sha256 == "a" * 64
+            assert await ImportJobService(db).claim_next() is None
+
+    @pytest.mark.asyncio
+    async def test_pipeline_error_keeps_stage_and_status_code(self, session_factory):
+        async with session_factory() as db:
+            service = ImportJobService(db)
+            await service.enqueue(1, _upload("b"), "doppelt.pdf", "job_1_doppelt.pdf")
+            job = await service.claim_next()
+            await service.run_job(job, import_service=_FakeImportService(ContractImportError("Duplikat: x", 400)))
+
+            stored = await service.get_job(job.id)
+            assert stored.status == ImportJobStatus.FAILED
+            assert stored.stage == ImportJobStage.EXTRACTING
+            assert stored.error_status_code == 400 and stored.error_message == "Duplikat: x"
+            assert stored.result is None
+
+    @pytest.mark.asyncio
+    async def test_abandoned_job_is_reclaimed_after_lease(self, session_factory):
+        async with session_factory() as db:
+            service = ImportJobService(db)
+            await service.enqueue(1, _upload("c"), "neustart.pdf", "job_1_neustart.pdf")
+            job = await service.claim_next()
+            # Worker stirbt: Job bleibt RUNNING / Worker morre: job continua RUNNING
+            assert await service.claim_next() is None
+
+            later = datetime.now(timezone.utc) + timedelta(days=1)
+            reclaimed = await service.claim_next(now=later)
+            assert reclaimed.id == job.id and reclaimed.attempts == 2
+
+            # Nach max_attempts wird der Job aufgegeben / Após max_attempts o job é abandonado
+            reclaimed.attempts = reclaimed.max_attempts
+            await db.commit()
+            assert await service.claim_next(now=later + timedelta(days=1)) is None
+            stored = await service.get_job(job.id)
+            assert stored.status == ImportJobStatus.FAILED and stored.error_status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_queue_stats(self, session_factory):
+        async with session_factory() as db:
+            service = ImportJobService(db)
+            for name in "def":
+                await service.enqueue(1, _upload(name), f"{name}.pdf", f"job_1_{name}.pdf")
+            job = await service.claim_next()
+            await service.run_job(job, import_service=_FakeImportService())
+            await service.claim_next()
+
+            stats = await service.queue_stats(window_seconds=600)
+            assert stats["queued"] == 1 and stats["running"] == 1
+            assert stats["succeeded"] == 1 and stats["failed"] == 0
+            assert stats["throughput_per_minute"] == pytest.approx(0.1)
+            assert stats["avg_processing_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_claim_each_job_once(self, tmp_path):
+        # Datei-DB: zwei Sitzungen mit eigenen Verbindungen / BD em arquivo: duas sessões com conexões próprias
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with factory() as db:
+            job = await ImportJobService(db).enqueue(1, _upload("g"), "einmal.pdf", "job_1_einmal.pdf")
+
+        async def claim():
+            async with factory() as db:
+                return await ImportJobService(db).claim_next()
+
+        claims = await asyncio.gather(claim(), claim())
+        won = [claimed for claimed in claims if claimed is not None]
+        assert len(won) == 1 and won[0].id == job.id and won[0].attempts == 1
+        async with factory() as db:
+            stored = await ImportJobService(db).get_job(job.id)
+            assert stored.attempts == 1 and stored.status == ImportJobStatus.RUNNING
+        await engine.dispose()
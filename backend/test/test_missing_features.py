@@ -21,7 +21,7 @@ from datetime import date, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy import select, func
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 from app.core.database import Base, get_db
 from app.models.contract import Contract
@@ -247,7 +247,7 @@ async def test_alert_race_conditions(test_db, test_user):
         await session.commit()
     
     # Mock de envio de email / Email-Versand mocken
-    with patch('app.services.notification_service.send_email', return_value=True):
+    with patch('app.utils.smtp_pool.SMTPConnectionPool.send', new_callable=AsyncMock, return_value=True):
         # Executar process_due_alerts() simultaneamente em 5 workers
         # process_due_alerts() gleichzeitig in 5 Workers ausführen
         async def process_alerts():
@@ -310,7 +310,7 @@ async def test_bulk_alert_processing(test_db, test_user):
     start = time.time()
     
     # Mock de envio de email / Email-Versand mocken
-    with patch('app.services.notification_service.send_email', return_value=True):
+    with patch('app.utils.smtp_pool.SMTPConnectionPool.send', new_callable=AsyncMock, return_value=True):
         async with test_db() as session:
             service = NotificationService(session)
             result = await service.process_due_alerts()
@@ -421,7 +421,7 @@ async def test_ocr_to_alerts_workflow(client, test_db, auth_headers, test_user):
     # Schritt 3: Alerts manuell verarbeiten (Option A - aktuelles Verhalten)
     
     # Mock de envio de email / Email-Versand mocken
-    with patch('app.services.notification_service.send_email', return_value=True):
+    with patch('app.utils.smtp_pool.SMTPConnectionPool.send', new_callable=AsyncMock, return_value=True):
         async with test_db() as session:
             service = NotificationService(session)
             result = await service.process_due_alerts()
@@ -0,0 +1,88 @@
+"""
+Tests für das prozessweite Modellregister und die Readiness-Probe
+Testes para o registro de modelos do processo e a verificação de prontidão
+"""
+
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers import health
+from app.services import extraction_engine, model_registry
+from app.services.extraction_engine import ExtractionEngine
+from app.services.model_registry import ModelRegistry
+from app.services.pdf_reader import PDFReaderService
+
+
+@pytest.fixture
+def counting_registry(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def load_nlp():
+        calls.append("spacy_de")
+        release.wait(5)
+        return "nlp"
+
+    def load_missing():
+        raise ImportError("nicht installiert")
+
+    registry = ModelRegistry({"spacy_de": load_nlp, "dateparser": load_missing})
+    monkeypatch.setattr(model_registry, "_registry", registry)
+    return registry, release, calls
+
+
+def test_models_are_shared_across_reader_instances(counting_registry):
+    registry, release, calls = counting_registry
+    release.set()
+
+    assert PDFReaderService()._ensure_nlp() == "nlp"
+    assert PDFReaderService()._ensure_nlp() == "nlp"
+    assert calls == ["spacy_de"]
+    assert PDFReaderService()._ensure_dateparser() is None
+    assert registry.status()["dateparser"]["state"] == model_registry.UNAVAILABLE
+    assert registry.ready
+
+
+def test_background_preload_and_waiting_readers(counting_registry):
+    registry, release, calls = counting_registry
+    thread = registry.start_preload()
+    assert registry.start_preload() is thread
+    assert not registry.ready
+
+    results = []
+    reader = threading.Thread(target=lambda: results.append(registry.get("spacy_de")))
+    reader.start()
+    release.set()
+    thread.join(5)
+    reader.join(5)
+
+    assert results == ["nlp"]
+    assert calls == ["spacy_de"]
+    assert registry.status()["spacy_de"]["state"] == model_registry.WARM
+    assert registry.ready
+
+
+@pytest.mark.asyncio
+async def test_ready_probe_waits_for_models(counting_registry, monkeypatch):
+    registry, release, _ = counting_registry
+    monkeypatch.setattr(extraction_engine, "_engine", ExtractionEngine(workers=0))
+
+    registry.start_preload()
+    with pytest.raises(HTTPException) as error:
+        await health.health_check_ready()
+    assert error.value.status_code == 503
+
+    release.set()
+    registry.start_preload().join(5)
+    result = await health.health_check_ready()
+    assert result["models"]["warm"] is True
+    assert result["models"]["models"]["spacy_de"]["state"] == "warm"
+
+
+def test_worker_engine_is_warm_only_after_start(monkeypatch):
+    monkeypatch.setattr(extraction_engine, "_engine", ExtractionEngine(workers=2))
+    status = health.models_status()
+    assert status["warm"] is False
+    assert status["loaded_in"] == "extraction_workers"
@@ -0,0 +1,169 @@
+"""
+Tests für die SQL-Auswahl fälliger Alerts im NotificationService
+Testes para a seleção SQL de alertas devidos no NotificationService
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import Base
+from app.models.alert import Alert, AlertStatus, AlertType
+from app.models.contract import Contract, ContractStatus, ContractType
+from app.models.user import User, UserRole, AccessLevel
+from app.models.email_outbox import EmailOutbox, OutboxStatus
+from app.services.email_outbox_service import EmailOutboxService
+from app.services.notification_service import NotificationService
+from app.services.stats_rollup_service import StatsRollupService
+from app.utils.smtp_pool import SMTPConnectionPool
+
+
+@pytest_asyncio.fixture
+async def env():
+    """Verträge an allen Tagesmarkern und daneben / Contratos em todos os marcos e fora deles"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    today = datetime.now(timezone.utc).date()
+    async with session_factory() as db:
+        owner = User(email="owner@example.com", name="Owner", password_hash="x", role=UserRole.STAFF,
+                     access_level=AccessLevel.LEVEL_1)
+        db.add(owner)
+        await db.commit()
+
+        contracts = {}
+        for label, days, status in [
+            ("t60", 60, ContractStatus.ACTIVE),
+            ("t30_sent", 30, ContractStatus.ACTIVE),
+            ("t10_failed", 10, ContractStatus.ACTIVE),
+            ("t1_other_sent", 1, ContractStatus.ACTIVE),
+            ("t30_draft", 30, ContractStatus.DRAFT),
+            ("t15", 15, ContractStatus.ACTIVE),
+        ]:
+            contract = Contract(
+                title=label, client_name="Kunde", client_email=f"{label}@example.com",
+                contract_type=ContractType.SERVICE, status=status, start_date=today - timedelta(days=100),
+                end_date=today + timedelta(days=days), created_by=owner.id,
+            )
+            db.add(contract)
+            contracts[label] = contract
+        await db.commit()
+
+        now = datetime.now(timezone.utc)
+        db.add_all([
+            Alert(contract_id=contracts["t30_sent"].id, alert_type=AlertType.T_MINUS_30,
+                  status=AlertStatus.SENT, scheduled_for=now),
+            Alert(contract_id=contracts["t10_failed"].id, alert_type=AlertType.T_MINUS_10,
+                  status=AlertStatus.FAILED, scheduled_for=now),
+            # Gesendeter Alert eines anderen Typs blockiert T-1 nicht / Alerta enviado de outro tipo não bloqueia T-1
+            Alert(contract_id=contracts["t1_other_sent"].id, alert_type=AlertType.T_MINUS_10,
+                  status=AlertStatus.SENT, scheduled_for=now),
+        ])
+        await db.commit()
+
+    yield engine, session_factory, contracts
+    await engine.dispose()
+
+
+class TestDueAlertSelection:
+    """Eine Abfrage mit Anti-Join statt N+1 / Uma consulta com anti-join em vez de N+1"""
+
+    @pytest.mark.asyncio
+    async def test_selects_only_contracts_needing_alerts(self, env):
+        engine, session_factory, contracts = env
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        async with session_factory() as db:
+            due = await NotificationService(db)._get_contracts_due_for_alerts(datetime.now(timezone.utc).date())
+
+        # Selectin-Loads der Vertragsbeziehungen ausgenommen / Exceto carregamentos selectin das relações
+        assert len([s for s in statements if "alerts" in s]) == 1
+        by_title = {contract.title: (alert, days) for contract, alert, days in due}
+        assert set(by_title) == {"t60", "t10_failed", "t1_other_sent"}
+        assert by_title["t60"] == (None, 60)
+        assert by_title["t1_other_sent"] == (None, 1)
+        retry, days = by_title["t10_failed"]
+        assert days == 10 and retry.status == AlertStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_process_due_alerts_enqueues_once(self, env, smtp_server):
+        _, session_factory, contracts = env
+        async with session_factory() as db:
+            first = await NotificationService(db).process_due_alerts()
+        async with session_factory() as db:
+            # Eingereihte Alerts werden nicht erneut ausgewählt / Alertas enfileirados não são selecionados de novo
+            second = await NotificationService(db).process_due_alerts()
+
+        assert first.total == 3
+        assert second.total == 0
+        assert smtp_server.handler.envelopes == []
+
+        mailer = SMTPConnectionPool(host=smtp_server.host, port=smtp_server.port, use_tls=False, size=2)
+        try:
+            async with session_factory() as db:
+                stats = await EmailOutboxService(db, mailer=mailer).drain_once()
+        finally:
+            await mailer.close()
+
+        assert stats == {"claimed": 3, "sent": 3, "retry": 0, "dead": 0}
+        assert len(smtp_server.handler.envelopes) == 3
+        async with session_factory() as db:
+            alerts = (await db.execute(select(Alert.contract_id, Alert.alert_type, Alert.status))).all()
+            assert len(alerts) == 5
+            assert all(status == AlertStatus.SENT for _, _, status in alerts)
+            retried = [a for a in alerts if a.contract_id == contracts["t10_failed"].id]
+            assert len(retried) == 1
+            outbox = (await db.execute(select(EmailOutbox.status))).scalars().all()
+            assert outbox == [OutboxStatus.SENT] * 3
+
+
+class TestBulkAlertCreation:
+    """Ein INSERT und ein Commit je Stapel / Um INSERT e um commit por lote"""
+
+    @pytest.mark.asyncio
+    async def test_batched_run_inserts_and_commits_per_chunk(self, env):
+        engine, session_factory, contracts = env
+        today = datetime.now(timezone.utc).date()
+        async with session_factory() as db:
+            owner_id = contracts["t60"].created_by
+            db.add_all([
+                Contract(title=f"bulk{i}", client_name="Kunde", client_email=f"bulk{i}@example.com",
+                         contract_type=ContractType.SERVICE, status=ContractStatus.ACTIVE,
+                         start_date=today - timedelta(days=100), end_date=today + timedelta(days=30),
+                         created_by=owner_id, department="IT")
+                for i in range(22)
+            ])
+            await db.commit()
+            await StatsRollupService(db).rebuild()
+
+        inserts, commits = [], []
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statement.startswith("INSERT INTO alerts") and inserts.append(statement))
+        event.listen(engine.sync_engine, "commit", lambda conn: commits.append(1))
+
+        async with session_factory() as db:
+            result = await NotificationService(db).process_due_alerts(batch_size=10)
+
+        # 25 fällige Verträge in 3 Stapeln / 25 contratos devidos em 3 lotes
+        assert result.total == 25
+        assert len(inserts) == 3
+        assert len(commits) == 3
+        async with session_factory() as db:
+            queued = (await db.execute(select(func.count(EmailOutbox.id)))).scalar()
+            assert queued == 25
+            report = await StatsRollupService(db).check()
+            assert report["mismatches"] == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_size(self, env):
+        _, session_factory, _ = env
+        async with session_factory() as db:
+            with pytest.raises(ValueError):
+                await NotificationService(db).process_due_alerts(batch_size=0)
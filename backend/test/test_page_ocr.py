@@ -0,0 +1,95 @@
+"""
+Tests für das seitenweise OCR (Textschicht-Erkennung, Zusammenführung)
+Testes para o OCR por página (detecção da camada de texto, mesclagem)
+"""
+
+import pytest
+
+from app.services import extraction_engine
+from app.services.pdf_reader import PDFReaderService
+from app.services.pdf_reader_pkg import ocr
+
+TEXT = "Mietvertrag zwischen der Max Muster GmbH und dem Kunden. Laufzeit bis 31.12.2026.\n" * 3
+
+
+@pytest.fixture
+def scanned_pdf(tmp_path):
+    """Textseite, Bildseite ohne Text, Textseite / Página de texto, página sem texto, página de texto"""
+    fitz = pytest.importorskip("fitz")
+    path = tmp_path / "gescannt.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 790), TEXT, fontsize=11)
+    doc.new_page().draw_rect(fitz.Rect(50, 50, 550, 790), fill=(0.8, 0.8, 0.8))
+    doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 790), TEXT, fontsize=11)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """Ersetzt Tesseract und merkt sich die erkannten Seiten / Substitui o Tesseract e registra as páginas"""
+    calls = []
+
+    def fake_ocr_page(pdf_path, page_number, dpi=300, language="deu", timeout=0):
+        calls.append((page_number, dpi, language))
+        text = f"Gescannte Anlage {page_number} zum Mietvertrag mit der Max Muster GmbH, Laufzeit bis 31.12.2026."
+        return {"page": page_number, "success": True, "text": text, "confidence": 87.5, "language": language}
+
+    monkeypatch.setattr(ocr, "tesseract_available", lambda: True)
+    monkeypatch.setattr(ocr, "ocr_page", fake_ocr_page)
+    return calls
+
+
+def _reader(**overrides) -> PDFReaderService:
+    reader = PDFReaderService()
+    reader.ocr_workers = 1
+    for name, value in overrides.items():
+        setattr(reader, name, value)
+    return reader
+
+
+def test_detects_pages_without_text_layer(scanned_pdf):
+    assert ocr.pages_without_text_layer(scanned_pdf) == [2]
+    assert ocr.rasterize_page(scanned_pdf, 2, dpi=50).startswith(b"\x89PNG")
+
+
+def test_text_from_ocr_data_groups_lines_and_averages_confidence():
+    data = {
+        "text": ["", "Vertrag", "Nr.", "7", "", "Seite"],
+        "conf": ["-1", "90", "80.0", 70, "-1", "60"],
+        "block_num": [1, 1, 1, 1, 2, 2],
+        "par_num": [1, 1, 1, 1, 1, 1],
+        "line_num": [1, 1, 1, 2, 1, 1],
+    }
+    result = ocr.text_from_ocr_data(data)
+    assert result["text"] == "Vertrag Nr.\n7\n\nSeite"
+    assert result["confidence"] == 75.0
+    assert ocr.ocr_language("deu", "eng") == "deu+eng"
+    assert ocr.ocr_language("deu", None) == "deu"
+
+
+def test_only_pages_without_text_are_ocred(scanned_pdf, fake_tesseract):
+    reader = _reader(ocr_dpi=200, ocr_second_language="eng")
+    result = ocr.apply_page_ocr(reader, scanned_pdf, reader.extract_text_combined(scanned_pdf))
+
+    assert fake_tesseract == [(2, 200, "deu+eng")]
+    assert [page["page"] for page in result["pages"]] == [1, 2, 3]
+    assert result["pages"][1]["backend"] == "ocr" and result["pages"][1]["ocr_confidence"] == 87.5
+    assert result["page_backends"][2] == "ocr" and result["page_backends"][1] == "pymupdf"
+    assert result["ocr_pages"] == [2] and result["ocr_confidence"] == 87.5
+    assert 2 not in result["low_quality_pages"]
+    assert result["text"] == "\n".join(page["text"] for page in result["pages"])
+    assert result["pages"][1]["text"].startswith("Gescannte Anlage 2")
+    assert result["total_chars"] == sum(page["char_count"] for page in result["pages"])
+
+
+def test_ocr_can_be_disabled(scanned_pdf, fake_tesseract, monkeypatch):
+    monkeypatch.setattr(extraction_engine, "_reader", _reader())
+    result = extraction_engine._run_extraction(scanned_pdf, "combined", None, False)
+    assert fake_tesseract == []
+    assert "ocr_pages" not in result["extraction"]
+
+    result = extraction_engine._run_extraction(scanned_pdf, "pymupdf", None, True)
+    assert fake_tesseract == [(2, 300, "deu")]
+    assert result["extraction"]["ocr_pages"] == [2]
@@ -0,0 +1,83 @@
+"""
+Tests für das Muster-Register und den gemeinsamen Scan der Feldextraktion
+Testes para o registro de padrões e a varredura compartilhada da extração de campos
+"""
+
+import re
+
+from app.services.pdf_reader_pkg import patterns
+from app.services.pdf_reader_pkg.analysis import extract_advanced_context_data, extract_legal_entities
+from app.services.pdf_reader_pkg.dates import calculate_notice_period
+from app.services.pdf_reader_pkg.financials import extract_money_values
+from app.services.pdf_reader_pkg.parsers import extract_client_name, extract_phone, extract_title
+from app.services.pdf_reader_pkg.patterns import PatternScan, scan_text
+
+TEXT = (
+    "Mietvertrag über Büroräume in Berlin\n"
+    "zwischen der Muster GmbH und der Beispiel AG, Telefon +49 30 1234567.\n"
+    "Die Miete beträgt € 1.250,00, die Kaution 3.750,00 EUR. Die Kündigungsfrist: 3 Monate.\n"
+)
+
+
+class _CountingPattern:
+    """Zählt Durchläufe eines kompilierten Musters / Conta as varreduras de um padrão compilado"""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.calls = 0
+
+    def finditer(self, text):
+        self.calls += 1
+        return self.pattern.finditer(text)
+
+    def search(self, text):
+        self.calls += 1
+        return self.pattern.search(text)
+
+
+def test_registry_is_compiled_at_import():
+    for field, compiled in patterns.REGISTRY.items():
+        assert len(compiled) == len(patterns.FIELD_PATTERNS[field])
+        assert all(isinstance(p, re.Pattern) for p in compiled)
+
+
+def test_scan_returns_tagged_matches_with_offsets():
+    found = scan_text(TEXT, ["money", "company"])
+    money = found["money"]
+    assert [(m.pattern, m.group(1)) for m in money] == [(0, "1.250,00"), (3, "3.750,00")]
+    assert TEXT[money[0].start:money[0].end] == money[0].text == "€ 1.250,00"
+    assert [m.text for m in found["company"]] == ["Muster GmbH", "Beispiel AG"]
+    assert {m.field for m in found["company"]} == {"company"}
+
+
+def test_priority_is_per_pattern_not_per_position():
+    # "Mietvertrag" steht vorne, "Vertrag über" hat aber die höhere Priorität
+    # "Mietvertrag" vem antes, mas "Vertrag über" tem prioridade maior
+    assert extract_title(TEXT) == "Büroräume in Berlin"
+    assert extract_client_name(TEXT) == "Muster GmbH"
+
+
+def test_shared_scan_runs_each_pattern_once(monkeypatch):
+    counting = {field: tuple(_CountingPattern(p) for p in compiled) for field, compiled in patterns.REGISTRY.items()}
+    monkeypatch.setattr(patterns, "REGISTRY", counting)
+
+    scan = PatternScan(TEXT)
+    assert extract_phone(TEXT, scan) == extract_phone(TEXT, scan)
+    assert extract_money_values(TEXT, scan)["value"] == "3.750,00"
+    assert extract_money_values(TEXT, scan)["value"] == "3.750,00"
+    extract_advanced_context_data(TEXT, scan)
+    assert calculate_notice_period(TEXT, scan)["days"] == 90
+
+    calls = [p.calls for compiled in counting.values() for p in compiled]
+    assert max(calls) == 1
+    # Nur das erste Telefonmuster wurde gebraucht / Só o primeiro padrão de telefone foi necessário
+    assert [p.calls for p in counting["phone"]] == [1, 0]
+
+
+def test_legal_entities_in_one_pass():
+    entities = extract_legal_entities("Vertrag mit Huber OHG; Schmidt & Co KG sowie Meier KG.")
+    assert [(e["name"], e["full_text"]) for e in entities] == [
+        ("Vertrag mit Huber", "Vertrag mit Huber OHG"),
+        ("Co", "Co KG"),
+        ("sowie Meier", "sowie Meier KG"),
+    ]
@@ -0,0 +1,92 @@
+"""
+Tests für die adaptive Extraktionskaskade (Qualitätsprüfung je Seite)
+Testes para a cascata de extração adaptativa (verificação de qualidade por página)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.pdf_reader import PDFReaderService
+from app.services.pdf_reader_pkg import extractors
+from app.services.pdf_reader_pkg.extractors import assess_page_quality
+
+TEXT = "Mietvertrag zwischen der Max Muster GmbH und dem Kunden. Laufzeit bis 31.12.2026.\n" * 3
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path):
+    """Zwei Textseiten und eine Seite ohne Textebene / Duas páginas de texto e uma sem texto"""
+    fitz = pytest.importorskip("fitz")
+    path = tmp_path / "gemischt.pdf"
+    doc = fitz.open()
+    for _ in range(2):
+        doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 790), TEXT, fontsize=11)
+    doc.new_page().draw_rect(fitz.Rect(50, 50, 550, 790), fill=(0.8, 0.8, 0.8))
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+class TestPageQuality:
+    """Heuristiken je Seite / Heurísticas por página"""
+
+    def test_clean_text_passes(self):
+        assert assess_page_quality(TEXT, coverage=0.2)["ok"] is True
+
+    def test_short_page_fails(self):
+        assert assess_page_quality("Seite 3", coverage=0.2)["ok"] is False
+
+    def test_garbage_glyphs_fail(self):
+        quality = assess_page_quality("(cid:12)(cid:44)(cid:7) " * 10 + TEXT[:40])
+        assert quality["garbage_ratio"] > 0.05
+        assert quality["ok"] is False
+        assert assess_page_quality("�" * 30 + TEXT)["ok"] is False
+
+    def test_low_coverage_fails(self):
+        assert assess_page_quality(TEXT, coverage=0.001)["ok"] is False
+
+
+class TestAdaptiveCascade:
+    """Kurzschluss nach PyMuPDF / Curto-circuito após o PyMuPDF"""
+
+    def test_only_failing_pages_reach_slower_backends(self, mixed_pdf):
+        reader = PDFReaderService()
+        with patch.object(extractors, "_pdfplumber_pages", wraps=extractors._pdfplumber_pages) as plumber, \
+                patch.object(extractors, "_pypdf2_pages", wraps=extractors._pypdf2_pages) as pypdf2:
+            result = reader.extract_text_combined(mixed_pdf)
+
+        assert result["success"] is True
+        assert result["method"] == "adaptive"
+        assert result["page_backends"] == {1: "pymupdf", 2: "pymupdf", 3: "pymupdf"}
+        assert result["fallback_pages"] == 1
+        assert result["low_quality_pages"] == [3]
+        assert plumber.call_args.args[2] == [3]
+        assert pypdf2.call_args.args[2] == [3]
+        assert all(page["backend"] == "pymupdf" for page in result["pages"])
+        assert "Max Muster GmbH" in result["text"]
+
+    def test_clean_document_skips_fallbacks(self, mixed_pdf, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        path = tmp_path / "sauber.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 790), TEXT, fontsize=11)
+        doc.save(str(path))
+        doc.close()
+
+        with patch.object(extractors, "_pdfplumber_pages") as plumber:
+            result = PDFReaderService().extract_text_combined(str(path))
+        plumber.assert_not_called()
+        assert result["fallback_pages"] == 0
+
+    def test_pymupdf_failure_falls_back_to_all_pages(self, mixed_pdf):
+        with patch.object(extractors, "_pymupdf_pages", side_effect=RuntimeError("defekt")):
+            result = PDFReaderService().extract_text_combined(mixed_pdf)
+        assert result["success"] is True
+        assert result["page_backends"][1] == "pdfplumber"
+        assert "pymupdf" in result["errors"]
+
+    def test_exhaustive_mode_keeps_previous_behaviour(self, mixed_pdf):
+        result = PDFReaderService().extract_text_exhaustive(mixed_pdf)
+        assert result["combined"] is True
+        assert set(result["all_methods"]) == {"pdfplumber", "pypdf2", "pymupdf"}
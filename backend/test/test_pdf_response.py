@@ -0,0 +1,98 @@
+"""
+Tests für die PDF-Auslieferung mit Range, ETag und bedingten GETs
+Testes para a entrega de PDF com Range, ETag e GET condicional
+"""
+
+import hashlib
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.utils.pdf_response import pdf_file_response
+
+CONTENT = b"%PDF-1.7\n" + bytes(range(256)) * 40
+
+
+@pytest.fixture
+def client(tmp_path):
+    path = tmp_path / "original.pdf"
+    path.write_bytes(CONTENT)
+    sha256 = hashlib.sha256(CONTENT).hexdigest()
+
+    app = FastAPI()
+
+    @app.get("/pdf")
+    async def serve(request: Request):
+        return pdf_file_response(request, str(path), sha256, {"Content-Disposition": "inline"})
+
+    @app.get("/pdf-ohne-hash")
+    async def serve_without_hash(request: Request):
+        return pdf_file_response(request, str(path))
+
+    return TestClient(app), f'"{sha256}"'
+
+
+def test_full_response_advertises_ranges_and_validators(client):
+    client, etag = client
+    response = client.get("/pdf")
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == etag
+    assert response.headers["last-modified"]
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"] == "inline"
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_single_and_multi_range(client):
+    client, _ = client
+    single = client.get("/pdf", headers={"Range": "bytes=0-8"})
+    assert single.status_code == 206
+    assert single.content == CONTENT[:9]
+    assert single.headers["content-range"] == f"bytes 0-8/{len(CONTENT)}"
+
+    suffix = client.get("/pdf", headers={"Range": "bytes=-16"})
+    assert suffix.status_code == 206
+    assert suffix.content == CONTENT[-16:]
+
+    multi = client.get("/pdf", headers={"Range": "bytes=0-3, 2000-2003"})
+    assert multi.status_code == 206
+    assert multi.headers["content-type"].startswith("multipart/byteranges; boundary=")
+    assert CONTENT[:4] in multi.content and CONTENT[2000:2004] in multi.content
+    assert len(multi.content) == int(multi.headers["content-length"])
+    boundary = multi.headers["content-type"].split("boundary=")[1]
+    assert multi.content.endswith(f"\n--{boundary}--\n".encode())
+
+    beyond = client.get("/pdf", headers={"Range": f"bytes={len(CONTENT)}-"})
+    assert beyond.status_code == 416
+
+
+def test_conditional_get_returns_304(client):
+    client, etag = client
+    assert client.get("/pdf", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/pdf", headers={"If-None-Match": f'"andere", W/{etag}'}).status_code == 304
+    assert client.get("/pdf", headers={"If-None-Match": '"andere"'}).status_code == 200
+
+    last_modified = client.get("/pdf").headers["last-modified"]
+    not_modified = client.get("/pdf", headers={"If-Modified-Since": last_modified})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+
+def test_if_range_only_with_current_strong_etag(client):
+    client, etag = client
+    assert client.get("/pdf", headers={"Range": "bytes=0-3", "If-Range": etag}).status_code == 206
+    stale = client.get("/pdf", headers={"Range": "bytes=0-3", "If-Range": '"veraltet"'})
+    assert stale.status_code == 200
+    assert stale.content == CONTENT
+    assert client.get("/pdf", headers={"Range": "bytes=0-3", "If-Range": f"W/{etag}"}).status_code == 200
+
+
+def test_without_hash_falls_back_to_stat_etag(client):
+    client, etag = client
+    response = client.get("/pdf-ohne-hash")
+    assert response.headers["etag"] != etag
+    assert client.get("/pdf-ohne-hash", headers={"If-None-Match": response.headers["etag"]}).status_code == 304
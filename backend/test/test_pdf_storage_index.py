@@ -0,0 +1,127 @@
+"""
+Tests für den Speicherindex der Original-PDFs und die Migration der Alt-Dateien
+Testes para o índice de armazenamento dos PDFs originais e a migração dos arquivos antigos
+"""
+
+import os
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.alert import Alert  # noqa: F401  (Mapper-Registrierung / registro dos mappers)
+from app.models.contract import Contract
+from app.services import contract_service
+from app.services.contract_service import ContractService
+from app.services.pdf_storage_index import PDFStorageIndex, canonical_pdf_path, migrate_pdf_storage
+
+
+def _pdf(path) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(b"%PDF-1.4\n")
+    return str(path)
+
+
+def _contract(**values) -> Contract:
+    return Contract(title="Vertrag", start_date=date(2025, 1, 1), client_name="Muster GmbH", created_by=1, **values)
+
+
+def test_resolve_trusts_loaded_row(tmp_path, monkeypatch):
+    index = PDFStorageIndex(str(tmp_path), max_entries=2)
+    stored = _pdf(tmp_path / "contracts" / "persisted" / "contract_7.pdf")
+
+    assert index.resolve(SimpleNamespace(id=7, original_pdf_path=stored, original_pdf_verified=True)) == stored
+    # Wiederverwendete ID: der LRU-Eintrag des gelöschten Vertrags gilt nicht
+    # ID reutilizado: a entrada do LRU do contrato excluído não vale
+    assert index.resolve(SimpleNamespace(id=7, original_pdf_path=None, original_pdf_verified=False)) is None
+    other = _pdf(tmp_path / "blobs" / "neu.pdf")
+    assert index.resolve(SimpleNamespace(id=7, original_pdf_path=other, original_pdf_verified=True)) == other
+
+    # Unbestätigte Zeilen werden nicht im Dateisystem gesucht / Linhas não confirmadas não são procuradas
+    _pdf(canonical_pdf_path(str(tmp_path), 8))
+    probed = []
+    monkeypatch.setattr(os.path, "isfile", lambda path: probed.append(path) or True)
+    assert index.resolve(SimpleNamespace(id=8, original_pdf_path=None, original_pdf_verified=False)) is None
+    assert index.resolve(SimpleNamespace(id=9, original_pdf_path=stored, original_pdf_verified=False)) is None
+    assert probed == []
+
+
+def test_lru_evicts_oldest_entry(tmp_path):
+    index = PDFStorageIndex(str(tmp_path), max_entries=2)
+    for contract_id in (1, 2, 3):
+        index.remember(contract_id, _pdf(canonical_pdf_path(str(tmp_path), contract_id)))
+    assert index.stats()["entries"] == 2
+    assert index._cached(1) is None
+    assert index._cached(3) == canonical_pdf_path(str(tmp_path), 3)
+
+
+@pytest.mark.asyncio
+async def test_resolve_id_queries_db_only_on_miss(tmp_path, monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    stored = _pdf(tmp_path / "irgendwo" / "vertrag.pdf")
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        contract = _contract(original_pdf_path=stored, original_pdf_verified=True)
+        db.add(contract)
+        await db.commit()
+
+        index = PDFStorageIndex(str(tmp_path))
+        assert await index.resolve_id(db, contract.id) == stored
+        assert await index.resolve_id(db, contract.id) == stored
+        assert await index.resolve_id(db, 999) is None
+        assert index.stats()["hits"] == 1
+        assert index.stats()["misses"] == 2
+
+        unverified = _contract(original_pdf_path=stored)
+        db.add(unverified)
+        await db.commit()
+        assert await index.resolve_id(db, unverified.id) is None
+
+        # Löschen entfernt den LRU-Eintrag / Excluir remove a entrada do LRU
+        monkeypatch.setattr(contract_service, "get_pdf_storage_index", lambda: index)
+        assert await ContractService(db).delete_contract(contract.id) is True
+        assert index._cached(contract.id) is None
+        assert await index.resolve_id(db, contract.id) is None
+    await engine.dispose()
+
+
+def test_migration_moves_legacy_files_by_exact_id(tmp_path):
+    upload_dir = str(tmp_path)
+    legacy_dir = tmp_path / "contracts"
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        contracts = [_contract() for _ in range(12)]
+        session.add_all(contracts)
+        session.flush()
+        by_db_path, by_name, missing, canonical = contracts[0], contracts[10], contracts[1], contracts[2]
+        by_db_path.original_pdf_path = _pdf(legacy_dir / "20250101_1_miete.pdf")
+        missing.original_pdf_path = str(legacy_dir / "weg.pdf")
+        session.commit()
+        ids = {name: contract.id for name, contract in
+               {"db": by_db_path, "name": by_name, "missing": missing, "canonical": canonical}.items()}
+
+    # Alt-Datei von Vertrag 11 darf nicht Vertrag 1 zugeordnet werden / Arquivo do contrato 11 não pode ir para o 1
+    _pdf(legacy_dir / f"upload_{ids['name']}_vertrag.pdf")
+    _pdf(canonical_pdf_path(upload_dir, ids["canonical"]))
+
+    with engine.begin() as connection:
+        counts = migrate_pdf_storage(connection, upload_dir)
+
+    assert counts == {"verified": 3, "moved": 2, "missing": 1}
+    with Session(engine) as session:
+        rows = {c.id: c for c in session.execute(select(Contract)).scalars()}
+    for name in ("db", "name", "canonical"):
+        assert rows[ids[name]].original_pdf_path == canonical_pdf_path(upload_dir, ids[name])
+        assert rows[ids[name]].original_pdf_verified is True
+        assert os.path.isfile(rows[ids[name]].original_pdf_path)
+    assert rows[ids["missing"]].original_pdf_verified is False
+    assert not any(name.endswith(".pdf") for name in os.listdir(legacy_dir))
+    engine.dispose()
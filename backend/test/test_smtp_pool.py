@@ -0,0 +1,65 @@
+"""
+Tests für den SMTP-Verbindungspool (gegen einen lokalen aiosmtpd-Server)
+Testes para o pool de conexões SMTP (contra um servidor aiosmtpd local)
+"""
+
+import pytest
+
+from app.utils.smtp_pool import OutgoingEmail, SMTPConnectionPool
+
+
+def _pool(smtp_server, size=3):
+    return SMTPConnectionPool(host=smtp_server.host, port=smtp_server.port, use_tls=False, timeout=5, size=size)
+
+
+def _messages(count):
+    return [OutgoingEmail(to=f"empfaenger{i}@example.com", subject=f"Alert {i}", body="<p>Test</p>") for i in range(count)]
+
+
+class TestSMTPConnectionPool:
+    """Wiederverwendung, Parallelität und Reconnect / Reuso, concorrência e reconexão"""
+
+    @pytest.mark.asyncio
+    async def test_batch_reuses_connections(self, smtp_server):
+        pool = _pool(smtp_server, size=3)
+        try:
+            results = await pool.send_batch(_messages(60))
+        finally:
+            await pool.close()
+
+        assert results == [True] * 60
+        assert len(smtp_server.handler.envelopes) == 60
+        assert pool.connections_opened <= 3
+        recipients = sorted(e.rcpt_tos[0] for e in smtp_server.handler.envelopes)
+        assert recipients == sorted(f"empfaenger{i}@example.com" for i in range(60))
+
+    @pytest.mark.asyncio
+    async def test_in_flight_sends_are_capped(self, smtp_server):
+        smtp_server.handler.delay = 0.05
+        pool = _pool(smtp_server, size=2)
+        try:
+            results = await pool.send_batch(_messages(8))
+        finally:
+            await pool.close()
+
+        assert all(results)
+        assert smtp_server.handler.max_active <= 2
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_server_disconnect(self, smtp_server):
+        pool = _pool(smtp_server, size=1)
+        try:
+            assert await pool.send(_messages(1)[0]) is True
+            smtp_server.restart()
+            assert await pool.send(_messages(1)[0]) is True
+        finally:
+            await pool.close()
+
+        assert pool.connections_opened == 2
+        assert len(smtp_server.handler.envelopes) == 2
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_reports_failure(self):
+        pool = SMTPConnectionPool(host="127.0.0.1", port=1, use_tls=False, timeout=1, size=2)
+        assert await pool.send_batch(_messages(2)) == [False, False]
+        assert pool.connections_opened == 0
@@ -0,0 +1,179 @@
+"""
+Tests für den Statistik-Rollup (contract_stats_rollup)
+Testes para o rollup de estatísticas (contract_stats_rollup)
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import Base
+from app.models.alert import Alert, AlertStatus, AlertType
+from app.models.contract import Contract, ContractStatus, ContractType, OperationType
+from app.models.contract_stats_rollup import ContractStatsRollup, expiry_bucket
+from app.models.user import User, UserRole, AccessLevel
+from app.services.contract_service import ContractService
+from app.services.dashboard_service import DashboardService
+from app.services.stats_rollup_service import StatsRollupService
+
+
+@pytest_asyncio.fixture
+async def env():
+    """Datenbank mit Benutzer und einigen Verträgen / Banco com usuário e alguns contratos"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as db:
+        director = User(email="dir@example.com", name="Dir", password_hash="x", role=UserRole.DIRECTOR,
+                        access_level=AccessLevel.LEVEL_5, department="IT", team="Alpha")
+        db.add(director)
+        await db.commit()
+
+        today = date.today()
+        for i, (dept, status, days) in enumerate([
+            ("IT", ContractStatus.ACTIVE, 10),
+            ("IT", ContractStatus.ACTIVE, 45),
+            ("Recht", ContractStatus.DRAFT, 400),
+        ]):
+            db.add(Contract(
+                title=f"Vertrag {i}", client_name="Kunde", start_date=today - timedelta(days=100),
+                end_date=today + timedelta(days=days), status=status, contract_type=ContractType.SERVICE,
+                operation_type=OperationType.INCOME, value=Decimal("100.00") * (i + 1),
+                department=dept, team="Alpha", created_by=director.id,
+            ))
+        await db.commit()
+
+    yield session_factory, director
+    await engine.dispose()
+
+
+async def _assert_consistent(session_factory):
+    async with session_factory() as db:
+        report = await StatsRollupService(db).check()
+    assert report["mismatches"] == []
+    assert report["consistent"] is True
+
+
+class TestExpiryBucket:
+    """Zuordnung der Ablauf-Buckets / Classificação das faixas de vencimento"""
+
+    def test_buckets(self):
+        today = date(2026, 1, 1)
+        assert expiry_bucket(None, today) == "none"
+        assert expiry_bucket(today - timedelta(days=1), today) == "past"
+        assert expiry_bucket(today, today) == "d30"
+        assert expiry_bucket(today + timedelta(days=30), today) == "d30"
+        assert expiry_bucket(today + timedelta(days=31), today) == "d90"
+        assert expiry_bucket(today + timedelta(days=91), today) == "later"
+
+
+class TestRollupMaintenance:
+    """Pflege im selben Flush und Konsistenzprüfung / Manutenção no mesmo flush e verificação"""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_then_changes_stay_consistent(self, env):
+        session_factory, director = env
+        async with session_factory() as db:
+            assert await StatsRollupService(db).rebuild() == 3
+        await _assert_consistent(session_factory)
+
+        async with session_factory() as db:
+            contract = (await db.execute(Contract.__table__.select().where(Contract.title == "Vertrag 0"))).first()
+            contract_id = contract.id
+
+            # Alerts anlegen, Status wechseln, löschen / Criar, mudar status e remover alertas
+            pending = Alert(contract_id=contract_id, alert_type=AlertType.T_MINUS_10, scheduled_for=datetime.now())
+            sent = Alert(contract_id=contract_id, alert_type=AlertType.T_MINUS_30, scheduled_for=datetime.now())
+            db.add_all([pending, sent])
+            await db.commit()
+            sent.status = AlertStatus.SENT
+            await db.commit()
+        await _assert_consistent(session_factory)
+
+        async with session_factory() as db:
+            # Schlüsseländerung verschiebt auch die Alert-Zähler / Mudança de chave move também os alertas
+            contract = await db.get(Contract, contract_id)
+            contract.department = "Finanzen"
+            contract.end_date = date.today() + timedelta(days=200)
+            contract.value = Decimal("999.99")
+            await db.commit()
+        await _assert_consistent(session_factory)
+
+        async with session_factory() as db:
+            alert = (await db.execute(Alert.__table__.select().where(Alert.status == AlertStatus.PENDING))).first()
+            await db.delete(await db.get(Alert, alert.id))
+            await db.commit()
+        await _assert_consistent(session_factory)
+
+        async with session_factory() as db:
+            assert await ContractService(db).delete_contract(contract_id) is True
+        await _assert_consistent(session_factory)
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_deltas(self, env):
+        session_factory, director = env
+        async with session_factory() as db:
+            await StatsRollupService(db).rebuild()
+
+        async with session_factory() as db:
+            db.add(Contract(title="Verworfen", client_name="K", start_date=date.today(), created_by=director.id))
+            await db.flush()
+            await db.rollback()
+        await _assert_consistent(session_factory)
+
+    @pytest.mark.asyncio
+    async def test_check_detects_and_repairs_drift(self, env):
+        session_factory, _ = env
+        async with session_factory() as db:
+            service = StatsRollupService(db)
+            await service.rebuild()
+            await db.execute(update(ContractStatsRollup.__table__).values(contract_count=42))
+            await db.commit()
+
+            report = await service.check(repair=True)
+            assert report["consistent"] is False
+            assert report["mismatches"]
+            assert report["repaired"] is True
+        await _assert_consistent(session_factory)
+
+
+class TestDashboardFromRollup:
+    """Dashboard liest den Rollup, solange er aktuell ist / Dashboard lê o rollup enquanto atual"""
+
+    @pytest.mark.asyncio
+    async def test_director_stats_match_live_query(self, env):
+        session_factory, director = env
+        async with session_factory() as db:
+            live = await DashboardService(db).get_stats_by_role(director)  # Rollup veraltet -> Live
+            await StatsRollupService(db).rebuild()
+
+        engine = db.bind
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        async with session_factory() as db:
+            from_rollup = await DashboardService(db).get_stats_by_role(director)
+
+        assert not any("FROM contracts" in s and "GROUP BY" in s for s in statements)
+        assert from_rollup == live
+        assert from_rollup.total_contracts == 3
+        assert from_rollup.expiring_30_days == 1
+        assert from_rollup.expiring_90_days == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_rollup_falls_back_to_live(self, env):
+        session_factory, _ = env
+        async with session_factory() as db:
+            service = StatsRollupService(db)
+            await service.rebuild(reference=date.today() - timedelta(days=1))
+            assert await service.scope_rows() is None
+
+            await service.rebuild()
+            rows = await service.scope_rows(department="IT")
+            assert sum(row.contract_count for row in rows) == 2
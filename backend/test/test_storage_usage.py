@@ -0,0 +1,86 @@
+"""
+Tests für die Speicherbuchhaltung (Deltas aus Blob-Speicher/Vorschaubildern, Abgleich, Zeitreihe)
+Testes para a contabilidade de armazenamento (deltas de blobs/miniaturas, reconciliação, série temporal)
+"""
+
+import hashlib
+import os
+
+import pytest
+
+from app.models.storage_usage import CATEGORY_BLOBS, CATEGORY_OTHER, CATEGORY_THUMBNAILS
+from app.services.blob_store import BlobStore
+from app.services.storage_usage_service import StorageUsageService, StorageUsageTracker, scan_upload_dir
+from app.services.thumbnail_service import ThumbnailCache
+
+SHA = "cd" * 32
+
+
+def _file(path, content: bytes) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(content)
+    return str(path)
+
+
+def test_stores_record_writes_and_deletes(tmp_path):
+    tracker = StorageUsageTracker()
+    store = BlobStore(str(tmp_path / "blobs"), tracker)
+    content = b"%PDF-1.7 Pachtvertrag"
+    sha256 = hashlib.sha256(content).hexdigest()
+    store.put(_file(tmp_path / "temp" / "a.pdf", content), sha256)
+    # Duplikat belegt keinen zusätzlichen Platz / Duplicata não ocupa espaço adicional
+    store.put(_file(tmp_path / "temp" / "b.pdf", content), sha256)
+    assert tracker.pending() == {CATEGORY_BLOBS: (len(content), 1)}
+    assert store.delete(sha256) and not store.delete(sha256)
+
+    cache = ThumbnailCache(str(tmp_path / "thumbnails"), max_bytes=250, usage=tracker)
+    for page in (1, 2, 3):
+        cache.put(SHA, page, 160, b"x" * 100)
+    assert tracker.drain() == {CATEGORY_BLOBS: (0, 0), CATEGORY_THUMBNAILS: (200, 2)}
+    assert scan_upload_dir(str(tmp_path))[CATEGORY_THUMBNAILS] == (200, 2)
+
+
+@pytest.mark.asyncio
+async def test_reads_include_pending_deltas_and_flush(session_factory):
+    async with session_factory() as db:
+        tracker = StorageUsageTracker()
+        service = StorageUsageService(db, tracker)
+        tracker.record(CATEGORY_BLOBS, 1000, 2)
+        tracker.record(CATEGORY_BLOBS, -400, -1)
+
+        usage = await service.usage()
+        assert usage["categories"][CATEGORY_BLOBS] == {"bytes": 600, "files": 1}
+        assert usage["reconciled_at"] is None
+
+        assert await service.flush() == 1
+        assert tracker.pending() == {}
+        tracker.record(CATEGORY_THUMBNAILS, 50, 1)
+        await service.flush()
+        usage = await service.usage()
+        assert usage["total_bytes"] == 650 and usage["total_files"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reconcile_corrects_drift_and_samples_history(session_factory, tmp_path):
+    async with session_factory() as db:
+        _file(tmp_path / "blobs" / "ab" / "cd" / ("ab" * 32), b"p" * 300)
+        _file(tmp_path / "thumbnails" / "ab" / "bild.png", b"t" * 20)
+        _file(tmp_path / "contracts" / "temp" / "staging.pdf", b"s" * 7)
+        _file(tmp_path / "lose.txt", b"l" * 3)
+
+        tracker = StorageUsageTracker()
+        service = StorageUsageService(db, tracker)
+        # Verpasste Löschung: Zähler zu hoch / Remoção perdida: contador alto demais
+        tracker.record(CATEGORY_BLOBS, 10_000, 5)
+        await service.flush()
+
+        totals = await service.reconcile(str(tmp_path))
+        assert totals == {CATEGORY_BLOBS: (300, 1), CATEGORY_THUMBNAILS: (20, 1), CATEGORY_OTHER: (10, 2)}
+        usage = await service.usage()
+        assert usage["total_bytes"] == 330 and usage["reconciled_at"] is not None
+
+        await service.reconcile(str(tmp_path))
+        history = await service.history(days=1, category=CATEGORY_BLOBS)
+        assert [(sample["bytes"], sample["files"]) for sample in history] == [(300, 1), (300, 1)]
+        assert len(await service.history(days=1)) == 6
@@ -0,0 +1,99 @@
+"""
+Tests für Seiten-Vorschaubilder (Rendern, Platten-Cache mit LRU, Vorab-Erzeugung)
+Testes para miniaturas de páginas (renderização, cache em disco com LRU, pré-geração)
+"""
+
+import asyncio
+import os
+import time
+
+import fitz
+import pytest
+
+from app.services.extraction_engine import ExtractionEngine
+from app.services.thumbnail_service import (
+    PREVIEW_WIDTH,
+    THUMBNAIL_WIDTH,
+    PageNotFoundError,
+    ThumbnailCache,
+    ThumbnailService,
+    render_page_png,
+)
+
+SHA = "ab" * 32
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "vertrag.pdf"
+    with fitz.open() as doc:
+        for number in (1, 2):
+            doc.new_page().insert_text((72, 72), f"Mietvertrag Seite {number}")
+        doc.save(str(path))
+    return str(path)
+
+
+class _CountingEngine(ExtractionEngine):
+    def __init__(self):
+        super().__init__(workers=0)
+        self.calls = []
+
+    async def render_page(self, pdf_path, page_number, width):
+        self.calls.append((page_number, width))
+        await asyncio.sleep(0.01)
+        return await super().render_page(pdf_path, page_number, width)
+
+
+def test_render_page_png(pdf_path):
+    data = render_page_png(pdf_path, 1, 160)
+    assert data.startswith(b"\x89PNG")
+    assert fitz.Pixmap(data).width == 160
+    with pytest.raises(PageNotFoundError):
+        render_page_png(pdf_path, 3, 160)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ThumbnailCache(str(tmp_path / "thumbs"), max_bytes=250)
+    for page in (1, 2):
+        cache.put(SHA, page, 160, b"x" * 100)
+        past = time.time() - 100 + page
+        os.utime(cache.path_for(SHA, page, 160), (past, past))
+    # Treffer frischt Seite 1 auf -> Seite 2 ist am ältesten / Acerto renova a página 1 -> página 2 é a mais antiga
+    assert cache.get(SHA, 1, 160) is not None
+    cache.put(SHA, 3, 160, b"x" * 100)
+
+    assert cache.get(SHA, 2, 160) is None
+    assert cache.get(SHA, 1, 160) is not None and cache.get(SHA, 3, 160) is not None
+    assert cache.stats()["bytes"] == 200
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_render_once(tmp_path, pdf_path):
+    engine = _CountingEngine()
+    service = ThumbnailService(ThumbnailCache(str(tmp_path / "thumbs"), 10 * 1024 * 1024), engine)
+
+    paths = await asyncio.gather(*(service.thumbnail(pdf_path, SHA, 1, THUMBNAIL_WIDTH) for _ in range(5)))
+    assert len(set(paths)) == 1 and os.path.isfile(paths[0])
+    assert engine.calls == [(1, THUMBNAIL_WIDTH)]
+
+    assert await service.thumbnail(pdf_path, SHA, 1, THUMBNAIL_WIDTH) == paths[0]
+    assert len(engine.calls) == 1
+
+    with pytest.raises(PageNotFoundError):
+        await service.thumbnail(pdf_path, SHA, 9, THUMBNAIL_WIDTH)
+    assert not service._inflight
+
+
+@pytest.mark.asyncio
+async def test_pregeneration_renders_preview_and_list_thumbnails(tmp_path, pdf_path):
+    engine = _CountingEngine()
+    service = ThumbnailService(ThumbnailCache(str(tmp_path / "thumbs"), 10 * 1024 * 1024), engine)
+
+    task = service.schedule_pregeneration(pdf_path, SHA)
+    await task
+    # Nur zwei Seiten vorhanden: die dritte wird still übersprungen / Só duas páginas: a terceira é ignorada
+    await service.pregenerate(pdf_path, SHA, pages=3)
+
+    assert engine.calls[:2] == [(1, PREVIEW_WIDTH), (1, THUMBNAIL_WIDTH)]
+    assert service.cache.get(SHA, 2, THUMBNAIL_WIDTH) is not None
+    assert not service._background
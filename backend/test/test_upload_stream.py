@@ -0,0 +1,115 @@
+"""
+Tests für den Streaming-Upload (Blockweise Kopie, Hash, Größengrenze)
+Testes para o upload em streaming (cópia em blocos, hash, limite de tamanho)
+"""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+from starlette.datastructures import UploadFile as StarletteUploadFile
+
+from app.utils.upload_stream import (
+    MULTIPART_OVERHEAD,
+    UploadSizeLimitMiddleware,
+    UploadTooLargeError,
+    ingest_upload,
+)
+
+
+def _upload(data: bytes) -> StarletteUploadFile:
+    return StarletteUploadFile(file=BytesIO(data), filename="vertrag.pdf")
+
+
+class TestIngestUpload:
+    """Blockweise Kopie / Cópia em blocos"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_size_match_content(self, tmp_path):
+        data = b"%PDF-1.4\n" + bytes(range(256)) * 1000
+        result = await ingest_upload(_upload(data), str(tmp_path / "a" / "original.pdf"), max_bytes=len(data), chunk_size=4096)
+
+        assert result.size == len(data)
+        assert result.sha256 == hashlib.sha256(data).hexdigest()
+        assert (tmp_path / "a" / "original.pdf").read_bytes() == data
+        assert not (tmp_path / "a" / "original.pdf.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_keeps_existing_target(self, tmp_path):
+        target = tmp_path / "original.pdf"
+        target.write_bytes(b"alt")
+        upload = _upload(b"x" * 10_000)
+
+        with pytest.raises(UploadTooLargeError):
+            await ingest_upload(upload, str(target), max_bytes=5_000, chunk_size=1024)
+
+        assert target.read_bytes() == b"alt"
+        assert not (tmp_path / "original.pdf.part").exists()
+        # Abbruch nach der ersten Überschreitung / Interrupção logo após exceder o limite
+        assert upload.file.tell() <= 5_000 + 1024
+
+
+class TestUploadSizeLimitMiddleware:
+    """Ablehnung vor dem Einlesen / Rejeição antes da leitura"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(UploadSizeLimitMiddleware, max_bytes=1000)
+        app.state.calls = 0
+
+        @app.post("/upload")
+        async def upload(file: UploadFile = File(...)):
+            app.state.calls += 1
+            return {"size": len(await file.read())}
+
+        return TestClient(app), app
+
+    def test_small_upload_passes(self, client):
+        test_client, app = client
+        response = test_client.post("/upload", files={"file": ("a.pdf", b"x" * 500, "application/pdf")})
+        assert response.status_code == 200
+        assert response.json() == {"size": 500}
+
+    def test_declared_length_over_limit_is_rejected(self, client):
+        test_client, app = client
+        payload = b"x" * (1000 + MULTIPART_OVERHEAD + 1)
+        response = test_client.post("/upload", files={"file": ("a.pdf", payload, "application/pdf")})
+        assert response.status_code == 413
+        assert app.state.calls == 0
+
+    def test_streamed_body_over_limit_is_rejected(self, client):
+        test_client, app = client
+
+        def chunks():
+            boundary = b"--grenze\r\n"
+            yield boundary + b'Content-Disposition: form-data; name="file"; filename="a.pdf"\r\n\r\n'
+            for _ in range(40):
+                yield b"x" * 65536
+            yield b"\r\n--grenze--\r\n"
+
+        response = test_client.post(
+            "/upload",
+            content=chunks(),
+            headers={"content-type": "multipart/form-data; boundary=grenze"},
+        )
+        assert response.status_code == 413
+        assert app.state.calls == 0
+
+    def test_rejection_carries_cors_headers(self):
+        # CORS außen: die SPA sieht die 413 statt eines CORS-Fehlers / CORS por fora: a SPA vê o 413
+        from main import app
+
+        response = TestClient(app).post(
+            "/api/contracts/import/upload",
+            content=b"x",
+            headers={
+                "origin": "http://localhost:5173",
+                "content-type": "multipart/form-data; boundary=grenze",
+                "content-length": str(50 * 1024 * 1024),
+            },
+        )
+        assert response.status_code == 413
+        assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
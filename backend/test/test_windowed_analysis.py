@@ -0,0 +1,75 @@
+"""
+Tests für die seitenweise Analyse langer Verträge
+Testes para a análise página a página de contratos longos
+"""
+
+import fitz
+
+from app.services.pdf_reader import PDFReaderService
+from app.services.pdf_reader_pkg import extractor_router
+from app.services.pdf_reader_pkg.extractor_router import normalize_text
+from app.services.pdf_reader_pkg.analysis import analyze_contract_complexity, extract_key_terms
+from app.services.pdf_reader_pkg.windowed import ComplexityCounter, KeyTermCounter, analyze_pages
+
+HEAD = (
+    "Mietvertrag über Büroräume in Berlin\n"
+    "zwischen der Muster GmbH und der Beispiel AG, Telefon +49 30 1234567.\n"
+    "Mietbeginn: 01.03.2025. Die Miete beträgt monatlich 950,00 EUR.\n"
+)
+ANNEX = "Anlage {n}. Leistungsbeschreibung und Haftung gemäß Vertrag.\n\nDie Kündigungsfrist: {n} Monate.\n"
+PAGES = [HEAD] + [ANNEX.format(n=n) for n in range(1, 8)] + ["Schlussbestimmungen. Gesamtbetrag 12.000,00 EUR, Laufzeit bis 31.12.2026."]
+
+
+def test_counters_match_full_text_functions():
+    complexity = ComplexityCounter()
+    key_terms = KeyTermCounter()
+    for page in PAGES:
+        complexity.feed(page)
+        key_terms.feed(page)
+    full_text = "\n".join(PAGES)
+
+    assert complexity.result() == analyze_contract_complexity(full_text)
+    terms = key_terms.result()
+    assert [{k: v for k, v in term.items() if k != "count"} for term in terms] == extract_key_terms(full_text)
+    assert all(term["count"] == full_text.lower().count(term["term"]) for term in terms)
+
+
+def test_header_fields_only_from_head_pages(monkeypatch):
+    seen = []
+    original = extractor_router.FIELD_EXTRACTORS["client_name"]
+    monkeypatch.setitem(
+        extractor_router.FIELD_EXTRACTORS, "client_name",
+        lambda text, scan: seen.append(text) or original(text, scan),
+    )
+
+    result = analyze_pages(iter(PAGES), head_pages=2)
+
+    assert seen == ["\n".join(normalize_text(page) for page in PAGES[:2])]
+    assert result["contract_type"] == "RENTAL"
+    assert result["client_name"] == "Muster GmbH"
+    assert result["analyzed_pages"] == len(PAGES)
+
+
+def test_body_fields_merged_across_pages():
+    result = analyze_pages(iter(PAGES))
+    assert result["money_values"]["value"] == "12.000,00"
+    assert result["notice_period"]["value"] == 7
+    assert result["payment_frequency"] == "monatlich"
+    assert result["start_date"] == "01.03.2025"
+    assert result["end_date"] == "31.12.2026"
+    assert result["contract_complexity"]["word_count"] > 0
+
+
+def test_reader_analyzes_extracted_pages(tmp_path):
+    pdf_path = tmp_path / "lang.pdf"
+    with fitz.open() as doc:
+        for text in PAGES:
+            doc.new_page().insert_text((50, 72), text, fontsize=9)
+        doc.save(str(pdf_path))
+
+    reader = PDFReaderService()
+    reader.max_pages = 5
+    extraction = reader.extract_text_with_pymupdf(str(pdf_path))
+    result = reader.extract_intelligent_data_windowed(page["text"] for page in extraction["pages"])
+    assert result["analyzed_pages"] == 5
+    assert result["contract_type"] == "RENTAL"